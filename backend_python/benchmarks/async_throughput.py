@@ -0,0 +1,129 @@
+"""Compare request throughput of the sync and async route stacks under concurrency.
+
+Starts the API once per stack with uvicorn: with `DATABASE_URL=memory://` (sync
+stack, todos kept in the process), with the `DATABASE_URL` as given (sync stack,
+`mysqlclient` on the thread pool) and with its driver swapped for `mysql+asyncmy`
+(async stack, on the event loop). Each server gets the same load: `GET /todos/{id}`
+for a freshly created todo at every concurrency level. The cache is disabled so every
+request reaches the database. The memory stack does no I/O at all, so what it costs
+is the framework's share of the others' latency.
+
+Usage:
+    DATABASE_URL=... uv run python benchmarks/async_throughput.py [--concurrency 1 64 512]
+    uv run python benchmarks/async_throughput.py --stacks memory
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+from sqlalchemy.engine import make_url
+
+STACKS = ("memory", "sync", "async")
+
+
+def start_server(database_url: str, port: int) -> subprocess.Popen[bytes]:
+    env = {**os.environ, "DATABASE_URL": database_url, "TODO_CACHE_SIZE": "0"}
+    # stdout carries the engine's SQL echo; drop it so the terminal stays readable.
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "error"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def stack_url(stack: str, database_url: str | None) -> str:
+    if stack == "memory":
+        return "memory://"
+    if not database_url:
+        raise RuntimeError(f"DATABASE_URL environment variable is required for the {stack} stack")
+    url = make_url(database_url)
+    if stack == "async":
+        url = url.set(drivername="mysql+asyncmy")
+    return url.render_as_string(hide_password=False)
+
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/healthcheck")).status_code == 200:
+                return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+        await asyncio.sleep(0.2)
+
+
+async def run_level(
+    client: httpx.AsyncClient, path: str, concurrency: int, requests: int
+) -> tuple[float, list[float]]:
+    """Send `requests` GETs with at most `concurrency` in flight; return (req/s, latencies)."""
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started), latencies
+
+
+def describe(latencies: list[float]) -> str:
+    ordered = sorted(latencies)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    return f"p50={statistics.median(ordered):.1f}ms p99={p99:.1f}ms"
+
+
+async def bench_stack(name: str, port: int, args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=max(args.concurrency), max_keepalive_connections=None)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60.0
+    ) as client:
+        await wait_until_ready(client)
+        created = await client.post("/todos", json={"title": "benchmark"})
+        created.raise_for_status()
+        path = f"/todos/{created.json()['id']}"
+        try:
+            for concurrency in args.concurrency:
+                requests = max(args.requests, concurrency * 10)
+                throughput, latencies = await run_level(client, path, concurrency, requests)
+                print(
+                    f"{name:>6} c={concurrency:<4} {throughput:8.0f} req/s | {describe(latencies)}"
+                )
+        finally:
+            await client.delete(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare throughput of the sync and async route stacks under concurrency."
+    )
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64, 256, 512])
+    parser.add_argument("--requests", type=int, default=2_000, help="requests per level")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--stacks", nargs="+", choices=STACKS, default=list(STACKS))
+    args = parser.parse_args()
+
+    database_url = os.environ.get("DATABASE_URL")
+    for name in args.stacks:
+        server = start_server(stack_url(name, database_url), args.port)
+        try:
+            asyncio.run(bench_stack(name, args.port, args))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
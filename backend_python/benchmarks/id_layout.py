@@ -0,0 +1,155 @@
+"""Compare CHAR(36) and BINARY(16) primary keys for the todos table on MySQL.
+
+Loads the same UUID7 ids into two scratch tables, one per layout, then reports the
+on-disk size of each table and the latency of primary-key point lookups and keyset
+page scans.
+
+Usage:
+    DATABASE_URL=... uv run python benchmarks/id_layout.py [--rows 10000000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from os import environ
+from typing import Any
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Engine,
+    MetaData,
+    Select,
+    String,
+    Table,
+    Text,
+    create_engine,
+    insert,
+    select,
+    text,
+)
+from uuid_utils import uuid7
+
+from todo_api.infrastructure.repository.data_model.types import BinaryUUID
+
+metadata = MetaData()
+LAYOUTS = {
+    "char": Table(
+        "bench_todos_char",
+        metadata,
+        Column("id", String(36), primary_key=True),
+        Column("title", String(255), nullable=False),
+        Column("description", Text),
+        Column("completed", Boolean, nullable=False),
+    ),
+    "binary": Table(
+        "bench_todos_binary",
+        metadata,
+        Column("id", BinaryUUID(), primary_key=True),
+        Column("title", String(255), nullable=False),
+        Column("description", Text),
+        Column("completed", Boolean, nullable=False),
+    ),
+}
+
+
+def load(engine: Engine, rows: int, chunk: int, sample_size: int) -> list[str]:
+    """Insert `rows` todos into every layout and return a random sample of their ids."""
+    sample: list[str] = []
+    seen = 0
+    while seen < rows:
+        batch = [
+            {
+                "id": str(uuid7()),
+                "title": f"todo {seen + offset}",
+                "description": "benchmark row",
+                "completed": (seen + offset) % 2 == 0,
+            }
+            for offset in range(min(chunk, rows - seen))
+        ]
+        for table in LAYOUTS.values():
+            with engine.begin() as connection:
+                connection.execute(insert(table), batch)
+        for row in batch:
+            seen += 1
+            if len(sample) < sample_size:
+                sample.append(row["id"])
+            elif (slot := random.randrange(seen)) < sample_size:
+                sample[slot] = row["id"]
+    return sample
+
+
+def table_size(engine: Engine, table: Table) -> tuple[int, int]:
+    with engine.begin() as connection:
+        connection.execute(text(f"ANALYZE TABLE {table.name}"))
+        data_length, index_length = connection.execute(
+            text(
+                "SELECT data_length, index_length FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = :name"
+            ),
+            {"name": table.name},
+        ).one()
+    return int(data_length), int(index_length)
+
+
+def time_queries(engine: Engine, statements: list[Select[Any]]) -> list[float]:
+    timings: list[float] = []
+    with engine.connect() as connection:
+        for stmt in statements:
+            started = time.perf_counter()
+            connection.execute(stmt).all()
+            timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def describe(timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    return f"p50={statistics.median(ordered):.3f}ms p99={p99:.3f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare CHAR(36) and BINARY(16) primary keys for the todos table on MySQL."
+    )
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--chunk", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--keep", action="store_true", help="keep the scratch tables")
+    args = parser.parse_args()
+
+    database_url = environ.get("DATABASE_URL")
+    if not database_url:
+        raise RuntimeError("DATABASE_URL environment variable is required")
+    engine = create_engine(database_url)
+
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    try:
+        started = time.perf_counter()
+        sample = load(engine, args.rows, args.chunk, args.lookups)
+        print(f"loaded {args.rows} rows per layout in {time.perf_counter() - started:.1f}s")
+
+        for layout, table in LAYOUTS.items():
+            data_length, index_length = table_size(engine, table)
+            lookups = time_queries(engine, [select(table).where(table.c.id == i) for i in sample])
+            pages = time_queries(
+                engine,
+                [
+                    select(table).where(table.c.id > i).order_by(table.c.id).limit(100)
+                    for i in sample
+                ],
+            )
+            print(
+                f"{layout:>6}: data={data_length / 2**20:.1f}MiB "
+                f"index={index_length / 2**20:.1f}MiB | "
+                f"point lookup {describe(lookups)} | page of 100 {describe(pages)}"
+            )
+    finally:
+        if not args.keep:
+            metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
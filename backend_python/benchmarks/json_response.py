@@ -0,0 +1,116 @@
+"""Measure GET /todos latency for a large page, through the response model and the fast JSON path.
+
+Drives two in-process ASGI apps whose `/todos` route is declared like the router's
+(same `response_model`), backed by a use case that returns `--todos` domain todos
+without touching a database. The default route builds `GetAllTodosResponse`, which
+FastAPI then validates again and serializes; the fast route renders the JSON body
+straight from the todos (with orjson if the `fast-json` extra is installed).
+
+Usage:
+    uv run python benchmarks/json_response.py [--todos 10000] [--requests 50]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any
+
+import anyio
+from fastapi import FastAPI, Response
+from starlette.types import Message
+
+from todo_api.application_service.usecase.get_all_todos_usecase import (
+    GetAllTodosUsecase,
+    GetAllTodosUsecaseInput,
+    GetAllTodosUsecaseOutput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.presentation.handler import todo_json
+from todo_api.presentation.handler.get_all_todos_handler import (
+    GetAllTodosHandler,
+    GetAllTodosResponse,
+)
+
+
+class FixedGetAllTodosUsecase(GetAllTodosUsecase):
+    def __init__(self, todos: list[Todo]) -> None:
+        self.todos = todos
+
+    def execute(self, input_dto: GetAllTodosUsecaseInput) -> GetAllTodosUsecaseOutput:
+        return GetAllTodosUsecaseOutput(todos=self.todos)
+
+
+def build_app(handler: GetAllTodosHandler, *, fast_json: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/todos", response_model=GetAllTodosResponse)
+    def get_all_todos() -> GetAllTodosResponse | Response:  # pyright: ignore[reportUnusedFunction]
+        return handler.handle_json() if fast_json else handler.handle()
+
+    return app
+
+
+async def drive(app: FastAPI, requests: int) -> list[float]:
+    """Call GET /todos `requests` times and return each request's latency in milliseconds."""
+    body_size = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal body_size
+        if message["type"] == "http.response.body":
+            body_size += len(message.get("body", b""))
+
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/todos",
+        "raw_path": b"/todos",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await app(dict(scope), receive, send)
+        latencies.append((time.perf_counter() - started) * 1e3)
+    assert body_size > 0
+    return latencies
+
+
+async def run(todos: int, requests: int) -> None:
+    items = [
+        Todo(title=f"todo {index}", description="a description" if index % 2 else None)
+        for index in range(todos)
+    ]
+    handler = GetAllTodosHandler(FixedGetAllTodosUsecase(items))
+    encoder = "orjson" if todo_json.orjson is not None else "json"
+    print(f"{todos} todos per response, fast path encoder: {encoder}")
+    print(f"{'route':<16}{'median ms':>12}{'p95 ms':>10}")
+    for name, fast_json in (("response model", False), ("fast json", True)):
+        app = build_app(handler, fast_json=fast_json)
+        await drive(app, 3)  # warm up
+        latencies = sorted(await drive(app, requests))
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"{name:<16}{statistics.median(latencies):>12.1f}{p95:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure GET /todos latency with and without the fast JSON path."
+    )
+    parser.add_argument("--todos", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    anyio.run(run, args.todos, args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Measure requests per second through the session and error middleware alone.
+
+Drives the ASGI app in-process (no sockets, no database) with a trivial JSON route
+and a small streaming route, once with the previous `BaseHTTPMiddleware`-based
+`SessionMiddleware`/`ErrorHandler` (reproduced below) and once with the current
+pure ASGI middleware. The context provider hands out a session that does nothing,
+so the difference between the rows is the middleware overhead.
+
+Usage:
+    uv run python benchmarks/middleware_stack.py [--requests 20000]
+"""
+
+import argparse
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from typing import Any, cast
+
+import anyio
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message
+
+from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.presentation.middleware.error_handler import ErrorHandler, HTTPError
+from todo_api.presentation.middleware.session_middleware import SessionMiddleware
+
+
+class NullSession:
+    def in_transaction(self) -> bool:
+        return True
+
+    def rollback(self) -> None:
+        pass
+
+
+class NullContextProvider(ContextProvider[Session]):
+    def __init__(self) -> None:
+        self._session = cast(Session, NullSession())
+
+    @contextmanager
+    def transaction(self, *, read_only: bool = False) -> Iterator[Session]:
+        yield self._session
+
+    @contextmanager
+    def deferred_transaction(self, *, pin_primary: bool = False) -> Iterator[None]:
+        yield
+
+    def current(self) -> Session:
+        return self._session
+
+    def rollback(self) -> None:
+        pass
+
+    def release(self) -> None:
+        pass
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        callback()
+
+
+class BaseHTTPSessionMiddleware(BaseHTTPMiddleware):
+    """`SessionMiddleware` as it was before it became a pure ASGI middleware."""
+
+    def __init__(self, app: ASGIApp, *, context_provider: ContextProvider[Session]) -> None:
+        super().__init__(app)
+        self._context_provider = context_provider
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        with ExitStack() as stack:
+            session = stack.enter_context(self._context_provider.transaction())
+            response = await call_next(request)
+            if response.status_code >= 400 and session.in_transaction():
+                session.rollback()
+            if response.status_code not in (204, 304) and "content-length" not in response.headers:
+                body = response.body_iterator  # pyright: ignore[reportAttributeAccessIssue]
+                response.body_iterator = _close_after(body, stack.pop_all())  # pyright: ignore[reportAttributeAccessIssue]
+            return response
+
+
+async def _close_after(body: AsyncIterator[bytes], stack: ExitStack) -> AsyncIterator[bytes]:
+    with stack:
+        async for chunk in body:
+            yield chunk
+
+
+class BaseHTTPErrorHandler(BaseHTTPMiddleware):
+    """`ErrorHandler` as it was before it became a pure ASGI middleware."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        try:
+            return await call_next(request)
+        except HTTPError as e:
+            return JSONResponse(
+                status_code=e.status_code,
+                content={"code": str(e.status_code), "message": e.message},
+            )
+
+
+STACKS: dict[str, tuple[Any, Any]] = {
+    "BaseHTTPMiddleware": (BaseHTTPSessionMiddleware, BaseHTTPErrorHandler),
+    "pure ASGI": (SessionMiddleware, ErrorHandler),
+}
+
+
+def build_app(session_middleware: Any, error_handler: Any) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        return JSONResponse({"status": "ok"})
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:  # pyright: ignore[reportUnusedFunction]
+        async def body() -> AsyncIterator[bytes]:
+            for index in range(10):
+                yield f"{index}\n".encode()
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    app.add_middleware(session_middleware, context_provider=NullContextProvider())
+    app.add_middleware(error_handler)
+    return app
+
+
+async def drive(app: FastAPI, path: str, requests: int) -> float:
+    """Call `app` `requests` times for `path` and return the achieved requests per second."""
+
+    async def send(message: Message) -> None:
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        received = False
+
+        async def receive() -> Message:
+            nonlocal received
+            if received:
+                # Nothing else arrives until the response is done, like a live client.
+                await anyio.sleep_forever()
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.4"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 50000),
+            "server": ("127.0.0.1", 8000),
+        }
+        await app(scope, receive, send)
+    return requests / (time.perf_counter() - started)
+
+
+async def run(requests: int) -> None:
+    for name, (session_middleware, error_handler) in STACKS.items():
+        app = build_app(session_middleware, error_handler)
+        await drive(app, "/ping", min(requests, 1_000))  # warm up
+        for path in ("/ping", "/stream"):
+            print(f"{name:>18} {path:<8} {await drive(app, path, requests):8.0f} req/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure requests per second through the session and error middleware alone."
+    )
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    anyio.run(run, args.requests)
+
+
+if __name__ == "__main__":
+    main()
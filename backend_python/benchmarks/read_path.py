@@ -0,0 +1,114 @@
+"""Measure the CPU cost per row of listing todos through ORM entities and through Core rows.
+
+Fills a `todos` table with `--rows` rows, then times `find_all` two ways inside one
+session: the previous query, which selected `TodoDataModel` entities into the identity
+map and converted each to a `Todo`, and `TodoRepositoryImpl.find_all`, which selects
+plain column tuples. CPU time (`time.process_time`) is reported, so database round trip
+time that is not spent in this process is left out. Uses a temporary SQLite file unless
+`--url` points at another database; the table there is dropped and recreated.
+
+Usage:
+    uv run python benchmarks/read_path.py [--rows 100000] [--url mysql://...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import Engine, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.infrastructure.repository.data_model.base import Base
+from todo_api.infrastructure.repository.data_model.todo import TodoDataModel
+from todo_api.infrastructure.repository.todo_repository import TodoRepositoryImpl
+
+
+class SessionProvider(ContextProvider[Session]):
+    """Hands out one fixed session; the benchmark manages its transaction."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    @contextmanager
+    def transaction(self, *, read_only: bool = False) -> Iterator[Session]:
+        yield self._session
+
+    @contextmanager
+    def deferred_transaction(self, *, pin_primary: bool = False) -> Iterator[None]:
+        yield
+
+    def current(self) -> Session:
+        return self._session
+
+    def rollback(self) -> None:
+        pass
+
+    def release(self) -> None:
+        pass
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        callback()
+
+
+def orm_find_all(session: Session) -> list[Todo]:
+    """The previous `TodoRepositoryImpl.find_all`."""
+    return [todo.to_domain() for todo in session.scalars(select(TodoDataModel)).all()]
+
+
+def fill(engine: Engine, rows: int) -> None:
+    Base.metadata.drop_all(engine, tables=[TodoDataModel.__table__])  # pyright: ignore[reportArgumentType]
+    Base.metadata.create_all(engine, tables=[TodoDataModel.__table__])  # pyright: ignore[reportArgumentType]
+    with Session(engine) as session, session.begin():
+        for start in range(0, rows, 1_000):
+            batch = [
+                TodoDataModel.values_from_domain(
+                    Todo(title=f"todo {index}", description=None if index % 2 else "description")
+                )
+                for index in range(start, min(start + 1_000, rows))
+            ]
+            session.execute(insert(TodoDataModel).values(batch))
+
+
+def cpu_per_row(engine: Engine, rows: int, find_all: Callable[[Session], list[Todo]]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        with Session(engine) as session, session.begin():
+            started = time.process_time()
+            todos = find_all(session)
+            best = min(best, time.process_time() - started)
+        assert len(todos) == rows
+    return best / rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure the CPU cost per row of listing todos as ORM entities and Core rows."
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--url")
+    args = parser.parse_args()
+
+    url = args.url
+    if url is None:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    fill(engine, args.rows)
+
+    def core_find_all(session: Session) -> list[Todo]:
+        return TodoRepositoryImpl(SessionProvider(session)).find_all()
+
+    print(f"{args.rows} rows on {engine.dialect.name}")
+    print(f"{'path':<26}{'CPU us/row':>12}")
+    for name, find_all in (("ORM entities (before)", orm_find_all), ("Core rows", core_find_all)):
+        print(f"{name:<26}{cpu_per_row(engine, args.rows, find_all) * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measure search latency of the in-process todo search index.
+
+Indexes `--todos` generated todos, then times `--queries` searches for the first page
+of results. Titles and descriptions are drawn from a vocabulary of `--words` words
+whose frequencies follow Zipf's law, as in natural text, and so are the one to three
+words of each query. The most common words therefore appear in most todos. Reports the
+time to build the index, the peak memory of the process and search latency percentiles.
+
+Usage:
+    uv run python benchmarks/search_index.py [--todos 1000000] [--queries 10000]
+"""
+
+import argparse
+import itertools
+import random
+import resource
+import statistics
+import time
+from collections.abc import Iterator
+
+from todo_api.domain.model.todo import Todo
+from todo_api.infrastructure.search.in_memory_todo_search_index import InMemoryTodoSearchIndex
+
+TITLE_WORDS = 4
+DESCRIPTION_WORDS = 12
+PAGE_SIZE = 20
+
+
+def generate_todos(count: int, vocabulary: list[str], cum_weights: list[float]) -> Iterator[Todo]:
+    for _ in range(count):
+        words = random.choices(
+            vocabulary, cum_weights=cum_weights, k=TITLE_WORDS + DESCRIPTION_WORDS
+        )
+        yield Todo(title=" ".join(words[:TITLE_WORDS]), description=" ".join(words[TITLE_WORDS:]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--todos", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--words", type=int, default=50_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    vocabulary = [f"word{rank}" for rank in range(args.words)]
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(args.words)))
+
+    index = InMemoryTodoSearchIndex()
+    started = time.perf_counter()
+    index.rebuild(generate_todos(args.todos, vocabulary, cum_weights))
+    built = time.perf_counter() - started
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"indexed {len(index)} todos in {built:.1f} s, peak memory {peak_mb:.0f} MB")
+
+    queries = [
+        " ".join(random.choices(vocabulary, cum_weights=cum_weights, k=random.randint(1, 3)))
+        for _ in range(args.queries)
+    ]
+    timings: list[float] = []
+    for query in queries:
+        started = time.perf_counter()
+        index.search(query, 0, PAGE_SIZE + 1)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    centiles = statistics.quantiles(timings, n=100)
+    print(
+        f"search: p50 {centiles[49]:.3f} ms, p99 {centiles[98]:.3f} ms, max {max(timings):.3f} ms"
+    )
+    for query in ("word0", "word0 word1", "word0 word1 word2", vocabulary[-1]):
+        started = time.perf_counter()
+        index.search(query, 0, PAGE_SIZE + 1)
+        print(f"{query!r}: {(time.perf_counter() - started) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measure what turning fetched rows into domain `Todo` objects costs.
+
+Compares the old path, which built a pydantic `TodoDTO` per row and re-validated its
+id, with `TodoDataModel.to_domain()` going through `Todo.reconstitute`. Also reports
+the memory a list of todos holds, for the old dict-backed `Todo` and the slotted one.
+No database is needed; rows are built in memory.
+
+Usage:
+    uv run python benchmarks/todo_hydration.py [--rows 100000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from uuid_utils import uuid7
+
+from todo_api.domain.model.todo import TodoDTO
+from todo_api.infrastructure.repository.data_model.todo import TodoDataModel
+from todo_api.utils.uuid import UUID7, parse_uuid7
+
+
+class DictTodo:
+    """The previous `Todo` layout: the same attributes, without `__slots__`."""
+
+    def __init__(self, id: UUID7, title: str, description: str | None, completed: bool) -> None:
+        self._id = id
+        self._title = title
+        self._description = description
+        self._completed = completed
+
+
+def via_dto(row: TodoDataModel) -> DictTodo:
+    """The previous `TodoDataModel.to_domain` and `Todo.from_dto`."""
+    dto = TodoDTO(id=row.id, title=row.title, description=row.description, completed=row.completed)
+    return DictTodo(parse_uuid7(dto.id), dto.title, dto.description, dto.completed)
+
+
+def build_rows(count: int) -> list[TodoDataModel]:
+    return [
+        TodoDataModel(
+            id=str(uuid7()),
+            title=f"todo {index}",
+            description=None if index % 2 else "description",
+            completed=index % 3 == 0,
+        )
+        for index in range(count)
+    ]
+
+
+def time_per_row(rows: list[TodoDataModel], hydrate: Callable[[TodoDataModel], Any]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for row in rows:
+            hydrate(row)
+        best = min(best, time.perf_counter() - started)
+    return best / len(rows)
+
+
+def bytes_per_todo(rows: list[TodoDataModel], hydrate: Callable[[TodoDataModel], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        todos = [hydrate(row) for row in rows]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / len(todos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure what turning fetched rows into domain `Todo` objects costs."
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    print(f"{args.rows} rows")
+    print(f"{'path':<34}{'us/row':>10}{'bytes/todo':>14}")
+    for name, hydrate in (
+        ("TodoDTO + dict Todo (before)", via_dto),
+        ("reconstitute + slotted Todo", TodoDataModel.to_domain),
+    ):
+        per_row = time_per_row(rows, hydrate) * 1e6
+        print(f"{name:<34}{per_row:>10.2f}{bytes_per_todo(rows, hydrate):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Micro-benchmark the `UUID7` value type against the previous annotated-str UUID7.
+
+The previous type validated into a plain `uuid_utils.UUID`, so every `str()` formatted
+the id again. `UUID7` parses once and keeps its string and bytes forms.
+
+Usage:
+    uv run python benchmarks/uuid7_value.py [--number 200000]
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+from typing import Annotated, Any
+
+from pydantic import TypeAdapter
+from pydantic.functional_serializers import PlainSerializer
+from pydantic.functional_validators import AfterValidator
+from uuid_utils import UUID as UUIDUtils
+from uuid_utils import uuid7 as _uuid7
+
+from todo_api.utils.uuid import UUID7, parse_uuid7
+
+
+def previous_parse(value: str) -> UUIDUtils:
+    """The previous `parse_uuid7`."""
+    uuid_obj = UUIDUtils(value)
+    if uuid_obj.version != 7:
+        raise ValueError(f"Expected a UUID7, got UUID{uuid_obj.version}")
+    return uuid_obj
+
+
+PreviousUUID7 = Annotated[
+    str, AfterValidator(previous_parse), PlainSerializer(str, return_type=str)
+]
+
+
+def cases(text: str) -> list[tuple[str, Callable[[], Any], Callable[[], Any]]]:
+    previous, current = previous_parse(text), parse_uuid7(text)
+    previous_twin, current_twin = previous_parse(text), parse_uuid7(text)
+    previous_adapter, current_adapter = TypeAdapter(PreviousUUID7), TypeAdapter(UUID7)
+    return [
+        ("parse", lambda: previous_parse(text), lambda: parse_uuid7(text)),
+        ("str()", lambda: str(previous), lambda: str(current)),
+        (".bytes", lambda: previous.bytes, lambda: current.bytes),
+        ("==", lambda: previous == previous_twin, lambda: current == current_twin),
+        (
+            "pydantic path param",
+            lambda: previous_adapter.validate_python(text),
+            lambda: current_adapter.validate_python(text),
+        ),
+        (
+            "pydantic serialize",
+            lambda: previous_adapter.dump_python(previous),
+            lambda: current_adapter.dump_python(current),
+        ),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmark the `UUID7` value type against the annotated-str UUID7."
+    )
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'operation':<22}{'previous ns':>14}{'UUID7 ns':>12}")
+    for name, previous, current in cases(str(_uuid7())):
+        per_call = [
+            min(timeit.repeat(stmt, number=args.number, repeat=5)) / args.number * 1e9
+            for stmt in (previous, current)
+        ]
+        print(f"{name:<22}{per_call[0]:>14.0f}{per_call[1]:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,89 +1,428 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from os import environ
+from typing import Any
 
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from sqlalchemy import create_engine
+from fastapi.routing import APIRoute
+from sqlalchemy.engine import make_url
 
-from todo_api.application_service.usecase.create_todo_usecase import CreateTodoUsecaseImpl
-from todo_api.application_service.usecase.delete_todo_usecase import DeleteTodoUsecaseImpl
-from todo_api.application_service.usecase.get_all_todos_usecase import GetAllTodosUsecaseImpl
-from todo_api.application_service.usecase.get_todo_usecase import GetTodoUsecaseImpl
+from todo_api.application_service.usecase.create_todo_usecase import (
+    AsyncCreateTodoUsecaseImpl,
+    CreateTodoUsecaseImpl,
+)
+from todo_api.application_service.usecase.create_todos_usecase import CreateTodosUsecaseImpl
+from todo_api.application_service.usecase.delete_todo_usecase import (
+    AsyncDeleteTodoUsecaseImpl,
+    DeleteTodoUsecaseImpl,
+)
+from todo_api.application_service.usecase.delete_todos_usecase import DeleteTodosUsecaseImpl
+from todo_api.application_service.usecase.get_all_todos_usecase import (
+    AsyncGetAllTodosUsecaseImpl,
+    GetAllTodosUsecaseImpl,
+)
+from todo_api.application_service.usecase.get_todo_changes_usecase import (
+    AsyncGetTodoChangesUsecaseImpl,
+    GetTodoChangesUsecaseImpl,
+)
+from todo_api.application_service.usecase.get_todo_stats_usecase import (
+    AsyncGetTodoStatsUsecaseImpl,
+    GetTodoStatsUsecaseImpl,
+)
+from todo_api.application_service.usecase.get_todo_usecase import (
+    AsyncGetTodoUsecaseImpl,
+    GetTodoUsecaseImpl,
+)
 from todo_api.application_service.usecase.mark_as_completed_todo_usecase import (
+    AsyncMarkAsCompletedTodoUsecaseImpl,
     MarkAsCompletedTodoUsecaseImpl,
 )
+from todo_api.application_service.usecase.mark_as_completed_todos_usecase import (
+    MarkAsCompletedTodosUsecaseImpl,
+)
 from todo_api.application_service.usecase.mark_as_uncompleted_todo_usecase import (
+    AsyncMarkAsUncompletedTodoUsecaseImpl,
     MarkAsUncompletedTodoUsecaseImpl,
 )
-from todo_api.application_service.usecase.update_todo_usecase import UpdateTodoUsecaseImpl
+from todo_api.application_service.usecase.mark_as_uncompleted_todos_usecase import (
+    MarkAsUncompletedTodosUsecaseImpl,
+)
+from todo_api.application_service.usecase.search_todos_usecase import SearchTodosUsecaseImpl
+from todo_api.application_service.usecase.stream_todos_usecase import StreamTodosUsecaseImpl
+from todo_api.application_service.usecase.update_todo_usecase import (
+    AsyncUpdateTodoUsecaseImpl,
+    UpdateTodoUsecaseImpl,
+)
+from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.repository.todo_stats_repository import TodoStatsRepository
+from todo_api.infrastructure.database.in_memory_todo_store import InMemoryTodoStore
+from todo_api.infrastructure.database.pool_metrics import PoolMetrics, PoolStats
+from todo_api.infrastructure.database.settings import (
+    EngineSettings,
+    build_async_engine,
+    build_engine,
+)
+from todo_api.infrastructure.repository.async_context_provider import AsyncContextProviderImpl
+from todo_api.infrastructure.repository.async_todo_repository import AsyncTodoRepositoryImpl
+from todo_api.infrastructure.repository.async_todo_stats_repository import (
+    AsyncTodoStatsRepositoryImpl,
+)
+from todo_api.infrastructure.repository.caching_todo_repository import (
+    CacheEvictingTodoRepository,
+    CachingTodoRepository,
+    TodoCache,
+)
 from todo_api.infrastructure.repository.context_provider import ContextProviderImpl
+from todo_api.infrastructure.repository.in_memory_context_provider import InMemoryContextProvider
+from todo_api.infrastructure.repository.in_memory_todo_repository import InMemoryTodoRepository
+from todo_api.infrastructure.repository.in_memory_todo_stats_repository import (
+    InMemoryTodoStatsRepository,
+)
+from todo_api.infrastructure.repository.indexing_todo_repository import IndexingTodoRepository
 from todo_api.infrastructure.repository.todo_repository import TodoRepositoryImpl
+from todo_api.infrastructure.repository.todo_stats_repository import TodoStatsRepositoryImpl
+from todo_api.infrastructure.search.fulltext_todo_search_index import FulltextTodoSearchIndex
+from todo_api.infrastructure.search.in_memory_todo_search_index import InMemoryTodoSearchIndex
+from todo_api.infrastructure.service.async_transaction_service import AsyncTransactionServiceImpl
 from todo_api.infrastructure.service.transaction_service import TransactionServiceImpl
-from todo_api.presentation.handler.create_todo_handler import CreateTodoHandler
-from todo_api.presentation.handler.delete_todo_handler import DeleteTodoHandler
-from todo_api.presentation.handler.get_all_todos_handler import GetAllTodosHandler
-from todo_api.presentation.handler.get_todo_handler import GetTodoHandler
-from todo_api.presentation.handler.mark_as_completed_todo_handler import MarkAsCompletedTodoHandler
+from todo_api.presentation.handler.create_todo_handler import (
+    AsyncCreateTodoHandler,
+    CreateTodoHandler,
+)
+from todo_api.presentation.handler.create_todos_handler import CreateTodosHandler
+from todo_api.presentation.handler.delete_todo_handler import (
+    AsyncDeleteTodoHandler,
+    DeleteTodoHandler,
+)
+from todo_api.presentation.handler.delete_todos_handler import DeleteTodosHandler
+from todo_api.presentation.handler.get_all_todos_handler import (
+    AsyncGetAllTodosHandler,
+    GetAllTodosHandler,
+)
+from todo_api.presentation.handler.get_todo_changes_handler import (
+    AsyncGetTodoChangesHandler,
+    GetTodoChangesHandler,
+)
+from todo_api.presentation.handler.get_todo_handler import AsyncGetTodoHandler, GetTodoHandler
+from todo_api.presentation.handler.get_todo_stats_handler import (
+    AsyncGetTodoStatsHandler,
+    GetTodoStatsHandler,
+)
+from todo_api.presentation.handler.mark_as_completed_todo_handler import (
+    AsyncMarkAsCompletedTodoHandler,
+    MarkAsCompletedTodoHandler,
+)
+from todo_api.presentation.handler.mark_as_completed_todos_handler import (
+    MarkAsCompletedTodosHandler,
+)
 from todo_api.presentation.handler.mark_as_uncompleted_todo_handler import (
+    AsyncMarkAsUnCompletedTodoHandler,
     MarkAsUnCompletedTodoHandler,
 )
-from todo_api.presentation.handler.update_todo_handler import UpdateTodoHandler
+from todo_api.presentation.handler.mark_as_uncompleted_todos_handler import (
+    MarkAsUnCompletedTodosHandler,
+)
+from todo_api.presentation.handler.search_todos_handler import SearchTodosHandler
+from todo_api.presentation.handler.stream_todos_handler import StreamTodosHandler
+from todo_api.presentation.handler.update_todo_handler import (
+    AsyncUpdateTodoHandler,
+    UpdateTodoHandler,
+)
 from todo_api.presentation.middleware.error_handler import ErrorHandler
-from todo_api.presentation.middleware.session_middleware import SessionMiddleware
+from todo_api.presentation.middleware.session_middleware import (
+    AsyncSessionMiddleware,
+    SessionMiddleware,
+)
+from todo_api.presentation.router.async_todo_router import AsyncTodoRouterContainer
+from todo_api.presentation.router.async_todo_router import router as async_todo_router
+from todo_api.presentation.router.commit_early_route import (
+    async_commit_early_route,
+    commit_early_route,
+)
 from todo_api.presentation.router.todo_router import TodoRouterContainer
 from todo_api.presentation.router.todo_router import router as todo_router
+from todo_api.utils.lru_cache import CacheStats
 
-app = FastAPI()
+# Work to finish before the first request is served, run on a worker thread at startup.
+startup_tasks: list[Callable[[], None]] = []
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    for task in startup_tasks:
+        await run_in_threadpool(task)
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 DATABASE_URL = environ.get("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL environment variable is required")
-engine = create_engine(DATABASE_URL, echo=True)  # echo=True is for debugging
+# DATABASE_URL=memory:// keeps todos in this process instead of a database, on the sync
+# stack. They are lost on restart; it measures what the service costs without any I/O.
+USE_MEMORY_STORE = DATABASE_URL == "memory://"
+# A DATABASE_URL with an async driver (e.g. mysql+asyncmy://...) selects the async
+# stack. It serves the shared todo API; the batch, bulk and streaming endpoints are
+# only available on the sync stack.
+USE_ASYNC_STACK = not USE_MEMORY_STORE and make_url(DATABASE_URL).get_dialect().is_async
+# With TODO_COMMIT_EARLY=1 each request commits and returns its connection as soon as
+# the route returns, before the response model is validated and serialized.
+TODO_COMMIT_EARLY = environ.get("TODO_COMMIT_EARLY", "0") == "1"
+# With TODO_FAST_JSON=1 the read routes render JSON straight from the domain todos,
+# skipping the response model round trip. Install the fast-json extra to use orjson.
+TODO_FAST_JSON = environ.get("TODO_FAST_JSON", "0") == "1"
+# Comma-separated replica URLs (same driver as DATABASE_URL) that serve read-only use
+# cases. After a write the client is pinned to the primary for the read-your-writes window.
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in environ.get("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+]
+TODO_READ_YOUR_WRITES_SECONDS = (
+    float(environ.get("TODO_READ_YOUR_WRITES_SECONDS", "5")) if DATABASE_REPLICA_URLS else 0.0
+)
+# Pool sizing comes from DATABASE_POOL_* on top of the DATABASE_PROFILE defaults
+# ("production", or "debug" to log every statement).
+ENGINE_SETTINGS = EngineSettings.from_env(DATABASE_URL, environ)
+pool_metrics: dict[str, PoolMetrics] = {}
+if not USE_MEMORY_STORE:
+    pool_metrics = {"primary": PoolMetrics()} | {
+        f"replica-{index}": PoolMetrics() for index in range(len(DATABASE_REPLICA_URLS))
+    }
+todo_cache: TodoCache | None = None
 
-# Infrastructure layer services
-context_provider = ContextProviderImpl(engine=engine)
-todo_repository = TodoRepositoryImpl(context_provider=context_provider)
-transaction_service = TransactionServiceImpl(context_provider=context_provider)
+if USE_ASYNC_STACK:
+    async_engine = build_async_engine(ENGINE_SETTINGS, pool_metrics["primary"])
+    async_replica_engines = [
+        build_async_engine(ENGINE_SETTINGS.for_url(url), pool_metrics[f"replica-{index}"])
+        for index, url in enumerate(DATABASE_REPLICA_URLS)
+    ]
+    async_context_provider = AsyncContextProviderImpl(
+        engine=async_engine, replicas=async_replica_engines
+    )
+    async_todo_repository = AsyncTodoRepositoryImpl(context_provider=async_context_provider)
+    async_todo_stats_repository = AsyncTodoStatsRepositoryImpl(
+        context_provider=async_context_provider
+    )
+    async_transaction_service = AsyncTransactionServiceImpl(context_provider=async_context_provider)
 
-# Application layer use cases
-create_todo_usecase = CreateTodoUsecaseImpl(todo_repository=todo_repository)
-delete_todo_usecase = DeleteTodoUsecaseImpl(
-    todo_repository=todo_repository, transaction_service=transaction_service
-)
-get_all_todos_usecase = GetAllTodosUsecaseImpl(todo_repository=todo_repository)
-get_todo_usecase = GetTodoUsecaseImpl(todo_repository=todo_repository)
-mark_as_completed_todo_usecase = MarkAsCompletedTodoUsecaseImpl(
-    todo_repository=todo_repository, transaction_service=transaction_service
-)
-mark_as_uncompleted_todo_usecase = MarkAsUncompletedTodoUsecaseImpl(
-    todo_repository=todo_repository, transaction_service=transaction_service
-)
-update_todo_usecase = UpdateTodoUsecaseImpl(
-    todo_repository=todo_repository, transaction_service=transaction_service
-)
+    async_todo_router_container = AsyncTodoRouterContainer(
+        create_todo=AsyncCreateTodoHandler(
+            create_todo_usecase=AsyncCreateTodoUsecaseImpl(todo_repository=async_todo_repository)
+        ),
+        delete_todo=AsyncDeleteTodoHandler(
+            delete_todo_usecase=AsyncDeleteTodoUsecaseImpl(todo_repository=async_todo_repository)
+        ),
+        get_all_todos=AsyncGetAllTodosHandler(
+            get_all_todos_usecase=AsyncGetAllTodosUsecaseImpl(
+                todo_repository=async_todo_repository,
+                transaction_service=async_transaction_service,
+            )
+        ),
+        get_todo=AsyncGetTodoHandler(
+            get_todo_usecase=AsyncGetTodoUsecaseImpl(
+                todo_repository=async_todo_repository,
+                transaction_service=async_transaction_service,
+            )
+        ),
+        get_todo_changes=AsyncGetTodoChangesHandler(
+            get_todo_changes_usecase=AsyncGetTodoChangesUsecaseImpl(
+                todo_repository=async_todo_repository,
+                transaction_service=async_transaction_service,
+            )
+        ),
+        get_todo_stats=AsyncGetTodoStatsHandler(
+            get_todo_stats_usecase=AsyncGetTodoStatsUsecaseImpl(
+                todo_stats_repository=async_todo_stats_repository,
+                transaction_service=async_transaction_service,
+            )
+        ),
+        mark_as_completed_todo=AsyncMarkAsCompletedTodoHandler(
+            mark_as_completed_usecase=AsyncMarkAsCompletedTodoUsecaseImpl(
+                todo_repository=async_todo_repository
+            )
+        ),
+        mark_as_uncompleted_todo=AsyncMarkAsUnCompletedTodoHandler(
+            mark_as_uncompleted_usecase=AsyncMarkAsUncompletedTodoUsecaseImpl(
+                todo_repository=async_todo_repository
+            )
+        ),
+        update_todo=AsyncUpdateTodoHandler(
+            update_todo_usecase=AsyncUpdateTodoUsecaseImpl(
+                todo_repository=async_todo_repository,
+                transaction_service=async_transaction_service,
+            )
+        ),
+    )
 
-# Presentation layer handlers
-create_todo_handler = CreateTodoHandler(create_todo_usecase=create_todo_usecase)
-delete_todo_handler = DeleteTodoHandler(delete_todo_usecase=delete_todo_usecase)
-get_all_todos_handler = GetAllTodosHandler(get_all_todos_usecase=get_all_todos_usecase)
-get_todo_handler = GetTodoHandler(get_todo_usecase=get_todo_usecase)
-mark_as_completed_todo_handler = MarkAsCompletedTodoHandler(
-    mark_as_completed_usecase=mark_as_completed_todo_usecase
-)
-mark_as_uncompleted_todo_handler = MarkAsUnCompletedTodoHandler(
-    mark_as_uncompleted_usecase=mark_as_uncompleted_todo_usecase
-)
-update_todo_handler = UpdateTodoHandler(update_todo_usecase=update_todo_usecase)
+    app.add_middleware(
+        AsyncSessionMiddleware,
+        context_provider=async_context_provider,
+        read_your_writes_seconds=TODO_READ_YOUR_WRITES_SECONDS,
+    )
+    async_route_class = (
+        async_commit_early_route(async_context_provider) if TODO_COMMIT_EARLY else APIRoute
+    )
+    app.include_router(
+        async_todo_router(async_todo_router_container, async_route_class, fast_json=TODO_FAST_JSON)
+    )
+else:
+    TODO_CACHE_SIZE = int(environ.get("TODO_CACHE_SIZE", "0"))  # 0 disables the cache
+    TODO_CACHE_TTL_SECONDS = float(environ.get("TODO_CACHE_TTL_SECONDS", "30"))
+    # "fulltext" searches MySQL's FULLTEXT index. "memory" searches an inverted index held
+    # in this process, built at startup and updated by this process's own writes.
+    TODO_SEARCH_INDEX = environ.get(
+        "TODO_SEARCH_INDEX", "memory" if USE_MEMORY_STORE else "fulltext"
+    )
+    if TODO_SEARCH_INDEX not in ("fulltext", "memory"):
+        raise RuntimeError(
+            f"TODO_SEARCH_INDEX must be 'fulltext' or 'memory', got {TODO_SEARCH_INDEX!r}"
+        )
 
-# Router registration
-todo_router_container = TodoRouterContainer(
-    create_todo=create_todo_handler,
-    delete_todo=delete_todo_handler,
-    get_all_todos=get_all_todos_handler,
-    get_todo=get_todo_handler,
-    mark_as_completed_todo=mark_as_completed_todo_handler,
-    mark_as_uncompleted_todo=mark_as_uncompleted_todo_handler,
-    update_todo=update_todo_handler,
-)
+    # Infrastructure layer services
+    context_provider: ContextProvider[Any]
+    todo_repository: TodoRepository
+    todo_stats_repository: TodoStatsRepository
+    if USE_MEMORY_STORE:
+        context_provider = InMemoryContextProvider(store=InMemoryTodoStore())
+        todo_repository = InMemoryTodoRepository(context_provider=context_provider)
+        todo_stats_repository = InMemoryTodoStatsRepository(context_provider=context_provider)
+    else:
+        engine = build_engine(ENGINE_SETTINGS, pool_metrics["primary"])
+        replica_engines = [
+            build_engine(ENGINE_SETTINGS.for_url(url), pool_metrics[f"replica-{index}"])
+            for index, url in enumerate(DATABASE_REPLICA_URLS)
+        ]
+        context_provider = ContextProviderImpl(engine=engine, replicas=replica_engines)
+        todo_repository = TodoRepositoryImpl(context_provider=context_provider)
+        todo_stats_repository = TodoStatsRepositoryImpl(context_provider=context_provider)
+    if TODO_SEARCH_INDEX == "memory":
+        in_memory_search_index = InMemoryTodoSearchIndex()
+        todo_search_index = in_memory_search_index
+        todo_repository = IndexingTodoRepository(
+            todo_repository, index=in_memory_search_index, context_provider=context_provider
+        )
+        indexed_todo_repository = todo_repository
+
+        def build_search_index() -> None:
+            # Rows stream through a server-side cursor, 1000 at a time. Read from the
+            # primary: todos a lagging replica is missing would stay unsearchable.
+            with context_provider.transaction():
+                in_memory_search_index.rebuild(indexed_todo_repository.iter_all(1000))
+
+        startup_tasks.append(build_search_index)
+    elif isinstance(context_provider, ContextProviderImpl):
+        todo_search_index = FulltextTodoSearchIndex(context_provider=context_provider)
+    else:
+        raise RuntimeError("TODO_SEARCH_INDEX=fulltext needs MySQL, not DATABASE_URL=memory://")
+    get_todo_repository = todo_repository
+    # The in-memory store answers faster than the cache would.
+    if TODO_CACHE_SIZE > 0 and isinstance(context_provider, ContextProviderImpl):
+        todo_cache = TodoCache(
+            context_provider=context_provider,
+            max_size=TODO_CACHE_SIZE,
+            ttl_seconds=TODO_CACHE_TTL_SECONDS,
+        )
+        # Only GET /todos/{id} reads through the cache. Use cases that change a todo read
+        # it from the database, so a stale entry is never saved back over newer changes.
+        get_todo_repository = CachingTodoRepository(todo_repository, cache=todo_cache)
+        todo_repository = CacheEvictingTodoRepository(todo_repository, cache=todo_cache)
+    transaction_service = TransactionServiceImpl(context_provider=context_provider)
+
+    # Application layer use cases
+    create_todo_usecase = CreateTodoUsecaseImpl(todo_repository=todo_repository)
+    create_todos_usecase = CreateTodosUsecaseImpl(todo_repository=todo_repository)
+    delete_todo_usecase = DeleteTodoUsecaseImpl(todo_repository=todo_repository)
+    delete_todos_usecase = DeleteTodosUsecaseImpl(
+        todo_repository=todo_repository, transaction_service=transaction_service
+    )
+    get_all_todos_usecase = GetAllTodosUsecaseImpl(
+        todo_repository=todo_repository, transaction_service=transaction_service
+    )
+    get_todo_usecase = GetTodoUsecaseImpl(
+        todo_repository=get_todo_repository, transaction_service=transaction_service
+    )
+    get_todo_changes_usecase = GetTodoChangesUsecaseImpl(
+        todo_repository=todo_repository, transaction_service=transaction_service
+    )
+    get_todo_stats_usecase = GetTodoStatsUsecaseImpl(
+        todo_stats_repository=todo_stats_repository, transaction_service=transaction_service
+    )
+    mark_as_completed_todo_usecase = MarkAsCompletedTodoUsecaseImpl(todo_repository=todo_repository)
+    mark_as_completed_todos_usecase = MarkAsCompletedTodosUsecaseImpl(
+        todo_repository=todo_repository, transaction_service=transaction_service
+    )
+    mark_as_uncompleted_todo_usecase = MarkAsUncompletedTodoUsecaseImpl(
+        todo_repository=todo_repository
+    )
+    mark_as_uncompleted_todos_usecase = MarkAsUncompletedTodosUsecaseImpl(
+        todo_repository=todo_repository, transaction_service=transaction_service
+    )
+    search_todos_usecase = SearchTodosUsecaseImpl(
+        todo_search_index=todo_search_index,
+        todo_repository=todo_repository,
+        transaction_service=transaction_service,
+    )
+    stream_todos_usecase = StreamTodosUsecaseImpl(todo_repository=todo_repository)
+    update_todo_usecase = UpdateTodoUsecaseImpl(
+        todo_repository=todo_repository, transaction_service=transaction_service
+    )
+
+    # Presentation layer handlers
+    create_todo_handler = CreateTodoHandler(create_todo_usecase=create_todo_usecase)
+    create_todos_handler = CreateTodosHandler(create_todos_usecase=create_todos_usecase)
+    delete_todo_handler = DeleteTodoHandler(delete_todo_usecase=delete_todo_usecase)
+    delete_todos_handler = DeleteTodosHandler(delete_todos_usecase=delete_todos_usecase)
+    get_all_todos_handler = GetAllTodosHandler(get_all_todos_usecase=get_all_todos_usecase)
+    get_todo_handler = GetTodoHandler(get_todo_usecase=get_todo_usecase)
+    get_todo_changes_handler = GetTodoChangesHandler(
+        get_todo_changes_usecase=get_todo_changes_usecase
+    )
+    get_todo_stats_handler = GetTodoStatsHandler(get_todo_stats_usecase=get_todo_stats_usecase)
+    mark_as_completed_todo_handler = MarkAsCompletedTodoHandler(
+        mark_as_completed_usecase=mark_as_completed_todo_usecase
+    )
+    mark_as_completed_todos_handler = MarkAsCompletedTodosHandler(
+        mark_as_completed_todos_usecase=mark_as_completed_todos_usecase
+    )
+    mark_as_uncompleted_todo_handler = MarkAsUnCompletedTodoHandler(
+        mark_as_uncompleted_usecase=mark_as_uncompleted_todo_usecase
+    )
+    mark_as_uncompleted_todos_handler = MarkAsUnCompletedTodosHandler(
+        mark_as_uncompleted_todos_usecase=mark_as_uncompleted_todos_usecase
+    )
+    search_todos_handler = SearchTodosHandler(search_todos_usecase=search_todos_usecase)
+    stream_todos_handler = StreamTodosHandler(stream_todos_usecase=stream_todos_usecase)
+    update_todo_handler = UpdateTodoHandler(update_todo_usecase=update_todo_usecase)
+
+    # Router registration
+    todo_router_container = TodoRouterContainer(
+        create_todo=create_todo_handler,
+        create_todos=create_todos_handler,
+        delete_todo=delete_todo_handler,
+        delete_todos=delete_todos_handler,
+        get_all_todos=get_all_todos_handler,
+        get_todo=get_todo_handler,
+        get_todo_changes=get_todo_changes_handler,
+        get_todo_stats=get_todo_stats_handler,
+        mark_as_completed_todo=mark_as_completed_todo_handler,
+        mark_as_completed_todos=mark_as_completed_todos_handler,
+        mark_as_uncompleted_todo=mark_as_uncompleted_todo_handler,
+        mark_as_uncompleted_todos=mark_as_uncompleted_todos_handler,
+        search_todos=search_todos_handler,
+        stream_todos=stream_todos_handler,
+        update_todo=update_todo_handler,
+    )
+
+    app.add_middleware(
+        SessionMiddleware,
+        context_provider=context_provider,
+        read_your_writes_seconds=TODO_READ_YOUR_WRITES_SECONDS,
+    )
+    route_class = commit_early_route(context_provider) if TODO_COMMIT_EARLY else APIRoute
+    app.include_router(todo_router(todo_router_container, route_class, fast_json=TODO_FAST_JSON))
 
 
 @app.exception_handler(RequestValidationError)
@@ -100,12 +439,21 @@ async def validation_exception_handler(
     return JSONResponse(status_code=400, content={"code": "400", "message": str(exc)})
 
 
-app.add_middleware(SessionMiddleware, context_provider=context_provider)
 app.add_middleware(ErrorHandler)
 
-app.include_router(todo_router(todo_router_container))
-
 
 @app.get("/healthcheck")
 def healthcheck():
     return "OK"
+
+
+@app.get("/internal/pool", include_in_schema=False)
+def pool_stats() -> dict[str, PoolStats]:
+    """Connection pool counters per engine, for telling pool exhaustion apart from slow SQL."""
+    return {name: metrics.stats() for name, metrics in pool_metrics.items()}
+
+
+@app.get("/internal/cache", include_in_schema=False)
+def cache_stats() -> dict[str, CacheStats]:
+    """Todo cache counters, empty while the cache is off."""
+    return {} if todo_cache is None else {"todos": todo_cache.stats()}
@@ -0,0 +1,77 @@
+"""Add the todo_stats counters to a database created before them, and fill them in.
+
+The counters start at zero, and the triggers that keep them only see writes made after
+they exist, so the todos already there must be counted once. This script:
+
+1. creates the ``todo_stats`` table and the ``todos_count_*`` triggers if they are
+   missing, and
+2. recounts the todos in one transaction: it empties ``todo_stats`` and stores the count
+   of ``todos`` in a single slot.
+
+The API keeps serving throughout. The triggers are in place before the recount, so a
+write either commits before the recount reads the todos (and is counted by it) or waits
+for the recount to commit and then adds to the new counts.
+
+Run it again whenever the counts may have drifted, e.g. after ``TRUNCATE TABLE todos``,
+which fires no triggers.
+
+Usage:
+    DATABASE_URL=... uv run python scripts/migrate_add_todo_stats.py
+"""
+
+import logging
+from os import environ
+
+from sqlalchemy import Engine, create_engine, text
+
+from todo_api.infrastructure.repository.data_model.todo_stats import COUNT_TRIGGERS
+
+logger = logging.getLogger("migrate_add_todo_stats")
+
+
+def install(engine: Engine) -> None:
+    with engine.begin() as connection:
+        # As in db/init.sql.
+        connection.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS todo_stats ("
+                "slot SMALLINT PRIMARY KEY, "
+                "total BIGINT NOT NULL DEFAULT 0, "
+                "completed BIGINT NOT NULL DEFAULT 0)"
+            )
+        )
+        for trigger in COUNT_TRIGGERS:
+            connection.execute(text(trigger))
+
+
+def recount(engine: Engine) -> tuple[int, int]:
+    """Replace the counts with those of the todos table and return them."""
+    with engine.begin() as connection:
+        # FOR SHARE waits for writers already under way and holds off new ones. They lock
+        # their todo before the trigger locks a counter row, and so does this, so the
+        # two cannot deadlock.
+        total, completed = connection.execute(
+            text("SELECT COUNT(*), COALESCE(SUM(completed), 0) FROM todos FOR SHARE")
+        ).one()
+        connection.execute(text("DELETE FROM todo_stats"))
+        connection.execute(
+            text("INSERT INTO todo_stats (slot, total, completed) VALUES (0, :total, :completed)"),
+            {"total": total, "completed": completed},
+        )
+    return int(total), int(completed)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    database_url = environ.get("DATABASE_URL")
+    if not database_url:
+        raise RuntimeError("DATABASE_URL environment variable is required")
+    engine = create_engine(database_url)
+
+    install(engine)
+    total, completed = recount(engine)
+    logger.info("Counted %d todos, %d of them completed", total, completed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Migrate todos.id from CHAR(36) to BINARY(16) without taking the table offline.
+
+The migration runs in two phases so that the long-running part never blocks writers:
+
+1. ``backfill`` (default): add a nullable ``id_bin`` column to ``todos`` and
+   ``todo_tombstones``, keep it populated for new rows with a BEFORE INSERT trigger, and
+   copy existing ids over in small keyset-ordered batches, each in its own short
+   transaction. The API keeps serving reads and writes throughout.
+2. ``--cutover``: copy any stragglers, then swap ``id_bin`` in as the primary key of each
+   table with one in-place rebuild and drop its trigger. Writes must be paused for this
+   phase: between the end of a rebuild and the trigger drop, the trigger still names
+   ``id_bin``, which no longer exists, so every insert into that table fails; and an API
+   running with ``TODO_ID_STORAGE=char`` cannot write to a swapped table at all.
+
+Stop every writer (scale the API down or put it in maintenance mode), run the cutover,
+then start the API with ``TODO_ID_STORAGE=binary``. Reads keep working until the
+``todos`` rebuild ends.
+
+Usage:
+    DATABASE_URL=... uv run python scripts/migrate_todo_id_to_binary.py [--batch-size N]
+    DATABASE_URL=... uv run python scripts/migrate_todo_id_to_binary.py --cutover
+"""
+
+import argparse
+import logging
+import time
+from os import environ
+
+from sqlalchemy import Connection, Engine, create_engine, text
+
+logger = logging.getLogger("migrate_todo_id_to_binary")
+
+TABLES = ("todos", "todo_tombstones")
+
+
+def _trigger_name(table: str) -> str:
+    return f"{table}_id_bin_before_insert"
+
+
+def _table_exists(connection: Connection, table: str) -> bool:
+    return (
+        connection.execute(
+            text(
+                "SELECT COUNT(*) FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = :table"
+            ),
+            {"table": table},
+        ).scalar_one()
+        > 0
+    )
+
+
+def _column_exists(connection: Connection, table: str, column: str) -> bool:
+    return (
+        connection.execute(
+            text(
+                "SELECT COUNT(*) FROM information_schema.columns "
+                "WHERE table_schema = DATABASE() AND table_name = :table "
+                "AND column_name = :column"
+            ),
+            {"table": table, "column": column},
+        ).scalar_one()
+        > 0
+    )
+
+
+def _existing_tables(engine: Engine) -> list[str]:
+    with engine.connect() as connection:
+        return [table for table in TABLES if _table_exists(connection, table)]
+
+
+def prepare(engine: Engine, table: str) -> None:
+    with engine.begin() as connection:
+        if not _column_exists(connection, table, "id_bin"):
+            logger.info("Adding %s.id_bin", table)
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN id_bin BINARY(16) NULL"))
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {_trigger_name(table)}"))
+        connection.execute(
+            text(
+                f"CREATE TRIGGER {_trigger_name(table)} BEFORE INSERT ON {table} FOR EACH ROW "
+                "SET NEW.id_bin = UUID_TO_BIN(NEW.id)"
+            )
+        )
+
+
+def backfill(engine: Engine, table: str, batch_size: int, pause: float) -> int:
+    """Copy ids batch by batch in primary-key order and return the number of rows updated."""
+    last_id = ""
+    updated = 0
+    while True:
+        with engine.begin() as connection:
+            ids = (
+                connection.execute(
+                    text(f"SELECT id FROM {table} WHERE id > :last_id ORDER BY id LIMIT :limit"),
+                    {"last_id": last_id, "limit": batch_size},
+                )
+                .scalars()
+                .all()
+            )
+            if not ids:
+                break
+            result = connection.execute(
+                text(
+                    f"UPDATE {table} SET id_bin = UUID_TO_BIN(id) "
+                    "WHERE id > :last_id AND id <= :upper_id AND id_bin IS NULL"
+                ),
+                {"last_id": last_id, "upper_id": ids[-1]},
+            )
+            updated += result.rowcount
+            last_id = ids[-1]
+        logger.info("Backfilled %s up to %s (%d rows so far)", table, last_id, updated)
+        if pause:
+            time.sleep(pause)
+    return updated
+
+
+def cutover(engine: Engine, table: str) -> None:
+    with engine.begin() as connection:
+        if not _column_exists(connection, table, "id_bin"):
+            raise RuntimeError(f"Run the backfill phase for {table} before --cutover")
+        connection.execute(
+            text(f"UPDATE {table} SET id_bin = UUID_TO_BIN(id) WHERE id_bin IS NULL")
+        )
+    # ALTER TABLE commits on its own, so the trigger can only be dropped after the swap. In
+    # between it names a column that is gone and inserts fail; writers must be paused.
+    with engine.begin() as connection:
+        logger.info("Swapping the primary key of %s to BINARY(16)", table)
+        connection.execute(
+            text(
+                f"ALTER TABLE {table} "
+                "DROP PRIMARY KEY, "
+                "DROP COLUMN id, "
+                "CHANGE COLUMN id_bin id BINARY(16) NOT NULL FIRST, "
+                "ADD PRIMARY KEY (id), "
+                "ALGORITHM=INPLACE, LOCK=NONE"
+            )
+        )
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {_trigger_name(table)}"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Migrate todos.id from CHAR(36) to BINARY(16) without taking the table offline."
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds to sleep per batch")
+    parser.add_argument("--cutover", action="store_true", help="swap the primary key")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    database_url = environ.get("DATABASE_URL")
+    if not database_url:
+        raise RuntimeError("DATABASE_URL environment variable is required")
+    engine = create_engine(database_url)
+
+    if args.cutover:
+        logger.info("Cutting over; writes to the todos must be paused until this ends")
+    for table in _existing_tables(engine):
+        if args.cutover:
+            cutover(engine, table)
+        else:
+            prepare(engine, table)
+            updated = backfill(engine, table, args.batch_size, args.pause)
+            logger.info("Backfill of %s finished: %d rows", table, updated)
+    if args.cutover:
+        logger.info("Restart the API with TODO_ID_STORAGE=binary now")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
 T = TypeVar("T")
@@ -9,3 +9,17 @@ class TransactionService(ABC):
     @abstractmethod
     def Run(self, func: Callable[[], T]) -> T:
         pass
+
+    @abstractmethod
+    def RunReadOnly(self, func: Callable[[], T]) -> T:
+        """Run `func` in a transaction that only reads, so a replica may serve it."""
+
+
+class AsyncTransactionService(ABC):
+    @abstractmethod
+    async def Run(self, func: Callable[[], Awaitable[T]]) -> T:
+        pass
+
+    @abstractmethod
+    async def RunReadOnly(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Run `func` in a transaction that only reads, so a replica may serve it."""
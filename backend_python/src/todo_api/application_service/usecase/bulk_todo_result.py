@@ -0,0 +1,27 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict
+
+from todo_api.utils.uuid import UUID7
+
+
+class BulkTodoOutcome(StrEnum):
+    UPDATED = "updated"
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+    UNCHANGED = "unchanged"
+
+
+class BulkTodoResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    id: UUID7
+    outcome: BulkTodoOutcome
+
+
+def unique_ids(ids: list[UUID7]) -> list[UUID7]:
+    """Drop repeated ids, keeping the first occurrence of each."""
+    seen: dict[str, UUID7] = {}
+    for todo_id in ids:
+        seen.setdefault(str(todo_id), todo_id)
+    return list(seen.values())
@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from pydantic import BaseModel, ConfigDict
 
 from todo_api.domain.model.todo import Todo
-from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository, TodoRepository
 
 
 class CreateTodoUsecaseInput(BaseModel):
@@ -33,5 +33,21 @@ class CreateTodoUsecaseImpl(CreateTodoUsecase):
 
     def execute(self, input_dto: CreateTodoUsecaseInput) -> CreateTodoUsecaseOutput:
         todo = Todo(title=input_dto.title, description=input_dto.description)
-        self.todo_repository.save(todo)
+        self.todo_repository.add(todo)
+        return CreateTodoUsecaseOutput(todo=todo)
+
+
+class AsyncCreateTodoUsecase(ABC):
+    @abstractmethod
+    async def execute(self, input_dto: CreateTodoUsecaseInput) -> CreateTodoUsecaseOutput:
+        pass
+
+
+class AsyncCreateTodoUsecaseImpl(AsyncCreateTodoUsecase):
+    def __init__(self, todo_repository: AsyncTodoRepository) -> None:
+        self.todo_repository = todo_repository
+
+    async def execute(self, input_dto: CreateTodoUsecaseInput) -> CreateTodoUsecaseOutput:
+        todo = Todo(title=input_dto.title, description=input_dto.description)
+        await self.todo_repository.add(todo)
         return CreateTodoUsecaseOutput(todo=todo)
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel, ConfigDict
+
+from todo_api.application_service.usecase.create_todo_usecase import CreateTodoUsecaseInput
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.repository.todo_repository import TodoRepository
+
+
+class CreateTodosUsecaseInput(BaseModel):
+    items: list[CreateTodoUsecaseInput]
+
+
+class CreateTodosUsecaseOutput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    todos: list[Todo]
+
+
+class CreateTodosUsecase(ABC):
+    @abstractmethod
+    def execute(self, input_dto: CreateTodosUsecaseInput) -> CreateTodosUsecaseOutput:
+        pass
+
+
+class CreateTodosUsecaseImpl(CreateTodosUsecase):
+    def __init__(self, todo_repository: TodoRepository) -> None:
+        """
+        Every todo is built before anything is written, and all of them are inserted
+        through a single repository call inside the request's transaction, so the
+        batch is stored completely or not at all.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(self, input_dto: CreateTodosUsecaseInput) -> CreateTodosUsecaseOutput:
+        todos = [Todo(title=item.title, description=item.description) for item in input_dto.items]
+        self.todo_repository.add_all(todos)
+        return CreateTodosUsecaseOutput(todos=todos)
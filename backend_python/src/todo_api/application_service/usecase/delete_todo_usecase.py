@@ -2,8 +2,7 @@ from abc import ABC, abstractmethod
 
 from pydantic import BaseModel, ConfigDict
 
-from todo_api.application_service.service.transaction_service import TransactionService
-from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository, TodoRepository
 from todo_api.utils.uuid import UUID7
 
 
@@ -23,16 +22,29 @@ class DeleteTodoUsecase(ABC):
 
 
 class DeleteTodoUsecaseImpl(DeleteTodoUsecase):
-    def __init__(
-        self, todo_repository: TodoRepository, transaction_service: TransactionService
-    ) -> None:
+    def __init__(self, todo_repository: TodoRepository) -> None:
+        """
+        Deleting is a single statement that also reports whether the todo existed, so
+        like CreateTodoUsecaseImpl we leave the transaction to the session layer
+        instead of paying for a SAVEPOINT round trip.
+        """
         self.todo_repository = todo_repository
-        self.transaction_service = transaction_service
 
     def execute(self, input_dto: DeleteTodoUsecaseInput) -> DeleteTodoUsecaseOutput:
-        def func() -> DeleteTodoUsecaseOutput:
-            todo = self.todo_repository.find_by_id(input_dto.id)
-            self.todo_repository.delete(todo)
-            return DeleteTodoUsecaseOutput()
+        self.todo_repository.delete_by_id(input_dto.id)
+        return DeleteTodoUsecaseOutput()
 
-        return self.transaction_service.Run(func)
+
+class AsyncDeleteTodoUsecase(ABC):
+    @abstractmethod
+    async def execute(self, input_dto: DeleteTodoUsecaseInput) -> DeleteTodoUsecaseOutput:
+        pass
+
+
+class AsyncDeleteTodoUsecaseImpl(AsyncDeleteTodoUsecase):
+    def __init__(self, todo_repository: AsyncTodoRepository) -> None:
+        self.todo_repository = todo_repository
+
+    async def execute(self, input_dto: DeleteTodoUsecaseInput) -> DeleteTodoUsecaseOutput:
+        await self.todo_repository.delete_by_id(input_dto.id)
+        return DeleteTodoUsecaseOutput()
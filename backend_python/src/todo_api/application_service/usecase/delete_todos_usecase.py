@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel, ConfigDict
+
+from todo_api.application_service.service.transaction_service import TransactionService
+from todo_api.application_service.usecase.bulk_todo_result import (
+    BulkTodoOutcome,
+    BulkTodoResult,
+    unique_ids,
+)
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.utils.uuid import UUID7
+
+
+class DeleteTodosUsecaseInput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    ids: list[UUID7]
+
+
+class DeleteTodosUsecaseOutput(BaseModel):
+    results: list[BulkTodoResult]
+
+
+class DeleteTodosUsecase(ABC):
+    @abstractmethod
+    def execute(self, input_dto: DeleteTodosUsecaseInput) -> DeleteTodosUsecaseOutput:
+        pass
+
+
+class DeleteTodosUsecaseImpl(DeleteTodosUsecase):
+    def __init__(
+        self, todo_repository: TodoRepository, transaction_service: TransactionService
+    ) -> None:
+        self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
+
+    def execute(self, input_dto: DeleteTodosUsecaseInput) -> DeleteTodosUsecaseOutput:
+        def func() -> DeleteTodosUsecaseOutput:
+            ids = unique_ids(input_dto.ids)
+            existing = {
+                str(todo.id) for todo in self.todo_repository.find_by_ids(ids, for_update=True)
+            }
+            found = [todo_id for todo_id in ids if str(todo_id) in existing]
+            results = [
+                BulkTodoResult(
+                    id=todo_id,
+                    outcome=BulkTodoOutcome.DELETED
+                    if str(todo_id) in existing
+                    else BulkTodoOutcome.NOT_FOUND,
+                )
+                for todo_id in ids
+            ]
+
+            if found:
+                self.todo_repository.delete_many(found)
+            return DeleteTodosUsecaseOutput(results=results)
+
+        return self.transaction_service.Run(func)
@@ -2,18 +2,47 @@ from abc import ABC, abstractmethod
 
 from pydantic import BaseModel, ConfigDict
 
+from todo_api.application_service.service.transaction_service import (
+    AsyncTransactionService,
+    TransactionService,
+)
 from todo_api.domain.model.todo import Todo
-from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository, TodoRepository
+from todo_api.utils.uuid import UUID7
+
+# In `known_versions`, stands for every version, as `*` does in `If-None-Match`.
+ANY_VERSION = "*"
+
+
+def is_known_version(version: str | None, known_versions: frozenset[str]) -> bool:
+    """Whether `version` is one of `known_versions`; a None version is never known."""
+    if version is None:
+        return False
+    return version in known_versions or ANY_VERSION in known_versions
 
 
 class GetAllTodosUsecaseInput(BaseModel):
-    pass
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    after_id: UUID7 | None = None
+    limit: int | None = None
+    # Versions the caller already holds the full list for; see `GetAllTodosUsecaseOutput`.
+    known_versions: frozenset[str] = frozenset()
+    # Filters and sort order. A query carries its own keyset position, so `after_id` is
+    # ignored, and its list is never versioned.
+    query: TodoQuery | None = None
 
 
 class GetAllTodosUsecaseOutput(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     todos: list[Todo]
+    next_after_id: UUID7 | None = None
+    # Only the full list (no `limit`) is versioned. When `not_modified` is set the version
+    # is one of `known_versions` and `todos` is empty: nothing was loaded.
+    version: str | None = None
+    not_modified: bool = False
 
 
 class GetAllTodosUsecase(ABC):
@@ -23,9 +52,82 @@ class GetAllTodosUsecase(ABC):
 
 
 class GetAllTodosUsecaseImpl(GetAllTodosUsecase):
-    def __init__(self, todo_repository: TodoRepository) -> None:
+    def __init__(
+        self, todo_repository: TodoRepository, transaction_service: TransactionService
+    ) -> None:
         self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
 
     def execute(self, input_dto: GetAllTodosUsecaseInput) -> GetAllTodosUsecaseOutput:
-        todos = self.todo_repository.find_all()
+        def func() -> GetAllTodosUsecaseOutput:
+            if input_dto.query is not None:
+                limit = input_dto.limit
+                todos = self.todo_repository.find_by_query(
+                    input_dto.query, None if limit is None else limit + 1
+                )
+                return _to_page(todos, limit)
+
+            if input_dto.limit is None:
+                # Versioning scans the table, so only the full list, which does anyway, gets it.
+                # A conditional request checks the version on its own first, so a match loads
+                # no rows; otherwise the version comes with the rows.
+                if input_dto.known_versions:
+                    version = self.todo_repository.list_version()
+                    if is_known_version(version, input_dto.known_versions):
+                        return GetAllTodosUsecaseOutput(
+                            todos=[], version=version, not_modified=True
+                        )
+                todos, version = self.todo_repository.find_all_with_version()
+                return GetAllTodosUsecaseOutput(todos=todos, version=version)
+
+            # Fetch one extra row so we know whether another page exists without a COUNT.
+            todos = self.todo_repository.find_page(input_dto.after_id, input_dto.limit + 1)
+            return _to_page(todos, input_dto.limit)
+
+        return self.transaction_service.RunReadOnly(func)
+
+
+class AsyncGetAllTodosUsecase(ABC):
+    @abstractmethod
+    async def execute(self, input_dto: GetAllTodosUsecaseInput) -> GetAllTodosUsecaseOutput:
+        pass
+
+
+class AsyncGetAllTodosUsecaseImpl(AsyncGetAllTodosUsecase):
+    def __init__(
+        self, todo_repository: AsyncTodoRepository, transaction_service: AsyncTransactionService
+    ) -> None:
+        self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
+
+    async def execute(self, input_dto: GetAllTodosUsecaseInput) -> GetAllTodosUsecaseOutput:
+        async def func() -> GetAllTodosUsecaseOutput:
+            if input_dto.query is not None:
+                limit = input_dto.limit
+                todos = await self.todo_repository.find_by_query(
+                    input_dto.query, None if limit is None else limit + 1
+                )
+                return _to_page(todos, limit)
+
+            if input_dto.limit is None:
+                if input_dto.known_versions:
+                    version = await self.todo_repository.list_version()
+                    if is_known_version(version, input_dto.known_versions):
+                        return GetAllTodosUsecaseOutput(
+                            todos=[], version=version, not_modified=True
+                        )
+                todos, version = await self.todo_repository.find_all_with_version()
+                return GetAllTodosUsecaseOutput(todos=todos, version=version)
+
+            todos = await self.todo_repository.find_page(input_dto.after_id, input_dto.limit + 1)
+            return _to_page(todos, input_dto.limit)
+
+        return await self.transaction_service.RunReadOnly(func)
+
+
+def _to_page(todos: list[Todo], limit: int | None) -> GetAllTodosUsecaseOutput:
+    if limit is None or len(todos) <= limit:
         return GetAllTodosUsecaseOutput(todos=todos)
+
+    page = todos[:limit]
+    return GetAllTodosUsecaseOutput(todos=page, next_after_id=page[-1].id)
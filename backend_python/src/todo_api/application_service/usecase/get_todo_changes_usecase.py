@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from todo_api.application_service.service.transaction_service import (
+    AsyncTransactionService,
+    TransactionService,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository, TodoRepository
+from todo_api.utils.uuid import UUID7
+
+
+class GetTodoChangesUsecaseInput(BaseModel):
+    since: datetime | None = None
+
+
+class GetTodoChangesUsecaseOutput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    todos: list[Todo]
+    deleted_ids: list[UUID7]
+    watermark: datetime
+
+
+class GetTodoChangesUsecase(ABC):
+    @abstractmethod
+    def execute(self, input_dto: GetTodoChangesUsecaseInput) -> GetTodoChangesUsecaseOutput:
+        pass
+
+
+class GetTodoChangesUsecaseImpl(GetTodoChangesUsecase):
+    def __init__(
+        self, todo_repository: TodoRepository, transaction_service: TransactionService
+    ) -> None:
+        self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
+
+    def execute(self, input_dto: GetTodoChangesUsecaseInput) -> GetTodoChangesUsecaseOutput:
+        def func() -> GetTodoChangesUsecaseOutput:
+            return _to_output(self.todo_repository.find_changes(input_dto.since))
+
+        # Not RunReadOnly: a lagging replica could still be missing changes stamped before
+        # the watermark it hands out, and the client would then never see them.
+        return self.transaction_service.Run(func)
+
+
+class AsyncGetTodoChangesUsecase(ABC):
+    @abstractmethod
+    async def execute(self, input_dto: GetTodoChangesUsecaseInput) -> GetTodoChangesUsecaseOutput:
+        pass
+
+
+class AsyncGetTodoChangesUsecaseImpl(AsyncGetTodoChangesUsecase):
+    def __init__(
+        self, todo_repository: AsyncTodoRepository, transaction_service: AsyncTransactionService
+    ) -> None:
+        self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
+
+    async def execute(self, input_dto: GetTodoChangesUsecaseInput) -> GetTodoChangesUsecaseOutput:
+        async def func() -> GetTodoChangesUsecaseOutput:
+            return _to_output(await self.todo_repository.find_changes(input_dto.since))
+
+        return await self.transaction_service.Run(func)
+
+
+def _to_output(changes: TodoChanges) -> GetTodoChangesUsecaseOutput:
+    return GetTodoChangesUsecaseOutput(
+        todos=changes.todos, deleted_ids=changes.deleted_ids, watermark=changes.watermark
+    )
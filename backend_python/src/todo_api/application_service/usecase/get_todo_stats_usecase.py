@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel, ConfigDict
+
+from todo_api.application_service.service.transaction_service import (
+    AsyncTransactionService,
+    TransactionService,
+)
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.domain.repository.todo_stats_repository import (
+    AsyncTodoStatsRepository,
+    TodoStatsRepository,
+)
+
+
+class GetTodoStatsUsecaseInput(BaseModel):
+    pass
+
+
+class GetTodoStatsUsecaseOutput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    stats: TodoStats
+
+
+class GetTodoStatsUsecase(ABC):
+    @abstractmethod
+    def execute(self, input_dto: GetTodoStatsUsecaseInput) -> GetTodoStatsUsecaseOutput:
+        pass
+
+
+class GetTodoStatsUsecaseImpl(GetTodoStatsUsecase):
+    def __init__(
+        self,
+        todo_stats_repository: TodoStatsRepository,
+        transaction_service: TransactionService,
+    ) -> None:
+        self.todo_stats_repository = todo_stats_repository
+        self.transaction_service = transaction_service
+
+    def execute(self, input_dto: GetTodoStatsUsecaseInput) -> GetTodoStatsUsecaseOutput:
+        def func() -> GetTodoStatsUsecaseOutput:
+            return GetTodoStatsUsecaseOutput(stats=self.todo_stats_repository.get())
+
+        return self.transaction_service.RunReadOnly(func)
+
+
+class AsyncGetTodoStatsUsecase(ABC):
+    @abstractmethod
+    async def execute(self, input_dto: GetTodoStatsUsecaseInput) -> GetTodoStatsUsecaseOutput:
+        pass
+
+
+class AsyncGetTodoStatsUsecaseImpl(AsyncGetTodoStatsUsecase):
+    def __init__(
+        self,
+        todo_stats_repository: AsyncTodoStatsRepository,
+        transaction_service: AsyncTransactionService,
+    ) -> None:
+        self.todo_stats_repository = todo_stats_repository
+        self.transaction_service = transaction_service
+
+    async def execute(self, input_dto: GetTodoStatsUsecaseInput) -> GetTodoStatsUsecaseOutput:
+        async def func() -> GetTodoStatsUsecaseOutput:
+            return GetTodoStatsUsecaseOutput(stats=await self.todo_stats_repository.get())
+
+        return await self.transaction_service.RunReadOnly(func)
@@ -2,8 +2,12 @@ from abc import ABC, abstractmethod
 
 from pydantic import BaseModel, ConfigDict
 
+from todo_api.application_service.service.transaction_service import (
+    AsyncTransactionService,
+    TransactionService,
+)
 from todo_api.domain.model.todo import Todo
-from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository, TodoRepository
 from todo_api.utils.uuid import UUID7
 
 
@@ -25,9 +29,36 @@ class GetTodoUsecase(ABC):
 
 
 class GetTodoUsecaseImpl(GetTodoUsecase):
-    def __init__(self, todo_repository: TodoRepository) -> None:
+    def __init__(
+        self, todo_repository: TodoRepository, transaction_service: TransactionService
+    ) -> None:
         self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
 
     def execute(self, input_dto: GetTodoUsecaseInput) -> GetTodoUsecaseOutput:
-        todo = self.todo_repository.find_by_id(input_dto.id)
-        return GetTodoUsecaseOutput(todo=todo)
+        def func() -> GetTodoUsecaseOutput:
+            todo = self.todo_repository.find_by_id(input_dto.id)
+            return GetTodoUsecaseOutput(todo=todo)
+
+        return self.transaction_service.RunReadOnly(func)
+
+
+class AsyncGetTodoUsecase(ABC):
+    @abstractmethod
+    async def execute(self, input_dto: GetTodoUsecaseInput) -> GetTodoUsecaseOutput:
+        pass
+
+
+class AsyncGetTodoUsecaseImpl(AsyncGetTodoUsecase):
+    def __init__(
+        self, todo_repository: AsyncTodoRepository, transaction_service: AsyncTransactionService
+    ) -> None:
+        self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
+
+    async def execute(self, input_dto: GetTodoUsecaseInput) -> GetTodoUsecaseOutput:
+        async def func() -> GetTodoUsecaseOutput:
+            todo = await self.todo_repository.find_by_id(input_dto.id)
+            return GetTodoUsecaseOutput(todo=todo)
+
+        return await self.transaction_service.RunReadOnly(func)
@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel, ConfigDict
+
+from todo_api.application_service.service.transaction_service import TransactionService
+from todo_api.application_service.usecase.bulk_todo_result import (
+    BulkTodoOutcome,
+    BulkTodoResult,
+    unique_ids,
+)
+from todo_api.domain.model.errors import TodoAlreadyCompletedError
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.utils.uuid import UUID7
+
+
+class MarkAsCompletedTodosUsecaseInput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    ids: list[UUID7]
+
+
+class MarkAsCompletedTodosUsecaseOutput(BaseModel):
+    results: list[BulkTodoResult]
+
+
+class MarkAsCompletedTodosUsecase(ABC):
+    @abstractmethod
+    def execute(
+        self, input_dto: MarkAsCompletedTodosUsecaseInput
+    ) -> MarkAsCompletedTodosUsecaseOutput:
+        pass
+
+
+class MarkAsCompletedTodosUsecaseImpl(MarkAsCompletedTodosUsecase):
+    def __init__(
+        self, todo_repository: TodoRepository, transaction_service: TransactionService
+    ) -> None:
+        """
+        The todos are read and locked once so `Todo.mark_as_completed` can decide each
+        outcome, then every todo that changed is written with a single statement.
+        """
+        self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
+
+    def execute(
+        self, input_dto: MarkAsCompletedTodosUsecaseInput
+    ) -> MarkAsCompletedTodosUsecaseOutput:
+        def func() -> MarkAsCompletedTodosUsecaseOutput:
+            ids = unique_ids(input_dto.ids)
+            todos = {
+                str(todo.id): todo
+                for todo in self.todo_repository.find_by_ids(ids, for_update=True)
+            }
+            results: list[BulkTodoResult] = []
+            changed: list[UUID7] = []
+            for todo_id in ids:
+                todo = todos.get(str(todo_id))
+                if todo is None:
+                    results.append(BulkTodoResult(id=todo_id, outcome=BulkTodoOutcome.NOT_FOUND))
+                    continue
+                try:
+                    todo.mark_as_completed()
+                except TodoAlreadyCompletedError:
+                    results.append(BulkTodoResult(id=todo_id, outcome=BulkTodoOutcome.UNCHANGED))
+                    continue
+                changed.append(todo.id)
+                results.append(BulkTodoResult(id=todo_id, outcome=BulkTodoOutcome.UPDATED))
+
+            if changed:
+                self.todo_repository.set_completed(changed, True)
+            return MarkAsCompletedTodosUsecaseOutput(results=results)
+
+        return self.transaction_service.Run(func)
@@ -2,9 +2,9 @@ from abc import ABC, abstractmethod
 
 from pydantic import BaseModel, ConfigDict
 
-from todo_api.application_service.service.transaction_service import TransactionService
+from todo_api.domain.model.errors import TodoNotCompletedError
 from todo_api.domain.model.todo import Todo
-from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository, TodoRepository
 from todo_api.utils.uuid import UUID7
 
 
@@ -28,19 +28,43 @@ class MarkAsUncompletedTodoUsecase(ABC):
 
 
 class MarkAsUncompletedTodoUsecaseImpl(MarkAsUncompletedTodoUsecase):
-    def __init__(
-        self, todo_repository: TodoRepository, transaction_service: TransactionService
-    ) -> None:
+    def __init__(self, todo_repository: TodoRepository) -> None:
+        """
+        Every path writes at most once, so like DeleteTodoUsecaseImpl we leave the
+        transaction to the session layer instead of paying for a SAVEPOINT round trip.
+        """
         self.todo_repository = todo_repository
-        self.transaction_service = transaction_service
 
     def execute(
         self, input_dto: MarkAsUncompletedTodoUsecaseInput
     ) -> MarkAsUncompletedTodoUsecaseOutput:
-        def func() -> MarkAsUncompletedTodoUsecaseOutput:
-            todo = self.todo_repository.find_by_id(input_dto.id)
-            todo.mark_as_uncompleted()
-            self.todo_repository.save(todo)
-            return MarkAsUncompletedTodoUsecaseOutput(todo=todo)
+        # The conditional UPDATE is the only write. The read feeds the response and, when
+        # nothing changed, raises for a missing todo (404); a todo that is there was
+        # already in the requested state when the UPDATE ran (409).
+        changed = self.todo_repository.mark_completed(input_dto.id, False)
+        todo = self.todo_repository.find_by_id(input_dto.id)
+        if not changed:
+            raise TodoNotCompletedError()
+        return MarkAsUncompletedTodoUsecaseOutput(todo=todo)
 
-        return self.transaction_service.Run(func)
+
+class AsyncMarkAsUncompletedTodoUsecase(ABC):
+    @abstractmethod
+    async def execute(
+        self, input_dto: MarkAsUncompletedTodoUsecaseInput
+    ) -> MarkAsUncompletedTodoUsecaseOutput:
+        pass
+
+
+class AsyncMarkAsUncompletedTodoUsecaseImpl(AsyncMarkAsUncompletedTodoUsecase):
+    def __init__(self, todo_repository: AsyncTodoRepository) -> None:
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self, input_dto: MarkAsUncompletedTodoUsecaseInput
+    ) -> MarkAsUncompletedTodoUsecaseOutput:
+        changed = await self.todo_repository.mark_completed(input_dto.id, False)
+        todo = await self.todo_repository.find_by_id(input_dto.id)
+        if not changed:
+            raise TodoNotCompletedError()
+        return MarkAsUncompletedTodoUsecaseOutput(todo=todo)
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel, ConfigDict
+
+from todo_api.application_service.service.transaction_service import TransactionService
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.repository.todo_search_index import TodoSearchIndex
+
+
+class SearchTodosUsecaseInput(BaseModel):
+    text: str
+    offset: int = 0
+    limit: int
+
+
+class SearchTodosUsecaseOutput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    todos: list[Todo]
+    next_offset: int | None = None
+
+
+class SearchTodosUsecase(ABC):
+    @abstractmethod
+    def execute(self, input_dto: SearchTodosUsecaseInput) -> SearchTodosUsecaseOutput:
+        pass
+
+
+class SearchTodosUsecaseImpl(SearchTodosUsecase):
+    def __init__(
+        self,
+        todo_search_index: TodoSearchIndex,
+        todo_repository: TodoRepository,
+        transaction_service: TransactionService,
+    ) -> None:
+        self.todo_search_index = todo_search_index
+        self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
+
+    def execute(self, input_dto: SearchTodosUsecaseInput) -> SearchTodosUsecaseOutput:
+        def func() -> SearchTodosUsecaseOutput:
+            # Ask for one extra match so we know whether another page exists.
+            ids = self.todo_search_index.search(
+                input_dto.text, input_dto.offset, input_dto.limit + 1
+            )
+            page = ids[: input_dto.limit]
+            found = {todo.id: todo for todo in self.todo_repository.find_by_ids(page)}
+            # Keep the index's ranking. An id the index knows but the database does not
+            # (deleted by another process, or not yet on this replica) is left out.
+            todos = [found[todo_id] for todo_id in page if todo_id in found]
+            has_more = len(ids) > input_dto.limit
+            return SearchTodosUsecaseOutput(
+                todos=todos, next_offset=input_dto.offset + input_dto.limit if has_more else None
+            )
+
+        return self.transaction_service.RunReadOnly(func)
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+from pydantic import BaseModel, ConfigDict
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.repository.todo_repository import TodoRepository
+
+
+class StreamTodosUsecaseInput(BaseModel):
+    batch_size: int = 500
+
+
+class StreamTodosUsecaseOutput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    todos: Iterator[Todo]
+
+
+class StreamTodosUsecase(ABC):
+    @abstractmethod
+    def execute(self, input_dto: StreamTodosUsecaseInput) -> StreamTodosUsecaseOutput:
+        pass
+
+
+class StreamTodosUsecaseImpl(StreamTodosUsecase):
+    def __init__(self, todo_repository: TodoRepository) -> None:
+        """
+        The returned iterator reads from the request-scoped session lazily, so the
+        session management layer keeps the transaction open until the body is sent.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(self, input_dto: StreamTodosUsecaseInput) -> StreamTodosUsecaseOutput:
+        todos = self.todo_repository.iter_all(input_dto.batch_size)
+        return StreamTodosUsecaseOutput(todos=todos)
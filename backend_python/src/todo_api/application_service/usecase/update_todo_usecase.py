@@ -2,9 +2,12 @@ from abc import ABC, abstractmethod
 
 from pydantic import BaseModel, ConfigDict
 
-from todo_api.application_service.service.transaction_service import TransactionService
+from todo_api.application_service.service.transaction_service import (
+    AsyncTransactionService,
+    TransactionService,
+)
 from todo_api.domain.model.todo import Todo
-from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository, TodoRepository
 from todo_api.utils.uuid import UUID7
 
 
@@ -42,3 +45,26 @@ class UpdateTodoUsecaseImpl(UpdateTodoUsecase):
             return UpdateTodoUsecaseOutput(todo=todo)
 
         return self.transaction_service.Run(func)
+
+
+class AsyncUpdateTodoUsecase(ABC):
+    @abstractmethod
+    async def execute(self, input_dto: UpdateTodoUsecaseInput) -> UpdateTodoUsecaseOutput:
+        pass
+
+
+class AsyncUpdateTodoUsecaseImpl(AsyncUpdateTodoUsecase):
+    def __init__(
+        self, todo_repository: AsyncTodoRepository, transaction_service: AsyncTransactionService
+    ) -> None:
+        self.todo_repository = todo_repository
+        self.transaction_service = transaction_service
+
+    async def execute(self, input_dto: UpdateTodoUsecaseInput) -> UpdateTodoUsecaseOutput:
+        async def func() -> UpdateTodoUsecaseOutput:
+            todo = await self.todo_repository.find_by_id(input_dto.id)
+            todo.update(title=input_dto.title, description=input_dto.description)
+            await self.todo_repository.save(todo)
+            return UpdateTodoUsecaseOutput(todo=todo)
+
+        return await self.transaction_service.Run(func)
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 
-from todo_api.utils.uuid import UUID7, parse_uuid7, uuid7
+from todo_api.utils.uuid import UUID7, parse_uuid7, trusted_uuid7, uuid7
 
 from .errors import TodoAlreadyCompletedError, TodoNotCompletedError
 
@@ -13,6 +13,8 @@ class TodoDTO(BaseModel):
 
 
 class Todo:
+    __slots__ = ("_id", "_title", "_description", "_completed")
+
     def __init__(self, title: str, description: str | None = None):
         self._id: UUID7 = uuid7()
         self._title = title
@@ -57,6 +59,20 @@ class Todo:
             completed=self.completed,
         )
 
+    @classmethod
+    def reconstitute(cls, id: str, title: str, description: str | None, completed: bool) -> "Todo":
+        """Rebuild a todo from values it was stored with.
+
+        Unlike `from_dto` nothing is validated again: `id` must be the canonical
+        UUID7 string this model wrote, as read back from the database.
+        """
+        todo = cls.__new__(cls)
+        todo._id = trusted_uuid7(id)
+        todo._title = title
+        todo._description = description
+        todo._completed = completed
+        return todo
+
     @classmethod
     def from_dto(cls, dto: TodoDTO) -> "Todo":
         todo = cls.__new__(cls)  # Bypass __init__ to avoid UUID regeneration
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from todo_api.utils.uuid import UUID7
+
+from .todo import Todo
+
+# How long the change feed keeps reporting a deletion. A `since` older than this can no
+# longer be answered; the client has to list every todo again.
+DELETIONS_RETENTION = timedelta(days=30)
+
+
+@dataclass(frozen=True)
+class TodoChanges:
+    """What changed in the todo list since a watermark.
+
+    `todos` are the todos created or updated since then and `deleted_ids` the ids
+    deleted since then. Pass `watermark` as the next `since`. Consecutive results can
+    overlap, so a todo may be reported again; applying a result twice is harmless.
+    """
+
+    todos: list[Todo]
+    deleted_ids: list[UUID7]
+    watermark: datetime
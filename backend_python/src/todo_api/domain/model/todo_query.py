@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+from todo_api.utils.uuid import UUID7
+
+
+class TodoSort(StrEnum):
+    """The orders a todo list can be sorted in; ties are broken by id."""
+
+    CREATED = "created"
+    CREATED_DESC = "-created"
+    TITLE = "title"
+    TITLE_DESC = "-title"
+
+    @property
+    def by_title(self) -> bool:
+        return self in (TodoSort.TITLE, TodoSort.TITLE_DESC)
+
+    @property
+    def descending(self) -> bool:
+        return self.startswith("-")
+
+
+@dataclass(frozen=True)
+class TodoQuery:
+    """Which todos to list and in what order.
+
+    A todo's creation time is the one its UUID7 id carries. `after_id` and
+    `after_title` hold the sort key of the last todo on the previous page; the
+    title is only used when sorting by title.
+    """
+
+    completed: bool | None = None
+    title_prefix: str | None = None
+    created_from: datetime | None = None
+    created_before: datetime | None = None
+    sort: TodoSort = TodoSort.CREATED
+    after_id: UUID7 | None = None
+    after_title: str | None = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TodoStats:
+    """How many todos there are, and how many of them are completed."""
+
+    total: int
+    completed: int
+
+    @property
+    def open(self) -> int:
+        return self.total - self.completed
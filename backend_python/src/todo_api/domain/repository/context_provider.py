@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from contextlib import AbstractContextManager
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from typing import TypeVar
 
 C = TypeVar("C")
@@ -7,9 +8,65 @@ C = TypeVar("C")
 
 class ContextProvider[C](ABC):
     @abstractmethod
-    def transaction(self) -> AbstractContextManager[C]:
-        """Return a transaction-scoped context manager bound to the current task."""
+    def transaction(self, *, read_only: bool = False) -> AbstractContextManager[C]:
+        """Return a transaction-scoped context manager bound to the current task.
+
+        `read_only=True` declares that the work inside only reads. It may then be served
+        by a replica, unless the enclosing scope already holds a session or is pinned to
+        the primary.
+        """
+
+    @abstractmethod
+    def deferred_transaction(self, *, pin_primary: bool = False) -> AbstractContextManager[None]:
+        """Open a transaction scope without acquiring a session yet.
+
+        The first `current()` call inside the scope checks one out. Leaving the scope
+        commits it, or rolls it back on error; if none was acquired there is nothing to end.
+        `pin_primary=True` keeps read-only work inside the scope on the primary.
+        """
 
     @abstractmethod
     def current(self) -> C:
         """Return the active session bound to the current context."""
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Roll back the current transaction if a session has been acquired for it."""
+
+    @abstractmethod
+    def release(self) -> None:
+        """Commit the deferred transaction now and return its connection to the pool.
+
+        A later `current()` call in the same scope acquires a new session.
+        """
+
+    @abstractmethod
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Run `callback` once the outermost active transaction commits.
+
+        The callback is discarded if that transaction rolls back instead.
+        """
+
+
+class AsyncContextProvider[C](ABC):
+    @abstractmethod
+    def transaction(self, *, read_only: bool = False) -> AbstractAsyncContextManager[C]:
+        """Async counterpart of `ContextProvider.transaction`."""
+
+    @abstractmethod
+    def deferred_transaction(
+        self, *, pin_primary: bool = False
+    ) -> AbstractAsyncContextManager[None]:
+        """Async counterpart of `ContextProvider.deferred_transaction`."""
+
+    @abstractmethod
+    def current(self) -> C:
+        """Return the active session bound to the current context."""
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Roll back the current transaction if a session has been acquired for it."""
+
+    @abstractmethod
+    async def release(self) -> None:
+        """Async counterpart of `ContextProvider.release`."""
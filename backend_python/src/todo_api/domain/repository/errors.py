@@ -2,3 +2,15 @@ class RepositoryNotFoundError(Exception):
     """Raised when a requested entity is not found in the repository."""
 
     pass
+
+
+class RepositoryChangesExpiredError(Exception):
+    """Raised when changes are asked for since a moment older than deletions are kept."""
+
+    pass
+
+
+class RepositoryConflictError(Exception):
+    """Raised when a write loses to a concurrent one; retrying the work can succeed."""
+
+    pass
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
 
 from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
 from todo_api.utils.uuid import UUID7
 
 
@@ -9,14 +13,137 @@ class TodoRepository(ABC):
     def find_all(self) -> list[Todo]:
         pass
 
+    @abstractmethod
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:
+        """Return up to `limit` todos ordered by id, starting after `after_id`."""
+
+    @abstractmethod
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:
+        """Return up to `limit` todos matching `query`, in its order, after its position."""
+
+    @abstractmethod
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:
+        """Yield every todo ordered by id, reading `batch_size` rows at a time."""
+
+    @abstractmethod
+    def list_version(self) -> str | None:
+        """Return a token that changes whenever a todo is added, changed or removed.
+
+        Returns None while the latest change is too recent for the token to be trusted
+        to change again on the next one.
+        """
+
+    @abstractmethod
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:
+        """Return every todo, and the `list_version` they were read at, in one read."""
+
+    @abstractmethod
+    def find_changes(self, since: datetime | None) -> TodoChanges:
+        """Return what changed at or after `since`; every todo when `since` is None.
+
+        Raises RepositoryChangesExpiredError when `since` is older than
+        `DELETIONS_RETENTION`, as the deletions since then are no longer known.
+        """
+
     @abstractmethod
     def find_by_id(self, todo_id: UUID7) -> Todo:
         pass
 
+    @abstractmethod
+    def find_by_ids(self, todo_ids: list[UUID7], for_update: bool = False) -> list[Todo]:
+        """Return the listed todos that exist, in no particular order.
+
+        With `for_update` the rows stay locked until the transaction ends.
+        """
+
     @abstractmethod
     def save(self, todo: Todo) -> None:
-        pass
+        """Insert the todo, or overwrite it if it already exists."""
+
+    @abstractmethod
+    def add(self, todo: Todo) -> None:
+        """Insert a todo that does not exist yet."""
+
+    @abstractmethod
+    def add_all(self, todos: list[Todo]) -> None:
+        """Insert todos that do not exist yet, in as few statements as possible."""
+
+    @abstractmethod
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:
+        """Set `completed` only if the todo currently holds the opposite value.
+
+        Returns False when nothing changed: the todo is missing or already in that state.
+        """
+
+    @abstractmethod
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:
+        """Set `completed` on every listed todo with a single statement."""
 
     @abstractmethod
     def delete(self, todo: Todo) -> None:
         pass
+
+    @abstractmethod
+    def delete_by_id(self, todo_id: UUID7) -> int:
+        """Delete the todo without loading it and return the number of rows removed.
+
+        Raises RepositoryNotFoundError when there was nothing to delete.
+        """
+
+    @abstractmethod
+    def delete_many(self, todo_ids: list[UUID7]) -> None:
+        """Delete every listed todo with a single statement."""
+
+
+class AsyncTodoRepository(ABC):
+    """Async counterpart of `TodoRepository` for the operations the async use cases need."""
+
+    @abstractmethod
+    async def find_all(self) -> list[Todo]:
+        pass
+
+    @abstractmethod
+    async def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:
+        """Return up to `limit` todos ordered by id, starting after `after_id`."""
+
+    @abstractmethod
+    async def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:
+        """See `TodoRepository.find_by_query`."""
+
+    @abstractmethod
+    async def list_version(self) -> str | None:
+        """See `TodoRepository.list_version`."""
+
+    @abstractmethod
+    async def find_all_with_version(self) -> tuple[list[Todo], str | None]:
+        """See `TodoRepository.find_all_with_version`."""
+
+    @abstractmethod
+    async def find_changes(self, since: datetime | None) -> TodoChanges:
+        """See `TodoRepository.find_changes`."""
+
+    @abstractmethod
+    async def find_by_id(self, todo_id: UUID7) -> Todo:
+        pass
+
+    @abstractmethod
+    async def save(self, todo: Todo) -> None:
+        """Insert the todo, or overwrite it if it already exists."""
+
+    @abstractmethod
+    async def add(self, todo: Todo) -> None:
+        """Insert a todo that does not exist yet."""
+
+    @abstractmethod
+    async def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:
+        """Set `completed` only if the todo currently holds the opposite value.
+
+        Returns False when nothing changed: the todo is missing or already in that state.
+        """
+
+    @abstractmethod
+    async def delete_by_id(self, todo_id: UUID7) -> int:
+        """Delete the todo without loading it and return the number of rows removed.
+
+        Raises RepositoryNotFoundError when there was nothing to delete.
+        """
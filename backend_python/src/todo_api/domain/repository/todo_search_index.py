@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from todo_api.utils.uuid import UUID7
+
+
+class TodoSearchIndex(ABC):
+    @abstractmethod
+    def search(self, text: str, offset: int, limit: int) -> list[UUID7]:
+        """Return the ids of todos whose title or description contains every word of `text`.
+
+        Best matches come first. The first `offset` matches are skipped and at most
+        `limit` are returned.
+        """
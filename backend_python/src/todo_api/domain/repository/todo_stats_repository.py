@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from todo_api.domain.model.todo_stats import TodoStats
+
+
+class TodoStatsRepository(ABC):
+    @abstractmethod
+    def get(self) -> TodoStats:
+        """Return the current counts without reading the todos themselves."""
+
+
+class AsyncTodoStatsRepository(ABC):
+    @abstractmethod
+    async def get(self) -> TodoStats:
+        """Async counterpart of `TodoStatsRepository.get`."""
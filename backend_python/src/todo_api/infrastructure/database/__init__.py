@@ -0,0 +1 @@
+"""Engine configuration and connection pool instrumentation for the Todo API."""
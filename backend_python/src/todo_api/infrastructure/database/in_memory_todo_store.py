@@ -0,0 +1,269 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
+
+from fastapi import logger
+
+from todo_api.domain.model.todo_changes import DELETIONS_RETENTION
+from todo_api.domain.repository.errors import RepositoryConflictError
+from todo_api.utils.uuid import UUID7, uuid7
+
+# Like the todo_tombstones_prune event in MySQL, deletions older than DELETIONS_RETENTION
+# are forgotten at most this often, so a commit rarely pays for the sweep.
+PRUNE_INTERVAL = timedelta(hours=1)
+
+
+class TodoRecord(NamedTuple):
+    """The stored values of one todo. Records are immutable, so readers can share them."""
+
+    title: str
+    description: str | None
+    completed: bool
+    updated_at: datetime
+
+
+class InMemoryTodoStore:
+    """The committed todos of an in-process database, indexed by id and in id order.
+
+    `rows` is the hash index and `ids` keeps every id sorted, so a keyset page is a
+    bisect followed by a slice. UUID7 ids grow with time, so new todos are appended to
+    the end of `ids`. Hold `lock` while reading or writing any of these fields. Write
+    only through `InMemoryTransaction`.
+
+    `undo` keeps what the last `len(undo)` commits replaced, oldest first, for as long
+    as a transaction that began before them is open: it is how those transactions
+    still see the todos as they were when they began.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.rows: dict[UUID7, TodoRecord] = {}
+        self.ids: list[UUID7] = []
+        self.deleted_at: dict[UUID7, datetime] = {}
+        self.pruned_at = utc_now()
+        self.completed = 0
+        # Commits since the store was created. The epoch tells the counts of two
+        # processes, or of one process before and after a restart, apart.
+        self.commits = 0
+        self.epoch = uuid7().hex
+        self.undo: list[dict[UUID7, TodoRecord | None]] = []
+        # How many open transactions began after each number of commits.
+        self.snapshots: Counter[int] = Counter()
+
+    def begin(self) -> int:
+        """Open a snapshot of the current commit and return it. Hold `lock`."""
+        self.snapshots[self.commits] += 1
+        return self.commits
+
+    def end(self, snapshot: int) -> None:
+        """Close a snapshot `begin` returned, dropping undo no open one needs. Hold `lock`."""
+        self.snapshots[snapshot] -= 1
+        if not self.snapshots[snapshot]:
+            del self.snapshots[snapshot]
+        oldest = min(self.snapshots, default=self.commits)
+        del self.undo[: max(0, len(self.undo) - (self.commits - oldest))]
+
+    def apply(self, writes: dict[UUID7, TodoRecord | None]) -> None:
+        """Commit `writes`, stamping every written todo with the current time. Hold `lock`."""
+        # Stamped under the lock, so a change feed read that takes its watermark under
+        # the lock too sees every change stamped before it.
+        now = utc_now()
+        replaced: dict[UUID7, TodoRecord | None] = {}
+        for todo_id, record in writes.items():
+            old = replaced[todo_id] = self.rows.get(todo_id)
+            if old is not None:
+                self.completed -= old.completed
+            if record is None:
+                if old is not None:
+                    del self.rows[todo_id]
+                    del self.ids[bisect_left(self.ids, todo_id)]
+                    self.deleted_at[todo_id] = now
+                continue
+            if old is None:
+                insort(self.ids, todo_id)
+            self.rows[todo_id] = record._replace(updated_at=now)
+            self.completed += record.completed
+        self.commits += 1
+        # Without open snapshots nobody can ask for the todos as they were.
+        if self.snapshots:
+            self.undo.append(replaced)
+        if now - self.pruned_at >= PRUNE_INTERVAL:
+            horizon = now - DELETIONS_RETENTION
+            self.deleted_at = {
+                todo_id: deleted_at
+                for todo_id, deleted_at in self.deleted_at.items()
+                if deleted_at >= horizon
+            }
+            self.pruned_at = now
+
+
+class InMemoryTransaction:
+    """One transaction on an `InMemoryTodoStore`, with snapshot isolation.
+
+    The transaction begins on its first read or write. From then on it sees the
+    todos as they were committed at that moment, as under MySQL's `REPEATABLE READ`:
+    later commits are hidden by laying what they replaced (`before`, gathered from
+    the store's undo log) over the store. Its own writes are kept in `writes` (None
+    marks a deletion), laid over that, until `commit` applies them all at once.
+
+    Nothing is locked while the transaction is open. Instead, the first committer
+    wins: a commit that writes a todo another transaction committed a change to in
+    the meantime raises `RepositoryConflictError` and applies nothing.
+    """
+
+    def __init__(self, store: InMemoryTodoStore) -> None:
+        self.store = store
+        self.writes: dict[UUID7, TodoRecord | None] = {}
+        self.callbacks: list[Callable[[], None]] = []
+        self.snapshot: int | None = None
+        self.began_at = utc_now()
+        # What the commits since the snapshot replaced, oldest value first; `seen` is
+        # how many commits have been gathered into it.
+        self.before: dict[UUID7, TodoRecord | None] = {}
+        self.seen = 0
+
+    def sync(self) -> None:
+        """Begin if needed, and catch up with the undo of newer commits. Hold `store.lock`."""
+        store = self.store
+        if self.snapshot is None:
+            self.snapshot = self.seen = store.begin()
+            self.began_at = utc_now()
+        if self.seen == store.commits:
+            return
+        for replaced in store.undo[len(store.undo) - (store.commits - self.seen) :]:
+            for todo_id, record in replaced.items():
+                self.before.setdefault(todo_id, record)
+        self.seen = store.commits
+
+    def version(self) -> str:
+        """The number of the commit the snapshot shows. Hold `store.lock`."""
+        self.sync()
+        return f"{self.store.epoch}-{self.snapshot}"
+
+    def counts(self) -> tuple[int, int]:
+        """How many todos this transaction sees, and how many are completed. Hold `store.lock`."""
+        self.sync()
+        total, completed = len(self.store.rows), self.store.completed
+        for todo_id in self.before.keys() | self.writes.keys():
+            current, seen = self.store.rows.get(todo_id), self.get(todo_id)
+            if current is not None:
+                total -= 1
+                completed -= current.completed
+            if seen is not None:
+                total += 1
+                completed += seen.completed
+        return total, completed
+
+    def get(self, todo_id: UUID7) -> TodoRecord | None:
+        """The todo as this transaction sees it. Hold `store.lock` while calling this."""
+        if todo_id in self.writes:
+            return self.writes[todo_id]
+        self.sync()
+        if todo_id in self.before:
+            return self.before[todo_id]
+        return self.store.rows.get(todo_id)
+
+    def put(self, todo_id: UUID7, title: str, description: str | None, completed: bool) -> None:
+        self._begin()
+        self.writes[todo_id] = TodoRecord(title, description, completed, utc_now())
+
+    def remove(self, todo_id: UUID7) -> None:
+        self._begin()
+        self.writes[todo_id] = None
+
+    def scan(
+        self, lower: UUID7 | None = None, upper: UUID7 | None = None, descending: bool = False
+    ) -> Iterator[tuple[UUID7, TodoRecord]]:
+        """Yield the todos with `lower <= id < upper`, ordered by id.
+
+        Consume it entirely while holding `store.lock`.
+        """
+        self.sync()
+        ids = self.store.ids
+        rows = self.store.rows
+        start = 0 if lower is None else bisect_left(ids, lower)
+        stop = len(ids) if upper is None else bisect_left(ids, upper)
+        positions = range(stop - 1, start - 1, -1) if descending else range(start, stop)
+        committed = map(ids.__getitem__, positions)
+        if not self.writes and not self.before:
+            yield from ((todo_id, rows[todo_id]) for todo_id in committed)
+            return
+
+        # Todos the store no longer has, but this transaction does: added by it, or
+        # deleted by a commit after the snapshot.
+        added = sorted(
+            (
+                todo_id
+                for todo_id in self.writes.keys() | self.before.keys()
+                if todo_id not in rows
+                and (lower is None or todo_id >= lower)
+                and (upper is None or todo_id < upper)
+                and self.get(todo_id) is not None
+            ),
+            reverse=descending,
+        )
+        for todo_id in heapq.merge(committed, added, reverse=descending):
+            record = self.get(todo_id)
+            if record is not None:
+                yield todo_id, record
+
+    def savepoint(self) -> tuple[dict[UUID7, TodoRecord | None], int]:
+        return dict(self.writes), len(self.callbacks)
+
+    def rollback_to(self, savepoint: tuple[dict[UUID7, TodoRecord | None], int]) -> None:
+        writes, callbacks = savepoint
+        self.writes = dict(writes)
+        del self.callbacks[callbacks:]
+
+    def commit(self) -> None:
+        """Apply the writes, then run the callbacks queued with `on_commit`.
+
+        Raises `RepositoryConflictError`, and applies nothing, when another transaction
+        committed a change to one of the written todos since this one began.
+        """
+        writes, self.writes = self.writes, {}
+        callbacks, self.callbacks = self.callbacks, []
+        with self.store.lock:
+            try:
+                if writes:
+                    self.sync()
+                    if not self.before.keys().isdisjoint(writes):
+                        raise RepositoryConflictError(
+                            "The todo was changed by another request; retry the request"
+                        )
+                    self.store.apply(writes)
+            finally:
+                self._end()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.logger.exception("on_commit callback failed")
+
+    def rollback(self) -> None:
+        self.writes = {}
+        self.callbacks = []
+        if self.snapshot is not None:
+            with self.store.lock:
+                self._end()
+
+    def _begin(self) -> None:
+        if self.snapshot is None:
+            with self.store.lock:
+                self.sync()
+
+    def _end(self) -> None:
+        # The next read or write begins again, on a new snapshot.
+        if self.snapshot is not None:
+            self.store.end(self.snapshot)
+            self.snapshot = None
+            self.before = {}
+
+
+def utc_now() -> datetime:
+    """The current time as a naive UTC datetime, the way TIMESTAMP columns read back."""
+    return datetime.now(UTC).replace(tzinfo=None)
@@ -0,0 +1,104 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection, QueuePool
+
+# Upper bounds, in seconds, of the checkout wait histogram buckets.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    checked_out: int
+    overflow: int
+    max_checked_out: int
+    checkouts: int
+    overflow_checkouts: int
+    timeouts: int
+    # Checkouts per wait bucket, keyed by the bucket's upper bound in seconds.
+    wait_seconds: dict[str, int]
+
+
+class PoolMetrics:
+    """Checkout counters for one engine's `QueuePool`, fed by SQLAlchemy pool events.
+
+    Pool events fire only once a connection has been handed out, so the time spent
+    waiting for it is measured by the pool class from `pool_class()` instead.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._size = 0
+        self._checked_out = 0
+        self._max_checked_out = 0
+        self._checkouts = 0
+        self._overflow_checkouts = 0
+        self._timeouts = 0
+        self._waits = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def pool_class(self, base: type[QueuePool]) -> type[QueuePool]:
+        """A subclass of `base` that reports how long each checkout waited."""
+        metrics = self
+
+        class InstrumentedPool(base):
+            def _do_get(self) -> ConnectionPoolEntry:
+                started = perf_counter()
+                try:
+                    return super()._do_get()
+                except PoolTimeoutError:
+                    metrics.record_timeout()
+                    raise
+                finally:
+                    metrics.record_wait(perf_counter() - started)
+
+        return InstrumentedPool
+
+    def instrument(self, engine: Engine) -> None:
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            raise TypeError(f"{type(pool).__name__} does not keep a fixed-size pool")
+        self._size = pool.size()
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._waits[bisect_left(WAIT_BUCKETS, seconds)] += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            labels = [str(bound) for bound in WAIT_BUCKETS] + ["+Inf"]
+            return PoolStats(
+                size=self._size,
+                checked_out=self._checked_out,
+                overflow=max(0, self._checked_out - self._size),
+                max_checked_out=self._max_checked_out,
+                checkouts=self._checkouts,
+                overflow_checkouts=self._overflow_checkouts,
+                timeouts=self._timeouts,
+                wait_seconds=dict(zip(labels, self._waits, strict=True)),
+            )
+
+    def _on_checkout(
+        self, dbapi_connection: Any, record: ConnectionPoolEntry, proxy: PoolProxiedConnection
+    ) -> None:
+        with self._lock:
+            self._checkouts += 1
+            self._checked_out += 1
+            self._max_checked_out = max(self._max_checked_out, self._checked_out)
+            if self._checked_out > self._size:
+                self._overflow_checkouts += 1
+
+    def _on_checkin(self, dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        with self._lock:
+            self._checked_out -= 1
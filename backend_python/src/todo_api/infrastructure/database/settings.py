@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import Any, cast
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool
+
+from todo_api.infrastructure.database.pool_metrics import PoolMetrics
+
+
+@dataclass(frozen=True)
+class EngineSettings:
+    """How to build the engine, and size its pool, for one database URL."""
+
+    url: str
+    echo: bool = False
+    hide_parameters: bool = True
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_timeout: float = 10.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+
+    @classmethod
+    def from_env(cls, url: str, environ: Mapping[str, str]) -> EngineSettings:
+        """Start from the `DATABASE_PROFILE` defaults and apply `DATABASE_POOL_*` overrides."""
+        profile = environ.get("DATABASE_PROFILE", "production")
+        if profile not in PROFILES:
+            raise ValueError(f"DATABASE_PROFILE must be one of {sorted(PROFILES)}, got {profile!r}")
+        defaults = PROFILES[profile]
+        return replace(
+            defaults,
+            url=url,
+            pool_size=int(environ.get("DATABASE_POOL_SIZE", defaults.pool_size)),
+            max_overflow=int(environ.get("DATABASE_MAX_OVERFLOW", defaults.max_overflow)),
+            pool_timeout=float(environ.get("DATABASE_POOL_TIMEOUT", defaults.pool_timeout)),
+            pool_recycle=int(environ.get("DATABASE_POOL_RECYCLE", defaults.pool_recycle)),
+            pool_pre_ping=_flag(environ, "DATABASE_POOL_PRE_PING", defaults.pool_pre_ping),
+        )
+
+    def for_url(self, url: str) -> EngineSettings:
+        return replace(self, url=url)
+
+
+PROFILES: dict[str, EngineSettings] = {
+    "production": EngineSettings(url=""),
+    # Logs every statement with its parameters; meant for local runs only.
+    "debug": EngineSettings(url="", echo=True, hide_parameters=False),
+}
+
+
+def build_engine(settings: EngineSettings, metrics: PoolMetrics | None = None) -> Engine:
+    kwargs = _engine_kwargs(settings, metrics)
+    engine = create_engine(settings.url, **kwargs)
+    if metrics is not None and "poolclass" in kwargs:
+        metrics.instrument(engine)
+    return engine
+
+
+def build_async_engine(settings: EngineSettings, metrics: PoolMetrics | None = None) -> AsyncEngine:
+    kwargs = _engine_kwargs(settings, metrics)
+    engine = create_async_engine(settings.url, **kwargs)
+    if metrics is not None and "poolclass" in kwargs:
+        metrics.instrument(engine.sync_engine)
+    return engine
+
+
+def _flag(environ: Mapping[str, str], name: str, default: bool) -> bool:
+    value = environ.get(name)
+    return default if value is None else value == "1"
+
+
+def _engine_kwargs(settings: EngineSettings, metrics: PoolMetrics | None) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {"echo": settings.echo, "hide_parameters": settings.hide_parameters}
+    url = make_url(settings.url)
+    # get_pool_class is only declared on DefaultDialect, which every real dialect extends.
+    dialect = cast("type[DefaultDialect]", url.get_dialect())
+    pool_class = dialect.get_pool_class(url)
+    if not issubclass(pool_class, QueuePool):
+        # e.g. in-memory SQLite, which keeps one connection per thread and has no pool to size.
+        return kwargs
+    kwargs.update(
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pool_pre_ping,
+    )
+    if metrics is not None:
+        kwargs["poolclass"] = metrics.pool_class(pool_class)
+    return kwargs
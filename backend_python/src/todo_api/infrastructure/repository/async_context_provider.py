@@ -0,0 +1,126 @@
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from fastapi import logger
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from todo_api.domain.repository.context_provider import AsyncContextProvider
+from todo_api.infrastructure.repository.replica_picker import ReplicaPicker
+
+
+class _Scope:
+    """The session of one root transaction scope, created on first use."""
+
+    __slots__ = ("session", "deferred", "pin_primary", "read_only")
+
+    def __init__(
+        self,
+        session: AsyncSession | None = None,
+        deferred: bool = False,
+        pin_primary: bool = False,
+        read_only: bool = False,
+    ) -> None:
+        self.session = session
+        self.deferred = deferred
+        self.pin_primary = pin_primary
+        self.read_only = read_only
+
+
+class AsyncContextProviderImpl(AsyncContextProvider[AsyncSession]):
+    """`ContextProviderImpl` for the async stack, with the same replica routing."""
+
+    def __init__(self, engine: AsyncEngine, replicas: Sequence[AsyncEngine] = ()) -> None:
+        self._session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        self._replicas = ReplicaPicker(
+            [
+                (replica.sync_engine.pool, async_sessionmaker(bind=replica, expire_on_commit=False))
+                for replica in replicas
+            ]
+        )
+        self._state: ContextVar[_Scope | None] = ContextVar("async_session_state", default=None)
+
+    @asynccontextmanager
+    async def transaction(self, *, read_only: bool = False) -> AsyncIterator[AsyncSession]:
+        scope = self._state.get()
+        if read_only and self._replicas and _may_use_replica(scope):
+            session = self._replicas.pick()()
+            async with self._root_transaction(session, read_only=True) as session:
+                yield session
+            return
+        if scope is not None:
+            if scope.read_only and not read_only:
+                raise RuntimeError("Cannot write inside a read-only transaction.")
+            logger.logger.debug("Reusing existing session in nested transaction scope")
+            existing = self.current()
+            if read_only:
+                # A read has nothing to undo, so it skips the SAVEPOINT round trips.
+                yield existing
+                return
+            async with existing.begin_nested():
+                yield existing
+            return
+
+        async with self._root_transaction(self._session_factory()) as session:
+            yield session
+
+    @asynccontextmanager
+    async def _root_transaction(
+        self, session: AsyncSession, read_only: bool = False
+    ) -> AsyncIterator[AsyncSession]:
+        logger.logger.debug("Acquiring %s session", "replica" if read_only else "database")
+        token = self._state.set(_Scope(session, read_only=read_only))
+        try:
+            async with session.begin():
+                yield session
+        finally:
+            self._state.reset(token)
+            await session.close()
+
+    @asynccontextmanager
+    async def deferred_transaction(self, *, pin_primary: bool = False) -> AsyncIterator[None]:
+        if self._state.get() is not None:
+            async with self.transaction():
+                yield
+            return
+
+        scope = _Scope(deferred=True, pin_primary=pin_primary)
+        token = self._state.set(scope)
+        try:
+            yield
+            if scope.session is not None:
+                await scope.session.commit()
+        finally:
+            self._state.reset(token)
+            if scope.session is not None:
+                await scope.session.close()
+
+    def current(self) -> AsyncSession:
+        scope = self._state.get()
+        if scope is None:
+            raise RuntimeError("No active session. Use transaction() to acquire one.")
+        if scope.session is None:
+            logger.logger.debug("Acquiring database session")
+            scope.session = self._session_factory()
+        return scope.session
+
+    async def rollback(self) -> None:
+        scope = self._state.get()
+        if scope is not None and scope.session is not None and scope.session.in_transaction():
+            await scope.session.rollback()
+
+    async def release(self) -> None:
+        scope = self._state.get()
+        if scope is None or scope.session is None:
+            return
+        if not scope.deferred:
+            raise RuntimeError("release() is only valid inside deferred_transaction().")
+        session, scope.session = scope.session, None
+        try:
+            await session.commit()
+        finally:
+            await session.close()
+
+
+def _may_use_replica(scope: _Scope | None) -> bool:
+    return scope is None or (scope.session is None and not scope.pin_primary)
@@ -0,0 +1,125 @@
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.context_provider import AsyncContextProvider
+from todo_api.domain.repository.errors import (
+    RepositoryChangesExpiredError,
+    RepositoryNotFoundError,
+)
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository
+from todo_api.infrastructure.repository.data_model.todo import TodoDataModel
+from todo_api.infrastructure.repository.data_model.todo_tombstone import TodoTombstoneDataModel
+from todo_api.utils.uuid import UUID7, trusted_uuid7
+
+_columns = TodoDataModel.__table__.c
+
+
+class AsyncTodoRepositoryImpl(AsyncTodoRepository):
+    """Same statements as `TodoRepositoryImpl`, awaited on an `AsyncSession`."""
+
+    def __init__(self, context_provider: AsyncContextProvider[AsyncSession]) -> None:
+        self.context_provider = context_provider
+
+    async def find_all(self) -> list[Todo]:
+        stmt = TodoDataModel.select_rows()
+        session = self.context_provider.current()
+        rows = (await session.execute(stmt)).all()
+
+        return [TodoDataModel.row_to_domain(row) for row in rows]
+
+    async def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:
+        stmt = TodoDataModel.select_rows().order_by(_columns.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(_columns.id > str(after_id))
+
+        session = self.context_provider.current()
+        rows = (await session.execute(stmt)).all()
+
+        return [TodoDataModel.row_to_domain(row) for row in rows]
+
+    async def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:
+        stmt = TodoDataModel.select_matching_rows(query).limit(limit)
+        session = self.context_provider.current()
+        rows = (await session.execute(stmt)).all()
+
+        return [TodoDataModel.row_to_domain(row) for row in rows]
+
+    async def list_version(self) -> str | None:
+        session = self.context_provider.current()
+        row = (await session.execute(TodoDataModel.select_list_version())).one()
+
+        return TodoDataModel.list_version_from_row(row)
+
+    async def find_all_with_version(self) -> tuple[list[Todo], str | None]:
+        session = self.context_provider.current()
+        rows = (await session.execute(TodoDataModel.select_rows_with_version())).all()
+
+        return TodoDataModel.versioned_rows_to_domain(rows)
+
+    async def find_changes(self, since: datetime | None) -> TodoChanges:
+        session = self.context_provider.current()
+        now = (await session.execute(select(func.current_timestamp()))).scalar_one()
+        if since is not None and not TodoTombstoneDataModel.kept_since(since, now):
+            raise RepositoryChangesExpiredError(f"Deletions before {since} are no longer kept")
+        rows = (await session.execute(TodoDataModel.select_changed_rows(since))).all()
+        deleted_ids: list[UUID7] = []
+        if since is not None:
+            deleted = await session.scalars(TodoTombstoneDataModel.select_deleted_ids(since))
+            deleted_ids = [trusted_uuid7(todo_id) for todo_id in deleted]
+
+        return TodoChanges(
+            todos=[TodoDataModel.row_to_domain(row) for row in rows],
+            deleted_ids=deleted_ids,
+            watermark=TodoDataModel.changes_watermark(now),
+        )
+
+    async def find_by_id(self, todo_id: UUID7) -> Todo:
+        stmt = TodoDataModel.select_rows().where(_columns.id == str(todo_id))
+
+        session = self.context_provider.current()
+        row = (await session.execute(stmt)).one_or_none()
+
+        if row is None:
+            raise RepositoryNotFoundError(f"Todo with id {todo_id} not found")
+        return TodoDataModel.row_to_domain(row)
+
+    async def save(self, todo: Todo) -> None:
+        stmt = mysql_insert(TodoDataModel).values(TodoDataModel.values_from_domain(todo))
+        stmt = stmt.on_duplicate_key_update(
+            title=stmt.inserted.title,
+            description=stmt.inserted.description,
+            completed=stmt.inserted.completed,
+            updated_at=func.current_timestamp(),
+        )
+
+        session = self.context_provider.current()
+        await session.execute(stmt)
+
+    async def add(self, todo: Todo) -> None:
+        session = self.context_provider.current()
+        await session.execute(insert(TodoDataModel).values(TodoDataModel.values_from_domain(todo)))
+
+    async def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:
+        session = self.context_provider.current()
+        result = await session.execute(
+            update(TodoDataModel)
+            .where(TodoDataModel.id == str(todo_id), TodoDataModel.completed == (not completed))
+            .values(completed=completed)
+        )
+        return result.rowcount == 1  # pyright: ignore[reportAttributeAccessIssue]
+
+    async def delete_by_id(self, todo_id: UUID7) -> int:
+        session = self.context_provider.current()
+        result = await session.execute(
+            delete(TodoDataModel).where(TodoDataModel.id == str(todo_id))
+        )
+        deleted = result.rowcount  # pyright: ignore[reportAttributeAccessIssue]
+        if deleted == 0:
+            raise RepositoryNotFoundError(f"Todo with id {todo_id} not found")
+        return deleted
@@ -0,0 +1,19 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.domain.repository.context_provider import AsyncContextProvider
+from todo_api.domain.repository.todo_stats_repository import AsyncTodoStatsRepository
+from todo_api.infrastructure.repository.data_model.todo_stats import TodoStatsDataModel
+
+
+class AsyncTodoStatsRepositoryImpl(AsyncTodoStatsRepository):
+    """Same statement as `TodoStatsRepositoryImpl`, awaited on an `AsyncSession`."""
+
+    def __init__(self, context_provider: AsyncContextProvider[AsyncSession]) -> None:
+        self.context_provider = context_provider
+
+    async def get(self) -> TodoStats:
+        session = self.context_provider.current()
+        row = (await session.execute(TodoStatsDataModel.select_totals())).one()
+
+        return TodoStatsDataModel.row_to_domain(row)
@@ -0,0 +1,156 @@
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from todo_api.domain.model.todo import Todo, TodoDTO
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.infrastructure.repository.context_provider import ContextProviderImpl
+from todo_api.utils.lru_cache import CacheStats, LRUCache
+from todo_api.utils.uuid import UUID7
+
+
+class TodoCache:
+    """Committed todos by id, as immutable `TodoDTO` snapshots, kept for `ttl_seconds`.
+
+    Writes evict their entry only after the surrounding transaction commits; until
+    then `get` misses that id for the writing transaction, so it sees its own changes
+    and never caches uncommitted state. Only reads from the primary fill the cache: a
+    lagging replica could hand back a todo older than a write that was just evicted.
+    """
+
+    def __init__(
+        self,
+        context_provider: ContextProviderImpl,
+        max_size: int = 10_000,
+        ttl_seconds: float = 30.0,
+    ) -> None:
+        self.context_provider = context_provider
+        self._cache: LRUCache[str, TodoDTO] = LRUCache(max_size, ttl_seconds)
+        self._written: WeakKeyDictionary[Any, set[str]] = WeakKeyDictionary()
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
+
+    def get(self, key: str) -> TodoDTO | None:
+        if key in self._written.get(self.context_provider.current(), ()):
+            return None
+        return self._cache.get(key)
+
+    def version(self) -> int:
+        return self._cache.version()
+
+    def put(self, key: str, todo: TodoDTO, version: int) -> None:
+        if self.context_provider.reads_from_replica():
+            return
+        if key not in self._written.get(self.context_provider.current(), ()):
+            self._cache.put(key, todo, version)
+
+    def evict_on_commit(self, key: str) -> None:
+        session = self.context_provider.current()
+        written = self._written.setdefault(session, set())
+        written.add(key)
+
+        def invalidate() -> None:
+            self._cache.invalidate(key)
+            written.discard(key)
+
+        self.context_provider.on_commit(invalidate)
+
+
+class CacheEvictingTodoRepository(TodoRepository):
+    """Evicts the todos written through another `TodoRepository` from a `TodoCache`.
+
+    Reads, `find_by_id` included, always go to `inner`, so use cases that read a todo
+    in order to change it never start from a cached copy.
+    """
+
+    def __init__(self, inner: TodoRepository, cache: TodoCache) -> None:
+        self.inner = inner
+        self.cache = cache
+
+    def find_all(self) -> list[Todo]:
+        return self.inner.find_all()
+
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:
+        return self.inner.find_page(after_id, limit)
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:
+        return self.inner.find_by_query(query, limit)
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:
+        return self.inner.iter_all(batch_size)
+
+    def list_version(self) -> str | None:
+        return self.inner.list_version()
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:
+        return self.inner.find_all_with_version()
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:
+        return self.inner.find_changes(since)
+
+    def find_by_id(self, todo_id: UUID7) -> Todo:
+        return self.inner.find_by_id(todo_id)
+
+    def find_by_ids(self, todo_ids: list[UUID7], for_update: bool = False) -> list[Todo]:
+        return self.inner.find_by_ids(todo_ids, for_update)
+
+    def save(self, todo: Todo) -> None:
+        self.inner.save(todo)
+        self.cache.evict_on_commit(str(todo.id))
+
+    def add(self, todo: Todo) -> None:
+        # New ids cannot have cache entries, and misses are never cached.
+        self.inner.add(todo)
+
+    def add_all(self, todos: list[Todo]) -> None:
+        self.inner.add_all(todos)
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:
+        changed = self.inner.mark_completed(todo_id, completed)
+        # Even when nothing changed the caller usually reads the todo next to find out
+        # why, and that read must not come from a possibly stale entry.
+        self.cache.evict_on_commit(str(todo_id))
+        return changed
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:
+        self.inner.set_completed(todo_ids, completed)
+        for todo_id in todo_ids:
+            self.cache.evict_on_commit(str(todo_id))
+
+    def delete(self, todo: Todo) -> None:
+        self.inner.delete(todo)
+        self.cache.evict_on_commit(str(todo.id))
+
+    def delete_by_id(self, todo_id: UUID7) -> int:
+        deleted = self.inner.delete_by_id(todo_id)
+        self.cache.evict_on_commit(str(todo_id))
+        return deleted
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:
+        self.inner.delete_many(todo_ids)
+        for todo_id in todo_ids:
+            self.cache.evict_on_commit(str(todo_id))
+
+
+class CachingTodoRepository(CacheEvictingTodoRepository):
+    """Serves `find_by_id` from a `TodoCache`, reading through to `inner` on a miss.
+
+    Only hand this to read-only use cases such as `GET /todos/{id}`: a write use case
+    that read a cached copy could save it back over newer changes. Changes made outside
+    this process are picked up once the TTL runs out.
+    """
+
+    def find_by_id(self, todo_id: UUID7) -> Todo:
+        key = str(todo_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return Todo.from_dto(cached)
+
+        version = self.cache.version()
+        todo = self.inner.find_by_id(todo_id)
+        self.cache.put(key, todo.to_dto(), version)
+        return todo
@@ -1,31 +1,88 @@
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from contextvars import ContextVar
 
 from fastapi import logger
-from sqlalchemy import Engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
 
 from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.infrastructure.repository.replica_picker import ReplicaPicker
+
+_ON_COMMIT_KEY = "todo_api.on_commit"
+
+
+class _Scope:
+    """The session of one root transaction scope, created on first use.
+
+    The scope object itself is what the context variable holds, so a session acquired
+    from a copied context (e.g. a child task sending a streamed body) is still seen,
+    and ended, by the code that opened the scope.
+    """
+
+    __slots__ = ("session", "deferred", "pin_primary", "read_only")
+
+    def __init__(
+        self,
+        session: Session | None = None,
+        deferred: bool = False,
+        pin_primary: bool = False,
+        read_only: bool = False,
+    ) -> None:
+        self.session = session
+        self.deferred = deferred
+        self.pin_primary = pin_primary
+        self.read_only = read_only
 
 
 class ContextProviderImpl(ContextProvider[Session]):
-    def __init__(self, engine: Engine) -> None:
+    """Hands out sessions on the primary `engine`, and read-only ones on `replicas`.
+
+    Read-only work that starts its own root scope goes to a replica; inside a scope
+    that already holds a primary session, or one pinned to the primary, it stays on
+    the primary so it sees that scope's writes.
+    """
+
+    def __init__(self, engine: Engine, replicas: Sequence[Engine] = ()) -> None:
         self._session_factory = sessionmaker(bind=engine, expire_on_commit=False)
-        self._state: ContextVar[Session | None] = ContextVar("session_state", default=None)
+        replica_factories = [
+            (replica.pool, sessionmaker(bind=replica, expire_on_commit=False))
+            for replica in replicas
+        ]
+        self._replicas = ReplicaPicker(replica_factories)
+        self._state: ContextVar[_Scope | None] = ContextVar("session_state", default=None)
+        for factory in [self._session_factory, *(factory for _, factory in replica_factories)]:
+            event.listen(factory, "after_commit", _run_on_commit)
+            event.listen(factory, "after_transaction_end", _discard_on_commit)
 
     @contextmanager
-    def transaction(self) -> Iterator[Session]:
-        existing = self._state.get()
-        if existing is not None:
+    def transaction(self, *, read_only: bool = False) -> Iterator[Session]:
+        scope = self._state.get()
+        if read_only and self._replicas and _may_use_replica(scope):
+            session = self._replicas.pick()()
+            with self._root_transaction(session, read_only=True) as session:
+                yield session
+            return
+        if scope is not None:
+            if scope.read_only and not read_only:
+                raise RuntimeError("Cannot write inside a read-only transaction.")
             logger.logger.debug("Reusing existing session in nested transaction scope")
+            existing = self.current()
+            if read_only:
+                # A read has nothing to undo, so it skips the SAVEPOINT round trips.
+                yield existing
+                return
             with existing.begin_nested():
                 yield existing
             return
 
-        session = self._session_factory()
-        logger.logger.info("Acquiring database session")
-        token = self._state.set(session)
+        with self._root_transaction(self._session_factory()) as session:
+            yield session
+
+    @contextmanager
+    def _root_transaction(self, session: Session, read_only: bool = False) -> Iterator[Session]:
+        logger.logger.debug("Acquiring %s session", "replica" if read_only else "database")
+        token = self._state.set(_Scope(session, read_only=read_only))
         try:
             with session.begin():
                 yield session
@@ -33,8 +90,80 @@ class ContextProviderImpl(ContextProvider[Session]):
             self._state.reset(token)
             session.close()
 
+    @contextmanager
+    def deferred_transaction(self, *, pin_primary: bool = False) -> Iterator[None]:
+        if self._state.get() is not None:
+            with self.transaction():
+                yield
+            return
+
+        scope = _Scope(deferred=True, pin_primary=pin_primary)
+        token = self._state.set(scope)
+        try:
+            yield
+            if scope.session is not None:
+                scope.session.commit()
+        finally:
+            self._state.reset(token)
+            if scope.session is not None:
+                # close() rolls back whatever the commit above did not reach.
+                scope.session.close()
+
     def current(self) -> Session:
-        session = self._state.get()
-        if session is None:
+        scope = self._state.get()
+        if scope is None:
             raise RuntimeError("No active session. Use transaction() to acquire one.")
-        return session
+        if scope.session is None:
+            # The connection itself is only checked out by the first statement.
+            logger.logger.debug("Acquiring database session")
+            scope.session = self._session_factory()
+        return scope.session
+
+    def reads_from_replica(self) -> bool:
+        """Whether the current scope is served by a replica, which may lag the primary."""
+        scope = self._state.get()
+        return scope is not None and scope.read_only
+
+    def rollback(self) -> None:
+        scope = self._state.get()
+        if scope is not None and scope.session is not None and scope.session.in_transaction():
+            scope.session.rollback()
+
+    def release(self) -> None:
+        scope = self._state.get()
+        if scope is None or scope.session is None:
+            return
+        if not scope.deferred:
+            raise RuntimeError("release() is only valid inside deferred_transaction().")
+        session, scope.session = scope.session, None
+        try:
+            session.commit()
+        finally:
+            session.close()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        # Callbacks hang off the session rather than the savepoint, so work queued
+        # inside a nested scope still waits for the outermost COMMIT.
+        self.current().info.setdefault(_ON_COMMIT_KEY, []).append(callback)
+
+
+def _may_use_replica(scope: _Scope | None) -> bool:
+    # Once a scope holds a session (primary or replica) further work nests inside it.
+    return scope is None or (scope.session is None and not scope.pin_primary)
+
+
+def _run_on_commit(session: Session) -> None:
+    # after_commit also fires when a savepoint is released; only the root COMMIT counts.
+    if session.in_nested_transaction():
+        return
+    for callback in session.info.pop(_ON_COMMIT_KEY, []):
+        try:
+            callback()
+        except Exception:
+            logger.logger.exception("on_commit callback failed")
+
+
+def _discard_on_commit(session: Session, transaction: SessionTransaction) -> None:
+    # Anything still queued when the root transaction ends was rolled back.
+    if transaction.parent is None:
+        session.info.pop(_ON_COMMIT_KEY, None)
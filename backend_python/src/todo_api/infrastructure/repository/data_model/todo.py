@@ -1,36 +1,216 @@
 from __future__ import annotations
 
-from sqlalchemy import Boolean, String, Text
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from os import environ
+from typing import Any
+
+from sqlalchemy import (
+    TIMESTAMP,
+    Boolean,
+    ColumnElement,
+    Index,
+    Row,
+    Select,
+    String,
+    Text,
+    and_,
+    func,
+    or_,
+    select,
+)
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeEngine
 
-from todo_api.domain.model.todo import Todo, TodoDTO
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.utils.uuid import uuid7_floor
 
 from .base import Base
+from .types import BinaryUUID
+
+# Physical layout of todos.id. The shared db/init.sql creates CHAR(36) ids; databases
+# migrated with scripts/migrate_todo_id_to_binary.py store them as BINARY(16) instead.
+TODO_ID_STORAGE = environ.get("TODO_ID_STORAGE", "char")
+if TODO_ID_STORAGE not in ("char", "binary"):
+    raise RuntimeError(f"TODO_ID_STORAGE must be 'char' or 'binary', got {TODO_ID_STORAGE!r}")
+
+# updated_at only has one-second resolution, and a transaction stamps it before it
+# commits. A change that becomes visible can therefore carry a timestamp older than the
+# database clock, e.g. leaving MAX(updated_at) where it was. We allow for this many
+# seconds; a transaction that takes longer between its write and its commit can slip
+# past the change feed and the list version.
+UPDATED_AT_SETTLE_SECONDS = 2
+
+_LIKE_ESCAPES = str.maketrans({"/": "//", "%": "/%", "_": "/_"})
+
+
+def todo_id_type() -> TypeEngine[str]:
+    """Column type for a todo id, following `TODO_ID_STORAGE`."""
+    return BinaryUUID() if TODO_ID_STORAGE == "binary" else String(36)
 
 
 class TodoDataModel(Base):
     __tablename__ = "todos"
+    # One index per filter `select_matching_rows` compiles, each ending in the column the
+    # list is then sorted by; InnoDB appends the primary key to the title indexes.
+    __table_args__ = (
+        Index("ix_todos_completed_id", "completed", "id"),
+        Index("ix_todos_completed_title", "completed", "title"),
+        Index("ix_todos_title", "title"),
+        # Read by FulltextTodoSearchIndex.
+        Index("ft_todos_title_description", "title", "description", mysql_prefix="FULLTEXT"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    id: Mapped[str] = mapped_column(todo_id_type(), primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     completed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, nullable=False, server_default=func.current_timestamp()
+    )
+    # db/init.sql also declares ON UPDATE CURRENT_TIMESTAMP; onupdate makes every Core
+    # UPDATE set it explicitly too, so it moves even on a schema created from this model.
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
+        index=True,
+    )
 
     def to_domain(self) -> Todo:
-        dto = TodoDTO(
-            id=self.id,
-            title=self.title,
-            description=self.description,
-            completed=self.completed,
+        return Todo.reconstitute(self.id, self.title, self.description, self.completed)
+
+    @classmethod
+    def select_rows(cls) -> Select[tuple[str, str, str | None, bool]]:
+        """A Core SELECT of the columns `row_to_domain` reads.
+
+        Reads that only hand back domain todos use this instead of selecting the entity,
+        so the rows skip the identity map and attribute instrumentation.
+        """
+        columns = cls.__table__.c
+        return select(columns.id, columns.title, columns.description, columns.completed)
+
+    @staticmethod
+    def row_to_domain(row: Row[tuple[str, str, str | None, bool]]) -> Todo:
+        return Todo.reconstitute(*row)
+
+    @classmethod
+    def select_matching_rows(cls, query: TodoQuery) -> Select[tuple[str, str, str | None, bool]]:
+        """`select_rows` filtered and ordered by `query`, starting after its keyset position.
+
+        Creation time bounds become id bounds, because UUID7 ids lead with their
+        creation time. So every filter is a range over an index in `__table_args__` or
+        the primary key.
+        """
+        columns = cls.__table__.c
+        stmt = cls.select_rows()
+        if query.completed is not None:
+            stmt = stmt.where(columns.completed == query.completed)
+        if query.title_prefix:
+            # A literal pattern rather than startswith(), which compiles to LIKE CONCAT(...):
+            # MySQL only range-scans an index for a LIKE whose prefix is a constant.
+            escaped = query.title_prefix.translate(_LIKE_ESCAPES)
+            stmt = stmt.where(columns.title.like(f"{escaped}%", escape="/"))
+        if query.created_from is not None:
+            stmt = stmt.where(columns.id >= str(uuid7_floor(query.created_from)))
+        if query.created_before is not None:
+            stmt = stmt.where(columns.id < str(uuid7_floor(query.created_before)))
+
+        descending = query.sort.descending
+        if query.after_id is not None:
+            stmt = stmt.where(_after(query, descending))
+        keys = [columns.title, columns.id] if query.sort.by_title else [columns.id]
+        return stmt.order_by(*(key.desc() if descending else key for key in keys))
+
+    @classmethod
+    def select_changed_rows(
+        cls, since: datetime | None
+    ) -> Select[tuple[str, str, str | None, bool]]:
+        """`select_rows` limited to todos created or updated at or after `since`."""
+        columns = cls.__table__.c
+        stmt = cls.select_rows().order_by(columns.updated_at, columns.id)
+        return stmt if since is None else stmt.where(columns.updated_at >= since)
+
+    @staticmethod
+    def changes_watermark(now: datetime) -> datetime:
+        """The `since` that catches the changes not yet visible at database time `now`.
+
+        Only those committed within UPDATED_AT_SETTLE_SECONDS of their write, that is.
+        """
+        return now - timedelta(seconds=UPDATED_AT_SETTLE_SECONDS)
+
+    @classmethod
+    def select_list_version(cls) -> Select[tuple[int, datetime | None, datetime]]:
+        """Row count, newest `updated_at` and the database clock, for `list_version_from_row`."""
+        columns = cls.__table__.c
+        return select(func.count(), func.max(columns.updated_at), func.current_timestamp())
+
+    @staticmethod
+    def list_version_from_row(row: Row[tuple[int, datetime | None, datetime]]) -> str | None:
+        count, newest, now = row
+        return _list_version(count, newest, now)
+
+    @classmethod
+    def select_rows_with_version(
+        cls,
+    ) -> Select[tuple[str, str, str | None, bool, datetime, datetime]]:
+        """`select_rows` plus each row's `updated_at` and the database clock.
+
+        `versioned_rows_to_domain` works out `list_version` from these, so reading the
+        whole list does not take a second query to version it.
+        """
+        columns = cls.__table__.c
+        return select(
+            columns.id,
+            columns.title,
+            columns.description,
+            columns.completed,
+            columns.updated_at,
+            func.current_timestamp(),
         )
-        return Todo.from_dto(dto)
+
+    @staticmethod
+    def versioned_rows_to_domain(
+        rows: Sequence[Row[tuple[str, str, str | None, bool, datetime, datetime]]],
+    ) -> tuple[list[Todo], str | None]:
+        todos = [Todo.reconstitute(*row[:4]) for row in rows]
+        if not rows:
+            return todos, _list_version(0, None, None)
+        return todos, _list_version(len(rows), max(row[4] for row in rows), rows[0][5])
 
     @classmethod
     def from_domain(cls, todo: Todo) -> TodoDataModel:
-        dto = todo.to_dto()
-        return cls(
-            id=dto.id,
-            title=dto.title,
-            description=dto.description,
-            completed=dto.completed,
-        )
+        return cls(**cls.values_from_domain(todo))
+
+    @staticmethod
+    def values_from_domain(todo: Todo) -> dict[str, Any]:
+        """Column values for a Core INSERT, without building an ORM instance."""
+        return {
+            "id": str(todo.id),
+            "title": todo.title,
+            "description": todo.description,
+            "completed": todo.completed,
+        }
+
+
+def _list_version(count: int, newest: datetime | None, now: datetime | None) -> str | None:
+    if newest is None or now is None:
+        return "0"
+    if (now - newest).total_seconds() < UPDATED_AT_SETTLE_SECONDS:
+        return None
+    return f"{count}-{newest:%Y%m%d%H%M%S}"
+
+
+def _after(query: TodoQuery, descending: bool) -> ColumnElement[bool]:
+    # Spelled out: MySQL only turns row constructor comparisons into an index range
+    # inside IN lists.
+    columns = TodoDataModel.__table__.c
+    after_id = str(query.after_id)
+    if not query.sort.by_title:
+        return columns.id < after_id if descending else columns.id > after_id
+    title = query.after_title or ""
+    if descending:
+        return or_(columns.title < title, and_(columns.title == title, columns.id < after_id))
+    return or_(columns.title > title, and_(columns.title == title, columns.id > after_id))
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from sqlalchemy import DDL, BigInteger, Row, Select, SmallInteger, event, func, select
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo_api.domain.model.todo_stats import TodoStats
+
+from .base import Base
+from .todo import TodoDataModel
+
+# Writers add their changes to one of this many rows, picked by connection id, so that
+# concurrent transactions do not queue for the lock on a single counter row.
+STATS_SLOTS = 16
+
+
+class TodoStatsDataModel(Base):
+    """Todo counts, kept by triggers on `todos` in the transaction that writes the todo.
+
+    A slot's counts can go negative, e.g. when a todo is deleted through a different
+    connection than the one that created it; only the sum over all slots means anything.
+    """
+
+    __tablename__ = "todo_stats"
+
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+    completed: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+
+    @classmethod
+    def select_totals(cls) -> Select[tuple[int, int]]:
+        columns = cls.__table__.c
+        return select(
+            func.coalesce(func.sum(columns.total), 0),
+            func.coalesce(func.sum(columns.completed), 0),
+        )
+
+    @staticmethod
+    def row_to_domain(row: Row[tuple[int, int]]) -> TodoStats:
+        total, completed = row
+        return TodoStats(total=int(total), completed=int(completed))
+
+
+# The same triggers as db/init.sql, so schemas made with `create_all` keep counts too;
+# scripts/migrate_add_todo_stats.py installs them on older databases. Updates that leave
+# `completed` alone, the common case, do not touch the counters.
+COUNT_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS todos_count_insert AFTER INSERT ON todos FOR EACH ROW
+    INSERT INTO todo_stats (slot, total, completed)
+    VALUES (MOD(CONNECTION_ID(), {STATS_SLOTS}), 1, NEW.completed)
+    ON DUPLICATE KEY UPDATE total = total + 1, completed = completed + NEW.completed
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS todos_count_update AFTER UPDATE ON todos FOR EACH ROW
+    INSERT INTO todo_stats (slot, total, completed)
+    SELECT MOD(CONNECTION_ID(), {STATS_SLOTS}), 0, NEW.completed - OLD.completed
+    FROM DUAL WHERE NEW.completed <> OLD.completed
+    ON DUPLICATE KEY UPDATE completed = completed + NEW.completed - OLD.completed
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS todos_count_delete AFTER DELETE ON todos FOR EACH ROW
+    INSERT INTO todo_stats (slot, total, completed)
+    VALUES (MOD(CONNECTION_ID(), {STATS_SLOTS}), -1, -OLD.completed)
+    ON DUPLICATE KEY UPDATE total = total - 1, completed = completed - OLD.completed
+    """,
+)
+for _trigger in COUNT_TRIGGERS:
+    event.listen(TodoDataModel.__table__, "after_create", DDL(_trigger).execute_if(dialect="mysql"))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DDL, TIMESTAMP, Select, event, func, select
+from sqlalchemy.orm import Mapped, mapped_column
+
+from todo_api.domain.model.todo_changes import DELETIONS_RETENTION
+
+from .base import Base
+from .todo import TodoDataModel, todo_id_type
+
+
+class TodoTombstoneDataModel(Base):
+    """One row per deleted todo, so the change feed can report deletions.
+
+    A trigger on `todos` writes the rows, so deletes made by any client are recorded,
+    and an event drops them once they are older than `DELETIONS_RETENTION`.
+    """
+
+    __tablename__ = "todo_tombstones"
+
+    id: Mapped[str] = mapped_column(todo_id_type(), primary_key=True)
+    deleted_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, nullable=False, server_default=func.current_timestamp(), index=True
+    )
+
+    @classmethod
+    def select_deleted_ids(cls, since: datetime) -> Select[tuple[str]]:
+        columns = cls.__table__.c
+        return select(columns.id).where(columns.deleted_at >= since)
+
+    @staticmethod
+    def kept_since(since: datetime, now: datetime) -> bool:
+        """Whether every deletion at or after `since` still has its row at database time `now`."""
+        # Drivers send a datetime's fields as they are and ignore tzinfo; compare the same way.
+        return since.replace(tzinfo=None) >= now - DELETIONS_RETENTION
+
+
+# The same trigger and event as db/init.sql, so schemas made with `create_all` keep
+# tombstones too. An id can only be tombstoned twice if it was re-created in between.
+_TRIGGER = """
+    CREATE TRIGGER todos_tombstone_delete AFTER DELETE ON todos FOR EACH ROW
+    INSERT INTO todo_tombstones (id) VALUES (OLD.id)
+    ON DUPLICATE KEY UPDATE deleted_at = CURRENT_TIMESTAMP
+    """
+# Events outlive the table they read, so drop this one with it.
+_PRUNE_EVENT = f"""
+    CREATE EVENT IF NOT EXISTS todo_tombstones_prune ON SCHEDULE EVERY 1 HOUR
+    DO DELETE FROM todo_tombstones
+    WHERE deleted_at < CURRENT_TIMESTAMP - INTERVAL {DELETIONS_RETENTION.days} DAY
+    """
+event.listen(TodoDataModel.__table__, "after_create", DDL(_TRIGGER).execute_if(dialect="mysql"))
+event.listen(
+    TodoTombstoneDataModel.__table__,
+    "after_create",
+    DDL(_PRUNE_EVENT).execute_if(dialect="mysql"),
+)
+event.listen(
+    TodoTombstoneDataModel.__table__,
+    "before_drop",
+    DDL("DROP EVENT IF EXISTS todo_tombstones_prune").execute_if(dialect="mysql"),
+)
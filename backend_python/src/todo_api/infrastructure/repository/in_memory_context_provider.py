@@ -0,0 +1,113 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from fastapi import logger
+
+from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.infrastructure.database.in_memory_todo_store import (
+    InMemoryTodoStore,
+    InMemoryTransaction,
+)
+
+
+class _Scope:
+    """The transaction of one root transaction scope, created on first use."""
+
+    __slots__ = ("transaction", "deferred", "read_only")
+
+    def __init__(
+        self,
+        transaction: InMemoryTransaction | None = None,
+        deferred: bool = False,
+        read_only: bool = False,
+    ) -> None:
+        self.transaction = transaction
+        self.deferred = deferred
+        self.read_only = read_only
+
+
+class InMemoryContextProvider(ContextProvider[InMemoryTransaction]):
+    """Hands out transactions on an `InMemoryTodoStore`, scoped like `ContextProviderImpl`.
+
+    A nested scope runs in its parent's transaction and rolls back to where it started
+    if it raises, as a savepoint would. There are no replicas, so read-only work and
+    `pin_primary` make no difference to where reads go.
+    """
+
+    def __init__(self, store: InMemoryTodoStore) -> None:
+        self._store = store
+        self._state: ContextVar[_Scope | None] = ContextVar("memory_state", default=None)
+
+    @contextmanager
+    def transaction(self, *, read_only: bool = False) -> Iterator[InMemoryTransaction]:
+        scope = self._state.get()
+        if scope is not None:
+            if scope.read_only and not read_only:
+                raise RuntimeError("Cannot write inside a read-only transaction.")
+            logger.logger.debug("Reusing existing transaction in nested transaction scope")
+            existing = self.current()
+            savepoint = existing.savepoint()
+            try:
+                yield existing
+            except BaseException:
+                existing.rollback_to(savepoint)
+                raise
+            return
+
+        transaction = InMemoryTransaction(self._store)
+        token = self._state.set(_Scope(transaction, read_only=read_only))
+        try:
+            yield transaction
+            transaction.commit()
+        finally:
+            self._state.reset(token)
+            # Rolls back whatever the commit above did not reach.
+            transaction.rollback()
+
+    @contextmanager
+    def deferred_transaction(self, *, pin_primary: bool = False) -> Iterator[None]:
+        if self._state.get() is not None:
+            with self.transaction():
+                yield
+            return
+
+        scope = _Scope(deferred=True)
+        token = self._state.set(scope)
+        try:
+            yield
+            if scope.transaction is not None:
+                scope.transaction.commit()
+        finally:
+            self._state.reset(token)
+            if scope.transaction is not None:
+                scope.transaction.rollback()
+
+    def current(self) -> InMemoryTransaction:
+        scope = self._state.get()
+        if scope is None:
+            raise RuntimeError("No active transaction. Use transaction() to acquire one.")
+        if scope.transaction is None:
+            scope.transaction = InMemoryTransaction(self._store)
+        return scope.transaction
+
+    def rollback(self) -> None:
+        scope = self._state.get()
+        if scope is not None and scope.transaction is not None:
+            scope.transaction.rollback()
+
+    def release(self) -> None:
+        scope = self._state.get()
+        if scope is None or scope.transaction is None:
+            return
+        if not scope.deferred:
+            raise RuntimeError("release() is only valid inside deferred_transaction().")
+        transaction, scope.transaction = scope.transaction, None
+        try:
+            transaction.commit()
+        finally:
+            transaction.rollback()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        # Nested scopes share the root transaction, so callbacks wait for its commit.
+        self.current().callbacks.append(callback)
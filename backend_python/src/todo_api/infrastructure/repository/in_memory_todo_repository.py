@@ -0,0 +1,226 @@
+import heapq
+import itertools
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import DELETIONS_RETENTION, TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.domain.repository.errors import (
+    RepositoryChangesExpiredError,
+    RepositoryNotFoundError,
+)
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.infrastructure.database.in_memory_todo_store import (
+    InMemoryTransaction,
+    TodoRecord,
+)
+from todo_api.utils.uuid import UUID7, uuid7_floor
+
+
+class InMemoryTodoRepository(TodoRepository):
+    """Todos kept in an `InMemoryTodoStore` instead of a database.
+
+    Lookups by id go through the store's hash index, and listings ordered by id walk
+    its sorted ids from a bisect, so a keyset page costs the same at any depth. Other
+    filters are checked todo by todo along that walk. Sorting by title, and the change
+    feed, look at every todo; titles compare case-insensitively, as under MySQL's
+    default collation.
+    """
+
+    def __init__(self, context_provider: ContextProvider[InMemoryTransaction]) -> None:
+        self.context_provider = context_provider
+
+    def find_all(self) -> list[Todo]:
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            return _to_domain(transaction.scan())
+
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            rows = _skip(transaction.scan(lower=after_id), after_id)
+            return _to_domain(itertools.islice(rows, limit))
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:
+        lower = None if query.created_from is None else uuid7_floor(query.created_from)
+        upper = None if query.created_before is None else uuid7_floor(query.created_before)
+        descending = query.sort.descending
+        after_id = None if query.sort.by_title else query.after_id
+        if after_id is not None and descending:
+            upper = after_id if upper is None else min(upper, after_id)
+        elif after_id is not None:
+            lower = after_id if lower is None else max(lower, after_id)
+
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            rows = _skip(transaction.scan(lower, upper, descending), after_id)
+            if query.completed is not None:
+                rows = (row for row in rows if row[1].completed == query.completed)
+            if query.title_prefix:
+                prefix = query.title_prefix.casefold()
+                rows = (row for row in rows if row[1].title.casefold().startswith(prefix))
+            if query.sort.by_title:
+                rows = _sorted_by_title(rows, query, limit)
+            return _to_domain(itertools.islice(rows, limit))
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:
+        # One page at a time, so the store is only locked while a page is copied out.
+        after_id: UUID7 | None = None
+        while True:
+            page = self.find_page(after_id, batch_size)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after_id = page[-1].id
+
+    def list_version(self) -> str | None:
+        transaction = self.context_provider.current()
+        if transaction.writes:
+            return None
+        with transaction.store.lock:
+            return transaction.version()
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            version = None if transaction.writes else transaction.version()
+            return _to_domain(transaction.scan()), version
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:
+        if since is not None and since.tzinfo is not None:
+            since = since.astimezone(UTC).replace(tzinfo=None)
+
+        transaction = self.context_provider.current()
+        store = transaction.store
+        with store.lock:
+            # The watermark is when the snapshot was taken. Commits stamp their todos
+            # under the same lock, so the ones the snapshot hides are stamped after it.
+            transaction.sync()
+            watermark = transaction.began_at
+            if since is not None and since < watermark - DELETIONS_RETENTION:
+                raise RepositoryChangesExpiredError(f"Deletions before {since} are no longer kept")
+            changed = sorted(
+                (
+                    (record.updated_at, todo_id, record)
+                    for todo_id, record in transaction.scan()
+                    if since is None or record.updated_at >= since
+                ),
+                key=lambda change: change[:2],
+            )
+            deleted_ids: list[UUID7] = []
+            if since is not None:
+                deleted_ids = [
+                    todo_id
+                    for todo_id, deleted_at in store.deleted_at.items()
+                    if since <= deleted_at < watermark
+                ]
+
+        return TodoChanges(
+            todos=_to_domain((todo_id, record) for _, todo_id, record in changed),
+            deleted_ids=deleted_ids,
+            watermark=watermark,
+        )
+
+    def find_by_id(self, todo_id: UUID7) -> Todo:
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            record = transaction.get(todo_id)
+
+        if record is None:
+            raise RepositoryNotFoundError(f"Todo with id {todo_id} not found")
+        return _to_domain([(todo_id, record)])[0]
+
+    def find_by_ids(self, todo_ids: list[UUID7], for_update: bool = False) -> list[Todo]:
+        # Nothing to lock: a write to a todo that changed since the snapshot fails at
+        # commit, so `for_update` readers cannot lose an update either.
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            rows = [(todo_id, transaction.get(todo_id)) for todo_id in todo_ids]
+
+        return _to_domain((todo_id, record) for todo_id, record in rows if record is not None)
+
+    def save(self, todo: Todo) -> None:
+        transaction = self.context_provider.current()
+        transaction.put(todo.id, todo.title, todo.description, todo.completed)
+
+    def add(self, todo: Todo) -> None:
+        self.save(todo)
+
+    def add_all(self, todos: list[Todo]) -> None:
+        transaction = self.context_provider.current()
+        for todo in todos:
+            transaction.put(todo.id, todo.title, todo.description, todo.completed)
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:
+        # Checked against the snapshot. Should another transaction change the todo
+        # first, the commit fails instead of overwriting it.
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            record = transaction.get(todo_id)
+        if record is None or record.completed == completed:
+            return False
+        transaction.put(todo_id, record.title, record.description, completed)
+        return True
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            rows = [(todo_id, transaction.get(todo_id)) for todo_id in todo_ids]
+        for todo_id, record in rows:
+            if record is not None:
+                transaction.put(todo_id, record.title, record.description, completed)
+
+    def delete(self, todo: Todo) -> None:
+        self.delete_many([todo.id])
+
+    def delete_by_id(self, todo_id: UUID7) -> int:
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            record = transaction.get(todo_id)
+        if record is None:
+            raise RepositoryNotFoundError(f"Todo with id {todo_id} not found")
+        transaction.remove(todo_id)
+        return 1
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:
+        transaction = self.context_provider.current()
+        for todo_id in todo_ids:
+            transaction.remove(todo_id)
+
+
+def _skip(
+    rows: Iterator[tuple[UUID7, TodoRecord]], after_id: UUID7 | None
+) -> Iterator[tuple[UUID7, TodoRecord]]:
+    # A scan includes its lower bound, which for a keyset page is the previous page's last
+    # todo. Walking down, the bound is excluded already and the first row never matches.
+    if after_id is None:
+        return rows
+    return itertools.dropwhile(lambda row: row[0] == after_id, rows)
+
+
+def _sorted_by_title(
+    rows: Iterable[tuple[UUID7, TodoRecord]], query: TodoQuery, limit: int | None
+) -> list[tuple[UUID7, TodoRecord]]:
+    def key(row: tuple[UUID7, TodoRecord]) -> tuple[str, UUID7]:
+        return row[1].title.casefold(), row[0]
+
+    if query.after_id is not None:
+        after = ((query.after_title or "").casefold(), query.after_id)
+        if query.sort.descending:
+            rows = (row for row in rows if key(row) < after)
+        else:
+            rows = (row for row in rows if key(row) > after)
+    if limit is None:
+        return sorted(rows, key=key, reverse=query.sort.descending)
+    pick = heapq.nlargest if query.sort.descending else heapq.nsmallest
+    return pick(limit, rows, key=key)
+
+
+def _to_domain(rows: Iterable[tuple[UUID7, TodoRecord]]) -> list[Todo]:
+    # Todos are mutable, so every read hands out new ones built from the shared records.
+    return [
+        Todo.reconstitute(str(todo_id), record.title, record.description, record.completed)
+        for todo_id, record in rows
+    ]
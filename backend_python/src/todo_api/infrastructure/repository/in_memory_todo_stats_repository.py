@@ -0,0 +1,20 @@
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.domain.repository.todo_stats_repository import TodoStatsRepository
+from todo_api.infrastructure.database.in_memory_todo_store import InMemoryTransaction
+
+
+class InMemoryTodoStatsRepository(TodoStatsRepository):
+    """Reads the counts an `InMemoryTodoStore` keeps up to date as it commits."""
+
+    def __init__(self, context_provider: ContextProvider[InMemoryTransaction]) -> None:
+        self.context_provider = context_provider
+
+    def get(self) -> TodoStats:
+        transaction = self.context_provider.current()
+        with transaction.store.lock:
+            # As of the snapshot, with the transaction's own writes counted, as the
+            # triggers would have.
+            total, completed = transaction.counts()
+
+        return TodoStats(total=total, completed=completed)
@@ -0,0 +1,106 @@
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.infrastructure.search.in_memory_todo_search_index import InMemoryTodoSearchIndex
+from todo_api.utils.uuid import UUID7
+
+
+class IndexingTodoRepository(TodoRepository):
+    """Keeps an `InMemoryTodoSearchIndex` in step with writes made through another repository.
+
+    Titles and descriptions are captured when the todo is written and applied to the
+    index once the surrounding transaction commits, so searches never see a todo that
+    was rolled back. Completion changes leave the indexed text alone and are not
+    forwarded.
+    """
+
+    def __init__(
+        self,
+        inner: TodoRepository,
+        index: InMemoryTodoSearchIndex,
+        context_provider: ContextProvider[Any],
+    ) -> None:
+        self.inner = inner
+        self.index = index
+        self.context_provider = context_provider
+
+    def find_all(self) -> list[Todo]:
+        return self.inner.find_all()
+
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:
+        return self.inner.find_page(after_id, limit)
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:
+        return self.inner.find_by_query(query, limit)
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:
+        return self.inner.iter_all(batch_size)
+
+    def list_version(self) -> str | None:
+        return self.inner.list_version()
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:
+        return self.inner.find_all_with_version()
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:
+        return self.inner.find_changes(since)
+
+    def find_by_id(self, todo_id: UUID7) -> Todo:
+        return self.inner.find_by_id(todo_id)
+
+    def find_by_ids(self, todo_ids: list[UUID7], for_update: bool = False) -> list[Todo]:
+        return self.inner.find_by_ids(todo_ids, for_update)
+
+    def save(self, todo: Todo) -> None:
+        self.inner.save(todo)
+        self._put_on_commit([todo])
+
+    def add(self, todo: Todo) -> None:
+        self.inner.add(todo)
+        self._put_on_commit([todo])
+
+    def add_all(self, todos: list[Todo]) -> None:
+        self.inner.add_all(todos)
+        self._put_on_commit(todos)
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:
+        return self.inner.mark_completed(todo_id, completed)
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:
+        self.inner.set_completed(todo_ids, completed)
+
+    def delete(self, todo: Todo) -> None:
+        self.inner.delete(todo)
+        self._remove_on_commit([todo.id])
+
+    def delete_by_id(self, todo_id: UUID7) -> int:
+        deleted = self.inner.delete_by_id(todo_id)
+        self._remove_on_commit([todo_id])
+        return deleted
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:
+        self.inner.delete_many(todo_ids)
+        self._remove_on_commit(list(todo_ids))
+
+    def _put_on_commit(self, todos: list[Todo]) -> None:
+        # Todos are mutable; index the text as written, not as it is at commit time.
+        written = [(todo.id, todo.title, todo.description) for todo in todos]
+
+        def put() -> None:
+            for todo_id, title, description in written:
+                self.index.put(todo_id, title, description)
+
+        self.context_provider.on_commit(put)
+
+    def _remove_on_commit(self, todo_ids: list[UUID7]) -> None:
+        def remove() -> None:
+            for todo_id in todo_ids:
+                self.index.remove(todo_id)
+
+        self.context_provider.on_commit(remove)
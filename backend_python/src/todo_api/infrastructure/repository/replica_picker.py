@@ -0,0 +1,31 @@
+from collections.abc import Sequence
+from itertools import count
+
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class ReplicaPicker[F]:
+    """Chooses the replica with the fewest checked-out connections.
+
+    Ties, including every pick from pools that do not count checkouts, go round-robin,
+    so idle replicas still share the load evenly.
+    """
+
+    def __init__(self, replicas: Sequence[tuple[Pool, F]]) -> None:
+        self._replicas = list(replicas)
+        self._rotation = count()
+
+    def __bool__(self) -> bool:
+        return bool(self._replicas)
+
+    def pick(self) -> F:
+        if not self._replicas:
+            raise RuntimeError("No replicas configured.")
+        start = next(self._rotation) % len(self._replicas)
+        rotated = self._replicas[start:] + self._replicas[:start]
+        _, factory = min(rotated, key=lambda replica: _checked_out(replica[0]))
+        return factory
+
+
+def _checked_out(pool: Pool) -> int:
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
@@ -1,12 +1,28 @@
-from sqlalchemy import delete, select
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import Session
 
 from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
 from todo_api.domain.repository.context_provider import ContextProvider
-from todo_api.domain.repository.errors import RepositoryNotFoundError
+from todo_api.domain.repository.errors import (
+    RepositoryChangesExpiredError,
+    RepositoryNotFoundError,
+)
 from todo_api.domain.repository.todo_repository import TodoRepository
 from todo_api.infrastructure.repository.data_model.todo import TodoDataModel
-from todo_api.utils.uuid import UUID7
+from todo_api.infrastructure.repository.data_model.todo_tombstone import TodoTombstoneDataModel
+from todo_api.utils.uuid import UUID7, trusted_uuid7
+
+# Rows per multi-row INSERT; keeps each statement well below max_allowed_packet.
+INSERT_CHUNK_SIZE = 500
+# Reads select these table columns rather than ORM attributes, so their statements stay
+# plain Core and never load entities into the session.
+_columns = TodoDataModel.__table__.c
 
 
 class TodoRepositoryImpl(TodoRepository):
@@ -14,29 +30,158 @@ class TodoRepositoryImpl(TodoRepository):
         self.context_provider = context_provider
 
     def find_all(self) -> list[Todo]:
-        stmt = select(TodoDataModel)
+        stmt = TodoDataModel.select_rows()
+        session = self.context_provider.current()
+        rows = session.execute(stmt).all()
+
+        return [TodoDataModel.row_to_domain(row) for row in rows]
+
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:
+        # UUID7 ids sort by creation time, so a range scan on the primary key gives
+        # a stable keyset page whose cost does not depend on how deep the cursor is.
+        stmt = TodoDataModel.select_rows().order_by(_columns.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(_columns.id > str(after_id))
+
+        session = self.context_provider.current()
+        rows = session.execute(stmt).all()
+
+        return [TodoDataModel.row_to_domain(row) for row in rows]
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:
+        stmt = TodoDataModel.select_matching_rows(query).limit(limit)
+        session = self.context_provider.current()
+        rows = session.execute(stmt).all()
+
+        return [TodoDataModel.row_to_domain(row) for row in rows]
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:
+        # yield_per streams rows through a server-side cursor, so only one batch of
+        # rows is buffered at a time instead of the whole table.
+        stmt = (
+            TodoDataModel.select_rows()
+            .order_by(_columns.id)
+            .execution_options(yield_per=batch_size)
+        )
+        session = self.context_provider.current()
+
+        for row in session.execute(stmt):
+            yield TodoDataModel.row_to_domain(row)
+
+    def list_version(self) -> str | None:
+        session = self.context_provider.current()
+        row = session.execute(TodoDataModel.select_list_version()).one()
+
+        return TodoDataModel.list_version_from_row(row)
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:
+        session = self.context_provider.current()
+        rows = session.execute(TodoDataModel.select_rows_with_version()).all()
+
+        return TodoDataModel.versioned_rows_to_domain(rows)
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:
         session = self.context_provider.current()
-        todos = session.scalars(stmt).all()
+        # Read the clock before the rows. A change these queries cannot see yet is usually
+        # stamped no earlier than the watermark (see UPDATED_AT_SETTLE_SECONDS), so the
+        # next call starting from it picks the change up.
+        now = session.execute(select(func.current_timestamp())).scalar_one()
+        if since is not None and not TodoTombstoneDataModel.kept_since(since, now):
+            raise RepositoryChangesExpiredError(f"Deletions before {since} are no longer kept")
+        rows = session.execute(TodoDataModel.select_changed_rows(since)).all()
+        deleted_ids: list[UUID7] = []
+        if since is not None:
+            deleted = session.scalars(TodoTombstoneDataModel.select_deleted_ids(since))
+            deleted_ids = [trusted_uuid7(todo_id) for todo_id in deleted]
 
-        return [todo.to_domain() for todo in todos]
+        return TodoChanges(
+            todos=[TodoDataModel.row_to_domain(row) for row in rows],
+            deleted_ids=deleted_ids,
+            watermark=TodoDataModel.changes_watermark(now),
+        )
 
     def find_by_id(self, todo_id: UUID7):
-        stmt = select(TodoDataModel).where(TodoDataModel.id == str(todo_id))
+        stmt = TodoDataModel.select_rows().where(_columns.id == str(todo_id))
 
         session = self.context_provider.current()
-        todo_data_model = session.scalars(stmt).one_or_none()
+        row = session.execute(stmt).one_or_none()
 
-        if todo_data_model is None:
+        if row is None:
             raise RepositoryNotFoundError(f"Todo with id {todo_id} not found")
-        return todo_data_model.to_domain()
+        return TodoDataModel.row_to_domain(row)
+
+    def find_by_ids(self, todo_ids: list[UUID7], for_update: bool = False) -> list[Todo]:
+        stmt = TodoDataModel.select_rows().where(_columns.id.in_([str(i) for i in todo_ids]))
+        if for_update:
+            stmt = stmt.with_for_update()
+
+        session = self.context_provider.current()
+        rows = session.execute(stmt).all()
+
+        return [TodoDataModel.row_to_domain(row) for row in rows]
 
     def save(self, todo: Todo) -> None:
+        # One INSERT ... ON DUPLICATE KEY UPDATE instead of merge(), which SELECTs the
+        # row first and then issues a separate INSERT or UPDATE.
+        stmt = mysql_insert(TodoDataModel).values(TodoDataModel.values_from_domain(todo))
+        stmt = stmt.on_duplicate_key_update(
+            title=stmt.inserted.title,
+            description=stmt.inserted.description,
+            completed=stmt.inserted.completed,
+            updated_at=func.current_timestamp(),
+        )
+
         session = self.context_provider.current()
-        todo_data_model = TodoDataModel.from_domain(todo)
+        session.execute(stmt)
 
-        session.merge(todo_data_model)
-        session.flush()
+    def add(self, todo: Todo) -> None:
+        session = self.context_provider.current()
+        session.execute(insert(TodoDataModel).values(TodoDataModel.values_from_domain(todo)))
+
+    def add_all(self, todos: list[Todo]) -> None:
+        # Plain INSERT ... VALUES (...), (...) instead of merge(): the todos are new,
+        # so there is nothing to SELECT first and one round trip covers a whole chunk.
+        session = self.context_provider.current()
+        for start in range(0, len(todos), INSERT_CHUNK_SIZE):
+            rows = [
+                TodoDataModel.values_from_domain(todo)
+                for todo in todos[start : start + INSERT_CHUNK_SIZE]
+            ]
+            session.execute(insert(TodoDataModel).values(rows))
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:
+        # The state check lives in the WHERE clause, so the row is locked only for this
+        # one statement and two concurrent requests cannot both see themselves succeed.
+        session = self.context_provider.current()
+        result = session.execute(
+            update(TodoDataModel)
+            .where(TodoDataModel.id == str(todo_id), TodoDataModel.completed == (not completed))
+            .values(completed=completed)
+        )
+        return result.rowcount == 1  # pyright: ignore[reportAttributeAccessIssue]
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:
+        session = self.context_provider.current()
+        session.execute(
+            update(TodoDataModel)
+            .where(TodoDataModel.id.in_([str(i) for i in todo_ids]))
+            .values(completed=completed)
+        )
 
     def delete(self, todo: Todo) -> None:
         session = self.context_provider.current()
         session.execute(delete(TodoDataModel).where(TodoDataModel.id == str(todo.id)))
+
+    def delete_by_id(self, todo_id: UUID7) -> int:
+        session = self.context_provider.current()
+        result = session.execute(delete(TodoDataModel).where(TodoDataModel.id == str(todo_id)))
+        deleted = result.rowcount  # pyright: ignore[reportAttributeAccessIssue]
+        if deleted == 0:
+            raise RepositoryNotFoundError(f"Todo with id {todo_id} not found")
+        return deleted
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:
+        session = self.context_provider.current()
+        session.execute(
+            delete(TodoDataModel).where(TodoDataModel.id.in_([str(i) for i in todo_ids]))
+        )
@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Session
+
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.domain.repository.todo_stats_repository import TodoStatsRepository
+from todo_api.infrastructure.repository.data_model.todo_stats import TodoStatsDataModel
+
+
+class TodoStatsRepositoryImpl(TodoStatsRepository):
+    """Sums the few `todo_stats` rows; the todos table is never read."""
+
+    def __init__(self, context_provider: ContextProvider[Session]) -> None:
+        self.context_provider = context_provider
+
+    def get(self) -> TodoStats:
+        session = self.context_provider.current()
+        row = session.execute(TodoStatsDataModel.select_totals()).one()
+
+        return TodoStatsDataModel.row_to_domain(row)
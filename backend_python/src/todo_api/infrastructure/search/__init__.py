@@ -0,0 +1 @@
+"""Todo search index implementations for the Todo API."""
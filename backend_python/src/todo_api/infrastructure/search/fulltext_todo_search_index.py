@@ -0,0 +1,40 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.domain.repository.todo_search_index import TodoSearchIndex
+from todo_api.infrastructure.repository.data_model.todo import TodoDataModel
+from todo_api.infrastructure.search.tokens import tokenize
+from todo_api.utils.uuid import UUID7, trusted_uuid7
+
+_columns = TodoDataModel.__table__.c
+
+
+class FulltextTodoSearchIndex(TodoSearchIndex):
+    """Searches the `ft_todos_title_description` FULLTEXT index in the current transaction.
+
+    Every word is required (`+word` in boolean mode). MySQL ignores its stopwords and
+    words shorter than `innodb_ft_min_token_size`, and only sees committed rows.
+    """
+
+    def __init__(self, context_provider: ContextProvider[Session]) -> None:
+        self.context_provider = context_provider
+
+    def search(self, text: str, offset: int, limit: int) -> list[UUID7]:
+        words = tokenize(text)
+        if not words:
+            return []
+
+        against = " ".join(f"+{word}" for word in dict.fromkeys(words))
+        relevance = match(_columns.title, _columns.description, against=against)
+        stmt = (
+            select(_columns.id)
+            .where(relevance.in_boolean_mode())
+            .order_by(relevance.in_boolean_mode().desc(), _columns.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        session = self.context_provider.current()
+
+        return [trusted_uuid7(todo_id) for todo_id in session.scalars(stmt)]
@@ -0,0 +1,142 @@
+import heapq
+import itertools
+import math
+import operator
+import sys
+import threading
+from collections.abc import Iterable, Iterator
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.repository.todo_search_index import TodoSearchIndex
+from todo_api.infrastructure.search.tokens import tokenize
+from todo_api.utils.uuid import UUID7
+
+# A word in the title counts this many times as much as one in the description.
+TITLE_WEIGHT = 2
+
+
+class InMemoryTodoSearchIndex(TodoSearchIndex):
+    """An inverted index over todo titles and descriptions, held in this process.
+
+    Each word maps to the todos containing it and its weight in each: occurrences in the
+    description plus `TITLE_WEIGHT` per occurrence in the title. A todo matches when it
+    contains every word searched for, and ranks by the sum of those weights, each scaled
+    by how rare the word is (its inverse document frequency). Ties go to the todo written
+    more recently; at startup todos are indexed in creation order.
+
+    A search walks every todo containing its rarest word, keeps those containing the
+    other words, scores them all and picks the best `offset + limit` with a bounded heap.
+    Its cost grows with the number of todos containing the rarest word searched for. Only
+    finding the matches holds the lock; they are scored and ranked after it is released.
+
+    The index only learns about writes it is told about (see `IndexingTodoRepository`).
+    """
+
+    def __init__(self) -> None:
+        self._postings = _Postings()
+        # Writes arrive from commit callbacks on any worker thread.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._postings.todos)
+
+    def rebuild(self, todos: Iterable[Todo]) -> None:
+        """Replace the whole index with `todos`; searches see the old one until it is built."""
+        postings = _Postings()
+        for todo in todos:
+            postings.add(todo.id, todo.title, todo.description)
+        with self._lock:
+            self._postings = postings
+
+    def put(self, todo_id: UUID7, title: str, description: str | None) -> None:
+        """Index a todo, replacing what was indexed for it before."""
+        with self._lock:
+            self._postings.remove(todo_id)
+            self._postings.add(todo_id, title, description)
+
+    def remove(self, todo_id: UUID7) -> None:
+        with self._lock:
+            self._postings.remove(todo_id)
+
+    def search(self, text: str, offset: int, limit: int) -> list[UUID7]:
+        searched = set(tokenize(text))
+        if not searched:
+            return []
+
+        with self._lock:
+            postings = self._postings
+            matching: list[dict[int, int]] = []
+            for word in searched:
+                weights = postings.by_word.get(word)
+                if not weights:
+                    return []
+                matching.append(weights)
+            matching.sort(key=len)
+
+            # filter and map keep the per-todo work in C; these loops run once per word.
+            newest_first: Iterator[int] = reversed(matching[0])
+            for weights in matching[1:]:
+                newest_first = filter(weights.__contains__, newest_first)
+            matches = list(newest_first)
+            # Copied out in C while the index cannot change. Scoring and ranking, the
+            # slow part, run on the copies without the lock, so writers do not wait on them.
+            todo_count = len(postings.todos)
+            word_weights = [
+                (len(weights), list(map(weights.__getitem__, matches))) for weights in matching
+            ]
+
+        scores = [0.0] * len(matches)
+        for todos_with_word, weights in word_weights:
+            idf = math.log(1 + todo_count / todos_with_word)
+            weighted = map(operator.mul, weights, itertools.repeat(idf))
+            scores = list(map(operator.add, scores, weighted))
+        # nlargest keeps equal scores in the order they came in, newest first.
+        best = heapq.nlargest(offset + limit, range(len(matches)), key=scores.__getitem__)
+
+        with self._lock:
+            # A todo written since the matches were found has a new number, and one that
+            # was removed has none; either way the page leaves it out.
+            found = map(postings.todos.get, (matches[position] for position in best[offset:]))
+            return [todo[0] for todo in found if todo is not None]
+
+
+class _Postings:
+    """The words of each indexed todo, and the todos each word appears in.
+
+    Todos are numbered in the order they are written, and rewriting one gives it a new
+    number, so each word's todos stay in write order. Small ints also hash much faster
+    than UUIDs, which matters when a search looks up thousands of them.
+    """
+
+    def __init__(self) -> None:
+        self.by_word: dict[str, dict[int, int]] = {}
+        self.todos: dict[int, tuple[UUID7, tuple[str, ...]]] = {}
+        self.numbers: dict[UUID7, int] = {}
+        self._next_number = itertools.count()
+
+    def add(self, todo_id: UUID7, title: str, description: str | None) -> None:
+        # Words are interned, so every todo containing one shares a single copy of it.
+        weights: dict[str, int] = {}
+        for word in tokenize(title):
+            word = sys.intern(word)
+            weights[word] = weights.get(word, 0) + TITLE_WEIGHT
+        for word in tokenize(description or ""):
+            word = sys.intern(word)
+            weights[word] = weights.get(word, 0) + 1
+
+        number = next(self._next_number)
+        for word, weight in weights.items():
+            self.by_word.setdefault(word, {})[number] = weight
+        self.todos[number] = (todo_id, tuple(weights))
+        self.numbers[todo_id] = number
+
+    def remove(self, todo_id: UUID7) -> None:
+        number = self.numbers.pop(todo_id, None)
+        if number is None:
+            return
+        _, words = self.todos.pop(number)
+        for word in words:
+            weights = self.by_word[word]
+            del weights[number]
+            if not weights:
+                del self.by_word[word]
@@ -0,0 +1,8 @@
+import re
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """The case-folded words of `text`, in order and with repeats."""
+    return _WORD.findall(text.casefold())
@@ -0,0 +1,22 @@
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from todo_api.application_service.service.transaction_service import AsyncTransactionService
+from todo_api.domain.repository.context_provider import AsyncContextProvider
+
+T = TypeVar("T")
+
+
+class AsyncTransactionServiceImpl(AsyncTransactionService):
+    def __init__(self, context_provider: AsyncContextProvider[AsyncSession]) -> None:
+        self.context_provider = context_provider
+
+    async def Run(self, func: Callable[[], Awaitable[T]]) -> T:
+        async with self.context_provider.transaction():
+            return await func()
+
+    async def RunReadOnly(self, func: Callable[[], Awaitable[T]]) -> T:
+        async with self.context_provider.transaction(read_only=True):
+            return await func()
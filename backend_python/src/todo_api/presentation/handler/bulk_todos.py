@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+from todo_api.application_service.usecase.bulk_todo_result import BulkTodoResult
+from todo_api.utils.uuid import UUID7
+
+MAX_BULK_SIZE = 1000
+
+
+class BulkTodosRequest(BaseModel):
+    ids: list[UUID7] = Field(min_length=1, max_length=MAX_BULK_SIZE)
+
+
+class BulkTodoResultDTO(BaseModel):
+    id: str
+    outcome: str
+
+
+class BulkTodosResponse(BaseModel):
+    results: list[BulkTodoResultDTO]
+
+
+def to_bulk_response(results: list[BulkTodoResult]) -> BulkTodosResponse:
+    return BulkTodosResponse(
+        results=[
+            BulkTodoResultDTO(id=str(result.id), outcome=result.outcome.value) for result in results
+        ]
+    )
@@ -0,0 +1,46 @@
+import hashlib
+
+from fastapi import Response
+
+from todo_api.application_service.usecase.get_all_todos_usecase import ANY_VERSION
+from todo_api.domain.model.todo import Todo
+from todo_api.presentation.handler.todo_json import dumps, todo_fields
+
+
+def etag(version: str) -> str:
+    return f'"{version}"'
+
+
+def known_versions(if_none_match: str | None) -> frozenset[str]:
+    """The versions an `If-None-Match` header names.
+
+    `If-None-Match` uses the weak comparison, so `W/"v"` and `"v"` both name `v`.
+    `*` names every version and comes back as `ANY_VERSION`; see `is_known_version`.
+    """
+    if not if_none_match:
+        return frozenset()
+    if if_none_match.strip() == "*":
+        return frozenset({ANY_VERSION})
+    versions: set[str] = set()
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if len(tag) >= 2 and tag[0] == tag[-1] == '"':
+            versions.add(tag[1:-1])
+    return frozenset(versions)
+
+
+def todo_version(todo: Todo) -> str:
+    """A digest of the todo's response fields.
+
+    Single todos are versioned by content rather than `updated_at`: the row is read
+    anyway (often from the cache), and two edits within one second share an `updated_at`.
+    """
+    return hashlib.blake2b(dumps(todo_fields(todo)), digest_size=16).hexdigest()
+
+
+def etag_headers(version: str | None) -> dict[str, str]:
+    return {} if version is None else {"ETag": etag(version)}
+
+
+def not_modified(version: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag(version)})
@@ -1,9 +1,11 @@
 from pydantic import BaseModel
 
 from todo_api.application_service.usecase.create_todo_usecase import (
+    AsyncCreateTodoUsecase,
     CreateTodoUsecase,
     CreateTodoUsecaseInput,
 )
+from todo_api.domain.model.todo import Todo
 
 
 class CreateTodoRequest(BaseModel):
@@ -30,9 +32,28 @@ class CreateTodoHandler:
             )
         )
 
-        return CreateTodoResponse(
-            id=str(result.todo.id),
-            title=result.todo.title,
-            description=result.todo.description,
-            completed=result.todo.completed,
+        return _to_response(result.todo)
+
+
+class AsyncCreateTodoHandler:
+    def __init__(self, create_todo_usecase: AsyncCreateTodoUsecase) -> None:
+        self.create_todo_usecase = create_todo_usecase
+
+    async def handle(self, request: CreateTodoRequest) -> CreateTodoResponse:
+        result = await self.create_todo_usecase.execute(
+            CreateTodoUsecaseInput(
+                title=request.title,
+                description=request.description,
+            )
         )
+
+        return _to_response(result.todo)
+
+
+def _to_response(todo: Todo) -> CreateTodoResponse:
+    return CreateTodoResponse(
+        id=str(todo.id),
+        title=todo.title,
+        description=todo.description,
+        completed=todo.completed,
+    )
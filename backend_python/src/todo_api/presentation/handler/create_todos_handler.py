@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+
+from todo_api.application_service.usecase.create_todo_usecase import CreateTodoUsecaseInput
+from todo_api.application_service.usecase.create_todos_usecase import (
+    CreateTodosUsecase,
+    CreateTodosUsecaseInput,
+)
+from todo_api.presentation.handler.create_todo_handler import (
+    CreateTodoRequest,
+    CreateTodoResponse,
+)
+
+MAX_BATCH_SIZE = 1000
+
+
+class CreateTodosRequest(BaseModel):
+    todos: list[CreateTodoRequest] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class CreateTodosResponse(BaseModel):
+    todos: list[CreateTodoResponse]
+
+
+class CreateTodosHandler:
+    def __init__(self, create_todos_usecase: CreateTodosUsecase) -> None:
+        self.create_todos_usecase = create_todos_usecase
+
+    def handle(self, request: CreateTodosRequest) -> CreateTodosResponse:
+        result = self.create_todos_usecase.execute(
+            CreateTodosUsecaseInput(
+                items=[
+                    CreateTodoUsecaseInput(title=item.title, description=item.description)
+                    for item in request.todos
+                ]
+            )
+        )
+
+        return CreateTodosResponse(
+            todos=[
+                CreateTodoResponse(
+                    id=str(todo.id),
+                    title=todo.title,
+                    description=todo.description,
+                    completed=todo.completed,
+                )
+                for todo in result.todos
+            ]
+        )
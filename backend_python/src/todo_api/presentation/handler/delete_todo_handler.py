@@ -1,4 +1,5 @@
 from todo_api.application_service.usecase.delete_todo_usecase import (
+    AsyncDeleteTodoUsecase,
     DeleteTodoUsecase,
     DeleteTodoUsecaseInput,
 )
@@ -17,3 +18,15 @@ class DeleteTodoHandler:
         except RepositoryNotFoundError:
             raise NotFoundError(message="Todo not found")
         return None
+
+
+class AsyncDeleteTodoHandler:
+    def __init__(self, delete_todo_usecase: AsyncDeleteTodoUsecase) -> None:
+        self.delete_todo_usecase = delete_todo_usecase
+
+    async def handle(self, id: UUID7) -> None:
+        try:
+            await self.delete_todo_usecase.execute(DeleteTodoUsecaseInput(id=id))
+        except RepositoryNotFoundError:
+            raise NotFoundError(message="Todo not found")
+        return None
@@ -0,0 +1,18 @@
+from todo_api.application_service.usecase.delete_todos_usecase import (
+    DeleteTodosUsecase,
+    DeleteTodosUsecaseInput,
+)
+from todo_api.presentation.handler.bulk_todos import (
+    BulkTodosRequest,
+    BulkTodosResponse,
+    to_bulk_response,
+)
+
+
+class DeleteTodosHandler:
+    def __init__(self, delete_todos_usecase: DeleteTodosUsecase) -> None:
+        self.delete_todos_usecase = delete_todos_usecase
+
+    def handle(self, request: BulkTodosRequest) -> BulkTodosResponse:
+        result = self.delete_todos_usecase.execute(DeleteTodosUsecaseInput(ids=request.ids))
+        return to_bulk_response(result.results)
@@ -1,9 +1,24 @@
+import base64
+import binascii
+from datetime import datetime
+
+from fastapi import Response
 from pydantic import BaseModel
+from uuid_utils import UUID as UUIDUtils
 
 from todo_api.application_service.usecase.get_all_todos_usecase import (
+    AsyncGetAllTodosUsecase,
     GetAllTodosUsecase,
     GetAllTodosUsecaseInput,
+    GetAllTodosUsecaseOutput,
 )
+from todo_api.domain.model.todo_query import TodoQuery, TodoSort
+from todo_api.presentation.handler.conditional import etag_headers, known_versions, not_modified
+from todo_api.presentation.handler.todo_json import RawJSONResponse, render_todo_page
+from todo_api.presentation.middleware.error_handler import BadRequestError
+from todo_api.utils.uuid import UUID7, parse_uuid7
+
+MAX_PAGE_SIZE = 100
 
 
 class TodoDTO(BaseModel):
@@ -14,22 +29,170 @@ class TodoDTO(BaseModel):
 
 
 class GetAllTodosResponse(BaseModel):
+    """A page of todos. `next_cursor` is only set, and rendered, when the list is paged."""
+
     todos: list[TodoDTO]
+    next_cursor: str | None = None
+
+
+class TodoFilters(BaseModel):
+    """Query parameters that narrow or reorder `GET /todos`; a filtered list is always paged."""
+
+    completed: bool | None = None
+    title_prefix: str | None = None
+    created_from: datetime | None = None
+    created_before: datetime | None = None
+    sort: TodoSort | None = None
+
+
+def _encode_cursor(after_id: UUID7, after_title: str | None = None) -> str:
+    raw = after_id.bytes if after_title is None else after_id.bytes + after_title.encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[UUID7, str | None]:
+    """The last id of the previous page, and its title if the list is sorted by title."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        after_id = parse_uuid7(UUIDUtils(bytes=raw[:16]))
+        return after_id, raw[16:].decode() if len(raw) > 16 else None
+    except (binascii.Error, ValueError, TypeError):
+        raise BadRequestError(message="Invalid cursor")
 
 
 class GetAllTodosHandler:
     def __init__(self, get_all_todos_usecase: GetAllTodosUsecase) -> None:
         self.get_all_todos_usecase = get_all_todos_usecase
 
-    def handle(self) -> GetAllTodosResponse:
-        result = self.get_all_todos_usecase.execute(GetAllTodosUsecaseInput())
-        todos = [
-            TodoDTO(
-                id=str(todo.id),
-                title=todo.title,
-                description=todo.description,
-                completed=todo.completed,
-            )
-            for todo in result.todos
-        ]
+    def handle(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        if_none_match: str | None = None,
+        response: Response | None = None,
+        filters: TodoFilters | None = None,
+    ) -> GetAllTodosResponse | Response:
+        """List todos; the full list carries an ETag, set on `response`, and may answer 304."""
+        input_dto = _to_input(cursor, limit, if_none_match, filters)
+        result = self.get_all_todos_usecase.execute(input_dto)
+        if result.not_modified and result.version is not None:
+            return not_modified(result.version)
+        if response is not None:
+            response.headers.update(etag_headers(result.version))
+        return _to_response(result, input_dto)
+
+    def handle_json(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        if_none_match: str | None = None,
+        filters: TodoFilters | None = None,
+    ) -> Response:
+        """`handle`, rendered straight to a `GetAllTodosResponse` JSON body."""
+        input_dto = _to_input(cursor, limit, if_none_match, filters)
+        result = self.get_all_todos_usecase.execute(input_dto)
+        if result.not_modified and result.version is not None:
+            return not_modified(result.version)
+        return _to_json(result, input_dto)
+
+
+class AsyncGetAllTodosHandler:
+    def __init__(self, get_all_todos_usecase: AsyncGetAllTodosUsecase) -> None:
+        self.get_all_todos_usecase = get_all_todos_usecase
+
+    async def handle(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        if_none_match: str | None = None,
+        response: Response | None = None,
+        filters: TodoFilters | None = None,
+    ) -> GetAllTodosResponse | Response:
+        input_dto = _to_input(cursor, limit, if_none_match, filters)
+        result = await self.get_all_todos_usecase.execute(input_dto)
+        if result.not_modified and result.version is not None:
+            return not_modified(result.version)
+        if response is not None:
+            response.headers.update(etag_headers(result.version))
+        return _to_response(result, input_dto)
+
+    async def handle_json(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        if_none_match: str | None = None,
+        filters: TodoFilters | None = None,
+    ) -> Response:
+        input_dto = _to_input(cursor, limit, if_none_match, filters)
+        result = await self.get_all_todos_usecase.execute(input_dto)
+        if result.not_modified and result.version is not None:
+            return not_modified(result.version)
+        return _to_json(result, input_dto)
+
+
+def _to_input(
+    cursor: str | None,
+    limit: int | None,
+    if_none_match: str | None,
+    filters: TodoFilters | None,
+) -> GetAllTodosUsecaseInput:
+    filtered = filters is not None and filters != TodoFilters()
+    if (cursor is not None or filtered) and limit is None:
+        limit = MAX_PAGE_SIZE
+    after_id, after_title = _decode_cursor(cursor) if cursor is not None else (None, None)
+    if filters is None or not filtered:
+        return GetAllTodosUsecaseInput(
+            after_id=after_id, limit=limit, known_versions=known_versions(if_none_match)
+        )
+
+    query = TodoQuery(
+        completed=filters.completed,
+        title_prefix=filters.title_prefix,
+        created_from=filters.created_from,
+        created_before=filters.created_before,
+        sort=filters.sort or TodoSort.CREATED,
+        after_id=after_id,
+        after_title=after_title,
+    )
+    return GetAllTodosUsecaseInput(limit=limit, query=query)
+
+
+def _to_response(
+    result: GetAllTodosUsecaseOutput, input_dto: GetAllTodosUsecaseInput
+) -> GetAllTodosResponse:
+    todos = [
+        TodoDTO(
+            id=str(todo.id),
+            title=todo.title,
+            description=todo.description,
+            completed=todo.completed,
+        )
+        for todo in result.todos
+    ]
+    if input_dto.limit is None:
+        # The unpaged list keeps the shape it had before paging existed.
         return GetAllTodosResponse(todos=todos)
+    return GetAllTodosResponse(todos=todos, next_cursor=_next_cursor(result, input_dto))
+
+
+def _to_json(
+    result: GetAllTodosUsecaseOutput, input_dto: GetAllTodosUsecaseInput
+) -> RawJSONResponse:
+    next_cursor = _next_cursor(result, input_dto)
+    return render_todo_page(
+        result.todos,
+        next_cursor,
+        etag_headers(result.version),
+        paged=input_dto.limit is not None,
+    )
+
+
+def _next_cursor(
+    result: GetAllTodosUsecaseOutput, input_dto: GetAllTodosUsecaseInput
+) -> str | None:
+    if result.next_after_id is None:
+        return None
+    if input_dto.query is not None and input_dto.query.sort.by_title:
+        # Title order is keyed on (title, id), so the cursor has to carry both.
+        return _encode_cursor(result.next_after_id, result.todos[-1].title)
+    return _encode_cursor(result.next_after_id)
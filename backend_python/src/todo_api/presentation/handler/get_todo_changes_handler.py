@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from todo_api.application_service.usecase.get_todo_changes_usecase import (
+    AsyncGetTodoChangesUsecase,
+    GetTodoChangesUsecase,
+    GetTodoChangesUsecaseInput,
+    GetTodoChangesUsecaseOutput,
+)
+from todo_api.domain.repository.errors import RepositoryChangesExpiredError
+from todo_api.presentation.handler.get_all_todos_handler import TodoDTO
+from todo_api.presentation.middleware.error_handler import BadRequestError, GoneError
+
+
+class GetTodoChangesResponse(BaseModel):
+    todos: list[TodoDTO]
+    deleted_ids: list[str]
+    next_since: str
+
+
+class GetTodoChangesHandler:
+    def __init__(self, get_todo_changes_usecase: GetTodoChangesUsecase) -> None:
+        self.get_todo_changes_usecase = get_todo_changes_usecase
+
+    def handle(self, since: str | None = None) -> GetTodoChangesResponse:
+        try:
+            result = self.get_todo_changes_usecase.execute(_to_input(since))
+        except RepositoryChangesExpiredError:
+            raise GoneError(message="since is too old; list every todo again")
+        return _to_response(result)
+
+
+class AsyncGetTodoChangesHandler:
+    def __init__(self, get_todo_changes_usecase: AsyncGetTodoChangesUsecase) -> None:
+        self.get_todo_changes_usecase = get_todo_changes_usecase
+
+    async def handle(self, since: str | None = None) -> GetTodoChangesResponse:
+        try:
+            result = await self.get_todo_changes_usecase.execute(_to_input(since))
+        except RepositoryChangesExpiredError:
+            raise GoneError(message="since is too old; list every todo again")
+        return _to_response(result)
+
+
+def _to_input(since: str | None) -> GetTodoChangesUsecaseInput:
+    if since is None:
+        return GetTodoChangesUsecaseInput()
+    try:
+        return GetTodoChangesUsecaseInput(since=datetime.fromisoformat(since))
+    except ValueError:
+        raise BadRequestError(message="Invalid since")
+
+
+def _to_response(result: GetTodoChangesUsecaseOutput) -> GetTodoChangesResponse:
+    todos = [
+        TodoDTO(
+            id=str(todo.id),
+            title=todo.title,
+            description=todo.description,
+            completed=todo.completed,
+        )
+        for todo in result.todos
+    ]
+    return GetTodoChangesResponse(
+        todos=todos,
+        deleted_ids=[str(todo_id) for todo_id in result.deleted_ids],
+        next_since=result.watermark.isoformat(),
+    )
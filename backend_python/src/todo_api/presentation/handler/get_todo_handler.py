@@ -1,10 +1,21 @@
+from fastapi import Response
 from pydantic import BaseModel
 
+from todo_api.application_service.usecase.get_all_todos_usecase import is_known_version
 from todo_api.application_service.usecase.get_todo_usecase import (
+    AsyncGetTodoUsecase,
     GetTodoUsecase,
     GetTodoUsecaseInput,
 )
+from todo_api.domain.model.todo import Todo
 from todo_api.domain.repository.errors import RepositoryNotFoundError
+from todo_api.presentation.handler.conditional import (
+    etag_headers,
+    known_versions,
+    not_modified,
+    todo_version,
+)
+from todo_api.presentation.handler.todo_json import render_todo
 from todo_api.presentation.middleware.error_handler import NotFoundError
 from todo_api.utils.uuid import UUID7
 
@@ -20,14 +31,68 @@ class GetTodoHandler:
     def __init__(self, get_todo_usecase: GetTodoUsecase) -> None:
         self.get_todo_usecase = get_todo_usecase
 
-    def handle(self, id: UUID7) -> GetTodoResponse:
+    def handle(
+        self, id: UUID7, if_none_match: str | None = None, response: Response | None = None
+    ) -> GetTodoResponse | Response:
+        """Get one todo, with an ETag set on `response`; 304 when `if_none_match` names it."""
+        todo = self._find(id)
+        version = todo_version(todo)
+        if is_known_version(version, known_versions(if_none_match)):
+            return not_modified(version)
+        if response is not None:
+            response.headers.update(etag_headers(version))
+        return _to_response(todo)
+
+    def handle_json(self, id: UUID7, if_none_match: str | None = None) -> Response:
+        """`handle`, rendered straight to a `GetTodoResponse` JSON body."""
+        todo = self._find(id)
+        version = todo_version(todo)
+        if is_known_version(version, known_versions(if_none_match)):
+            return not_modified(version)
+        return render_todo(todo, etag_headers(version))
+
+    def _find(self, id: UUID7) -> Todo:
         try:
             result = self.get_todo_usecase.execute(GetTodoUsecaseInput(id=id))
         except RepositoryNotFoundError:
             raise NotFoundError(message="Todo not found")
-        return GetTodoResponse(
-            id=str(result.todo.id),
-            title=result.todo.title,
-            description=result.todo.description,
-            completed=result.todo.completed,
-        )
+        return result.todo
+
+
+class AsyncGetTodoHandler:
+    def __init__(self, get_todo_usecase: AsyncGetTodoUsecase) -> None:
+        self.get_todo_usecase = get_todo_usecase
+
+    async def handle(
+        self, id: UUID7, if_none_match: str | None = None, response: Response | None = None
+    ) -> GetTodoResponse | Response:
+        todo = await self._find(id)
+        version = todo_version(todo)
+        if is_known_version(version, known_versions(if_none_match)):
+            return not_modified(version)
+        if response is not None:
+            response.headers.update(etag_headers(version))
+        return _to_response(todo)
+
+    async def handle_json(self, id: UUID7, if_none_match: str | None = None) -> Response:
+        todo = await self._find(id)
+        version = todo_version(todo)
+        if is_known_version(version, known_versions(if_none_match)):
+            return not_modified(version)
+        return render_todo(todo, etag_headers(version))
+
+    async def _find(self, id: UUID7) -> Todo:
+        try:
+            result = await self.get_todo_usecase.execute(GetTodoUsecaseInput(id=id))
+        except RepositoryNotFoundError:
+            raise NotFoundError(message="Todo not found")
+        return result.todo
+
+
+def _to_response(todo: Todo) -> GetTodoResponse:
+    return GetTodoResponse(
+        id=str(todo.id),
+        title=todo.title,
+        description=todo.description,
+        completed=todo.completed,
+    )
@@ -0,0 +1,37 @@
+from pydantic import BaseModel
+
+from todo_api.application_service.usecase.get_todo_stats_usecase import (
+    AsyncGetTodoStatsUsecase,
+    GetTodoStatsUsecase,
+    GetTodoStatsUsecaseInput,
+    GetTodoStatsUsecaseOutput,
+)
+
+
+class GetTodoStatsResponse(BaseModel):
+    total: int
+    completed: int
+    open: int
+
+
+class GetTodoStatsHandler:
+    def __init__(self, get_todo_stats_usecase: GetTodoStatsUsecase) -> None:
+        self.get_todo_stats_usecase = get_todo_stats_usecase
+
+    def handle(self) -> GetTodoStatsResponse:
+        result = self.get_todo_stats_usecase.execute(GetTodoStatsUsecaseInput())
+        return _to_response(result)
+
+
+class AsyncGetTodoStatsHandler:
+    def __init__(self, get_todo_stats_usecase: AsyncGetTodoStatsUsecase) -> None:
+        self.get_todo_stats_usecase = get_todo_stats_usecase
+
+    async def handle(self) -> GetTodoStatsResponse:
+        result = await self.get_todo_stats_usecase.execute(GetTodoStatsUsecaseInput())
+        return _to_response(result)
+
+
+def _to_response(result: GetTodoStatsUsecaseOutput) -> GetTodoStatsResponse:
+    stats = result.stats
+    return GetTodoStatsResponse(total=stats.total, completed=stats.completed, open=stats.open)
@@ -1,10 +1,12 @@
 from pydantic import BaseModel
 
 from todo_api.application_service.usecase.mark_as_completed_todo_usecase import (
+    AsyncMarkAsCompletedTodoUsecase,
     MarkAsCompletedTodoUsecase,
     MarkAsCompletedTodoUsecaseInput,
 )
 from todo_api.domain.model.errors import TodoAlreadyCompletedError
+from todo_api.domain.model.todo import Todo
 from todo_api.domain.repository.errors import RepositoryNotFoundError
 from todo_api.presentation.middleware.error_handler import ConflictError, NotFoundError
 from todo_api.utils.uuid import UUID7
@@ -28,9 +30,29 @@ class MarkAsCompletedTodoHandler:
             raise NotFoundError(message="Todo not found")
         except TodoAlreadyCompletedError:
             raise ConflictError(message="Todo is already completed")
-        return MarkAsCompletedTodoResponse(
-            id=str(result.todo.id),
-            title=result.todo.title,
-            description=result.todo.description,
-            completed=result.todo.completed,
-        )
+        return _to_response(result.todo)
+
+
+class AsyncMarkAsCompletedTodoHandler:
+    def __init__(self, mark_as_completed_usecase: AsyncMarkAsCompletedTodoUsecase) -> None:
+        self.mark_as_completed_usecase = mark_as_completed_usecase
+
+    async def handle(self, id: UUID7) -> MarkAsCompletedTodoResponse:
+        try:
+            result = await self.mark_as_completed_usecase.execute(
+                MarkAsCompletedTodoUsecaseInput(id=id)
+            )
+        except RepositoryNotFoundError:
+            raise NotFoundError(message="Todo not found")
+        except TodoAlreadyCompletedError:
+            raise ConflictError(message="Todo is already completed")
+        return _to_response(result.todo)
+
+
+def _to_response(todo: Todo) -> MarkAsCompletedTodoResponse:
+    return MarkAsCompletedTodoResponse(
+        id=str(todo.id),
+        title=todo.title,
+        description=todo.description,
+        completed=todo.completed,
+    )
@@ -0,0 +1,20 @@
+from todo_api.application_service.usecase.mark_as_completed_todos_usecase import (
+    MarkAsCompletedTodosUsecase,
+    MarkAsCompletedTodosUsecaseInput,
+)
+from todo_api.presentation.handler.bulk_todos import (
+    BulkTodosRequest,
+    BulkTodosResponse,
+    to_bulk_response,
+)
+
+
+class MarkAsCompletedTodosHandler:
+    def __init__(self, mark_as_completed_todos_usecase: MarkAsCompletedTodosUsecase) -> None:
+        self.mark_as_completed_todos_usecase = mark_as_completed_todos_usecase
+
+    def handle(self, request: BulkTodosRequest) -> BulkTodosResponse:
+        result = self.mark_as_completed_todos_usecase.execute(
+            MarkAsCompletedTodosUsecaseInput(ids=request.ids)
+        )
+        return to_bulk_response(result.results)
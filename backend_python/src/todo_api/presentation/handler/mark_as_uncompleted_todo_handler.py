@@ -1,10 +1,12 @@
 from pydantic import BaseModel
 
 from todo_api.application_service.usecase.mark_as_uncompleted_todo_usecase import (
+    AsyncMarkAsUncompletedTodoUsecase,
     MarkAsUncompletedTodoUsecase,
     MarkAsUncompletedTodoUsecaseInput,
 )
 from todo_api.domain.model.errors import TodoNotCompletedError
+from todo_api.domain.model.todo import Todo
 from todo_api.domain.repository.errors import RepositoryNotFoundError
 from todo_api.presentation.middleware.error_handler import ConflictError, NotFoundError
 from todo_api.utils.uuid import UUID7
@@ -30,9 +32,29 @@ class MarkAsUnCompletedTodoHandler:
             raise NotFoundError(message="Todo not found")
         except TodoNotCompletedError:
             raise ConflictError(message="Todo is not completed")
-        return MarkAsUnCompletedTodoResponse(
-            id=str(result.todo.id),
-            title=result.todo.title,
-            description=result.todo.description,
-            completed=result.todo.completed,
-        )
+        return _to_response(result.todo)
+
+
+class AsyncMarkAsUnCompletedTodoHandler:
+    def __init__(self, mark_as_uncompleted_usecase: AsyncMarkAsUncompletedTodoUsecase) -> None:
+        self.mark_as_uncompleted_usecase = mark_as_uncompleted_usecase
+
+    async def handle(self, id: UUID7) -> MarkAsUnCompletedTodoResponse:
+        try:
+            result = await self.mark_as_uncompleted_usecase.execute(
+                MarkAsUncompletedTodoUsecaseInput(id=id)
+            )
+        except RepositoryNotFoundError:
+            raise NotFoundError(message="Todo not found")
+        except TodoNotCompletedError:
+            raise ConflictError(message="Todo is not completed")
+        return _to_response(result.todo)
+
+
+def _to_response(todo: Todo) -> MarkAsUnCompletedTodoResponse:
+    return MarkAsUnCompletedTodoResponse(
+        id=str(todo.id),
+        title=todo.title,
+        description=todo.description,
+        completed=todo.completed,
+    )
@@ -0,0 +1,20 @@
+from todo_api.application_service.usecase.mark_as_uncompleted_todos_usecase import (
+    MarkAsUncompletedTodosUsecase,
+    MarkAsUncompletedTodosUsecaseInput,
+)
+from todo_api.presentation.handler.bulk_todos import (
+    BulkTodosRequest,
+    BulkTodosResponse,
+    to_bulk_response,
+)
+
+
+class MarkAsUnCompletedTodosHandler:
+    def __init__(self, mark_as_uncompleted_todos_usecase: MarkAsUncompletedTodosUsecase) -> None:
+        self.mark_as_uncompleted_todos_usecase = mark_as_uncompleted_todos_usecase
+
+    def handle(self, request: BulkTodosRequest) -> BulkTodosResponse:
+        result = self.mark_as_uncompleted_todos_usecase.execute(
+            MarkAsUncompletedTodosUsecaseInput(ids=request.ids)
+        )
+        return to_bulk_response(result.results)
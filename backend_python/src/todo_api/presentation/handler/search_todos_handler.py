@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+
+from todo_api.application_service.usecase.search_todos_usecase import (
+    SearchTodosUsecase,
+    SearchTodosUsecaseInput,
+    SearchTodosUsecaseOutput,
+)
+from todo_api.presentation.handler.get_all_todos_handler import TodoDTO
+
+SEARCH_PAGE_SIZE = 20
+# Deep pages cost the index every match before them, so they are not offered.
+MAX_SEARCH_OFFSET = 1000
+
+
+class SearchTodosResponse(BaseModel):
+    todos: list[TodoDTO]
+    next_offset: int | None = None
+
+
+class SearchTodosHandler:
+    def __init__(self, search_todos_usecase: SearchTodosUsecase) -> None:
+        self.search_todos_usecase = search_todos_usecase
+
+    def handle(self, q: str, offset: int = 0, limit: int = SEARCH_PAGE_SIZE) -> SearchTodosResponse:
+        input_dto = SearchTodosUsecaseInput(text=q, offset=offset, limit=limit)
+        result = self.search_todos_usecase.execute(input_dto)
+        return _to_response(result)
+
+
+def _to_response(result: SearchTodosUsecaseOutput) -> SearchTodosResponse:
+    todos = [
+        TodoDTO(
+            id=str(todo.id),
+            title=todo.title,
+            description=todo.description,
+            completed=todo.completed,
+        )
+        for todo in result.todos
+    ]
+    return SearchTodosResponse(todos=todos, next_offset=result.next_offset)
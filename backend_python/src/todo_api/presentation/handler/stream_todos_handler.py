@@ -0,0 +1,73 @@
+from collections.abc import Iterator
+
+from todo_api.application_service.usecase.stream_todos_usecase import (
+    StreamTodosUsecase,
+    StreamTodosUsecaseInput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.presentation.handler.get_all_todos_handler import TodoFilters
+from todo_api.presentation.handler.todo_json import dumps, todo_fields
+from todo_api.presentation.middleware.error_handler import BadRequestError
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_JSON_MEDIA_RANGES = ("application/json", "application/*", "*/*")
+
+
+def prefers_ndjson(accept: str | None) -> bool:
+    """Whether an `Accept` header ranks NDJSON at least as high as plain JSON."""
+    if not accept:
+        return False
+    quality: dict[str, float] = {}
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        media_type = media_type.lower()
+        quality[media_type] = max(quality.get(media_type, 0.0), q)
+
+    ndjson = quality.get(NDJSON_MEDIA_TYPE, 0.0)
+    return ndjson > 0 and all(ndjson >= quality.get(other, 0.0) for other in _JSON_MEDIA_RANGES)
+
+
+class StreamTodosHandler:
+    def __init__(self, stream_todos_usecase: StreamTodosUsecase, batch_size: int = 500) -> None:
+        self.stream_todos_usecase = stream_todos_usecase
+        self.batch_size = batch_size
+
+    def handle(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        filters: TodoFilters | None = None,
+    ) -> Iterator[bytes]:
+        """Render every todo as NDJSON, emitting one chunk per batch of rows.
+
+        The stream always covers the whole list, so paging and filter parameters are
+        refused up front rather than silently ignored.
+        """
+        if cursor is not None or limit is not None or (filters or TodoFilters()) != TodoFilters():
+            raise BadRequestError(
+                message="Streaming does not support cursor, limit, filters or sort"
+            )
+        result = self.stream_todos_usecase.execute(
+            StreamTodosUsecaseInput(batch_size=self.batch_size)
+        )
+        return self._render(result.todos)
+
+    def _render(self, todos: Iterator[Todo]) -> Iterator[bytes]:
+        # The shared encoder escapes newlines inside strings, so each todo is one line,
+        # encoded exactly like the JSON list endpoints encode it.
+        lines: list[bytes] = []
+        for todo in todos:
+            lines.append(dumps(todo_fields(todo)))
+            if len(lines) >= self.batch_size:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
@@ -0,0 +1,55 @@
+import json
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from fastapi import Response
+
+from todo_api.domain.model.todo import Todo
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+
+class RawJSONResponse(Response):
+    """A response whose body is already-encoded JSON."""
+
+    media_type = "application/json"
+
+
+def todo_fields(todo: Todo) -> dict[str, Any]:
+    """The JSON object every todo response model renders, in the same key order."""
+    return {
+        "id": str(todo.id),
+        "title": todo.title,
+        "description": todo.description,
+        "completed": todo.completed,
+    }
+
+
+def render_todo(todo: Todo, headers: Mapping[str, str] | None = None) -> RawJSONResponse:
+    return RawJSONResponse(dumps(todo_fields(todo)), headers=headers)
+
+
+def render_todo_page(
+    todos: Iterable[Todo],
+    next_cursor: str | None,
+    headers: Mapping[str, str] | None = None,
+    *,
+    paged: bool = True,
+) -> RawJSONResponse:
+    """A `GetAllTodosResponse` body; `next_cursor` is left out of an unpaged list."""
+    body: dict[str, Any] = {"todos": [todo_fields(todo) for todo in todos]}
+    if paged:
+        body["next_cursor"] = next_cursor
+    return RawJSONResponse(dumps(body), headers=headers)
+
+
+def dumps(value: Any) -> bytes:
+    """Encode like FastAPI's JSONResponse, with orjson when the `fast-json` extra is installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
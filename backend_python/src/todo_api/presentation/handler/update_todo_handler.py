@@ -1,9 +1,11 @@
 from pydantic import BaseModel
 
 from todo_api.application_service.usecase.update_todo_usecase import (
+    AsyncUpdateTodoUsecase,
     UpdateTodoUsecase,
     UpdateTodoUsecaseInput,
 )
+from todo_api.domain.model.todo import Todo
 from todo_api.domain.repository.errors import RepositoryNotFoundError
 from todo_api.presentation.middleware.error_handler import NotFoundError
 from todo_api.utils.uuid import UUID7
@@ -32,9 +34,27 @@ class UpdateTodoHandler:
             )
         except RepositoryNotFoundError:
             raise NotFoundError(message="Todo not found")
-        return UpdateTodoResponse(
-            id=str(result.todo.id),
-            title=result.todo.title,
-            description=result.todo.description,
-            completed=result.todo.completed,
-        )
+        return _to_response(result.todo)
+
+
+class AsyncUpdateTodoHandler:
+    def __init__(self, update_todo_usecase: AsyncUpdateTodoUsecase) -> None:
+        self.update_todo_usecase = update_todo_usecase
+
+    async def handle(self, id: UUID7, request: UpdateTodoRequest) -> UpdateTodoResponse:
+        try:
+            result = await self.update_todo_usecase.execute(
+                UpdateTodoUsecaseInput(id=id, title=request.title, description=request.description)
+            )
+        except RepositoryNotFoundError:
+            raise NotFoundError(message="Todo not found")
+        return _to_response(result.todo)
+
+
+def _to_response(todo: Todo) -> UpdateTodoResponse:
+    return UpdateTodoResponse(
+        id=str(todo.id),
+        title=todo.title,
+        description=todo.description,
+        completed=todo.completed,
+    )
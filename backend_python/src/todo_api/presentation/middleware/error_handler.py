@@ -1,9 +1,9 @@
 import logging
-from collections.abc import Awaitable, Callable
 
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from todo_api.domain.repository.errors import RepositoryConflictError
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,11 @@ class HTTPError(Exception):
         self.message = message
 
 
+class BadRequestError(HTTPError):
+    def __init__(self, message: str) -> None:
+        super().__init__(status_code=400, message=message)
+
+
 class NotFoundError(HTTPError):
     def __init__(self, message: str) -> None:
         super().__init__(status_code=404, message=message)
@@ -24,21 +29,52 @@ class ConflictError(HTTPError):
         super().__init__(status_code=409, message=message)
 
 
-class ErrorHandler(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+class GoneError(HTTPError):
+    def __init__(self, message: str) -> None:
+        super().__init__(status_code=410, message=message)
+
+
+class ErrorHandler:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_tracking_start)
         except HTTPError as e:
-            return JSONResponse(
-                status_code=e.status_code,
-                content={"code": str(e.status_code), "message": e.message},
-            )
+            if response_started:
+                raise
+            await _error_response(e)(scope, receive, send)
+        except RepositoryConflictError as e:
+            # Commits raise it too, once the handler has returned, so it is mapped here.
+            if response_started:
+                raise
+            await _error_response(ConflictError(str(e)))(scope, receive, send)
         except Exception:
             logger.exception("Unhandled exception during request processing")
-            return JSONResponse(
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=500,
                 content={"code": "500", "message": "Internal server error"},
             )
+            await response(scope, receive, send)
+
+
+def _error_response(error: HTTPError) -> JSONResponse:
+    return JSONResponse(
+        status_code=error.status_code,
+        content={"code": str(error.status_code), "message": error.message},
+    )
@@ -1,32 +1,150 @@
-from collections.abc import Awaitable, Callable
-from types import FunctionType
+import math
+import time
+from contextlib import AsyncExitStack, ExitStack
+from typing import Any
 
-from fastapi import Request, Response
-from sqlalchemy.orm import Session
-from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from todo_api.domain.repository.context_provider import ContextProvider
+from todo_api.domain.repository.context_provider import AsyncContextProvider, ContextProvider
 
+PRIMARY_UNTIL_COOKIE = "todo_primary_until"
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
-class SessionMiddleware(BaseHTTPMiddleware):
-    """Bind a SQLAlchemy session to the request lifecycle."""
+
+class SessionMiddleware:
+    """Bind the context provider's session to the request lifecycle.
+
+    The request only opens a deferred transaction: requests that never touch the
+    repository (health checks, validation failures, unknown routes) take no connection.
+
+    A response with a known length commits (or rolls back) before its headers reach
+    the client; a streamed body keeps the transaction open until the last chunk has
+    been sent.
+
+    With `read_your_writes_seconds` set, a successful write also sets a cookie that
+    pins the client's requests to the primary for that long, so its reads do not hit
+    a replica that has not caught up with the write yet.
+    """
 
     def __init__(
         self,
-        app: FunctionType,
+        app: ASGIApp,
         *,
-        context_provider: ContextProvider[Session],
+        context_provider: ContextProvider[Any],
+        read_your_writes_seconds: float = 0.0,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._context_provider = context_provider
+        self._read_your_writes_seconds = read_your_writes_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with ExitStack() as stack:
+            pin_primary = _pinned_to_primary(scope, self._read_your_writes_seconds)
+            stack.enter_context(
+                self._context_provider.deferred_transaction(pin_primary=pin_primary)
+            )
+            start: Message | None = None
 
-    async def dispatch(
+            async def send_in_transaction(message: Message) -> None:
+                nonlocal start
+                if message["type"] == "http.response.start":
+                    if message["status"] >= 400:
+                        self._context_provider.rollback()
+                    _pin_after_write(scope, message, self._read_your_writes_seconds)
+                    if _has_streamed_body(message):
+                        await send(message)
+                    else:
+                        start = message
+                    return
+                if start is not None:
+                    if not message.get("more_body", False):
+                        stack.close()
+                    await send(start)
+                    start = None
+                await send(message)
+
+            await self.app(scope, receive, send_in_transaction)
+
+
+class AsyncSessionMiddleware:
+    """Bind an `AsyncSession` to the request lifecycle for the async route stack."""
+
+    def __init__(
         self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        with self._context_provider.transaction() as session:
-            response = await call_next(request)
-            if response.status_code >= 400 and session.in_transaction():
-                session.rollback()
-            return response
+        app: ASGIApp,
+        *,
+        context_provider: AsyncContextProvider[AsyncSession],
+        read_your_writes_seconds: float = 0.0,
+    ) -> None:
+        self.app = app
+        self._context_provider = context_provider
+        self._read_your_writes_seconds = read_your_writes_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with AsyncExitStack() as stack:
+            pin_primary = _pinned_to_primary(scope, self._read_your_writes_seconds)
+            await stack.enter_async_context(
+                self._context_provider.deferred_transaction(pin_primary=pin_primary)
+            )
+            start: Message | None = None
+
+            async def send_in_transaction(message: Message) -> None:
+                nonlocal start
+                if message["type"] == "http.response.start":
+                    if message["status"] >= 400:
+                        await self._context_provider.rollback()
+                    _pin_after_write(scope, message, self._read_your_writes_seconds)
+                    if _has_streamed_body(message):
+                        await send(message)
+                    else:
+                        start = message
+                    return
+                if start is not None:
+                    if not message.get("more_body", False):
+                        await stack.aclose()
+                    await send(start)
+                    start = None
+                await send(message)
+
+            await self.app(scope, receive, send_in_transaction)
+
+
+def _has_streamed_body(start: Message) -> bool:
+    # Responses with a known length are sent from the task that called the app, so the
+    # transaction can end before their headers go out. Chunked bodies may be sent from
+    # another task and still read from the session, so they keep it until the app returns.
+    if start["status"] in (204, 304):
+        return False
+    return all(name.lower() != b"content-length" for name, _ in start.get("headers", []))
+
+
+def _pinned_to_primary(scope: Scope, window: float) -> bool:
+    if window <= 0:
+        return False
+    try:
+        until = float(HTTPConnection(scope).cookies.get(PRIMARY_UNTIL_COOKIE, ""))
+    except ValueError:
+        return False
+    return time.time() < until
+
+
+def _pin_after_write(scope: Scope, start: Message, window: float) -> None:
+    if window <= 0 or scope["method"] in _SAFE_METHODS or start["status"] >= 400:
+        return
+    until = time.time() + window
+    MutableHeaders(scope=start).append(
+        "set-cookie",
+        f"{PRIMARY_UNTIL_COOKIE}={until:.3f}; Max-Age={math.ceil(window)}; Path=/; "
+        "HttpOnly; SameSite=lax",
+    )
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from fastapi import APIRouter, Body, Header, Path, Query, Response
+from fastapi.routing import APIRoute
+
+from todo_api.domain.model.todo_query import TodoSort
+from todo_api.presentation.handler.create_todo_handler import (
+    AsyncCreateTodoHandler,
+    CreateTodoRequest,
+    CreateTodoResponse,
+)
+from todo_api.presentation.handler.delete_todo_handler import AsyncDeleteTodoHandler
+from todo_api.presentation.handler.get_all_todos_handler import (
+    MAX_PAGE_SIZE,
+    AsyncGetAllTodosHandler,
+    GetAllTodosResponse,
+    TodoFilters,
+)
+from todo_api.presentation.handler.get_todo_changes_handler import (
+    AsyncGetTodoChangesHandler,
+    GetTodoChangesResponse,
+)
+from todo_api.presentation.handler.get_todo_handler import AsyncGetTodoHandler, GetTodoResponse
+from todo_api.presentation.handler.get_todo_stats_handler import (
+    AsyncGetTodoStatsHandler,
+    GetTodoStatsResponse,
+)
+from todo_api.presentation.handler.mark_as_completed_todo_handler import (
+    AsyncMarkAsCompletedTodoHandler,
+    MarkAsCompletedTodoResponse,
+)
+from todo_api.presentation.handler.mark_as_uncompleted_todo_handler import (
+    AsyncMarkAsUnCompletedTodoHandler,
+    MarkAsUnCompletedTodoResponse,
+)
+from todo_api.presentation.handler.update_todo_handler import (
+    AsyncUpdateTodoHandler,
+    UpdateTodoRequest,
+    UpdateTodoResponse,
+)
+from todo_api.utils.uuid import UUID7
+
+
+@dataclass
+class AsyncTodoRouterContainer:
+    create_todo: AsyncCreateTodoHandler
+    delete_todo: AsyncDeleteTodoHandler
+    get_all_todos: AsyncGetAllTodosHandler
+    get_todo: AsyncGetTodoHandler
+    get_todo_changes: AsyncGetTodoChangesHandler
+    get_todo_stats: AsyncGetTodoStatsHandler
+    mark_as_completed_todo: AsyncMarkAsCompletedTodoHandler
+    mark_as_uncompleted_todo: AsyncMarkAsUnCompletedTodoHandler
+    update_todo: AsyncUpdateTodoHandler
+
+
+def router(
+    container: AsyncTodoRouterContainer,
+    route_class: type[APIRoute] = APIRoute,
+    *,
+    fast_json: bool = False,
+) -> APIRouter:
+    """The shared todo API as `async def` routes, run on the event loop.
+
+    Unlike `todo_router.router` no request occupies a thread-pool worker, so the number
+    of requests in flight is bounded by the database connection pool instead.
+    `fast_json` works as it does for `todo_router.router`.
+    """
+    api = APIRouter(prefix="/todos", tags=["todos"], route_class=route_class)
+
+    @api.post("", response_model=CreateTodoResponse, status_code=201)
+    async def create_todo(request: CreateTodoRequest = Body()) -> CreateTodoResponse:  # pyright: ignore[reportUnusedFunction]
+        return await container.create_todo.handle(request)
+
+    @api.delete("/{id}", response_model=None, status_code=204)
+    async def delete_todo(id: UUID7 = Path(...)) -> None:  # pyright: ignore[reportUnusedFunction]
+        await container.delete_todo.handle(id)
+        return None
+
+    @api.get("", response_model=GetAllTodosResponse, response_model_exclude_unset=True)
+    async def get_all_todos(  # pyright: ignore[reportUnusedFunction]
+        response: Response,
+        cursor: str | None = Query(None),
+        limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        completed: bool | None = Query(None),
+        title_prefix: str | None = Query(None, max_length=255),
+        created_from: datetime | None = Query(None),
+        created_before: datetime | None = Query(None),
+        sort: TodoSort | None = Query(None),
+        if_none_match: str | None = Header(None),
+    ) -> GetAllTodosResponse | Response:
+        filters = TodoFilters(
+            completed=completed,
+            title_prefix=title_prefix,
+            created_from=created_from,
+            created_before=created_before,
+            sort=sort,
+        )
+        if fast_json:
+            return await container.get_all_todos.handle_json(cursor, limit, if_none_match, filters)
+        return await container.get_all_todos.handle(cursor, limit, if_none_match, response, filters)
+
+    @api.get("/changes", response_model=GetTodoChangesResponse)
+    async def get_todo_changes(since: str | None = Query(None)) -> GetTodoChangesResponse:  # pyright: ignore[reportUnusedFunction]
+        return await container.get_todo_changes.handle(since)
+
+    @api.get("/stats", response_model=GetTodoStatsResponse)
+    async def get_todo_stats() -> GetTodoStatsResponse:  # pyright: ignore[reportUnusedFunction]
+        return await container.get_todo_stats.handle()
+
+    @api.get("/{id}", response_model=GetTodoResponse)
+    async def get_todo(  # pyright: ignore[reportUnusedFunction]
+        response: Response,
+        id: UUID7 = Path(...),
+        if_none_match: str | None = Header(None),
+    ) -> GetTodoResponse | Response:
+        if fast_json:
+            return await container.get_todo.handle_json(id, if_none_match)
+        return await container.get_todo.handle(id, if_none_match, response)
+
+    @api.put("/{id}/complete", response_model=MarkAsCompletedTodoResponse)
+    async def mark_as_completed_todo(id: UUID7 = Path(...)) -> MarkAsCompletedTodoResponse:  # pyright: ignore[reportUnusedFunction]
+        return await container.mark_as_completed_todo.handle(id)
+
+    @api.put("/{id}/uncomplete", response_model=MarkAsUnCompletedTodoResponse)
+    async def mark_as_uncompleted_todo(id: UUID7 = Path(...)) -> MarkAsUnCompletedTodoResponse:  # pyright: ignore[reportUnusedFunction]
+        return await container.mark_as_uncompleted_todo.handle(id)
+
+    @api.put("/{id}", response_model=UpdateTodoResponse)
+    async def update_todo(  # pyright: ignore[reportUnusedFunction]
+        id: UUID7 = Path(...), request: UpdateTodoRequest = Body()
+    ) -> UpdateTodoResponse:
+        return await container.update_todo.handle(id, request)
+
+    return api
@@ -0,0 +1,75 @@
+from collections.abc import Callable
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any
+from weakref import WeakSet
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from todo_api.domain.repository.context_provider import AsyncContextProvider, ContextProvider
+
+# include_router() rebuilds every route from its (already wrapped) endpoint.
+_RELEASING_ENDPOINTS: WeakSet[Callable[..., Any]] = WeakSet()
+
+
+def commit_early_route(context_provider: ContextProvider[Any]) -> type[APIRoute]:
+    """Route class that ends the request transaction as soon as the endpoint returns.
+
+    FastAPI validates and serializes the response model after the endpoint returns,
+    and the connection would otherwise stay checked out for all of it. Raised errors
+    and error responses skip the early commit, so `SessionMiddleware` still rolls
+    them back; streamed responses keep reading from the session and skip it too.
+    """
+
+    class CommitEarlyRoute(APIRoute):
+        def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+            if endpoint in _RELEASING_ENDPOINTS:
+                super().__init__(path, endpoint, **kwargs)
+                return
+
+            @wraps(endpoint)
+            def release_after(*args: Any, **kwargs: Any) -> Any:
+                result = endpoint(*args, **kwargs)
+                if _can_release(result):
+                    context_provider.release()
+                return result
+
+            _RELEASING_ENDPOINTS.add(release_after)
+            super().__init__(path, release_after, **kwargs)
+
+    return CommitEarlyRoute
+
+
+def async_commit_early_route(
+    context_provider: AsyncContextProvider[AsyncSession],
+) -> type[APIRoute]:
+    """`commit_early_route` for the async route stack."""
+
+    class AsyncCommitEarlyRoute(APIRoute):
+        def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+            if endpoint in _RELEASING_ENDPOINTS:
+                super().__init__(path, endpoint, **kwargs)
+                return
+            if not iscoroutinefunction(endpoint):
+                raise TypeError(f"{endpoint.__name__} must be an async def endpoint")
+
+            @wraps(endpoint)
+            async def release_after(*args: Any, **kwargs: Any) -> Any:
+                result = await endpoint(*args, **kwargs)
+                if _can_release(result):
+                    await context_provider.release()
+                return result
+
+            _RELEASING_ENDPOINTS.add(release_after)
+            super().__init__(path, release_after, **kwargs)
+
+    return AsyncCommitEarlyRoute
+
+
+def _can_release(result: object) -> bool:
+    if isinstance(result, StreamingResponse):
+        return False
+    return not (isinstance(result, Response) and result.status_code >= 400)
@@ -1,26 +1,64 @@
 from dataclasses import dataclass
+from datetime import datetime
 
-from fastapi import APIRouter, Body, Path
+from fastapi import APIRouter, Body, Header, Path, Query, Response
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
 
+from todo_api.domain.model.todo_query import TodoSort
+from todo_api.presentation.handler.bulk_todos import BulkTodosRequest, BulkTodosResponse
 from todo_api.presentation.handler.create_todo_handler import (
     CreateTodoHandler,
     CreateTodoRequest,
     CreateTodoResponse,
 )
+from todo_api.presentation.handler.create_todos_handler import (
+    CreateTodosHandler,
+    CreateTodosRequest,
+    CreateTodosResponse,
+)
 from todo_api.presentation.handler.delete_todo_handler import DeleteTodoHandler
+from todo_api.presentation.handler.delete_todos_handler import DeleteTodosHandler
 from todo_api.presentation.handler.get_all_todos_handler import (
+    MAX_PAGE_SIZE,
     GetAllTodosHandler,
     GetAllTodosResponse,
+    TodoFilters,
+)
+from todo_api.presentation.handler.get_todo_changes_handler import (
+    GetTodoChangesHandler,
+    GetTodoChangesResponse,
 )
 from todo_api.presentation.handler.get_todo_handler import GetTodoHandler, GetTodoResponse
+from todo_api.presentation.handler.get_todo_stats_handler import (
+    GetTodoStatsHandler,
+    GetTodoStatsResponse,
+)
 from todo_api.presentation.handler.mark_as_completed_todo_handler import (
     MarkAsCompletedTodoHandler,
     MarkAsCompletedTodoResponse,
 )
+from todo_api.presentation.handler.mark_as_completed_todos_handler import (
+    MarkAsCompletedTodosHandler,
+)
 from todo_api.presentation.handler.mark_as_uncompleted_todo_handler import (
     MarkAsUnCompletedTodoHandler,
     MarkAsUnCompletedTodoResponse,
 )
+from todo_api.presentation.handler.mark_as_uncompleted_todos_handler import (
+    MarkAsUnCompletedTodosHandler,
+)
+from todo_api.presentation.handler.search_todos_handler import (
+    MAX_SEARCH_OFFSET,
+    SEARCH_PAGE_SIZE,
+    SearchTodosHandler,
+    SearchTodosResponse,
+)
+from todo_api.presentation.handler.stream_todos_handler import (
+    NDJSON_MEDIA_TYPE,
+    StreamTodosHandler,
+    prefers_ndjson,
+)
 from todo_api.presentation.handler.update_todo_handler import (
     UpdateTodoHandler,
     UpdateTodoRequest,
@@ -32,33 +70,116 @@ from todo_api.utils.uuid import UUID7
 @dataclass
 class TodoRouterContainer:
     create_todo: CreateTodoHandler
+    create_todos: CreateTodosHandler
     delete_todo: DeleteTodoHandler
+    delete_todos: DeleteTodosHandler
     get_all_todos: GetAllTodosHandler
     get_todo: GetTodoHandler
+    get_todo_changes: GetTodoChangesHandler
+    get_todo_stats: GetTodoStatsHandler
     mark_as_completed_todo: MarkAsCompletedTodoHandler
+    mark_as_completed_todos: MarkAsCompletedTodosHandler
     mark_as_uncompleted_todo: MarkAsUnCompletedTodoHandler
+    mark_as_uncompleted_todos: MarkAsUnCompletedTodosHandler
+    search_todos: SearchTodosHandler
+    stream_todos: StreamTodosHandler
     update_todo: UpdateTodoHandler
 
 
-def router(container: TodoRouterContainer) -> APIRouter:
-    api = APIRouter(prefix="/todos", tags=["todos"])
+def router(
+    container: TodoRouterContainer,
+    route_class: type[APIRoute] = APIRoute,
+    *,
+    fast_json: bool = False,
+) -> APIRouter:
+    """The todo API routes.
+
+    With `fast_json` the read routes render their JSON body straight from the domain
+    todos and return it as a raw response, which FastAPI neither validates against
+    `response_model` nor serializes again. The OpenAPI schema is unchanged.
+    """
+    api = APIRouter(prefix="/todos", tags=["todos"], route_class=route_class)
 
     @api.post("", response_model=CreateTodoResponse, status_code=201)
     def create_todo(request: CreateTodoRequest = Body()) -> CreateTodoResponse:  # pyright: ignore[reportUnusedFunction]
         return container.create_todo.handle(request)
 
+    @api.post(":batch", response_model=CreateTodosResponse, status_code=201)
+    def create_todos(request: CreateTodosRequest = Body()) -> CreateTodosResponse:  # pyright: ignore[reportUnusedFunction]
+        return container.create_todos.handle(request)
+
+    @api.put(":complete", response_model=BulkTodosResponse)
+    def mark_as_completed_todos(request: BulkTodosRequest = Body()) -> BulkTodosResponse:  # pyright: ignore[reportUnusedFunction]
+        return container.mark_as_completed_todos.handle(request)
+
+    @api.put(":uncomplete", response_model=BulkTodosResponse)
+    def mark_as_uncompleted_todos(request: BulkTodosRequest = Body()) -> BulkTodosResponse:  # pyright: ignore[reportUnusedFunction]
+        return container.mark_as_uncompleted_todos.handle(request)
+
+    @api.post(":delete", response_model=BulkTodosResponse)
+    def delete_todos(request: BulkTodosRequest = Body()) -> BulkTodosResponse:  # pyright: ignore[reportUnusedFunction]
+        return container.delete_todos.handle(request)
+
     @api.delete("/{id}", response_model=None, status_code=204)
     def delete_todo(id: UUID7 = Path(...)) -> None:  # pyright: ignore[reportUnusedFunction]
         container.delete_todo.handle(id)
         return None
 
-    @api.get("", response_model=GetAllTodosResponse)
-    def get_all_todos() -> GetAllTodosResponse:  # pyright: ignore[reportUnusedFunction]
-        return container.get_all_todos.handle()
+    @api.get("", response_model=GetAllTodosResponse, response_model_exclude_unset=True)
+    def get_all_todos(  # pyright: ignore[reportUnusedFunction]
+        response: Response,
+        cursor: str | None = Query(None),
+        limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        completed: bool | None = Query(None),
+        title_prefix: str | None = Query(None, max_length=255),
+        created_from: datetime | None = Query(None),
+        created_before: datetime | None = Query(None),
+        sort: TodoSort | None = Query(None),
+        stream: bool = Query(False),
+        accept: str | None = Header(None),
+        if_none_match: str | None = Header(None),
+    ) -> GetAllTodosResponse | Response:
+        filters = TodoFilters(
+            completed=completed,
+            title_prefix=title_prefix,
+            created_from=created_from,
+            created_before=created_before,
+            sort=sort,
+        )
+        if stream or prefers_ndjson(accept):
+            return StreamingResponse(
+                container.stream_todos.handle(cursor, limit, filters),
+                media_type=NDJSON_MEDIA_TYPE,
+            )
+        if fast_json:
+            return container.get_all_todos.handle_json(cursor, limit, if_none_match, filters)
+        return container.get_all_todos.handle(cursor, limit, if_none_match, response, filters)
+
+    @api.get("/changes", response_model=GetTodoChangesResponse)
+    def get_todo_changes(since: str | None = Query(None)) -> GetTodoChangesResponse:  # pyright: ignore[reportUnusedFunction]
+        return container.get_todo_changes.handle(since)
+
+    @api.get("/stats", response_model=GetTodoStatsResponse)
+    def get_todo_stats() -> GetTodoStatsResponse:  # pyright: ignore[reportUnusedFunction]
+        return container.get_todo_stats.handle()
+
+    @api.get("/search", response_model=SearchTodosResponse)
+    def search_todos(  # pyright: ignore[reportUnusedFunction]
+        q: str = Query(..., min_length=1, max_length=255),
+        offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+        limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ) -> SearchTodosResponse:
+        return container.search_todos.handle(q, offset, limit)
 
     @api.get("/{id}", response_model=GetTodoResponse)
-    def get_todo(id: UUID7 = Path(...)) -> GetTodoResponse:  # pyright: ignore[reportUnusedFunction]
-        return container.get_todo.handle(id)
+    def get_todo(  # pyright: ignore[reportUnusedFunction]
+        response: Response,
+        id: UUID7 = Path(...),
+        if_none_match: str | None = Header(None),
+    ) -> GetTodoResponse | Response:
+        if fast_json:
+            return container.get_todo.handle_json(id, if_none_match)
+        return container.get_todo.handle(id, if_none_match, response)
 
     @api.put("/{id}/complete", response_model=MarkAsCompletedTodoResponse)
     def mark_as_completed_todo(id: UUID7 = Path(...)) -> MarkAsCompletedTodoResponse:  # pyright: ignore[reportUnusedFunction]
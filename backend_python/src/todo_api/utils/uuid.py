@@ -1,8 +1,11 @@
-from typing import Annotated, Any, cast
+import builtins
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 from uuid import UUID as StdUUID
 
-from pydantic.functional_serializers import PlainSerializer
-from pydantic.functional_validators import AfterValidator, BeforeValidator
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
 from uuid_utils import UUID as UUIDUtils
 from uuid_utils import uuid7 as _uuid7
 
@@ -13,37 +16,117 @@ from uuid_utils import uuid7 as _uuid7
 # https://docs.python.org/ja/dev/library/uuid.html#uuid.uuid7
 
 
-def _to_uuid7(value: Any) -> UUIDUtils:
-    if isinstance(value, UUIDUtils):
-        uuid_obj = value
-    elif isinstance(value, StdUUID):
-        uuid_obj = UUIDUtils(str(value))
-    elif isinstance(value, str):
-        uuid_obj = UUIDUtils(value)
+class UUID7(UUIDUtils):
+    """An immutable UUID7 that keeps its canonical string and bytes once parsed.
+
+    Ids are formatted far more often than they are parsed (every query parameter,
+    cache key and response body), so `str()` and `.bytes` return the cached forms.
+    It is still a `uuid_utils.UUID`, and compares and hashes equal to one.
+    `UUID7(value)` trusts `value` to be a UUID7; use `parse_uuid7` for input.
+    """
+
+    __slots__ = ("_str", "_bytes")
+
+    _str: str
+    _bytes: builtins.bytes
+
+    def __str__(self) -> str:
+        try:
+            return self._str
+        except AttributeError:
+            # Filled on first use: parsing alone should not pay for formatting.
+            text = UUIDUtils.__str__(self)
+            _set_slot(self, "_str", text)
+            return text
+
+    def __repr__(self) -> str:
+        return f"UUID7('{self}')"
+
+    def __reduce__(self) -> tuple[type["UUID7"], tuple[str]]:
+        return (UUID7, (str(self),))
+
+    def __copy__(self) -> "UUID7":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "UUID7":
+        return self
+
+    if TYPE_CHECKING:
+        # The uuid_utils stub defines __eq__ without __hash__, which type checkers read as
+        # unhashable. At runtime the inherited C hash is kept, and is fast.
+        def __hash__(self) -> int: ...
+
+    @property
+    def bytes(self) -> builtins.bytes:
+        try:
+            return self._bytes
+        except AttributeError:
+            raw = UUIDUtils.bytes.__get__(self)
+            _set_slot(self, "_bytes", raw)
+            return raw
+
+    @property
+    def timestamp_ms(self) -> int:
+        """Milliseconds since the Unix epoch, from the id's leading 48 bits."""
+        return int.from_bytes(self.bytes[:6])
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # parse_uuid7 hands instances straight back, so they are never parsed twice.
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.no_info_after_validator_function(
+                parse_uuid7, core_schema.str_schema()
+            ),
+            python_schema=core_schema.no_info_plain_validator_function(parse_uuid7),
+            serialization=core_schema.plain_serializer_function_ser_schema(str),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "string", "format": "uuid"}
+
+
+# UUID objects reject attribute assignment; the cache slots are only ever set this way.
+_set_slot = object.__setattr__
+
+
+def uuid7() -> UUID7:
+    return UUID7(str(_uuid7()))
+
+
+def parse_uuid7(value: Any) -> UUID7:
+    if isinstance(value, str):
+        pass
+    elif isinstance(value, UUID7):
+        return value
+    elif isinstance(value, (UUIDUtils, StdUUID)):
+        value = str(value)
     else:
         raise TypeError(f"Expected a UUID-compatible value, got {type(value)!r}")
 
+    uuid_obj = UUID7(value)
     if uuid_obj.version != 7:
         raise ValueError(f"Expected a UUID7, got UUID{uuid_obj.version}")
 
     return uuid_obj
 
 
-def _uuid7_serializer(value: UUIDUtils) -> str:
-    return str(value)
-
+def trusted_uuid7(value: str) -> UUID7:
+    """Parse an id this service generated itself, skipping the version check."""
+    return UUID7(value)
 
-UUID7 = Annotated[
-    str,
-    BeforeValidator(lambda value: str(value) if isinstance(value, (UUIDUtils, StdUUID)) else value),
-    AfterValidator(_to_uuid7),
-    PlainSerializer(_uuid7_serializer, return_type=str),
-]
-
-
-def uuid7() -> UUID7:
-    return cast(UUID7, _to_uuid7(_uuid7()))
 
+def uuid7_floor(moment: datetime) -> UUID7:
+    """The smallest UUID7 stamped with `moment`'s millisecond; naive times are UTC.
 
-def parse_uuid7(value: str) -> UUID7:
-    return cast(UUID7, _to_uuid7(value))
+    Every id generated at or after `moment` compares greater than or equal to it.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    timestamp_ms = int(moment.timestamp() * 1000)
+    # Version 7 and the RFC 4122 variant, with every random bit zero.
+    return UUID7(bytes=timestamp_ms.to_bytes(6) + b"\x70\x00\x80" + bytes(7))
@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from datetime import datetime
+
 import pytest
 
 from todo_api.application_service.usecase.create_todo_usecase import (
@@ -5,26 +8,69 @@ from todo_api.application_service.usecase.create_todo_usecase import (
     CreateTodoUsecaseInput,
 )
 from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
 from todo_api.domain.repository.todo_repository import TodoRepository
 from todo_api.utils.uuid import UUID7
 
 
 class TrackingTodoRepository(TodoRepository):
     def __init__(self) -> None:
-        self.saved: list[Todo] = []
+        self.added: list[Todo] = []
 
     def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to find_all")
 
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_page")
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to iter_all")
+
+    def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
+
     def find_by_id(self, todo_id: UUID7) -> Todo:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to find_by_id")
 
-    def save(self, todo: Todo) -> None:
-        self.saved.append(todo)
+    def find_by_ids(  # pragma: no cover
+        self, todo_ids: list[UUID7], for_update: bool = False
+    ) -> list[Todo]:
+        raise AssertionError("unexpected call to find_by_ids")
+
+    def save(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to save")
+
+    def add(self, todo: Todo) -> None:
+        self.added.append(todo)
+
+    def add_all(self, todos: list[Todo]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add_all")
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:  # pragma: no cover
+        raise AssertionError("unexpected call to mark_completed")
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to set_completed")
 
     def delete(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to delete")
 
+    def delete_by_id(self, todo_id: UUID7) -> int:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_by_id")
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_many")
+
 
 @pytest.fixture
 def todo_repository() -> TrackingTodoRepository:
@@ -37,8 +83,8 @@ def test_execute_creates_and_persists_todo(todo_repository: TrackingTodoReposito
 
     output = usecase.execute(input_dto)
 
-    assert len(todo_repository.saved) == 1
-    saved_todo = todo_repository.saved[0]
+    assert len(todo_repository.added) == 1
+    saved_todo = todo_repository.added[0]
     assert isinstance(saved_todo, Todo)
     assert saved_todo.title == "write tests"
     assert saved_todo.description == "for usecases"
@@ -0,0 +1,91 @@
+from collections.abc import Iterator
+from datetime import datetime
+
+from todo_api.application_service.usecase.create_todo_usecase import CreateTodoUsecaseInput
+from todo_api.application_service.usecase.create_todos_usecase import (
+    CreateTodosUsecaseImpl,
+    CreateTodosUsecaseInput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.utils.uuid import UUID7
+
+
+class BatchTrackingTodoRepository(TodoRepository):
+    def __init__(self) -> None:
+        self.batches: list[list[Todo]] = []
+
+    def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_all")
+
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_page")
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to iter_all")
+
+    def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
+
+    def find_by_id(self, todo_id: UUID7) -> Todo:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_by_id")
+
+    def find_by_ids(  # pragma: no cover
+        self, todo_ids: list[UUID7], for_update: bool = False
+    ) -> list[Todo]:
+        raise AssertionError("unexpected call to find_by_ids")
+
+    def save(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to save")
+
+    def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    def add_all(self, todos: list[Todo]) -> None:
+        self.batches.append(todos)
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:  # pragma: no cover
+        raise AssertionError("unexpected call to mark_completed")
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to set_completed")
+
+    def delete(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to delete")
+
+    def delete_by_id(self, todo_id: UUID7) -> int:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_by_id")
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_many")
+
+
+def test_execute_persists_all_todos_in_one_call() -> None:
+    todo_repository = BatchTrackingTodoRepository()
+    usecase = CreateTodosUsecaseImpl(todo_repository)
+    input_dto = CreateTodosUsecaseInput(
+        items=[
+            CreateTodoUsecaseInput(title="first", description=None),
+            CreateTodoUsecaseInput(title="second", description="more"),
+        ]
+    )
+
+    output = usecase.execute(input_dto)
+
+    assert len(todo_repository.batches) == 1
+    assert todo_repository.batches[0] == output.todos
+    assert [todo.title for todo in output.todos] == ["first", "second"]
+    assert output.todos[1].description == "more"
+    assert len({todo.id for todo in output.todos}) == 2
+    assert not any(todo.completed for todo in output.todos)
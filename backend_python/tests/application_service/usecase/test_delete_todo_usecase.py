@@ -1,61 +1,164 @@
-from collections.abc import Callable
-from typing import Any, TypeVar
+from collections.abc import Iterator
+from datetime import datetime
+
+import pytest
 
-from todo_api.application_service.service.transaction_service import TransactionService
 from todo_api.application_service.usecase.delete_todo_usecase import (
+    AsyncDeleteTodoUsecaseImpl,
     DeleteTodoUsecaseImpl,
     DeleteTodoUsecaseInput,
     DeleteTodoUsecaseOutput,
 )
 from todo_api.domain.model.todo import Todo
-from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.errors import RepositoryNotFoundError
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository, TodoRepository
 from todo_api.utils.uuid import UUID7, uuid7
 
-ReturnType = TypeVar("ReturnType")
 
+class RecordingTodoRepository(TodoRepository):
+    def __init__(self, rowcount: int) -> None:
+        self.rowcount = rowcount
+        self.deleted_ids: list[UUID7] = []
 
-class RecordingTransactionService(TransactionService):
-    def __init__(self) -> None:
-        self.calls = 0
-        self.last_func: Any = None
+    def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_all")
 
-    def Run(self, func: Callable[[], ReturnType]) -> ReturnType:
-        self.calls += 1
-        self.last_func = func
-        return func()
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_page")
 
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to iter_all")
 
-class RecordingTodoRepository(TodoRepository):
-    def __init__(self, todo: Todo) -> None:
-        self.todo = todo
-        self.find_by_id_argument: UUID7 | None = None
-        self.deleted: list[Todo] = []
+    def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
 
-    def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
-        raise AssertionError("unexpected call to find_all")
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
 
-    def find_by_id(self, todo_id: UUID7) -> Todo:
-        self.find_by_id_argument = todo_id
-        return self.todo
+    def find_by_id(self, todo_id: UUID7) -> Todo:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_by_id")
+
+    def find_by_ids(  # pragma: no cover
+        self, todo_ids: list[UUID7], for_update: bool = False
+    ) -> list[Todo]:
+        raise AssertionError("unexpected call to find_by_ids")
 
     def save(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to save")
 
-    def delete(self, todo: Todo) -> None:
-        self.deleted.append(todo)
+    def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    def add_all(self, todos: list[Todo]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add_all")
 
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:  # pragma: no cover
+        raise AssertionError("unexpected call to mark_completed")
 
-def test_execute_deletes_within_transaction():
-    existing = Todo(title="obsolete")
-    todo_repository = RecordingTodoRepository(existing)
-    transaction_service = RecordingTransactionService()
-    usecase = DeleteTodoUsecaseImpl(todo_repository, transaction_service)
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to set_completed")
+
+    def delete(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to delete")
+
+    def delete_by_id(self, todo_id: UUID7) -> int:
+        self.deleted_ids.append(todo_id)
+        if self.rowcount == 0:
+            raise RepositoryNotFoundError(f"Todo with id {todo_id} not found")
+        return self.rowcount
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_many")
+
+
+def test_execute_deletes_by_id_without_reading():
+    todo_repository = RecordingTodoRepository(rowcount=1)
+    usecase = DeleteTodoUsecaseImpl(todo_repository)
     todo_id = uuid7()
 
     output = usecase.execute(DeleteTodoUsecaseInput(id=todo_id))
 
-    assert transaction_service.calls == 1
-    assert callable(transaction_service.last_func)
-    assert todo_repository.find_by_id_argument == todo_id
-    assert todo_repository.deleted == [existing]
+    assert todo_repository.deleted_ids == [todo_id]
     assert isinstance(output, DeleteTodoUsecaseOutput)
+
+
+def test_execute_propagates_not_found():
+    todo_repository = RecordingTodoRepository(rowcount=0)
+    usecase = DeleteTodoUsecaseImpl(todo_repository)
+
+    with pytest.raises(RepositoryNotFoundError):
+        usecase.execute(DeleteTodoUsecaseInput(id=uuid7()))
+
+
+class RecordingAsyncTodoRepository(AsyncTodoRepository):
+    def __init__(self, rowcount: int) -> None:
+        self.rowcount = rowcount
+        self.deleted_ids: list[UUID7] = []
+
+    async def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_all")
+
+    async def find_page(  # pragma: no cover
+        self, after_id: UUID7 | None, limit: int
+    ) -> list[Todo]:
+        raise AssertionError("unexpected call to find_page")
+
+    async def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
+
+    async def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    async def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    async def find_by_query(
+        self, query: TodoQuery, limit: int | None
+    ) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
+
+    async def find_by_id(self, todo_id: UUID7) -> Todo:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_id")
+
+    async def save(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to save")
+
+    async def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    async def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:  # pragma: no cover
+        raise AssertionError("unexpected call to mark_completed")
+
+    async def delete_by_id(self, todo_id: UUID7) -> int:
+        self.deleted_ids.append(todo_id)
+        if self.rowcount == 0:
+            raise RepositoryNotFoundError(f"Todo with id {todo_id} not found")
+        return self.rowcount
+
+
+@pytest.mark.anyio
+async def test_async_execute_deletes_by_id_without_reading():
+    todo_repository = RecordingAsyncTodoRepository(rowcount=1)
+    usecase = AsyncDeleteTodoUsecaseImpl(todo_repository)
+    todo_id = uuid7()
+
+    output = await usecase.execute(DeleteTodoUsecaseInput(id=todo_id))
+
+    assert todo_repository.deleted_ids == [todo_id]
+    assert isinstance(output, DeleteTodoUsecaseOutput)
+
+
+@pytest.mark.anyio
+async def test_async_execute_propagates_not_found():
+    usecase = AsyncDeleteTodoUsecaseImpl(RecordingAsyncTodoRepository(rowcount=0))
+
+    with pytest.raises(RepositoryNotFoundError):
+        await usecase.execute(DeleteTodoUsecaseInput(id=uuid7()))
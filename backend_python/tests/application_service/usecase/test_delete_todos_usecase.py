@@ -0,0 +1,116 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import TypeVar
+
+from todo_api.application_service.service.transaction_service import TransactionService
+from todo_api.application_service.usecase.bulk_todo_result import BulkTodoOutcome
+from todo_api.application_service.usecase.delete_todos_usecase import (
+    DeleteTodosUsecaseImpl,
+    DeleteTodosUsecaseInput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.utils.uuid import UUID7, uuid7
+
+ReturnType = TypeVar("ReturnType")
+
+
+class RecordingTransactionService(TransactionService):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def Run(self, func: Callable[[], ReturnType]) -> ReturnType:
+        self.calls += 1
+        return func()
+
+    def RunReadOnly(self, func: Callable[[], ReturnType]) -> ReturnType:  # pragma: no cover
+        raise AssertionError("unexpected call to RunReadOnly")
+
+
+class BulkTodoRepository(TodoRepository):
+    def __init__(self, todos: list[Todo]) -> None:
+        self.todos = {str(todo.id): todo for todo in todos}
+        self.locked: list[list[UUID7]] = []
+        self.deleted: list[list[UUID7]] = []
+
+    def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_all")
+
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_page")
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to iter_all")
+
+    def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
+
+    def find_by_id(self, todo_id: UUID7) -> Todo:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_by_id")
+
+    def find_by_ids(self, todo_ids: list[UUID7], for_update: bool = False) -> list[Todo]:
+        assert for_update
+        self.locked.append(todo_ids)
+        return [self.todos[str(i)] for i in todo_ids if str(i) in self.todos]
+
+    def save(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to save")
+
+    def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    def add_all(self, todos: list[Todo]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add_all")
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:  # pragma: no cover
+        raise AssertionError("unexpected call to mark_completed")
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to set_completed")
+
+    def delete(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to delete")
+
+    def delete_by_id(self, todo_id: UUID7) -> int:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_by_id")
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:
+        self.deleted.append(todo_ids)
+
+
+def test_execute_reports_outcome_per_id_and_deletes_once():
+    existing = Todo(title="obsolete")
+    missing_id = uuid7()
+    todo_repository = BulkTodoRepository([existing])
+    transaction_service = RecordingTransactionService()
+    usecase = DeleteTodosUsecaseImpl(todo_repository, transaction_service)
+
+    output = usecase.execute(DeleteTodosUsecaseInput(ids=[existing.id, missing_id, existing.id]))
+
+    assert transaction_service.calls == 1
+    assert [(str(r.id), r.outcome) for r in output.results] == [
+        (str(existing.id), BulkTodoOutcome.DELETED),
+        (str(missing_id), BulkTodoOutcome.NOT_FOUND),
+    ]
+    assert todo_repository.deleted == [[existing.id]]
+
+
+def test_execute_skips_delete_when_nothing_exists():
+    todo_repository = BulkTodoRepository([])
+    usecase = DeleteTodosUsecaseImpl(todo_repository, RecordingTransactionService())
+
+    output = usecase.execute(DeleteTodosUsecaseInput(ids=[uuid7()]))
+
+    assert [r.outcome for r in output.results] == [BulkTodoOutcome.NOT_FOUND]
+    assert todo_repository.deleted == []
@@ -1,38 +1,218 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import TypeVar
 from uuid import UUID
 
+from todo_api.application_service.service.transaction_service import TransactionService
 from todo_api.application_service.usecase.get_all_todos_usecase import (
+    ANY_VERSION,
     GetAllTodosUsecaseImpl,
     GetAllTodosUsecaseInput,
 )
 from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
 from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.utils.uuid import UUID7
+
+ReturnType = TypeVar("ReturnType")
+
+
+class ReadOnlyTransactionService(TransactionService):
+    def __init__(self) -> None:
+        self.read_only_calls = 0
+
+    def Run(self, func: Callable[[], ReturnType]) -> ReturnType:  # pragma: no cover
+        raise AssertionError("unexpected call to Run")
+
+    def RunReadOnly(self, func: Callable[[], ReturnType]) -> ReturnType:
+        self.read_only_calls += 1
+        return func()
 
 
 class PreloadedTodoRepository(TodoRepository):
     def __init__(self, todos: list[Todo]) -> None:
         self._todos = todos
         self.find_all_calls = 0
+        self.find_page_calls: list[tuple[UUID7 | None, int]] = []
+        self.version: str | None = None
+        self.list_version_calls = 0
+        self.find_by_query_calls: list[tuple[TodoQuery, int | None]] = []
 
     def find_all(self) -> list[Todo]:
         self.find_all_calls += 1
         return self._todos
 
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:
+        self.find_page_calls.append((after_id, limit))
+        todos = sorted(self._todos, key=lambda todo: str(todo.id))
+        if after_id is not None:
+            todos = [todo for todo in todos if str(todo.id) > str(after_id)]
+        return todos[:limit]
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to iter_all")
+
+    def list_version(self) -> str | None:
+        self.list_version_calls += 1
+        return self.version
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:
+        self.find_all_calls += 1
+        return self._todos, self.version
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:
+        self.find_by_query_calls.append((query, limit))
+        matching = [todo for todo in self._todos if todo.completed == query.completed]
+        return matching[:limit]
+
     def find_by_id(self, todo_id: UUID) -> Todo:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to find_by_id")
 
+    def find_by_ids(  # pragma: no cover
+        self, todo_ids: list[UUID7], for_update: bool = False
+    ) -> list[Todo]:
+        raise AssertionError("unexpected call to find_by_ids")
+
     def save(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to save")
 
+    def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    def add_all(self, todos: list[Todo]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add_all")
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:  # pragma: no cover
+        raise AssertionError("unexpected call to mark_completed")
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to set_completed")
+
     def delete(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to delete")
 
+    def delete_by_id(self, todo_id: UUID7) -> int:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_by_id")
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_many")
+
 
 def test_execute_returns_all_todos():
     todos = [Todo(title="one"), Todo(title="two")]
     todo_repository = PreloadedTodoRepository(todos)
-    usecase = GetAllTodosUsecaseImpl(todo_repository)
+    transaction_service = ReadOnlyTransactionService()
+    usecase = GetAllTodosUsecaseImpl(todo_repository, transaction_service)
 
     output = usecase.execute(GetAllTodosUsecaseInput())
 
+    assert transaction_service.read_only_calls == 1
     assert todo_repository.find_all_calls == 1
     assert output.todos == todos
+    assert output.next_after_id is None
+
+
+def test_execute_returns_page_with_next_after_id_when_more_rows_exist():
+    todos = [Todo(title="one"), Todo(title="two"), Todo(title="three")]
+    todo_repository = PreloadedTodoRepository(todos)
+    transaction_service = ReadOnlyTransactionService()
+    usecase = GetAllTodosUsecaseImpl(todo_repository, transaction_service)
+
+    output = usecase.execute(GetAllTodosUsecaseInput(limit=2))
+
+    assert todo_repository.find_all_calls == 0
+    assert todo_repository.find_page_calls == [(None, 3)]
+    assert output.todos == todos[:2]
+    assert output.next_after_id == todos[1].id
+
+
+def test_execute_returns_last_page_without_next_after_id():
+    todos = [Todo(title="one"), Todo(title="two"), Todo(title="three")]
+    todo_repository = PreloadedTodoRepository(todos)
+    transaction_service = ReadOnlyTransactionService()
+    usecase = GetAllTodosUsecaseImpl(todo_repository, transaction_service)
+
+    output = usecase.execute(GetAllTodosUsecaseInput(after_id=todos[1].id, limit=2))
+
+    assert todo_repository.find_page_calls == [(todos[1].id, 3)]
+    assert output.todos == todos[2:]
+    assert output.next_after_id is None
+
+
+def test_execute_pages_a_query_without_versioning_it():
+    done = [Todo(title="one"), Todo(title="two"), Todo(title="three")]
+    for todo in done:
+        todo.mark_as_completed()
+    todo_repository = PreloadedTodoRepository([Todo(title="open"), *done])
+    todo_repository.version = "4-20250101000000"
+    transaction_service = ReadOnlyTransactionService()
+    usecase = GetAllTodosUsecaseImpl(todo_repository, transaction_service)
+    query = TodoQuery(completed=True)
+
+    output = usecase.execute(GetAllTodosUsecaseInput(limit=2, query=query))
+
+    assert transaction_service.read_only_calls == 1
+    assert todo_repository.find_by_query_calls == [(query, 3)]
+    assert todo_repository.list_version_calls == 0
+    assert output.todos == done[:2]
+    assert output.next_after_id == done[1].id
+    assert output.version is None
+
+
+def test_execute_skips_loading_when_caller_knows_the_current_version():
+    todo_repository = PreloadedTodoRepository([Todo(title="one")])
+    todo_repository.version = "1-20250101000000"
+    usecase = GetAllTodosUsecaseImpl(todo_repository, ReadOnlyTransactionService())
+
+    unchanged = usecase.execute(
+        GetAllTodosUsecaseInput(known_versions=frozenset({"1-20250101000000"}))
+    )
+    changed = usecase.execute(GetAllTodosUsecaseInput(known_versions=frozenset({"0"})))
+
+    assert unchanged.not_modified is True
+    assert unchanged.todos == []
+    assert changed.not_modified is False
+    assert changed.version == "1-20250101000000"
+    assert todo_repository.find_all_calls == 1
+
+
+def test_execute_treats_any_version_as_knowing_the_current_one():
+    todo_repository = PreloadedTodoRepository([Todo(title="one")])
+    todo_repository.version = "1-20250101000000"
+    usecase = GetAllTodosUsecaseImpl(todo_repository, ReadOnlyTransactionService())
+
+    output = usecase.execute(GetAllTodosUsecaseInput(known_versions=frozenset({ANY_VERSION})))
+
+    assert output.not_modified is True
+    assert output.version == "1-20250101000000"
+    assert todo_repository.find_all_calls == 0
+
+
+def test_execute_versions_an_unconditional_list_from_the_rows_it_loads():
+    todo_repository = PreloadedTodoRepository([Todo(title="one")])
+    todo_repository.version = "1-20250101000000"
+    usecase = GetAllTodosUsecaseImpl(todo_repository, ReadOnlyTransactionService())
+
+    output = usecase.execute(GetAllTodosUsecaseInput())
+
+    assert todo_repository.list_version_calls == 0
+    assert todo_repository.find_all_calls == 1
+    assert output.version == "1-20250101000000"
+
+
+def test_execute_does_not_version_pages():
+    todo_repository = PreloadedTodoRepository([Todo(title="one")])
+    todo_repository.version = "1-20250101000000"
+    usecase = GetAllTodosUsecaseImpl(todo_repository, ReadOnlyTransactionService())
+
+    output = usecase.execute(
+        GetAllTodosUsecaseInput(limit=10, known_versions=frozenset({"1-20250101000000"}))
+    )
+
+    assert todo_repository.list_version_calls == 0
+    assert output.version is None
+    assert len(output.todos) == 1
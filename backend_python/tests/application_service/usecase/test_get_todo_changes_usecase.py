@@ -0,0 +1,106 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import TypeVar
+
+from todo_api.application_service.service.transaction_service import TransactionService
+from todo_api.application_service.usecase.get_todo_changes_usecase import (
+    GetTodoChangesUsecaseImpl,
+    GetTodoChangesUsecaseInput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.utils.uuid import UUID7, uuid7
+
+ReturnType = TypeVar("ReturnType")
+
+
+class PrimaryOnlyTransactionService(TransactionService):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def Run(self, func: Callable[[], ReturnType]) -> ReturnType:
+        self.calls += 1
+        return func()
+
+    def RunReadOnly(self, func: Callable[[], ReturnType]) -> ReturnType:  # pragma: no cover
+        raise AssertionError("unexpected call to RunReadOnly")
+
+
+class RecordingTodoRepository(TodoRepository):
+    def __init__(self, changes: TodoChanges) -> None:
+        self.changes = changes
+        self.find_changes_arguments: list[datetime | None] = []
+
+    def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_all")
+
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_page")
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to iter_all")
+
+    def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:
+        self.find_changes_arguments.append(since)
+        return self.changes
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
+
+    def find_by_id(self, todo_id: UUID7) -> Todo:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_id")
+
+    def find_by_ids(  # pragma: no cover
+        self, todo_ids: list[UUID7], for_update: bool = False
+    ) -> list[Todo]:
+        raise AssertionError("unexpected call to find_by_ids")
+
+    def save(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to save")
+
+    def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    def add_all(self, todos: list[Todo]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add_all")
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:  # pragma: no cover
+        raise AssertionError("unexpected call to mark_completed")
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to set_completed")
+
+    def delete(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to delete")
+
+    def delete_by_id(self, todo_id: UUID7) -> int:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_by_id")
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_many")
+
+
+def test_execute_reads_changes_since_watermark_on_the_primary():
+    changes = TodoChanges(
+        todos=[Todo(title="changed")], deleted_ids=[uuid7()], watermark=datetime(2025, 1, 1, 12)
+    )
+    todo_repository = RecordingTodoRepository(changes)
+    transaction_service = PrimaryOnlyTransactionService()
+    usecase = GetTodoChangesUsecaseImpl(todo_repository, transaction_service)
+    since = datetime(2025, 1, 1, 11)
+
+    output = usecase.execute(GetTodoChangesUsecaseInput(since=since))
+
+    assert transaction_service.calls == 1
+    assert todo_repository.find_changes_arguments == [since]
+    assert output.todos == changes.todos
+    assert output.deleted_ids == changes.deleted_ids
+    assert output.watermark == changes.watermark
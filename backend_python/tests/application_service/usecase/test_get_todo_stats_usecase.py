@@ -0,0 +1,46 @@
+from collections.abc import Callable
+from typing import TypeVar
+
+from todo_api.application_service.service.transaction_service import TransactionService
+from todo_api.application_service.usecase.get_todo_stats_usecase import (
+    GetTodoStatsUsecaseImpl,
+    GetTodoStatsUsecaseInput,
+)
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.domain.repository.todo_stats_repository import TodoStatsRepository
+
+ReturnType = TypeVar("ReturnType")
+
+
+class ReadOnlyTransactionService(TransactionService):
+    def __init__(self) -> None:
+        self.read_only_calls = 0
+
+    def Run(self, func: Callable[[], ReturnType]) -> ReturnType:  # pragma: no cover
+        raise AssertionError("unexpected call to Run")
+
+    def RunReadOnly(self, func: Callable[[], ReturnType]) -> ReturnType:
+        self.read_only_calls += 1
+        return func()
+
+
+class FixedTodoStatsRepository(TodoStatsRepository):
+    def __init__(self, stats: TodoStats) -> None:
+        self.stats = stats
+
+    def get(self) -> TodoStats:
+        return self.stats
+
+
+def test_execute_reads_the_counters_in_a_read_only_transaction() -> None:
+    transaction_service = ReadOnlyTransactionService()
+    usecase = GetTodoStatsUsecaseImpl(
+        todo_stats_repository=FixedTodoStatsRepository(TodoStats(total=5, completed=2)),
+        transaction_service=transaction_service,
+    )
+
+    result = usecase.execute(GetTodoStatsUsecaseInput())
+
+    assert result.stats == TodoStats(total=5, completed=2)
+    assert result.stats.open == 3
+    assert transaction_service.read_only_calls == 1
@@ -1,11 +1,32 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import TypeVar
+
+from todo_api.application_service.service.transaction_service import TransactionService
 from todo_api.application_service.usecase.get_todo_usecase import (
     GetTodoUsecaseImpl,
     GetTodoUsecaseInput,
 )
 from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
 from todo_api.domain.repository.todo_repository import TodoRepository
 from todo_api.utils.uuid import UUID7, uuid7
 
+ReturnType = TypeVar("ReturnType")
+
+
+class ReadOnlyTransactionService(TransactionService):
+    def __init__(self) -> None:
+        self.read_only_calls = 0
+
+    def Run(self, func: Callable[[], ReturnType]) -> ReturnType:  # pragma: no cover
+        raise AssertionError("unexpected call to Run")
+
+    def RunReadOnly(self, func: Callable[[], ReturnType]) -> ReturnType:
+        self.read_only_calls += 1
+        return func()
+
 
 class RecordingTodoRepository(TodoRepository):
     def __init__(self, todo: Todo) -> None:
@@ -15,24 +36,67 @@ class RecordingTodoRepository(TodoRepository):
     def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to find_all")
 
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_page")
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to iter_all")
+
+    def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
+
     def find_by_id(self, todo_id: UUID7) -> Todo:
         self.find_by_id_argument = todo_id
         return self.todo
 
+    def find_by_ids(  # pragma: no cover
+        self, todo_ids: list[UUID7], for_update: bool = False
+    ) -> list[Todo]:
+        raise AssertionError("unexpected call to find_by_ids")
+
     def save(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to save")
 
+    def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    def add_all(self, todos: list[Todo]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add_all")
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:  # pragma: no cover
+        raise AssertionError("unexpected call to mark_completed")
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to set_completed")
+
     def delete(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to delete")
 
+    def delete_by_id(self, todo_id: UUID7) -> int:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_by_id")
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_many")
+
 
 def test_execute_fetches_todo_by_id():
     todo = Todo(title="inspect")
     todo_repository = RecordingTodoRepository(todo)
-    usecase = GetTodoUsecaseImpl(todo_repository)
+    transaction_service = ReadOnlyTransactionService()
+    usecase = GetTodoUsecaseImpl(todo_repository, transaction_service)
     todo_id = uuid7()
 
     output = usecase.execute(GetTodoUsecaseInput(id=todo_id))
 
+    assert transaction_service.read_only_calls == 1
     assert todo_repository.find_by_id_argument == todo_id
     assert output.todo is todo
@@ -1,61 +1,196 @@
-from collections.abc import Callable
-from typing import Any, TypeVar
+from collections.abc import Iterator
+from datetime import datetime
+
+import pytest
 
-from todo_api.application_service.service.transaction_service import TransactionService
 from todo_api.application_service.usecase.mark_as_completed_todo_usecase import (
+    AsyncMarkAsCompletedTodoUsecaseImpl,
     MarkAsCompletedTodoUsecaseImpl,
     MarkAsCompletedTodoUsecaseInput,
 )
+from todo_api.domain.model.errors import TodoAlreadyCompletedError
 from todo_api.domain.model.todo import Todo
-from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.errors import RepositoryNotFoundError
+from todo_api.domain.repository.todo_repository import AsyncTodoRepository, TodoRepository
 from todo_api.utils.uuid import UUID7, uuid7
 
-ReturnType = TypeVar("ReturnType")
-
-
-class RecordingTransactionService(TransactionService):
-    def __init__(self) -> None:
-        self.calls = 0
-        self.last_func: Any = None
-
-    def Run(self, func: Callable[[], ReturnType]) -> ReturnType:
-        self.calls += 1
-        self.last_func = func
-        return func()
-
 
 class RecordingTodoRepository(TodoRepository):
-    def __init__(self, todo: Todo) -> None:
+    def __init__(self, todo: Todo | None, changed: bool) -> None:
         self.todo = todo
+        self.changed = changed
         self.find_by_id_argument: UUID7 | None = None
-        self.saved: list[Todo] = []
+        self.mark_completed_calls: list[tuple[UUID7, bool]] = []
 
     def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to find_all")
 
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_page")
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to iter_all")
+
+    def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
+
     def find_by_id(self, todo_id: UUID7) -> Todo:
         self.find_by_id_argument = todo_id
+        if self.todo is None:
+            raise RepositoryNotFoundError(f"Todo with id {todo_id} not found")
         return self.todo
 
-    def save(self, todo: Todo) -> None:
-        self.saved.append(todo)
+    def find_by_ids(  # pragma: no cover
+        self, todo_ids: list[UUID7], for_update: bool = False
+    ) -> list[Todo]:
+        raise AssertionError("unexpected call to find_by_ids")
+
+    def save(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to save")
+
+    def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    def add_all(self, todos: list[Todo]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add_all")
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:
+        self.mark_completed_calls.append((todo_id, completed))
+        return self.changed
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to set_completed")
 
     def delete(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
         raise AssertionError("unexpected call to delete")
 
+    def delete_by_id(self, todo_id: UUID7) -> int:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_by_id")
 
-def test_execute_marks_completed_within_transaction():
-    existing = Todo(title="finish docs")
-    todo_repository = RecordingTodoRepository(existing)
-    transaction_service = RecordingTransactionService()
-    usecase = MarkAsCompletedTodoUsecaseImpl(todo_repository, transaction_service)
+    def delete_many(self, todo_ids: list[UUID7]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_many")
+
+
+def test_execute_completes_with_conditional_update():
+    stored = Todo(title="finish docs")
+    stored.mark_as_completed()
+    todo_repository = RecordingTodoRepository(stored, changed=True)
+    usecase = MarkAsCompletedTodoUsecaseImpl(todo_repository)
     todo_id = uuid7()
 
     output = usecase.execute(MarkAsCompletedTodoUsecaseInput(id=todo_id))
 
-    assert transaction_service.calls == 1
-    assert callable(transaction_service.last_func)
+    assert todo_repository.mark_completed_calls == [(todo_id, True)]
     assert todo_repository.find_by_id_argument == todo_id
-    assert todo_repository.saved == [existing]
-    assert existing.completed is True
-    assert output.todo is existing
+    assert output.todo is stored
+
+
+def test_execute_raises_when_already_completed():
+    stored = Todo(title="finish docs")
+    stored.mark_as_completed()
+    todo_repository = RecordingTodoRepository(stored, changed=False)
+    usecase = MarkAsCompletedTodoUsecaseImpl(todo_repository)
+
+    with pytest.raises(TodoAlreadyCompletedError):
+        usecase.execute(MarkAsCompletedTodoUsecaseInput(id=uuid7()))
+
+
+def test_execute_raises_when_missing():
+    todo_repository = RecordingTodoRepository(None, changed=False)
+    usecase = MarkAsCompletedTodoUsecaseImpl(todo_repository)
+
+    with pytest.raises(RepositoryNotFoundError):
+        usecase.execute(MarkAsCompletedTodoUsecaseInput(id=uuid7()))
+
+
+def test_execute_reports_conflict_without_writing_again_when_state_changed_concurrently():
+    # The UPDATE found the todo completed; another request uncompleted it before the read.
+    existing = Todo(title="finish docs")
+    todo_repository = RecordingTodoRepository(existing, changed=False)
+    usecase = MarkAsCompletedTodoUsecaseImpl(todo_repository)
+
+    with pytest.raises(TodoAlreadyCompletedError):
+        usecase.execute(MarkAsCompletedTodoUsecaseInput(id=uuid7()))
+
+    assert existing.completed is False
+
+
+class RecordingAsyncTodoRepository(AsyncTodoRepository):
+    def __init__(self, todo: Todo, changed: bool) -> None:
+        self.todo = todo
+        self.changed = changed
+        self.mark_completed_calls: list[tuple[UUID7, bool]] = []
+
+    async def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_all")
+
+    async def find_page(  # pragma: no cover
+        self, after_id: UUID7 | None, limit: int
+    ) -> list[Todo]:
+        raise AssertionError("unexpected call to find_page")
+
+    async def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
+
+    async def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    async def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    async def find_by_query(
+        self, query: TodoQuery, limit: int | None
+    ) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
+
+    async def find_by_id(self, todo_id: UUID7) -> Todo:
+        return self.todo
+
+    async def save(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to save")
+
+    async def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    async def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:
+        self.mark_completed_calls.append((todo_id, completed))
+        return self.changed
+
+    async def delete_by_id(self, todo_id: UUID7) -> int:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_by_id")
+
+
+@pytest.mark.anyio
+async def test_async_execute_completes_with_conditional_update():
+    stored = Todo(title="finish docs")
+    stored.mark_as_completed()
+    todo_repository = RecordingAsyncTodoRepository(stored, changed=True)
+    usecase = AsyncMarkAsCompletedTodoUsecaseImpl(todo_repository)
+    todo_id = uuid7()
+
+    output = await usecase.execute(MarkAsCompletedTodoUsecaseInput(id=todo_id))
+
+    assert todo_repository.mark_completed_calls == [(todo_id, True)]
+    assert output.todo is stored
+
+
+@pytest.mark.anyio
+async def test_async_execute_raises_when_already_completed():
+    stored = Todo(title="finish docs")
+    stored.mark_as_completed()
+    todo_repository = RecordingAsyncTodoRepository(stored, changed=False)
+    usecase = AsyncMarkAsCompletedTodoUsecaseImpl(todo_repository)
+
+    with pytest.raises(TodoAlreadyCompletedError):
+        await usecase.execute(MarkAsCompletedTodoUsecaseInput(id=uuid7()))
@@ -0,0 +1,126 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import TypeVar
+
+from todo_api.application_service.service.transaction_service import TransactionService
+from todo_api.application_service.usecase.search_todos_usecase import (
+    SearchTodosUsecaseImpl,
+    SearchTodosUsecaseInput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import TodoChanges
+from todo_api.domain.model.todo_query import TodoQuery
+from todo_api.domain.repository.todo_repository import TodoRepository
+from todo_api.domain.repository.todo_search_index import TodoSearchIndex
+from todo_api.utils.uuid import UUID7, uuid7
+
+ReturnType = TypeVar("ReturnType")
+
+
+class ReadOnlyTransactionService(TransactionService):
+    def __init__(self) -> None:
+        self.read_only_calls = 0
+
+    def Run(self, func: Callable[[], ReturnType]) -> ReturnType:  # pragma: no cover
+        raise AssertionError("unexpected call to Run")
+
+    def RunReadOnly(self, func: Callable[[], ReturnType]) -> ReturnType:
+        self.read_only_calls += 1
+        return func()
+
+
+class RankedSearchIndex(TodoSearchIndex):
+    def __init__(self, ranking: list[UUID7]) -> None:
+        self.ranking = ranking
+        self.calls: list[tuple[str, int, int]] = []
+
+    def search(self, text: str, offset: int, limit: int) -> list[UUID7]:
+        self.calls.append((text, offset, limit))
+        return self.ranking[offset : offset + limit]
+
+
+class PreloadedTodoRepository(TodoRepository):
+    def __init__(self, todos: list[Todo]) -> None:
+        self._todos = {todo.id: todo for todo in todos}
+
+    def find_all(self) -> list[Todo]:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to find_all")
+
+    def find_page(self, after_id: UUID7 | None, limit: int) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_page")
+
+    def iter_all(self, batch_size: int) -> Iterator[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to iter_all")
+
+    def list_version(self) -> str | None:  # pragma: no cover
+        raise AssertionError("unexpected call to list_version")
+
+    def find_all_with_version(self) -> tuple[list[Todo], str | None]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_all_with_version")
+
+    def find_changes(self, since: datetime | None) -> TodoChanges:  # pragma: no cover
+        raise AssertionError("unexpected call to find_changes")
+
+    def find_by_query(self, query: TodoQuery, limit: int | None) -> list[Todo]:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_query")
+
+    def find_by_id(self, todo_id: UUID7) -> Todo:  # pragma: no cover
+        raise AssertionError("unexpected call to find_by_id")
+
+    def find_by_ids(self, todo_ids: list[UUID7], for_update: bool = False) -> list[Todo]:
+        # Reversed: the repository promises no particular order.
+        return [self._todos[todo_id] for todo_id in reversed(todo_ids) if todo_id in self._todos]
+
+    def save(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to save")
+
+    def add(self, todo: Todo) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add")
+
+    def add_all(self, todos: list[Todo]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to add_all")
+
+    def mark_completed(self, todo_id: UUID7, completed: bool) -> bool:  # pragma: no cover
+        raise AssertionError("unexpected call to mark_completed")
+
+    def set_completed(self, todo_ids: list[UUID7], completed: bool) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to set_completed")
+
+    def delete(self, todo: Todo) -> None:  # pragma: no cover - not used in this test
+        raise AssertionError("unexpected call to delete")
+
+    def delete_by_id(self, todo_id: UUID7) -> int:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_by_id")
+
+    def delete_many(self, todo_ids: list[UUID7]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to delete_many")
+
+
+def test_execute_keeps_ranking_and_reports_next_offset():
+    todos = [Todo(title=f"todo {index}") for index in range(4)]
+    ranking = [todos[2].id, todos[0].id, todos[3].id, todos[1].id]
+    search_index = RankedSearchIndex(ranking)
+    transaction_service = ReadOnlyTransactionService()
+    usecase = SearchTodosUsecaseImpl(
+        search_index, PreloadedTodoRepository(todos), transaction_service
+    )
+
+    output = usecase.execute(SearchTodosUsecaseInput(text="todo", offset=1, limit=2))
+
+    assert transaction_service.read_only_calls == 1
+    assert search_index.calls == [("todo", 1, 3)]
+    assert output.todos == [todos[0], todos[3]]
+    assert output.next_offset == 3
+
+
+def test_execute_skips_ids_missing_from_the_repository_on_the_last_page():
+    kept = Todo(title="kept")
+    search_index = RankedSearchIndex([uuid7(), kept.id])
+    usecase = SearchTodosUsecaseImpl(
+        search_index, PreloadedTodoRepository([kept]), ReadOnlyTransactionService()
+    )
+
+    output = usecase.execute(SearchTodosUsecaseInput(text="kept", limit=5))
+
+    assert output.todos == [kept]
+    assert output.next_offset is None
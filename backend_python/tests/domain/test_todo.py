@@ -85,6 +85,26 @@ def test_from_dto_restores_state_without_generating_new_id():
     assert todo.completed
 
 
+def test_reconstitute_restores_stored_values():
+    todo_id = str(uuid7())
+
+    todo = Todo.reconstitute(todo_id, "restore", None, True)
+
+    assert todo.id == UUID(todo_id)
+    assert str(todo.id) == todo_id
+    assert todo.title == "restore"
+    assert todo.description is None
+    assert todo.completed
+
+
+def test_todo_has_no_instance_dict():
+    todo = Todo(title="slotted")
+
+    assert not hasattr(todo, "__dict__")
+    with pytest.raises(AttributeError):
+        setattr(todo, "extra", "value")
+
+
 def test_id_property_is_read_only():
     todo = Todo(title="immutable id")
 
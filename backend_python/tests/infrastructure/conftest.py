@@ -1,17 +1,25 @@
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 
 import pytest
 from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, delete
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
 from testcontainers.mysql import MySqlContainer
 
 from todo_api.infrastructure.repository.data_model.base import Base
 from todo_api.infrastructure.repository.data_model.todo import TodoDataModel
+from todo_api.infrastructure.repository.data_model.todo_stats import TodoStatsDataModel
+from todo_api.infrastructure.repository.data_model.todo_tombstone import TodoTombstoneDataModel
+
+# The test user lacks SUPER, which MySQL requires for CREATE TRIGGER while binary logging
+# is on; create_all installs the todo_stats triggers.
+MYSQL_COMMAND = "--disable-log-bin"
 
 
 @pytest.fixture(scope="session")
 def mysql_container() -> Iterator[MySqlContainer]:
-    with MySqlContainer("mysql:8.4") as container:
+    with MySqlContainer("mysql:8.4").with_command(MYSQL_COMMAND) as container:
         yield container
 
 
@@ -30,6 +38,52 @@ def mysql_engine(mysql_container: MySqlContainer) -> Iterator[Engine]:
         engine.dispose()
 
 
+@pytest.fixture(scope="session")
+def mysql_replica_container() -> Iterator[MySqlContainer]:
+    # An independent server standing in for a replica: tests seed it directly, so what a
+    # read returns shows which server served it.
+    with MySqlContainer("mysql:8.4").with_command(MYSQL_COMMAND) as container:
+        yield container
+
+
+@pytest.fixture()
+def mysql_replica_engine(mysql_replica_container: MySqlContainer) -> Iterator[Engine]:
+    connection_url = mysql_replica_container.get_connection_url()
+    connection_url = connection_url.replace("localhost", "127.0.0.1")
+    engine = create_engine(connection_url)
+    Base.metadata.create_all(engine)
+    INFRA_TEST_METADATA.create_all(engine)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(engine)
+        INFRA_TEST_METADATA.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.fixture()
+async def mysql_async_engine(mysql_engine: Engine) -> AsyncIterator[AsyncEngine]:
+    # NullPool: connections must not outlive the event loop of the test that opened them.
+    engine = create_async_engine(
+        mysql_engine.url.set(drivername="mysql+asyncmy"), poolclass=NullPool
+    )
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture()
+async def mysql_async_replica_engine(mysql_replica_engine: Engine) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(
+        mysql_replica_engine.url.set(drivername="mysql+asyncmy"), poolclass=NullPool
+    )
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
 INFRA_TEST_METADATA = MetaData()
 INFRA_TEST_TABLE = Table(
     "infrastructure_test_records",
@@ -46,13 +100,22 @@ def infrastructure_test_table() -> Table:
 
 
 @pytest.fixture(autouse=True)
-def clean_tables(mysql_engine: Engine) -> Iterator[None]:
+def clean_tables(request: pytest.FixtureRequest) -> Iterator[None]:
+    # Only tests that use MySQL start the container, and only they need clean tables.
+    if "mysql_engine" not in request.fixturenames:
+        yield
+        return
+    mysql_engine: Engine = request.getfixturevalue("mysql_engine")
     with mysql_engine.connect() as connection:
         with connection.begin():
             connection.execute(delete(TodoDataModel))
+            connection.execute(delete(TodoTombstoneDataModel))
+            connection.execute(delete(TodoStatsDataModel))
             connection.execute(INFRA_TEST_TABLE.delete())
     yield
     with mysql_engine.connect() as connection:
         with connection.begin():
             connection.execute(delete(TodoDataModel))
+            connection.execute(delete(TodoTombstoneDataModel))
+            connection.execute(delete(TodoStatsDataModel))
             connection.execute(INFRA_TEST_TABLE.delete())
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from todo_api.infrastructure.database.pool_metrics import PoolMetrics
+from todo_api.infrastructure.database.settings import EngineSettings, build_engine
+
+
+@pytest.fixture()
+def tiny_pool_engine(mysql_engine: Engine) -> tuple[Engine, PoolMetrics]:
+    settings = EngineSettings(
+        url=mysql_engine.url.render_as_string(hide_password=False),
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    metrics = PoolMetrics()
+    return build_engine(settings, metrics), metrics
+
+
+def test_pool_metrics_track_checkouts_overflow_and_timeouts(
+    tiny_pool_engine: tuple[Engine, PoolMetrics],
+) -> None:
+    engine, metrics = tiny_pool_engine
+    try:
+        with engine.connect(), engine.connect():
+            busy = metrics.stats()
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        stats = metrics.stats()
+    finally:
+        engine.dispose()
+
+    assert (busy.size, busy.checked_out, busy.overflow) == (1, 2, 1)
+    assert stats.checked_out == 0
+    assert stats.max_checked_out == 2
+    assert stats.checkouts == 2
+    assert stats.overflow_checkouts == 1
+    assert stats.timeouts == 1
+    assert sum(stats.wait_seconds.values()) == 3
+    assert stats.wait_seconds["0.001"] + stats.wait_seconds["0.005"] >= 2
+    assert stats.wait_seconds["0.05"] + stats.wait_seconds["0.1"] == 1
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy.pool import QueuePool, SingletonThreadPool
+
+from todo_api.infrastructure.database.pool_metrics import PoolMetrics
+from todo_api.infrastructure.database.settings import EngineSettings, build_engine
+
+
+def test_from_env_applies_pool_overrides_to_the_profile() -> None:
+    settings = EngineSettings.from_env(
+        "mysql+mysqldb://user@db/todo",
+        {
+            "DATABASE_PROFILE": "debug",
+            "DATABASE_POOL_SIZE": "20",
+            "DATABASE_MAX_OVERFLOW": "0",
+            "DATABASE_POOL_TIMEOUT": "2.5",
+            "DATABASE_POOL_RECYCLE": "600",
+            "DATABASE_POOL_PRE_PING": "0",
+        },
+    )
+
+    assert settings == EngineSettings(
+        url="mysql+mysqldb://user@db/todo",
+        echo=True,
+        hide_parameters=False,
+        pool_size=20,
+        max_overflow=0,
+        pool_timeout=2.5,
+        pool_recycle=600,
+        pool_pre_ping=False,
+    )
+
+
+def test_from_env_defaults_to_the_quiet_production_profile() -> None:
+    settings = EngineSettings.from_env("mysql+mysqldb://user@db/todo", {})
+
+    assert settings.echo is False
+    assert settings.hide_parameters is True
+    assert settings.pool_pre_ping is True
+
+
+def test_from_env_rejects_unknown_profiles() -> None:
+    with pytest.raises(ValueError):
+        EngineSettings.from_env("mysql+mysqldb://user@db/todo", {"DATABASE_PROFILE": "fast"})
+
+
+def test_build_engine_sizes_queue_pools_only(tmp_path: Path) -> None:
+    file_engine = build_engine(
+        EngineSettings(url=f"sqlite:///{tmp_path / 'todo.db'}", pool_size=3), PoolMetrics()
+    )
+    memory_engine = build_engine(EngineSettings(url="sqlite://", pool_size=3), PoolMetrics())
+
+    assert isinstance(file_engine.pool, QueuePool)
+    assert file_engine.pool.size() == 3
+    assert isinstance(memory_engine.pool, SingletonThreadPool)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Column, Engine, MetaData, String, Table, func, insert, select
+
+from todo_api.infrastructure.repository.data_model.types import BinaryUUID
+from todo_api.utils.uuid import uuid7
+
+BINARY_METADATA = MetaData()
+BINARY_TABLE = Table(
+    "binary_uuid_records",
+    BINARY_METADATA,
+    Column("id", BinaryUUID(), primary_key=True),
+    Column("label", String(32), nullable=False),
+)
+
+
+@pytest.fixture()
+def binary_table(mysql_engine: Engine) -> Iterator[Table]:
+    BINARY_METADATA.create_all(mysql_engine)
+    try:
+        yield BINARY_TABLE
+    finally:
+        BINARY_METADATA.drop_all(mysql_engine)
+
+
+def test_binary_uuid_round_trips_canonical_string(
+    mysql_engine: Engine, binary_table: Table
+) -> None:
+    todo_id = uuid7()
+
+    with mysql_engine.begin() as connection:
+        connection.execute(insert(binary_table).values(id=str(todo_id), label="string"))
+
+    with mysql_engine.connect() as connection:
+        stored = connection.execute(
+            select(binary_table.c.id, func.length(binary_table.c.id)).where(
+                binary_table.c.id == str(todo_id)
+            )
+        ).one()
+
+    assert stored == (str(todo_id), 16)
+
+
+def test_binary_uuid_accepts_uuid_objects_as_parameters(
+    mysql_engine: Engine, binary_table: Table
+) -> None:
+    ids = [uuid7() for _ in range(3)]
+
+    with mysql_engine.begin() as connection:
+        connection.execute(
+            insert(binary_table), [{"id": todo_id, "label": "uuid"} for todo_id in ids]
+        )
+
+    with mysql_engine.connect() as connection:
+        after_first = (
+            connection.execute(
+                select(binary_table.c.id)
+                .where(binary_table.c.id > ids[0])
+                .order_by(binary_table.c.id)
+            )
+            .scalars()
+            .all()
+        )
+
+    assert after_first == [str(todo_id) for todo_id in ids[1:]]
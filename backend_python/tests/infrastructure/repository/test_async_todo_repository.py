@@ -0,0 +1,157 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_query import TodoQuery, TodoSort
+from todo_api.domain.repository.errors import RepositoryNotFoundError
+from todo_api.infrastructure.repository.async_context_provider import AsyncContextProviderImpl
+from todo_api.infrastructure.repository.async_todo_repository import AsyncTodoRepositoryImpl
+from todo_api.infrastructure.repository.data_model.todo import TodoDataModel
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture()
+def context_provider(mysql_async_engine: AsyncEngine) -> AsyncContextProviderImpl:
+    return AsyncContextProviderImpl(mysql_async_engine)
+
+
+@pytest.fixture()
+def todo_repository(context_provider: AsyncContextProviderImpl) -> AsyncTodoRepositoryImpl:
+    return AsyncTodoRepositoryImpl(context_provider)
+
+
+async def test_add_and_find_by_id_round_trip(
+    context_provider: AsyncContextProviderImpl, todo_repository: AsyncTodoRepositoryImpl
+) -> None:
+    todo = Todo(title="async", description="await me")
+
+    async with context_provider.transaction():
+        await todo_repository.add(todo)
+    async with context_provider.transaction():
+        found = await todo_repository.find_by_id(todo.id)
+
+    assert found.id == todo.id
+    assert found.description == "await me"
+
+
+async def test_save_overwrites_existing_row(
+    mysql_engine: Engine,
+    context_provider: AsyncContextProviderImpl,
+    todo_repository: AsyncTodoRepositoryImpl,
+) -> None:
+    todo = Todo(title="before")
+
+    async with context_provider.transaction():
+        await todo_repository.add(todo)
+        todo.update(title="after", description=None)
+        await todo_repository.save(todo)
+
+    with Session(mysql_engine) as session:
+        stored = session.get(TodoDataModel, str(todo.id))
+    assert stored is not None
+    assert stored.title == "after"
+
+
+async def test_find_page_orders_by_id_after_cursor(
+    context_provider: AsyncContextProviderImpl, todo_repository: AsyncTodoRepositoryImpl
+) -> None:
+    todos = [Todo(title=f"todo {index}") for index in range(3)]
+
+    async with context_provider.transaction():
+        for todo in todos:
+            await todo_repository.add(todo)
+    async with context_provider.transaction():
+        page = await todo_repository.find_page(after_id=todos[0].id, limit=5)
+
+    assert [todo.id for todo in page] == [todos[1].id, todos[2].id]
+
+
+async def test_find_by_query_filters_and_sorts_by_title(
+    context_provider: AsyncContextProviderImpl, todo_repository: AsyncTodoRepositoryImpl
+) -> None:
+    todos = [Todo(title=title) for title in ("walk", "buy milk", "buy eggs", "build")]
+    todos[1].mark_as_completed()
+
+    async with context_provider.transaction():
+        for todo in todos:
+            await todo_repository.add(todo)
+    async with context_provider.transaction():
+        found = await todo_repository.find_by_query(
+            TodoQuery(completed=False, title_prefix="bu", sort=TodoSort.TITLE), limit=5
+        )
+
+    assert [todo.title for todo in found] == ["build", "buy eggs"]
+
+
+async def test_mark_completed_and_delete_by_id(
+    context_provider: AsyncContextProviderImpl, todo_repository: AsyncTodoRepositoryImpl
+) -> None:
+    todo = Todo(title="finish")
+
+    async with context_provider.transaction():
+        await todo_repository.add(todo)
+        assert await todo_repository.mark_completed(todo.id, True) is True
+        assert await todo_repository.mark_completed(todo.id, True) is False
+        assert await todo_repository.delete_by_id(todo.id) == 1
+
+    with pytest.raises(RepositoryNotFoundError):
+        async with context_provider.transaction():
+            await todo_repository.delete_by_id(todo.id)
+
+
+async def test_transaction_rolls_back_on_error(
+    context_provider: AsyncContextProviderImpl, todo_repository: AsyncTodoRepositoryImpl
+) -> None:
+    todo = Todo(title="discarded")
+
+    with pytest.raises(RuntimeError):
+        async with context_provider.transaction():
+            await todo_repository.add(todo)
+            raise RuntimeError("boom")
+
+    async with context_provider.transaction():
+        assert await todo_repository.find_all() == []
+
+    with pytest.raises(RuntimeError):
+        context_provider.current()
+
+
+async def test_deferred_transaction_acquires_on_first_use_and_commits(
+    context_provider: AsyncContextProviderImpl, todo_repository: AsyncTodoRepositoryImpl
+) -> None:
+    todo = Todo(title="deferred")
+
+    async with context_provider.deferred_transaction():
+        await context_provider.rollback()
+        await todo_repository.add(todo)
+    async with context_provider.deferred_transaction():
+        found = await todo_repository.find_by_id(todo.id)
+
+    assert found.title == "deferred"
+
+
+async def test_read_only_transaction_is_served_by_a_replica(
+    mysql_async_engine: AsyncEngine,
+    mysql_async_replica_engine: AsyncEngine,
+    mysql_replica_engine: Engine,
+) -> None:
+    todo = Todo(title="replicated")
+    with mysql_replica_engine.begin() as connection:
+        connection.execute(insert(TodoDataModel).values(TodoDataModel.values_from_domain(todo)))
+    context_provider = AsyncContextProviderImpl(
+        mysql_async_engine, replicas=[mysql_async_replica_engine]
+    )
+    todo_repository = AsyncTodoRepositoryImpl(context_provider)
+
+    async with context_provider.transaction(read_only=True):
+        found = await todo_repository.find_by_id(todo.id)
+    async with context_provider.deferred_transaction(pin_primary=True):
+        async with context_provider.transaction(read_only=True):
+            with pytest.raises(RepositoryNotFoundError):
+                await todo_repository.find_by_id(todo.id)
+
+    assert found.title == "replicated"
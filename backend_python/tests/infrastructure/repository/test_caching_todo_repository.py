@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.repository.errors import RepositoryNotFoundError
+from todo_api.infrastructure.repository.caching_todo_repository import (
+    CacheEvictingTodoRepository,
+    CachingTodoRepository,
+    TodoCache,
+)
+from todo_api.infrastructure.repository.context_provider import ContextProviderImpl
+from todo_api.infrastructure.repository.data_model.todo import TodoDataModel
+from todo_api.infrastructure.repository.todo_repository import TodoRepositoryImpl
+
+
+@pytest.fixture()
+def context_provider(mysql_engine: Engine) -> ContextProviderImpl:
+    return ContextProviderImpl(mysql_engine)
+
+
+@pytest.fixture()
+def cache(context_provider: ContextProviderImpl) -> TodoCache:
+    return TodoCache(context_provider, max_size=10, ttl_seconds=60)
+
+
+@pytest.fixture()
+def repository(context_provider: ContextProviderImpl, cache: TodoCache) -> CachingTodoRepository:
+    return CachingTodoRepository(TodoRepositoryImpl(context_provider), cache=cache)
+
+
+def seed(mysql_engine: Engine, todo: Todo) -> None:
+    with Session(mysql_engine) as session, session.begin():
+        session.add(TodoDataModel.from_domain(todo))
+
+
+def rename_behind_cache(mysql_engine: Engine, todo: Todo, title: str) -> None:
+    with Session(mysql_engine) as session, session.begin():
+        session.execute(
+            update(TodoDataModel).where(TodoDataModel.id == str(todo.id)).values(title=title)
+        )
+
+
+def test_find_by_id_serves_repeat_reads_from_cache(
+    mysql_engine: Engine,
+    context_provider: ContextProviderImpl,
+    cache: TodoCache,
+    repository: CachingTodoRepository,
+) -> None:
+    todo = Todo(title="cached")
+    seed(mysql_engine, todo)
+
+    with context_provider.transaction():
+        first = repository.find_by_id(todo.id)
+    rename_behind_cache(mysql_engine, todo, "changed elsewhere")
+    with context_provider.transaction():
+        second = repository.find_by_id(todo.id)
+
+    assert first.title == second.title == "cached"
+    assert first is not second
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_save_invalidates_after_commit(
+    mysql_engine: Engine,
+    context_provider: ContextProviderImpl,
+    repository: CachingTodoRepository,
+) -> None:
+    todo = Todo(title="before")
+    seed(mysql_engine, todo)
+    with context_provider.transaction():
+        repository.find_by_id(todo.id)
+
+    with context_provider.transaction():
+        todo.update(title="after")
+        repository.save(todo)
+        assert repository.find_by_id(todo.id).title == "after"
+
+    with context_provider.transaction():
+        assert repository.find_by_id(todo.id).title == "after"
+
+
+def test_rolled_back_write_is_not_cached(
+    mysql_engine: Engine,
+    context_provider: ContextProviderImpl,
+    repository: CachingTodoRepository,
+) -> None:
+    todo = Todo(title="committed")
+    seed(mysql_engine, todo)
+    with context_provider.transaction():
+        repository.find_by_id(todo.id)
+
+    with pytest.raises(ValueError):
+        with context_provider.transaction():
+            todo.update(title="uncommitted")
+            repository.save(todo)
+            assert repository.find_by_id(todo.id).title == "uncommitted"
+            raise ValueError("boom")
+
+    with context_provider.transaction():
+        assert repository.find_by_id(todo.id).title == "committed"
+
+
+def test_delete_invalidates_after_commit(
+    mysql_engine: Engine,
+    context_provider: ContextProviderImpl,
+    repository: CachingTodoRepository,
+) -> None:
+    todo = Todo(title="doomed")
+    seed(mysql_engine, todo)
+    with context_provider.transaction():
+        repository.find_by_id(todo.id)
+
+    with context_provider.transaction():
+        repository.delete(todo)
+
+    with context_provider.transaction():
+        with pytest.raises(RepositoryNotFoundError):
+            repository.find_by_id(todo.id)
+
+
+def test_bulk_writes_invalidate_after_commit(
+    mysql_engine: Engine,
+    context_provider: ContextProviderImpl,
+    repository: CachingTodoRepository,
+) -> None:
+    completed, deleted = Todo(title="complete me"), Todo(title="delete me")
+    seed(mysql_engine, completed)
+    seed(mysql_engine, deleted)
+    with context_provider.transaction():
+        repository.find_by_id(completed.id)
+        repository.find_by_id(deleted.id)
+
+    with context_provider.transaction():
+        repository.set_completed([completed.id], True)
+        repository.delete_many([deleted.id])
+
+    with context_provider.transaction():
+        assert repository.find_by_id(completed.id).completed is True
+        with pytest.raises(RepositoryNotFoundError):
+            repository.find_by_id(deleted.id)
+
+
+def test_evicting_repository_reads_past_the_cache_and_evicts_its_writes(
+    mysql_engine: Engine,
+    context_provider: ContextProviderImpl,
+    cache: TodoCache,
+    repository: CachingTodoRepository,
+) -> None:
+    todo = Todo(title="cached")
+    seed(mysql_engine, todo)
+    writer = CacheEvictingTodoRepository(TodoRepositoryImpl(context_provider), cache=cache)
+    with context_provider.transaction():
+        repository.find_by_id(todo.id)
+    rename_behind_cache(mysql_engine, todo, "changed elsewhere")
+
+    with context_provider.transaction():
+        read_for_write = writer.find_by_id(todo.id)
+        read_for_write.mark_as_completed()
+        writer.save(read_for_write)
+
+    with context_provider.transaction():
+        found = repository.find_by_id(todo.id)
+    assert (found.title, found.completed) == ("changed elsewhere", True)
+
+
+def test_reads_from_a_replica_do_not_fill_the_cache(
+    mysql_engine: Engine, mysql_replica_engine: Engine
+) -> None:
+    todo = Todo(title="on the primary")
+    seed(mysql_engine, todo)
+    seed(mysql_replica_engine, todo)
+    rename_behind_cache(mysql_replica_engine, todo, "lagging replica")
+    provider = ContextProviderImpl(mysql_engine, replicas=[mysql_replica_engine])
+    cache = TodoCache(provider, max_size=10, ttl_seconds=60)
+    repository = CachingTodoRepository(TodoRepositoryImpl(provider), cache=cache)
+
+    with provider.transaction(read_only=True):
+        assert repository.find_by_id(todo.id).title == "lagging replica"
+    assert cache.stats().size == 0
+    with provider.transaction():
+        repository.find_by_id(todo.id)
+    with provider.transaction(read_only=True):
+        assert repository.find_by_id(todo.id).title == "on the primary"
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import pytest
-from sqlalchemy import Engine, text
+from sqlalchemy import Engine, Table, event, insert, select, text
 
 from todo_api.infrastructure.repository.context_provider import ContextProviderImpl
+from todo_api.infrastructure.repository.replica_picker import ReplicaPicker
 
 
 @pytest.fixture()
@@ -28,3 +29,194 @@ def test_transaction_clears_current_after_exit(context_provider: ContextProvider
 
     with pytest.raises(RuntimeError):
         context_provider.current()
+
+
+def test_on_commit_runs_after_outermost_commit(context_provider: ContextProviderImpl) -> None:
+    calls: list[str] = []
+
+    with context_provider.transaction():
+        with context_provider.transaction():
+            context_provider.on_commit(lambda: calls.append("nested"))
+        assert calls == []
+        context_provider.on_commit(lambda: calls.append("outer"))
+        assert calls == []
+
+    assert calls == ["nested", "outer"]
+
+
+def test_read_only_scope_inside_a_transaction_takes_no_savepoint(
+    context_provider: ContextProviderImpl,
+) -> None:
+    with context_provider.transaction() as session:
+        with context_provider.transaction(read_only=True) as nested:
+            assert nested is session
+            assert not session.in_nested_transaction()
+        with context_provider.transaction():
+            assert session.in_nested_transaction()
+
+    with context_provider.deferred_transaction():
+        with context_provider.transaction(read_only=True) as session:
+            assert not session.in_nested_transaction()
+
+
+def test_on_commit_is_discarded_on_rollback(context_provider: ContextProviderImpl) -> None:
+    calls: list[str] = []
+
+    with pytest.raises(ValueError):
+        with context_provider.transaction():
+            context_provider.on_commit(lambda: calls.append("rolled back"))
+            raise ValueError("boom")
+
+    with context_provider.transaction():
+        pass
+
+    assert calls == []
+
+
+def test_deferred_transaction_checks_out_nothing_until_current(
+    mysql_engine: Engine, context_provider: ContextProviderImpl
+) -> None:
+    checkouts: list[object] = []
+
+    def on_checkout(*args: object) -> None:
+        checkouts.append(args)
+
+    event.listen(mysql_engine, "checkout", on_checkout)
+    try:
+        with context_provider.deferred_transaction():
+            context_provider.rollback()
+        assert checkouts == []
+
+        with context_provider.deferred_transaction():
+            context_provider.current().execute(text("SELECT 1"))
+        assert len(checkouts) == 1
+    finally:
+        event.remove(mysql_engine, "checkout", on_checkout)
+
+
+def test_deferred_transaction_commits_on_exit(
+    mysql_engine: Engine,
+    context_provider: ContextProviderImpl,
+    infrastructure_test_table: Table,
+) -> None:
+    with context_provider.deferred_transaction():
+        with context_provider.transaction() as session:
+            session.execute(
+                insert(infrastructure_test_table).values(scope="deferred", value="kept")
+            )
+        assert context_provider.current() is session
+
+    with mysql_engine.connect() as connection:
+        values = connection.execute(select(infrastructure_test_table.c.value)).scalars().all()
+    assert values == ["kept"]
+
+
+def test_deferred_transaction_rolls_back_on_error_and_on_request(
+    mysql_engine: Engine,
+    context_provider: ContextProviderImpl,
+    infrastructure_test_table: Table,
+) -> None:
+    with pytest.raises(ValueError):
+        with context_provider.deferred_transaction():
+            context_provider.current().execute(
+                insert(infrastructure_test_table).values(scope="deferred", value="error")
+            )
+            raise ValueError("boom")
+
+    with context_provider.deferred_transaction():
+        context_provider.current().execute(
+            insert(infrastructure_test_table).values(scope="deferred", value="rolled back")
+        )
+        context_provider.rollback()
+
+    with mysql_engine.connect() as connection:
+        assert connection.execute(select(infrastructure_test_table.c.value)).all() == []
+
+
+def test_release_commits_and_next_current_starts_a_new_session(
+    mysql_engine: Engine,
+    context_provider: ContextProviderImpl,
+    infrastructure_test_table: Table,
+) -> None:
+    with context_provider.deferred_transaction():
+        first = context_provider.current()
+        first.execute(insert(infrastructure_test_table).values(scope="release", value="early"))
+        context_provider.release()
+
+        with mysql_engine.connect() as connection:
+            values = connection.execute(select(infrastructure_test_table.c.value)).scalars().all()
+        assert values == ["early"]
+        assert context_provider.current() is not first
+
+
+def test_release_is_rejected_inside_a_plain_transaction(
+    context_provider: ContextProviderImpl,
+) -> None:
+    with context_provider.transaction():
+        with pytest.raises(RuntimeError):
+            context_provider.release()
+
+
+@pytest.fixture()
+def routing_provider(
+    mysql_engine: Engine, mysql_replica_engine: Engine, infrastructure_test_table: Table
+) -> ContextProviderImpl:
+    for engine, server in ((mysql_engine, "primary"), (mysql_replica_engine, "replica")):
+        with engine.begin() as connection:
+            connection.execute(
+                insert(infrastructure_test_table).values(scope="server", value=server)
+            )
+    return ContextProviderImpl(mysql_engine, replicas=[mysql_replica_engine])
+
+
+def _served_by(provider: ContextProviderImpl, table: Table) -> list[str]:
+    query = select(table.c.value).where(table.c.scope == "server")
+    return list(provider.current().execute(query).scalars())
+
+
+def test_read_only_transaction_is_served_by_a_replica(
+    routing_provider: ContextProviderImpl, infrastructure_test_table: Table
+) -> None:
+    with routing_provider.transaction(read_only=True):
+        assert _served_by(routing_provider, infrastructure_test_table) == ["replica"]
+        with routing_provider.transaction(read_only=True):
+            assert _served_by(routing_provider, infrastructure_test_table) == ["replica"]
+        with pytest.raises(RuntimeError):
+            with routing_provider.transaction():
+                pass
+
+    with routing_provider.transaction():
+        assert _served_by(routing_provider, infrastructure_test_table) == ["primary"]
+
+
+def test_read_only_work_stays_on_the_primary_once_the_scope_wrote(
+    routing_provider: ContextProviderImpl, infrastructure_test_table: Table
+) -> None:
+    with routing_provider.deferred_transaction():
+        with routing_provider.transaction(read_only=True):
+            assert _served_by(routing_provider, infrastructure_test_table) == ["replica"]
+
+        routing_provider.current().execute(
+            insert(infrastructure_test_table).values(scope="server", value="written")
+        )
+        with routing_provider.transaction(read_only=True):
+            served = _served_by(routing_provider, infrastructure_test_table)
+        assert sorted(served) == ["primary", "written"]
+
+
+def test_pinned_scope_reads_from_the_primary(
+    routing_provider: ContextProviderImpl, infrastructure_test_table: Table
+) -> None:
+    with routing_provider.deferred_transaction(pin_primary=True):
+        with routing_provider.transaction(read_only=True):
+            assert _served_by(routing_provider, infrastructure_test_table) == ["primary"]
+
+
+def test_replica_picker_prefers_the_least_loaded_and_rotates_ties(
+    mysql_engine: Engine, mysql_replica_engine: Engine
+) -> None:
+    picker = ReplicaPicker([(mysql_engine.pool, "first"), (mysql_replica_engine.pool, "second")])
+
+    assert [picker.pick() for _ in range(4)] == ["first", "second", "first", "second"]
+    with mysql_engine.connect():
+        assert [picker.pick() for _ in range(2)] == ["second", "second"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from todo_api.domain.model.todo import Todo
+from todo_api.infrastructure.database.in_memory_todo_store import InMemoryTodoStore
+from todo_api.infrastructure.repository.in_memory_context_provider import InMemoryContextProvider
+from todo_api.infrastructure.repository.in_memory_todo_repository import InMemoryTodoRepository
+from todo_api.presentation.middleware.session_middleware import SessionMiddleware
+
+
+@pytest.fixture()
+def store() -> InMemoryTodoStore:
+    return InMemoryTodoStore()
+
+
+@pytest.fixture()
+def context_provider(store: InMemoryTodoStore) -> InMemoryContextProvider:
+    return InMemoryContextProvider(store)
+
+
+def add(context_provider: InMemoryContextProvider, title: str) -> Todo:
+    todo = Todo(title=title)
+    InMemoryTodoRepository(context_provider).add(todo)
+    return todo
+
+
+def test_current_is_bound_to_the_transaction_scope(
+    context_provider: InMemoryContextProvider,
+) -> None:
+    with pytest.raises(RuntimeError):
+        context_provider.current()
+
+    with context_provider.transaction() as transaction:
+        assert context_provider.current() is transaction
+        with context_provider.transaction() as nested:
+            assert nested is transaction
+
+    with pytest.raises(RuntimeError):
+        context_provider.current()
+
+
+def test_failed_nested_scope_rolls_back_to_where_it_started(
+    store: InMemoryTodoStore, context_provider: InMemoryContextProvider
+) -> None:
+    calls: list[str] = []
+
+    with context_provider.transaction():
+        kept = add(context_provider, "kept")
+        context_provider.on_commit(lambda: calls.append("outer"))
+        with pytest.raises(ValueError):
+            with context_provider.transaction():
+                add(context_provider, "undone")
+                context_provider.on_commit(lambda: calls.append("nested"))
+                raise ValueError("boom")
+        assert calls == []
+
+    assert list(store.rows) == [kept.id]
+    assert calls == ["outer"]
+
+
+def test_failed_transaction_leaves_the_store_and_callbacks_alone(
+    store: InMemoryTodoStore, context_provider: InMemoryContextProvider
+) -> None:
+    calls: list[str] = []
+
+    with pytest.raises(ValueError):
+        with context_provider.transaction():
+            add(context_provider, "rolled back")
+            context_provider.on_commit(lambda: calls.append("rolled back"))
+            raise ValueError("boom")
+
+    with context_provider.transaction():
+        add(context_provider, "committed")
+
+    assert [record.title for record in store.rows.values()] == ["committed"]
+    assert calls == []
+
+
+def test_deferred_transaction_commits_on_exit_and_on_release(
+    store: InMemoryTodoStore, context_provider: InMemoryContextProvider
+) -> None:
+    with context_provider.deferred_transaction():
+        add(context_provider, "released")
+        context_provider.release()
+        assert store.commits == 1
+        add(context_provider, "committed on exit")
+
+    assert store.commits == 2
+    assert len(store.rows) == 2
+
+
+def test_session_middleware_rolls_back_error_responses(
+    store: InMemoryTodoStore, context_provider: InMemoryContextProvider
+) -> None:
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, context_provider=context_provider)
+
+    @app.post("/todos")
+    def create(fail: bool = False) -> JSONResponse:
+        add(context_provider, "from a request")
+        return JSONResponse({}, status_code=400 if fail else 201)
+
+    client = TestClient(app)
+    assert client.post("/todos", params={"fail": True}).status_code == 400
+    assert store.rows == {}
+    assert client.post("/todos").status_code == 201
+    assert len(store.rows) == 1
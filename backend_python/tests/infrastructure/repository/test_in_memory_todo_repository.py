@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import DELETIONS_RETENTION
+from todo_api.domain.model.todo_query import TodoQuery, TodoSort
+from todo_api.domain.repository.errors import (
+    RepositoryChangesExpiredError,
+    RepositoryConflictError,
+    RepositoryNotFoundError,
+)
+from todo_api.infrastructure.database.in_memory_todo_store import (
+    PRUNE_INTERVAL,
+    InMemoryTodoStore,
+    utc_now,
+)
+from todo_api.infrastructure.repository.in_memory_context_provider import InMemoryContextProvider
+from todo_api.infrastructure.repository.in_memory_todo_repository import InMemoryTodoRepository
+from todo_api.utils.uuid import uuid7_floor
+
+
+@pytest.fixture()
+def store() -> InMemoryTodoStore:
+    return InMemoryTodoStore()
+
+
+@pytest.fixture()
+def context_provider(store: InMemoryTodoStore) -> InMemoryContextProvider:
+    return InMemoryContextProvider(store)
+
+
+@pytest.fixture()
+def todo_repository(context_provider: InMemoryContextProvider) -> InMemoryTodoRepository:
+    return InMemoryTodoRepository(context_provider)
+
+
+def test_save_overwrites_and_reads_hand_out_copies(
+    context_provider: InMemoryContextProvider, todo_repository: InMemoryTodoRepository
+) -> None:
+    todo = Todo(title="draft", description="first")
+    with context_provider.transaction():
+        todo_repository.add(todo)
+    todo.update("final", None)
+    todo.mark_as_completed()
+    with context_provider.transaction():
+        todo_repository.save(todo)
+
+    with context_provider.transaction():
+        found = todo_repository.find_by_id(todo.id)
+        found.update("changed without saving")
+        again = todo_repository.find_by_id(todo.id)
+        by_ids = todo_repository.find_by_ids([todo.id, Todo(title="missing").id])
+
+    assert (again.title, again.description, again.completed) == ("final", None, True)
+    assert [t.id for t in by_ids] == [todo.id]
+
+
+def test_find_by_id_and_delete_by_id_raise_when_missing(
+    context_provider: InMemoryContextProvider, todo_repository: InMemoryTodoRepository
+) -> None:
+    todo = Todo(title="gone")
+    with context_provider.transaction():
+        todo_repository.add(todo)
+        assert todo_repository.delete_by_id(todo.id) == 1
+
+    with context_provider.transaction():
+        with pytest.raises(RepositoryNotFoundError):
+            todo_repository.find_by_id(todo.id)
+        with pytest.raises(RepositoryNotFoundError):
+            todo_repository.delete_by_id(todo.id)
+
+
+def test_find_page_and_iter_all_follow_id_order(
+    context_provider: InMemoryContextProvider, todo_repository: InMemoryTodoRepository
+) -> None:
+    todos = [Todo(title=f"todo {index}") for index in range(5)]
+    with context_provider.transaction():
+        todo_repository.add_all(list(reversed(todos)))
+
+    with context_provider.transaction():
+        first = todo_repository.find_page(None, 2)
+        second = todo_repository.find_page(first[-1].id, 2)
+        last = todo_repository.find_page(todos[-1].id, 2)
+        everything = list(todo_repository.iter_all(2))
+
+    assert [t.id for t in first + second] == [t.id for t in todos[:4]]
+    assert last == []
+    assert [t.id for t in everything] == [t.id for t in todos]
+
+
+def todo_created_at(moment: datetime, title: str, completed: bool = False) -> Todo:
+    return Todo.reconstitute(str(uuid7_floor(moment)), title, None, completed)
+
+
+def test_find_by_query_filters_sorts_and_pages(
+    context_provider: InMemoryContextProvider, todo_repository: InMemoryTodoRepository
+) -> None:
+    buy_milk = todo_created_at(datetime(2024, 1, 1), "Buy milk", completed=True)
+    buy_eggs = todo_created_at(datetime(2024, 1, 2), "buy eggs")
+    call_mom = todo_created_at(datetime(2024, 1, 3), "call mom")
+    discount = todo_created_at(datetime(2024, 1, 4), "100% off")
+    other = todo_created_at(datetime(2024, 1, 5), "1000 steps")
+    with context_provider.transaction():
+        todo_repository.add_all([buy_milk, buy_eggs, call_mom, discount, other])
+
+    def titles(query: TodoQuery, limit: int | None = None) -> list[str]:
+        with context_provider.transaction():
+            return [todo.title for todo in todo_repository.find_by_query(query, limit)]
+
+    assert titles(TodoQuery(completed=False)) == ["buy eggs", "call mom", "100% off", "1000 steps"]
+    assert titles(TodoQuery(title_prefix="buy", sort=TodoSort.TITLE)) == ["buy eggs", "Buy milk"]
+    assert titles(TodoQuery(title_prefix="100%")) == ["100% off"]
+    assert titles(
+        TodoQuery(created_from=datetime(2024, 1, 2), created_before=datetime(2024, 1, 4))
+    ) == ["buy eggs", "call mom"]
+    assert titles(TodoQuery(sort=TodoSort.CREATED_DESC), limit=2) == ["1000 steps", "100% off"]
+    assert titles(TodoQuery(sort=TodoSort.CREATED_DESC, after_id=discount.id)) == [
+        "call mom",
+        "buy eggs",
+        "Buy milk",
+    ]
+    assert titles(TodoQuery(created_from=datetime(2024, 1, 2), after_id=call_mom.id)) == [
+        "100% off",
+        "1000 steps",
+    ]
+    assert titles(
+        TodoQuery(sort=TodoSort.TITLE_DESC, after_id=buy_milk.id, after_title=buy_milk.title),
+        limit=2,
+    ) == ["buy eggs", "1000 steps"]
+
+
+def test_mark_completed_only_changes_todos_in_the_opposite_state(
+    context_provider: InMemoryContextProvider, todo_repository: InMemoryTodoRepository
+) -> None:
+    first, second = Todo(title="first"), Todo(title="second")
+    with context_provider.transaction():
+        todo_repository.add_all([first, second])
+
+    with context_provider.transaction():
+        assert todo_repository.mark_completed(first.id, True)
+        assert not todo_repository.mark_completed(first.id, True)
+        assert not todo_repository.mark_completed(Todo(title="missing").id, True)
+        todo_repository.set_completed([second.id, Todo(title="missing").id], True)
+
+    with context_provider.transaction():
+        assert [t.completed for t in todo_repository.find_all()] == [True, True]
+
+
+def test_writes_stay_invisible_to_other_transactions_until_commit(
+    context_provider: InMemoryContextProvider, todo_repository: InMemoryTodoRepository
+) -> None:
+    kept, deleted, added = Todo(title="kept"), Todo(title="deleted"), Todo(title="added")
+    with context_provider.transaction():
+        todo_repository.add_all([kept, deleted])
+    seen_elsewhere: list[list[str]] = []
+
+    def read_from_another_transaction() -> None:
+        with context_provider.transaction():
+            seen_elsewhere.append([t.title for t in todo_repository.find_all()])
+
+    with context_provider.transaction():
+        todo_repository.delete(deleted)
+        todo_repository.add(added)
+        kept.update("renamed")
+        todo_repository.save(kept)
+        own_view = [t.title for t in todo_repository.find_page(None, 10)]
+        reader = threading.Thread(target=read_from_another_transaction)
+        reader.start()
+        reader.join()
+    read_from_another_transaction()
+
+    assert own_view == ["renamed", "added"]
+    assert seen_elsewhere == [["kept", "deleted"], ["renamed", "added"]]
+
+
+def test_a_transaction_reads_the_snapshot_it_began_with(
+    store: InMemoryTodoStore,
+    context_provider: InMemoryContextProvider,
+    todo_repository: InMemoryTodoRepository,
+) -> None:
+    kept, deleted = Todo(title="kept"), Todo(title="deleted")
+    with context_provider.transaction():
+        todo_repository.add_all([kept, deleted])
+
+    def change_in_another_transaction() -> None:
+        with context_provider.transaction():
+            todo_repository.mark_completed(kept.id, True)
+            todo_repository.delete_by_id(deleted.id)
+            todo_repository.add(Todo(title="added"))
+
+    with context_provider.transaction():
+        before = [(t.title, t.completed) for t in todo_repository.find_all()]
+        version = todo_repository.list_version()
+        writer = threading.Thread(target=change_in_another_transaction)
+        writer.start()
+        writer.join()
+        assert [(t.title, t.completed) for t in todo_repository.find_all()] == before
+        assert todo_repository.find_by_id(deleted.id).title == "deleted"
+        assert todo_repository.list_version() == version
+    with context_provider.transaction():
+        after = [(t.title, t.completed) for t in todo_repository.find_all()]
+
+    assert before == [("kept", False), ("deleted", False)]
+    assert after == [("kept", True), ("added", False)]
+    # Once no transaction is open, nothing needs the replaced todos any more.
+    assert store.undo == []
+
+
+def test_the_first_writer_to_commit_wins(
+    store: InMemoryTodoStore,
+    context_provider: InMemoryContextProvider,
+    todo_repository: InMemoryTodoRepository,
+) -> None:
+    todo = Todo(title="contended")
+    with context_provider.transaction():
+        todo_repository.add(todo)
+    outcomes: list[bool] = []
+
+    def complete_in_another_transaction() -> None:
+        with context_provider.transaction():
+            outcomes.append(todo_repository.mark_completed(todo.id, True))
+
+    with pytest.raises(RepositoryConflictError):
+        with context_provider.transaction():
+            assert todo_repository.mark_completed(todo.id, True)
+            # The other writer does not wait for this one, and commits first.
+            writer = threading.Thread(target=complete_in_another_transaction)
+            writer.start()
+            writer.join()
+
+    assert outcomes == [True]
+    assert store.commits == 2
+    assert store.undo == []
+
+
+def test_list_version_changes_on_every_commit(
+    context_provider: InMemoryContextProvider, todo_repository: InMemoryTodoRepository
+) -> None:
+    todo = Todo(title="versioned")
+    with context_provider.transaction():
+        empty = todo_repository.list_version()
+        todo_repository.add(todo)
+        uncommitted = todo_repository.list_version()
+        assert todo_repository.find_all_with_version()[1] is None
+    with context_provider.transaction():
+        after_add = todo_repository.list_version()
+        assert todo_repository.list_version() == after_add
+        todos, version = todo_repository.find_all_with_version()
+        assert ([t.id for t in todos], version) == ([todo.id], after_add)
+
+    assert len({empty, after_add}) == 2
+    assert uncommitted is None
+
+
+def test_find_changes_reports_updates_and_deletions_since_watermark(
+    context_provider: InMemoryContextProvider, todo_repository: InMemoryTodoRepository
+) -> None:
+    old, newer, deleted = Todo(title="old"), Todo(title="newer"), Todo(title="deleted")
+    with context_provider.transaction():
+        todo_repository.add_all([old, deleted])
+    with context_provider.transaction():
+        first = todo_repository.find_changes(None)
+    # Changes are stamped to the microsecond; make sure the next commit lands after it.
+    time.sleep(0.02)
+    with context_provider.transaction():
+        todo_repository.add(newer)
+        todo_repository.delete_by_id(deleted.id)
+        todo_repository.delete_many([Todo(title="missing").id])
+    with context_provider.transaction():
+        since_first = todo_repository.find_changes(first.watermark)
+        since_now = todo_repository.find_changes(since_first.watermark)
+
+    assert [todo.title for todo in first.todos] == ["old", "deleted"]
+    assert first.deleted_ids == []
+    assert [todo.title for todo in since_first.todos] == ["newer"]
+    assert since_first.deleted_ids == [deleted.id]
+    assert since_now.todos == []
+    assert since_now.deleted_ids == []
+
+
+def test_deletions_are_forgotten_after_the_retention(
+    store: InMemoryTodoStore,
+    context_provider: InMemoryContextProvider,
+    todo_repository: InMemoryTodoRepository,
+) -> None:
+    expired, kept = Todo(title="expired"), Todo(title="kept")
+    with context_provider.transaction():
+        todo_repository.add_all([expired, kept])
+    with context_provider.transaction():
+        todo_repository.delete_by_id(expired.id)
+    store.deleted_at[expired.id] -= DELETIONS_RETENTION + timedelta(days=1)
+    store.pruned_at -= PRUNE_INTERVAL
+    with context_provider.transaction():
+        todo_repository.delete_by_id(kept.id)
+
+    assert list(store.deleted_at) == [kept.id]
+    with context_provider.transaction():
+        with pytest.raises(RepositoryChangesExpiredError):
+            todo_repository.find_changes(utc_now() - DELETIONS_RETENTION - timedelta(days=1))
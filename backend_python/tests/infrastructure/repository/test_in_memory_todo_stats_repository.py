@@ -0,0 +1,54 @@
+import threading
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.infrastructure.database.in_memory_todo_store import InMemoryTodoStore
+from todo_api.infrastructure.repository.in_memory_context_provider import InMemoryContextProvider
+from todo_api.infrastructure.repository.in_memory_todo_repository import InMemoryTodoRepository
+from todo_api.infrastructure.repository.in_memory_todo_stats_repository import (
+    InMemoryTodoStatsRepository,
+)
+
+
+def test_counts_follow_committed_and_own_writes() -> None:
+    context_provider = InMemoryContextProvider(InMemoryTodoStore())
+    todo_repository = InMemoryTodoRepository(context_provider)
+    todo_stats_repository = InMemoryTodoStatsRepository(context_provider)
+    first, second, third = Todo(title="first"), Todo(title="second"), Todo(title="third")
+
+    with context_provider.transaction():
+        todo_repository.add_all([first, second, third])
+        todo_repository.mark_completed(first.id, True)
+        assert todo_stats_repository.get() == TodoStats(total=3, completed=1)
+    with context_provider.transaction():
+        todo_repository.set_completed([second.id, third.id], True)
+        todo_repository.delete_by_id(first.id)
+        assert todo_stats_repository.get() == TodoStats(total=2, completed=2)
+        todo_repository.mark_completed(third.id, False)
+    with context_provider.transaction():
+        assert todo_stats_repository.get() == TodoStats(total=2, completed=1)
+
+
+def test_counts_are_those_of_the_snapshot() -> None:
+    context_provider = InMemoryContextProvider(InMemoryTodoStore())
+    todo_repository = InMemoryTodoRepository(context_provider)
+    todo_stats_repository = InMemoryTodoStatsRepository(context_provider)
+    first, second, third = Todo(title="first"), Todo(title="second"), Todo(title="third")
+    third.mark_as_completed()
+    with context_provider.transaction():
+        todo_repository.add_all([first, second])
+
+    def change_in_another_transaction() -> None:
+        with context_provider.transaction():
+            todo_repository.mark_completed(first.id, True)
+            todo_repository.delete_by_id(second.id)
+            todo_repository.add(third)
+
+    with context_provider.transaction():
+        assert todo_stats_repository.get() == TodoStats(total=2, completed=0)
+        writer = threading.Thread(target=change_in_another_transaction)
+        writer.start()
+        writer.join()
+        assert todo_stats_repository.get() == TodoStats(total=2, completed=0)
+    with context_provider.transaction():
+        assert todo_stats_repository.get() == TodoStats(total=2, completed=2)
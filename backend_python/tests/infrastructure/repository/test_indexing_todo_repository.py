@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from todo_api.domain.model.todo import Todo
+from todo_api.infrastructure.repository.context_provider import ContextProviderImpl
+from todo_api.infrastructure.repository.indexing_todo_repository import IndexingTodoRepository
+from todo_api.infrastructure.repository.todo_repository import TodoRepositoryImpl
+from todo_api.infrastructure.search.in_memory_todo_search_index import InMemoryTodoSearchIndex
+
+
+@pytest.fixture()
+def context_provider(mysql_engine: Engine) -> ContextProviderImpl:
+    return ContextProviderImpl(mysql_engine)
+
+
+@pytest.fixture()
+def index() -> InMemoryTodoSearchIndex:
+    return InMemoryTodoSearchIndex()
+
+
+@pytest.fixture()
+def repository(
+    context_provider: ContextProviderImpl, index: InMemoryTodoSearchIndex
+) -> IndexingTodoRepository:
+    return IndexingTodoRepository(TodoRepositoryImpl(context_provider), index, context_provider)
+
+
+def test_writes_reach_the_index_when_they_commit(
+    context_provider: ContextProviderImpl,
+    index: InMemoryTodoSearchIndex,
+    repository: IndexingTodoRepository,
+) -> None:
+    todo = Todo(title="buy milk")
+
+    with context_provider.transaction():
+        repository.add(todo)
+        todo.update(title="changed before commit")
+        assert index.search("milk", 0, 10) == []
+    assert index.search("milk", 0, 10) == [todo.id]
+
+    with context_provider.transaction():
+        repository.save(todo)
+    assert index.search("milk", 0, 10) == []
+    assert index.search("changed", 0, 10) == [todo.id]
+
+    with context_provider.transaction():
+        repository.delete_by_id(todo.id)
+    assert len(index) == 0
+
+
+def test_rolled_back_write_is_not_indexed(
+    context_provider: ContextProviderImpl,
+    index: InMemoryTodoSearchIndex,
+    repository: IndexingTodoRepository,
+) -> None:
+    with pytest.raises(ValueError):
+        with context_provider.transaction():
+            repository.add_all([Todo(title="never committed")])
+            raise ValueError("boom")
+
+    assert index.search("committed", 0, 10) == []
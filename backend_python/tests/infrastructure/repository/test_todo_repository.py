@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import itertools
 from collections.abc import Callable
 from contextlib import contextmanager
 from contextvars import ContextVar
+from datetime import UTC, datetime, timedelta
 
 import pytest
-from sqlalchemy import insert
+from sqlalchemy import delete, event, insert
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
 
 from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_changes import DELETIONS_RETENTION
+from todo_api.domain.model.todo_query import TodoQuery, TodoSort
 from todo_api.domain.repository.context_provider import ContextProvider
-from todo_api.domain.repository.errors import RepositoryNotFoundError
+from todo_api.domain.repository.errors import (
+    RepositoryChangesExpiredError,
+    RepositoryNotFoundError,
+)
+from todo_api.infrastructure.repository import todo_repository as todo_repository_module
 from todo_api.infrastructure.repository.data_model.todo import TodoDataModel
 from todo_api.infrastructure.repository.todo_repository import TodoRepositoryImpl
+from todo_api.utils.uuid import uuid7_floor
 
 
 class StubContextProvider(ContextProvider[Session]):
@@ -22,7 +32,7 @@ class StubContextProvider(ContextProvider[Session]):
         self._session: ContextVar[Session | None] = ContextVar("stub_session", default=None)
 
     @contextmanager
-    def transaction(self):
+    def transaction(self, *, read_only: bool = False):
         existing = self._session.get()
         if existing is not None:
             with existing.begin_nested():
@@ -38,12 +48,24 @@ class StubContextProvider(ContextProvider[Session]):
             self._session.reset(token)
             session.close()
 
+    def deferred_transaction(self, *, pin_primary: bool = False):  # pragma: no cover
+        raise AssertionError("unexpected call to deferred_transaction")
+
     def current(self) -> Session:
         session = self._session.get()
         if session is None:
             raise RuntimeError("No active session bound to context provider")
         return session
 
+    def rollback(self) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to rollback")
+
+    def release(self) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to release")
+
+    def on_commit(self, callback: Callable[[], None]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to on_commit")
+
 
 @pytest.fixture()
 def stub_context_provider(mysql_engine: Engine) -> StubContextProvider:
@@ -109,6 +131,41 @@ def test_save_updates_existing_row(
     assert stored.completed is True
 
 
+def test_save_and_add_issue_a_single_statement(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    added, saved = Todo(title="add"), Todo(title="save")
+    statements: list[str] = []
+
+    def record(conn: object, cursor: object, statement: str, *args: object) -> None:
+        statements.append(statement.split(None, 1)[0].upper())
+
+    event.listen(mysql_engine, "before_cursor_execute", record)
+    try:
+        run_in_transaction(stub_context_provider, lambda: todo_repository.add(added))
+        run_in_transaction(stub_context_provider, lambda: todo_repository.save(saved))
+    finally:
+        event.remove(mysql_engine, "before_cursor_execute", record)
+
+    assert statements == ["INSERT", "INSERT"]
+    with Session(mysql_engine) as session:
+        assert session.get(TodoDataModel, str(added.id)) is not None
+        assert session.get(TodoDataModel, str(saved.id)) is not None
+
+
+def test_add_rejects_existing_id(
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    todo = Todo(title="once")
+    run_in_transaction(stub_context_provider, lambda: todo_repository.add(todo))
+
+    with pytest.raises(IntegrityError):
+        run_in_transaction(stub_context_provider, lambda: todo_repository.add(todo))
+
+
 def test_find_all_returns_domain_objects(
     mysql_engine: Engine,
     stub_context_provider: StubContextProvider,
@@ -134,6 +191,150 @@ def test_find_all_returns_domain_objects(
     assert todos[0].id == todo.id
 
 
+def test_find_page_returns_todos_after_cursor_in_id_order(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    todos = [Todo(title=f"page-{index}") for index in range(5)]
+
+    with Session(mysql_engine) as session, session.begin():
+        for todo in reversed(todos):
+            model = TodoDataModel.from_domain(todo)
+            session.execute(
+                insert(TodoDataModel).values(
+                    id=model.id,
+                    title=model.title,
+                    description=model.description,
+                    completed=model.completed,
+                )
+            )
+
+    with stub_context_provider.transaction():
+        first_page = todo_repository.find_page(None, 2)
+        second_page = todo_repository.find_page(first_page[-1].id, 2)
+        last_page = todo_repository.find_page(todos[-1].id, 2)
+
+    assert [todo.id for todo in first_page] == [todo.id for todo in todos[:2]]
+    assert [todo.id for todo in second_page] == [todo.id for todo in todos[2:4]]
+    assert last_page == []
+
+
+def test_iter_all_yields_every_todo_in_id_order(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    todos = [Todo(title=f"stream-{index}") for index in range(5)]
+
+    with Session(mysql_engine) as session, session.begin():
+        for todo in reversed(todos):
+            model = TodoDataModel.from_domain(todo)
+            session.execute(
+                insert(TodoDataModel).values(
+                    id=model.id,
+                    title=model.title,
+                    description=model.description,
+                    completed=model.completed,
+                )
+            )
+
+    with stub_context_provider.transaction():
+        streamed = list(todo_repository.iter_all(batch_size=2))
+
+    assert [todo.id for todo in streamed] == [todo.id for todo in todos]
+
+
+def test_add_all_inserts_each_chunk_with_one_statement(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(todo_repository_module, "INSERT_CHUNK_SIZE", 2)
+    todos = [Todo(title=f"bulk-{index}", description="d") for index in range(5)]
+    inserts: list[str] = []
+
+    def record(conn: object, cursor: object, statement: str, *args: object) -> None:
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(statement)
+
+    event.listen(mysql_engine, "before_cursor_execute", record)
+    try:
+        run_in_transaction(stub_context_provider, lambda: todo_repository.add_all(todos))
+    finally:
+        event.remove(mysql_engine, "before_cursor_execute", record)
+
+    assert len(inserts) == 3
+    with Session(mysql_engine) as session:
+        stored = session.query(TodoDataModel).order_by(TodoDataModel.id).all()
+    assert [(row.id, row.title, row.completed) for row in stored] == [
+        (str(todo.id), todo.title, False) for todo in todos
+    ]
+
+
+def test_bulk_operations_touch_only_listed_todos(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    todos = [Todo(title=f"bulk-{index}") for index in range(3)]
+    missing = Todo(title="missing")
+    with Session(mysql_engine) as session, session.begin():
+        session.add_all([TodoDataModel.from_domain(todo) for todo in todos])
+
+    with stub_context_provider.transaction():
+        found = todo_repository.find_by_ids([todos[0].id, todos[1].id, missing.id], for_update=True)
+        todo_repository.set_completed([todos[0].id, todos[1].id], True)
+        todo_repository.delete_many([todos[1].id, missing.id])
+
+    assert {str(todo.id) for todo in found} == {str(todos[0].id), str(todos[1].id)}
+    with Session(mysql_engine) as session:
+        stored = {row.id: row.completed for row in session.query(TodoDataModel).all()}
+    assert stored == {str(todos[0].id): True, str(todos[2].id): False}
+
+
+def test_mark_completed_only_changes_rows_in_the_opposite_state(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    todo = Todo(title="toggle")
+    with Session(mysql_engine) as session, session.begin():
+        session.add(TodoDataModel.from_domain(todo))
+    outcomes: list[bool] = []
+
+    with stub_context_provider.transaction():
+        outcomes.append(todo_repository.mark_completed(todo.id, True))
+        outcomes.append(todo_repository.mark_completed(todo.id, True))
+        outcomes.append(todo_repository.mark_completed(Todo(title="missing").id, True))
+        outcomes.append(todo_repository.mark_completed(todo.id, False))
+
+    assert outcomes == [True, False, False, True]
+    with Session(mysql_engine) as session:
+        stored = session.get(TodoDataModel, str(todo.id))
+    assert stored is not None
+    assert stored.completed is False
+
+
+def test_delete_by_id_removes_row_or_raises_when_missing(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    todo = Todo(title="remove")
+    with Session(mysql_engine) as session, session.begin():
+        session.add(TodoDataModel.from_domain(todo))
+
+    with stub_context_provider.transaction():
+        assert todo_repository.delete_by_id(todo.id) == 1
+
+    with pytest.raises(RepositoryNotFoundError), stub_context_provider.transaction():
+        todo_repository.delete_by_id(todo.id)
+    with Session(mysql_engine) as session:
+        assert session.get(TodoDataModel, str(todo.id)) is None
+
+
 def test_find_by_id_returns_matching_todo(
     mysql_engine: Engine,
     stub_context_provider: StubContextProvider,
@@ -158,6 +359,171 @@ def test_find_by_id_returns_matching_todo(
     assert fetched.id == todo.id
 
 
+def test_reads_do_not_load_entities_into_the_session(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    todos = [Todo(title="plain-0"), Todo(title="plain-1")]
+    rows = [TodoDataModel.values_from_domain(todo) for todo in todos]
+    with Session(mysql_engine) as session, session.begin():
+        session.execute(insert(TodoDataModel).values(rows))
+
+    with stub_context_provider.transaction() as session:
+        todo_repository.find_all()
+        todo_repository.find_page(None, 10)
+        todo_repository.find_by_id(todos[0].id)
+        todo_repository.find_by_ids([todo.id for todo in todos])
+        list(todo_repository.iter_all(batch_size=1))
+
+        assert len(session.identity_map) == 0
+
+
+def test_list_version_tracks_count_and_newest_settled_change(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    todos = [Todo(title="version-0"), Todo(title="version-1")]
+    long_ago = datetime(2020, 1, 1)
+
+    with stub_context_provider.transaction():
+        empty = todo_repository.list_version()
+        assert todo_repository.find_all_with_version() == ([], empty)
+    with Session(mysql_engine) as session, session.begin():
+        rows = [TodoDataModel.values_from_domain(todo) | {"updated_at": long_ago} for todo in todos]
+        session.execute(insert(TodoDataModel).values(rows))
+    with stub_context_provider.transaction():
+        settled = todo_repository.list_version()
+        loaded, loaded_version = todo_repository.find_all_with_version()
+        todo_repository.delete_by_id(todos[1].id)
+        after_delete = todo_repository.list_version()
+        todo_repository.mark_completed(todos[0].id, True)
+        after_update = todo_repository.list_version()
+        assert todo_repository.find_all_with_version()[1] is None
+
+    assert empty == "0"
+    assert settled == loaded_version == "2-20200101000000"
+    assert sorted(todo.title for todo in loaded) == ["version-0", "version-1"]
+    assert after_delete == "1-20200101000000"
+    # Just changed: another change within the same second could keep MAX(updated_at).
+    assert after_update is None
+
+
+def test_find_changes_reports_updates_and_deletions_since_watermark(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    old, newer = Todo(title="old"), Todo(title="newer")
+    deleted, deleted_by_hand = Todo(title="deleted"), Todo(title="deleted by hand")
+    yesterday = datetime.now(UTC).replace(tzinfo=None, microsecond=0) - timedelta(days=1)
+    day_before = yesterday - timedelta(days=1)
+    stamps = {old: day_before, newer: yesterday, deleted: day_before, deleted_by_hand: day_before}
+    with Session(mysql_engine) as session, session.begin():
+        rows = [
+            TodoDataModel.values_from_domain(todo) | {"updated_at": stamp}
+            for todo, stamp in stamps.items()
+        ]
+        session.execute(insert(TodoDataModel).values(rows))
+
+    with stub_context_provider.transaction():
+        todo_repository.delete_by_id(deleted.id)
+        todo_repository.delete_many([Todo(title="missing").id])
+    # The tombstones come from a trigger, so deletes that bypass the repository count too.
+    with Session(mysql_engine) as session, session.begin():
+        session.execute(delete(TodoDataModel).where(TodoDataModel.id == str(deleted_by_hand.id)))
+    with stub_context_provider.transaction():
+        everything = todo_repository.find_changes(None)
+        since_newer = todo_repository.find_changes(yesterday)
+        since_watermark = todo_repository.find_changes(everything.watermark)
+        with pytest.raises(RepositoryChangesExpiredError):
+            todo_repository.find_changes(day_before - DELETIONS_RETENTION)
+
+    assert [todo.title for todo in everything.todos] == ["old", "newer"]
+    assert everything.deleted_ids == []
+    assert [todo.title for todo in since_newer.todos] == ["newer"]
+    assert sorted(since_newer.deleted_ids) == sorted([deleted.id, deleted_by_hand.id])
+    assert since_watermark.todos == []
+    assert sorted(since_watermark.deleted_ids) == sorted([deleted.id, deleted_by_hand.id])
+
+
+def todo_created_at(moment: datetime, title: str, completed: bool = False) -> Todo:
+    return Todo.reconstitute(str(uuid7_floor(moment)), title, None, completed)
+
+
+def test_find_by_query_filters_sorts_and_pages(
+    mysql_engine: Engine,
+    stub_context_provider: StubContextProvider,
+    todo_repository: TodoRepositoryImpl,
+) -> None:
+    buy_milk = todo_created_at(datetime(2024, 1, 1), "buy milk", completed=True)
+    buy_eggs = todo_created_at(datetime(2024, 1, 2), "buy eggs")
+    call_mom = todo_created_at(datetime(2024, 1, 3), "call mom")
+    discount = todo_created_at(datetime(2024, 1, 4), "100% off")
+    other = todo_created_at(datetime(2024, 1, 5), "1000 steps")
+    run_in_transaction(
+        stub_context_provider,
+        lambda: todo_repository.add_all([buy_milk, buy_eggs, call_mom, discount, other]),
+    )
+
+    def titles(query: TodoQuery, limit: int | None = None) -> list[str]:
+        with stub_context_provider.transaction():
+            return [todo.title for todo in todo_repository.find_by_query(query, limit)]
+
+    assert titles(TodoQuery(completed=False)) == ["buy eggs", "call mom", "100% off", "1000 steps"]
+    assert titles(TodoQuery(title_prefix="buy", sort=TodoSort.TITLE)) == ["buy eggs", "buy milk"]
+    assert titles(TodoQuery(title_prefix="100%")) == ["100% off"]
+    assert titles(
+        TodoQuery(created_from=datetime(2024, 1, 2), created_before=datetime(2024, 1, 4))
+    ) == ["buy eggs", "call mom"]
+    assert titles(TodoQuery(sort=TodoSort.CREATED_DESC), limit=2) == ["1000 steps", "100% off"]
+    assert titles(
+        TodoQuery(sort=TodoSort.TITLE_DESC, after_id=buy_milk.id, after_title=buy_milk.title)
+    ) == ["buy eggs", "1000 steps", "100% off"]
+
+
+def test_every_filter_combination_is_served_from_an_index(
+    mysql_engine: Engine, todo_repository: TodoRepositoryImpl
+) -> None:
+    # Enough rows, with fresh statistics, that the optimizer prefers a selective index.
+    start = datetime(2024, 1, 1)
+    todos = [
+        todo_created_at(start + timedelta(minutes=index), f"todo {index:04}", index % 2 == 0)
+        for index in range(2_000)
+    ]
+    with Session(mysql_engine) as session, session.begin():
+        session.execute(insert(TodoDataModel), [TodoDataModel.values_from_domain(t) for t in todos])
+    with mysql_engine.connect() as connection:
+        connection.exec_driver_sql("ANALYZE TABLE todos")
+
+    created_range = (start + timedelta(minutes=500), start + timedelta(minutes=600))
+    full_scans = []
+    with mysql_engine.connect() as connection:
+        for completed, title_prefix, created, sort in itertools.product(
+            (None, True), (None, "todo 01"), (None, created_range), TodoSort
+        ):
+            if completed is None and title_prefix is None and created is None:
+                continue
+            query = TodoQuery(
+                completed=completed,
+                title_prefix=title_prefix,
+                created_from=created and created[0],
+                created_before=created and created[1],
+                sort=sort,
+            )
+            # A full page from the handler, which always pages filtered lists, plus one.
+            stmt = TodoDataModel.select_matching_rows(query).limit(101)
+            compiled = stmt.compile(dialect=connection.dialect)
+            params = tuple(compiled.params[name] for name in compiled.positiontup or ())
+            plan = connection.exec_driver_sql(f"EXPLAIN {compiled}", params).mappings()
+            full_scans += [
+                (query, row["type"]) for row in plan if row["key"] is None or row["type"] == "ALL"
+            ]
+
+    assert full_scans == []
+
+
 def test_find_by_id_raises_when_missing(
     stub_context_provider: StubContextProvider,
     todo_repository: TodoRepositoryImpl,
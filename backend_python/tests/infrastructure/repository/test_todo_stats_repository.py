@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.infrastructure.repository.context_provider import ContextProviderImpl
+from todo_api.infrastructure.repository.todo_repository import TodoRepositoryImpl
+from todo_api.infrastructure.repository.todo_stats_repository import TodoStatsRepositoryImpl
+
+
+@pytest.fixture()
+def context_provider(mysql_engine: Engine) -> ContextProviderImpl:
+    return ContextProviderImpl(mysql_engine)
+
+
+def test_counts_follow_every_kind_of_write(context_provider: ContextProviderImpl) -> None:
+    todos = TodoRepositoryImpl(context_provider)
+    stats = TodoStatsRepositoryImpl(context_provider)
+
+    def counts() -> TodoStats:
+        with context_provider.transaction():
+            return stats.get()
+
+    assert counts() == TodoStats(total=0, completed=0)
+
+    first, second, third = Todo(title="first"), Todo(title="second"), Todo(title="third")
+    third.mark_as_completed()
+    with context_provider.transaction():
+        todos.add(first)
+        todos.add_all([second, third])
+    assert counts() == TodoStats(total=3, completed=1)
+
+    with context_provider.transaction():
+        assert todos.mark_completed(first.id, True)
+        todos.set_completed([second.id, third.id], True)
+    assert counts() == TodoStats(total=3, completed=3)
+
+    # `first` was only completed in the database, so saving it uncompletes it.
+    first.update(title="renamed")
+    with context_provider.transaction():
+        todos.save(first)
+        todos.save(Todo(title="upserted"))
+    assert counts() == TodoStats(total=4, completed=2)
+
+    with context_provider.transaction():
+        todos.delete_by_id(second.id)
+        todos.delete_many([first.id, third.id])
+    assert counts() == TodoStats(total=1, completed=0)
+
+
+def test_rolled_back_writes_leave_counts_alone(context_provider: ContextProviderImpl) -> None:
+    todos = TodoRepositoryImpl(context_provider)
+
+    with pytest.raises(RuntimeError):
+        with context_provider.transaction():
+            todos.add(Todo(title="discarded"))
+            raise RuntimeError("roll back")
+
+    with context_provider.transaction():
+        assert TodoStatsRepositoryImpl(context_provider).get() == TodoStats(total=0, completed=0)
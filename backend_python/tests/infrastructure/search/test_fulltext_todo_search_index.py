@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from todo_api.domain.model.todo import Todo
+from todo_api.infrastructure.repository.context_provider import ContextProviderImpl
+from todo_api.infrastructure.repository.todo_repository import TodoRepositoryImpl
+from todo_api.infrastructure.search.fulltext_todo_search_index import FulltextTodoSearchIndex
+
+
+@pytest.fixture()
+def context_provider(mysql_engine: Engine) -> ContextProviderImpl:
+    return ContextProviderImpl(mysql_engine)
+
+
+def test_search_matches_every_word_and_ranks_by_relevance(
+    context_provider: ContextProviderImpl,
+) -> None:
+    repeated = Todo(title="Groceries", description="milk, more milk and bread")
+    once = Todo(title="Groceries", description="milk and bread")
+    eggs = Todo(title="Groceries", description="eggs and bread")
+    with context_provider.transaction():
+        TodoRepositoryImpl(context_provider).add_all([once, repeated, eggs])
+    index = FulltextTodoSearchIndex(context_provider)
+
+    with context_provider.transaction():
+        assert index.search("MILK bread", 0, 10) == [repeated.id, once.id]
+        assert index.search("milk bread", 1, 10) == [once.id]
+        assert index.search("milk eggs", 0, 10) == []
+        assert index.search("!!", 0, 10) == []
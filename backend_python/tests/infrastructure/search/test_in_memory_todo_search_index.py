@@ -0,0 +1,55 @@
+from todo_api.domain.model.todo import Todo
+from todo_api.infrastructure.search.in_memory_todo_search_index import InMemoryTodoSearchIndex
+
+
+def build_index(*todos: Todo) -> InMemoryTodoSearchIndex:
+    index = InMemoryTodoSearchIndex()
+    index.rebuild(todos)
+    return index
+
+
+def test_search_requires_every_word_and_ignores_case() -> None:
+    milk = Todo(title="Buy milk", description="From the corner shop")
+    eggs = Todo(title="Buy eggs")
+    index = build_index(milk, eggs)
+
+    assert index.search("buy MILK", 0, 10) == [milk.id]
+    assert index.search("milk bread", 0, 10) == []
+    assert index.search("corner", 0, 10) == [milk.id]
+    assert index.search("  !? ", 0, 10) == []
+
+
+def test_search_ranks_by_weighted_words_then_newest_first() -> None:
+    in_description = Todo(title="Errands", description="buy stamps")
+    in_title = Todo(title="Stamps")
+    older = Todo(title="Post letters")
+    newer = Todo(title="Post parcels")
+    newest = Todo(title="Post parcels", description="urgent letters")
+    index = build_index(in_description, in_title, older, newer, newest)
+
+    assert index.search("stamps", 0, 10) == [in_title.id, in_description.id]
+    assert index.search("post", 0, 10) == [newest.id, newer.id, older.id]
+    assert index.search("post", 1, 1) == [newer.id]
+    assert index.search("post letters", 0, 10) == [older.id, newest.id]
+
+
+def test_put_replaces_and_remove_forgets_a_todo() -> None:
+    todo = Todo(title="draft")
+    index = build_index(todo)
+
+    index.put(todo.id, "final", "reviewed")
+    assert index.search("draft", 0, 10) == []
+    assert index.search("final reviewed", 0, 10) == [todo.id]
+
+    index.remove(todo.id)
+    assert index.search("final", 0, 10) == []
+    assert len(index) == 0
+
+
+def test_search_ranks_every_match_however_many_there_are() -> None:
+    best = Todo(title="Milk milk", description="milk")
+    newer = [Todo(title="Milk") for _ in range(3000)]
+    index = build_index(best, *newer)
+
+    assert index.search("milk", 0, 1) == [best.id]
+    assert index.search("milk", 3000, 10) == [newer[0].id]
@@ -0,0 +1,55 @@
+import pytest
+from pydantic import ValidationError
+
+from todo_api.application_service.usecase.create_todo_usecase import CreateTodoUsecaseInput
+from todo_api.application_service.usecase.create_todos_usecase import (
+    CreateTodosUsecase,
+    CreateTodosUsecaseInput,
+    CreateTodosUsecaseOutput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.presentation.handler.create_todo_handler import CreateTodoRequest
+from todo_api.presentation.handler.create_todos_handler import (
+    MAX_BATCH_SIZE,
+    CreateTodosHandler,
+    CreateTodosRequest,
+)
+
+
+class RecordingCreateTodosUsecase(CreateTodosUsecase):
+    def __init__(self, todos: list[Todo]) -> None:
+        self.todos = todos
+        self.received_input: CreateTodosUsecaseInput | None = None
+
+    def execute(self, input_dto: CreateTodosUsecaseInput) -> CreateTodosUsecaseOutput:
+        self.received_input = input_dto
+        return CreateTodosUsecaseOutput(todos=self.todos)
+
+
+def test_handle_invokes_usecase_and_returns_response() -> None:
+    todos = [Todo(title="first"), Todo(title="second", description="more")]
+    usecase = RecordingCreateTodosUsecase(todos)
+    handler = CreateTodosHandler(create_todos_usecase=usecase)
+    request = CreateTodosRequest(
+        todos=[
+            CreateTodoRequest(title="first"),
+            CreateTodoRequest(title="second", description="more"),
+        ]
+    )
+
+    response = handler.handle(request)
+
+    assert usecase.received_input == CreateTodosUsecaseInput(
+        items=[
+            CreateTodoUsecaseInput(title="first", description=None),
+            CreateTodoUsecaseInput(title="second", description="more"),
+        ]
+    )
+    assert [todo.id for todo in response.todos] == [str(todo.id) for todo in todos]
+    assert response.todos[1].description == "more"
+    assert all(todo.completed is False for todo in response.todos)
+
+
+def test_request_rejects_oversized_batch() -> None:
+    with pytest.raises(ValidationError):
+        CreateTodosRequest(todos=[CreateTodoRequest(title="x")] * (MAX_BATCH_SIZE + 1))
@@ -0,0 +1,39 @@
+from todo_api.application_service.usecase.bulk_todo_result import (
+    BulkTodoOutcome,
+    BulkTodoResult,
+)
+from todo_api.application_service.usecase.delete_todos_usecase import (
+    DeleteTodosUsecase,
+    DeleteTodosUsecaseInput,
+    DeleteTodosUsecaseOutput,
+)
+from todo_api.presentation.handler.bulk_todos import BulkTodosRequest
+from todo_api.presentation.handler.delete_todos_handler import (
+    DeleteTodosHandler,
+)
+from todo_api.utils.uuid import uuid7
+
+
+class RecordingDeleteTodosUsecase(DeleteTodosUsecase):
+    def __init__(self) -> None:
+        self.received_input: DeleteTodosUsecaseInput | None = None
+
+    def execute(self, input_dto: DeleteTodosUsecaseInput) -> DeleteTodosUsecaseOutput:
+        self.received_input = input_dto
+        return DeleteTodosUsecaseOutput(
+            results=[
+                BulkTodoResult(id=todo_id, outcome=BulkTodoOutcome.DELETED)
+                for todo_id in input_dto.ids
+            ]
+        )
+
+
+def test_handle_returns_outcome_per_id() -> None:
+    ids = [uuid7(), uuid7()]
+    usecase = RecordingDeleteTodosUsecase()
+    handler = DeleteTodosHandler(delete_todos_usecase=usecase)
+
+    response = handler.handle(BulkTodosRequest(ids=ids))
+
+    assert usecase.received_input == DeleteTodosUsecaseInput(ids=ids)
+    assert [(r.id, r.outcome) for r in response.results] == [(str(i), "deleted") for i in ids]
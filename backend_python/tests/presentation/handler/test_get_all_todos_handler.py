@@ -1,20 +1,38 @@
+import pytest
+from fastapi import Response
+
 from todo_api.application_service.usecase.get_all_todos_usecase import (
     GetAllTodosUsecase,
     GetAllTodosUsecaseInput,
     GetAllTodosUsecaseOutput,
+    is_known_version,
 )
 from todo_api.domain.model.todo import Todo
-from todo_api.presentation.handler.get_all_todos_handler import GetAllTodosHandler
+from todo_api.domain.model.todo_query import TodoQuery, TodoSort
+from todo_api.presentation.handler.get_all_todos_handler import (
+    MAX_PAGE_SIZE,
+    GetAllTodosHandler,
+    GetAllTodosResponse,
+    TodoFilters,
+)
+from todo_api.presentation.middleware.error_handler import BadRequestError
+from todo_api.utils.uuid import UUID7
 
 
 class StubGetAllTodosUsecase(GetAllTodosUsecase):
-    def __init__(self, todos: list[Todo]) -> None:
+    def __init__(self, todos: list[Todo], next_after_id: UUID7 | None = None) -> None:
         self.todos = todos
+        self.next_after_id = next_after_id
+        self.version: str | None = None
         self.called_with: GetAllTodosUsecaseInput | None = None
 
     def execute(self, input_dto: GetAllTodosUsecaseInput) -> GetAllTodosUsecaseOutput:
         self.called_with = input_dto
-        return GetAllTodosUsecaseOutput(todos=self.todos)
+        if is_known_version(self.version, input_dto.known_versions):
+            return GetAllTodosUsecaseOutput(todos=[], version=self.version, not_modified=True)
+        return GetAllTodosUsecaseOutput(
+            todos=self.todos, next_after_id=self.next_after_id, version=self.version
+        )
 
 
 def test_handle_maps_domain_list_to_response() -> None:
@@ -24,7 +42,94 @@ def test_handle_maps_domain_list_to_response() -> None:
 
     response = handler.handle()
 
+    assert isinstance(response, GetAllTodosResponse)
     assert usecase.called_with == GetAllTodosUsecaseInput()
     assert len(response.todos) == 2
     assert response.todos[0].id == str(todos[0].id)
     assert response.todos[1].description == "extra"
+
+
+def test_handle_passes_decoded_cursor_and_returns_next_cursor() -> None:
+    todos = [Todo(title="first"), Todo(title="second")]
+    usecase = StubGetAllTodosUsecase(todos, next_after_id=todos[1].id)
+    handler = GetAllTodosHandler(get_all_todos_usecase=usecase)
+
+    first_page = handler.handle(limit=2)
+    assert isinstance(first_page, GetAllTodosResponse)
+    assert first_page.next_cursor is not None
+
+    handler.handle(cursor=first_page.next_cursor, limit=2)
+
+    assert usecase.called_with == GetAllTodosUsecaseInput(after_id=todos[1].id, limit=2)
+
+
+def test_handle_raises_bad_request_for_malformed_cursor() -> None:
+    handler = GetAllTodosHandler(get_all_todos_usecase=StubGetAllTodosUsecase([]))
+
+    with pytest.raises(BadRequestError):
+        handler.handle(cursor="not-a-cursor")
+
+
+def test_handle_pages_filtered_list_and_carries_title_in_cursor() -> None:
+    todos = [Todo(title="alpha"), Todo(title="beta")]
+    usecase = StubGetAllTodosUsecase(todos, next_after_id=todos[1].id)
+    handler = GetAllTodosHandler(get_all_todos_usecase=usecase)
+    filters = TodoFilters(completed=False, sort=TodoSort.TITLE)
+
+    first_page = handler.handle(filters=filters)
+    assert isinstance(first_page, GetAllTodosResponse)
+    assert first_page.next_cursor is not None
+    assert usecase.called_with == GetAllTodosUsecaseInput(
+        limit=MAX_PAGE_SIZE, query=TodoQuery(completed=False, sort=TodoSort.TITLE)
+    )
+
+    handler.handle(cursor=first_page.next_cursor, filters=filters)
+
+    assert usecase.called_with is not None
+    assert usecase.called_with.query == TodoQuery(
+        completed=False, sort=TodoSort.TITLE, after_id=todos[1].id, after_title="beta"
+    )
+
+
+def test_handle_json_renders_the_response_model_body_with_cursor() -> None:
+    todos = [Todo(title="first"), Todo(title="second", description="extra")]
+    usecase = StubGetAllTodosUsecase(todos, next_after_id=todos[1].id)
+    handler = GetAllTodosHandler(get_all_todos_usecase=usecase)
+
+    response = handler.handle_json(limit=2)
+
+    expected = handler.handle(limit=2)
+    assert isinstance(expected, GetAllTodosResponse)
+    assert response.body == expected.model_dump_json().encode()
+    assert usecase.called_with == GetAllTodosUsecaseInput(limit=2)
+
+
+def test_handle_sets_etag_and_answers_304_for_a_known_version() -> None:
+    usecase = StubGetAllTodosUsecase([Todo(title="first")])
+    usecase.version = "1-20250101000000"
+    handler = GetAllTodosHandler(get_all_todos_usecase=usecase)
+    response = Response()
+
+    handler.handle(response=response)
+    not_modified = handler.handle(if_none_match='W/"0", "1-20250101000000"')
+
+    assert response.headers["ETag"] == '"1-20250101000000"'
+    assert usecase.called_with is not None
+    assert usecase.called_with.known_versions == {"0", "1-20250101000000"}
+    assert isinstance(not_modified, Response)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == '"1-20250101000000"'
+
+
+def test_handle_answers_304_to_if_none_match_any() -> None:
+    usecase = StubGetAllTodosUsecase([Todo(title="first")])
+    usecase.version = "1-20250101000000"
+    handler = GetAllTodosHandler(get_all_todos_usecase=usecase)
+
+    not_modified = handler.handle(if_none_match="*")
+
+    assert usecase.called_with is not None
+    assert usecase.called_with.known_versions == {"*"}
+    assert isinstance(not_modified, Response)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == '"1-20250101000000"'
@@ -1,4 +1,5 @@
 import pytest
+from fastapi import Response
 
 from todo_api.application_service.usecase.get_todo_usecase import (
     GetTodoUsecase,
@@ -7,7 +8,7 @@ from todo_api.application_service.usecase.get_todo_usecase import (
 )
 from todo_api.domain.model.todo import Todo
 from todo_api.domain.repository.errors import RepositoryNotFoundError
-from todo_api.presentation.handler.get_todo_handler import GetTodoHandler
+from todo_api.presentation.handler.get_todo_handler import GetTodoHandler, GetTodoResponse
 from todo_api.presentation.middleware.error_handler import NotFoundError
 from todo_api.utils.uuid import UUID7
 
@@ -34,6 +35,7 @@ def test_handle_returns_response_from_usecase() -> None:
 
     response = handler.handle(todo_id)
 
+    assert isinstance(response, GetTodoResponse)
     assert usecase.received_input == GetTodoUsecaseInput(id=todo_id)
     assert response.id == str(todo.id)
     assert response.title == todo.title
@@ -48,3 +50,51 @@ def test_handle_raises_not_found_error_when_repository_returns_none() -> None:
 
     with pytest.raises(NotFoundError):
         handler.handle(todo_id)
+
+
+def test_handle_json_renders_the_response_model_body() -> None:
+    todo = Todo(title="inspect", description="d")
+    handler = GetTodoHandler(get_todo_usecase=StubGetTodoUsecase(todo=todo))
+
+    response = handler.handle_json(todo.id)
+
+    expected = handler.handle(todo.id)
+    assert isinstance(expected, GetTodoResponse)
+    assert response.media_type == "application/json"
+    assert response.body == expected.model_dump_json().encode()
+
+
+def test_handle_json_raises_not_found_error_when_repository_returns_none() -> None:
+    usecase = StubGetTodoUsecase(raises=RepositoryNotFoundError("missing"))
+    handler = GetTodoHandler(get_todo_usecase=usecase)
+
+    with pytest.raises(NotFoundError):
+        handler.handle_json(Todo(title="temp").id)
+
+
+def test_handle_etag_follows_the_todo_content() -> None:
+    todo = Todo(title="inspect")
+    handler = GetTodoHandler(get_todo_usecase=StubGetTodoUsecase(todo=todo))
+    first, second = Response(), Response()
+
+    handler.handle(todo.id, response=first)
+    etag = first.headers["ETag"]
+    not_modified = handler.handle(todo.id, if_none_match=etag)
+    todo.mark_as_completed()
+    handler.handle(todo.id, if_none_match=etag, response=second)
+
+    assert isinstance(not_modified, Response)
+    assert not_modified.status_code == 304
+    assert second.headers["ETag"] != etag
+
+
+def test_handle_answers_304_to_if_none_match_any() -> None:
+    todo = Todo(title="inspect")
+    handler = GetTodoHandler(get_todo_usecase=StubGetTodoUsecase(todo=todo))
+    response = Response()
+    handler.handle(todo.id, response=response)
+
+    not_modified = handler.handle_json(todo.id, if_none_match=" * ")
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == response.headers["ETag"]
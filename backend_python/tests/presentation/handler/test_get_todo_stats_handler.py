@@ -0,0 +1,24 @@
+from todo_api.application_service.usecase.get_todo_stats_usecase import (
+    GetTodoStatsUsecase,
+    GetTodoStatsUsecaseInput,
+    GetTodoStatsUsecaseOutput,
+)
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.presentation.handler.get_todo_stats_handler import GetTodoStatsHandler
+
+
+class StubGetTodoStatsUsecase(GetTodoStatsUsecase):
+    def __init__(self, stats: TodoStats) -> None:
+        self.stats = stats
+
+    def execute(self, input_dto: GetTodoStatsUsecaseInput) -> GetTodoStatsUsecaseOutput:
+        return GetTodoStatsUsecaseOutput(stats=self.stats)
+
+
+def test_handle_reports_total_completed_and_open() -> None:
+    usecase = StubGetTodoStatsUsecase(TodoStats(total=7, completed=3))
+    handler = GetTodoStatsHandler(get_todo_stats_usecase=usecase)
+
+    response = handler.handle()
+
+    assert response.model_dump() == {"total": 7, "completed": 3, "open": 4}
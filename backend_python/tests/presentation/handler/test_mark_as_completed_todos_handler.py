@@ -0,0 +1,51 @@
+import pytest
+from pydantic import ValidationError
+
+from todo_api.application_service.usecase.bulk_todo_result import (
+    BulkTodoOutcome,
+    BulkTodoResult,
+)
+from todo_api.application_service.usecase.mark_as_completed_todos_usecase import (
+    MarkAsCompletedTodosUsecase,
+    MarkAsCompletedTodosUsecaseInput,
+    MarkAsCompletedTodosUsecaseOutput,
+)
+from todo_api.presentation.handler.bulk_todos import MAX_BULK_SIZE, BulkTodosRequest
+from todo_api.presentation.handler.mark_as_completed_todos_handler import (
+    MarkAsCompletedTodosHandler,
+)
+from todo_api.utils.uuid import uuid7
+
+
+class RecordingMarkAsCompletedTodosUsecase(MarkAsCompletedTodosUsecase):
+    def __init__(self) -> None:
+        self.received_input: MarkAsCompletedTodosUsecaseInput | None = None
+
+    def execute(
+        self, input_dto: MarkAsCompletedTodosUsecaseInput
+    ) -> MarkAsCompletedTodosUsecaseOutput:
+        self.received_input = input_dto
+        return MarkAsCompletedTodosUsecaseOutput(
+            results=[
+                BulkTodoResult(id=todo_id, outcome=BulkTodoOutcome.UPDATED)
+                for todo_id in input_dto.ids
+            ]
+        )
+
+
+def test_handle_returns_outcome_per_id() -> None:
+    ids = [uuid7(), uuid7()]
+    usecase = RecordingMarkAsCompletedTodosUsecase()
+    handler = MarkAsCompletedTodosHandler(mark_as_completed_todos_usecase=usecase)
+
+    response = handler.handle(BulkTodosRequest(ids=ids))
+
+    assert usecase.received_input == MarkAsCompletedTodosUsecaseInput(ids=ids)
+    assert [(r.id, r.outcome) for r in response.results] == [(str(i), "updated") for i in ids]
+
+
+def test_request_rejects_empty_and_oversized_lists() -> None:
+    with pytest.raises(ValidationError):
+        BulkTodosRequest(ids=[])
+    with pytest.raises(ValidationError):
+        BulkTodosRequest(ids=[uuid7() for _ in range(MAX_BULK_SIZE + 1)])
@@ -0,0 +1,41 @@
+from todo_api.application_service.usecase.bulk_todo_result import (
+    BulkTodoOutcome,
+    BulkTodoResult,
+)
+from todo_api.application_service.usecase.mark_as_uncompleted_todos_usecase import (
+    MarkAsUncompletedTodosUsecase,
+    MarkAsUncompletedTodosUsecaseInput,
+    MarkAsUncompletedTodosUsecaseOutput,
+)
+from todo_api.presentation.handler.bulk_todos import BulkTodosRequest
+from todo_api.presentation.handler.mark_as_uncompleted_todos_handler import (
+    MarkAsUnCompletedTodosHandler,
+)
+from todo_api.utils.uuid import uuid7
+
+
+class RecordingMarkAsUncompletedTodosUsecase(MarkAsUncompletedTodosUsecase):
+    def __init__(self) -> None:
+        self.received_input: MarkAsUncompletedTodosUsecaseInput | None = None
+
+    def execute(
+        self, input_dto: MarkAsUncompletedTodosUsecaseInput
+    ) -> MarkAsUncompletedTodosUsecaseOutput:
+        self.received_input = input_dto
+        return MarkAsUncompletedTodosUsecaseOutput(
+            results=[
+                BulkTodoResult(id=todo_id, outcome=BulkTodoOutcome.UPDATED)
+                for todo_id in input_dto.ids
+            ]
+        )
+
+
+def test_handle_returns_outcome_per_id() -> None:
+    ids = [uuid7(), uuid7()]
+    usecase = RecordingMarkAsUncompletedTodosUsecase()
+    handler = MarkAsUnCompletedTodosHandler(mark_as_uncompleted_todos_usecase=usecase)
+
+    response = handler.handle(BulkTodosRequest(ids=ids))
+
+    assert usecase.received_input == MarkAsUncompletedTodosUsecaseInput(ids=ids)
+    assert [(r.id, r.outcome) for r in response.results] == [(str(i), "updated") for i in ids]
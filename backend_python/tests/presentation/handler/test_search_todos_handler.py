@@ -0,0 +1,31 @@
+from todo_api.application_service.usecase.search_todos_usecase import (
+    SearchTodosUsecase,
+    SearchTodosUsecaseInput,
+    SearchTodosUsecaseOutput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.presentation.handler.search_todos_handler import SEARCH_PAGE_SIZE, SearchTodosHandler
+
+
+class StubSearchTodosUsecase(SearchTodosUsecase):
+    def __init__(self, todos: list[Todo], next_offset: int | None) -> None:
+        self.todos = todos
+        self.next_offset = next_offset
+        self.called_with: SearchTodosUsecaseInput | None = None
+
+    def execute(self, input_dto: SearchTodosUsecaseInput) -> SearchTodosUsecaseOutput:
+        self.called_with = input_dto
+        return SearchTodosUsecaseOutput(todos=self.todos, next_offset=self.next_offset)
+
+
+def test_handle_maps_matches_to_response() -> None:
+    todos = [Todo(title="buy milk", description="two litres"), Todo(title="buy eggs")]
+    usecase = StubSearchTodosUsecase(todos, next_offset=SEARCH_PAGE_SIZE)
+    handler = SearchTodosHandler(search_todos_usecase=usecase)
+
+    response = handler.handle("buy")
+
+    assert usecase.called_with == SearchTodosUsecaseInput(text="buy", limit=SEARCH_PAGE_SIZE)
+    assert [todo.id for todo in response.todos] == [str(todo.id) for todo in todos]
+    assert response.todos[0].description == "two litres"
+    assert response.next_offset == SEARCH_PAGE_SIZE
@@ -0,0 +1,59 @@
+import json
+from collections.abc import Iterator
+
+from todo_api.application_service.usecase.stream_todos_usecase import (
+    StreamTodosUsecase,
+    StreamTodosUsecaseInput,
+    StreamTodosUsecaseOutput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.presentation.handler.stream_todos_handler import StreamTodosHandler
+
+
+class StubStreamTodosUsecase(StreamTodosUsecase):
+    def __init__(self, todos: list[Todo]) -> None:
+        self.todos = todos
+        self.called_with: StreamTodosUsecaseInput | None = None
+
+    def execute(self, input_dto: StreamTodosUsecaseInput) -> StreamTodosUsecaseOutput:
+        self.called_with = input_dto
+        return StreamTodosUsecaseOutput(todos=iter(self.todos))
+
+
+def decode(chunks: Iterator[bytes]) -> list[dict[str, object]]:
+    body = b"".join(chunks).decode()
+    return [json.loads(line) for line in body.splitlines()]
+
+
+def test_handle_renders_one_json_object_per_line() -> None:
+    todos = [Todo(title="first"), Todo(title="second", description="extra")]
+    usecase = StubStreamTodosUsecase(todos)
+    handler = StreamTodosHandler(stream_todos_usecase=usecase, batch_size=10)
+
+    rows = decode(handler.handle())
+
+    assert usecase.called_with == StreamTodosUsecaseInput(batch_size=10)
+    assert rows == [
+        {"id": str(todos[0].id), "title": "first", "description": None, "completed": False},
+        {"id": str(todos[1].id), "title": "second", "description": "extra", "completed": False},
+    ]
+
+
+def test_handle_emits_one_chunk_per_batch() -> None:
+    todos = [Todo(title=f"todo-{index}") for index in range(5)]
+    handler = StreamTodosHandler(stream_todos_usecase=StubStreamTodosUsecase(todos), batch_size=2)
+
+    chunks = list(handler.handle())
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+
+def test_handle_keeps_multiline_text_on_one_line() -> None:
+    todo = Todo(title="café", description="first line\nsecond line")
+    handler = StreamTodosHandler(stream_todos_usecase=StubStreamTodosUsecase([todo]))
+
+    body = b"".join(handler.handle())
+
+    assert body.count(b"\n") == 1
+    assert "café".encode() in body
+    assert decode(iter([body]))[0]["description"] == "first line\nsecond line"
@@ -1,7 +1,11 @@
+from collections.abc import AsyncIterator
+
+import pytest
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.testclient import TestClient
 
+from todo_api.domain.repository.errors import RepositoryConflictError
 from todo_api.presentation.middleware.error_handler import (
     ConflictError,
     ErrorHandler,
@@ -25,10 +29,22 @@ def build_app() -> FastAPI:
     async def conflict() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
         raise ConflictError("busy")
 
+    @app.get("/write-conflict")
+    async def write_conflict() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        raise RepositoryConflictError("retry")
+
     @app.get("/unexpected")
     async def unexpected() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
         raise RuntimeError("boom")
 
+    @app.get("/broken-stream")
+    async def broken_stream() -> StreamingResponse:  # pyright: ignore[reportUnusedFunction]
+        async def body() -> AsyncIterator[bytes]:
+            yield b"partial"
+            raise RuntimeError("boom")
+
+        return StreamingResponse(body())
+
     return app
 
 
@@ -59,6 +75,15 @@ def test_error_handler_converts_not_found_error() -> None:
     assert response.json() == {"code": "404", "message": "missing"}
 
 
+def test_error_handler_converts_write_conflicts() -> None:
+    client = TestClient(build_app())
+
+    response = client.get("/write-conflict")
+
+    assert response.status_code == 409
+    assert response.json() == {"code": "409", "message": "retry"}
+
+
 def test_error_handler_returns_internal_server_error_for_unexpected_exception() -> None:
     client = TestClient(build_app())
 
@@ -66,3 +91,10 @@ def test_error_handler_returns_internal_server_error_for_unexpected_exception()
 
     assert response.status_code == 500
     assert response.json() == {"code": "500", "message": "Internal server error"}
+
+
+def test_error_handler_reraises_once_the_response_has_started() -> None:
+    client = TestClient(build_app())
+
+    with pytest.raises(RuntimeError):
+        client.get("/broken-stream")
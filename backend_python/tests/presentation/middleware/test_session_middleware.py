@@ -1,12 +1,23 @@
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, asynccontextmanager
+from contextvars import ContextVar
 from typing import cast
 
+import anyio
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.types import Message
 
-from todo_api.domain.repository.context_provider import ContextProvider
-from todo_api.presentation.middleware.session_middleware import SessionMiddleware
+from todo_api.domain.repository.context_provider import AsyncContextProvider, ContextProvider
+from todo_api.presentation.middleware.session_middleware import (
+    PRIMARY_UNTIL_COOKIE,
+    AsyncSessionMiddleware,
+    SessionMiddleware,
+)
 
 
 class FakeSession:
@@ -28,18 +39,23 @@ class FakeSession:
         self._in_transaction = False
 
 
+_ACTIVE_SESSION: ContextVar[FakeSession | None] = ContextVar("active_session", default=None)
+
+
 class FakeContextProvider(ContextProvider[Session]):
     class _Transaction:
         def __init__(self, provider: "FakeContextProvider") -> None:
             self.provider = provider
 
-        def __enter__(self) -> Session:
+        def __enter__(self) -> None:
             self.provider.enter_count += 1
+            # Like the real provider, the scope is bound to the context it was entered in.
+            self.token = _ACTIVE_SESSION.set(self.provider._session)
             self.provider._session.begin()
-            return cast(Session, self.provider._session)
 
         def __exit__(self, exc_type, exc, tb) -> bool:  # type: ignore[override]
             self.provider.exit_count += 1
+            _ACTIVE_SESSION.reset(self.token)
             self.provider._session.finish()
             return False
 
@@ -47,23 +63,42 @@ class FakeContextProvider(ContextProvider[Session]):
         self._session = FakeSession()
         self.enter_count = 0
         self.exit_count = 0
+        self.observed_in_transaction: list[bool] = []
+        self.pinned: list[bool] = []
 
-    def transaction(self) -> "FakeContextProvider._Transaction":
+    def transaction(  # pragma: no cover
+        self, *, read_only: bool = False
+    ) -> AbstractContextManager[Session]:
+        raise AssertionError("unexpected call to transaction")
+
+    def deferred_transaction(self, *, pin_primary: bool = False) -> AbstractContextManager[None]:
+        self.pinned.append(pin_primary)
         return FakeContextProvider._Transaction(self)
 
     def current(self) -> Session:
         return cast(Session, self._session)
 
+    def rollback(self) -> None:
+        if self._session.in_transaction():
+            self._session.rollback()
+
+    def release(self) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to release")
+
+    def on_commit(self, callback: Callable[[], None]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to on_commit")
+
     @property
     def session(self) -> FakeSession:
         return self._session
 
 
-def build_app(provider: FakeContextProvider) -> FastAPI:
+def build_app(provider: FakeContextProvider, read_your_writes_seconds: float = 0.0) -> FastAPI:
     app = FastAPI()
     app.add_middleware(
         SessionMiddleware,
         context_provider=cast(ContextProvider[Session], provider),
+        read_your_writes_seconds=read_your_writes_seconds,
     )
 
     @app.get("/success")
@@ -76,6 +111,28 @@ def build_app(provider: FakeContextProvider) -> FastAPI:
         provider.current()
         return JSONResponse({"status": "fail"}, status_code=422)
 
+    @app.post("/write")
+    async def write() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        provider.current()
+        return JSONResponse({"status": "ok"}, status_code=201)
+
+    @app.post("/rejected-write")
+    async def rejected_write() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        return JSONResponse({"status": "fail"}, status_code=409)
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:  # pyright: ignore[reportUnusedFunction]
+        async def body() -> AsyncIterator[bytes]:
+            for index in range(3):
+                provider.observed_in_transaction.append(provider.session.in_transaction())
+                yield f"{index}\n".encode()
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    @app.get("/empty-stream")
+    async def empty_stream() -> StreamingResponse:  # pyright: ignore[reportUnusedFunction]
+        return StreamingResponse(iter([]), media_type="application/x-ndjson")
+
     return app
 
 
@@ -99,3 +156,201 @@ def test_session_middleware_rolls_back_on_client_error() -> None:
 
     assert response.status_code == 422
     assert provider.session.rollback_called is True
+
+
+def test_session_middleware_keeps_transaction_open_while_body_streams() -> None:
+    provider = FakeContextProvider()
+    client = TestClient(build_app(provider))
+
+    response = client.get("/stream")
+
+    assert response.status_code == 200
+    assert response.text == "0\n1\n2\n"
+    assert provider.observed_in_transaction == [True, True, True]
+    assert provider.enter_count == 1
+    assert provider.exit_count == 1
+
+
+def test_session_middleware_handles_empty_stream() -> None:
+    provider = FakeContextProvider()
+    client = TestClient(build_app(provider))
+
+    response = client.get("/empty-stream")
+
+    assert response.status_code == 200
+    assert response.text == ""
+    assert provider.exit_count == 1
+
+
+def test_session_middleware_pins_client_to_primary_after_write() -> None:
+    provider = FakeContextProvider()
+    client = TestClient(build_app(provider, read_your_writes_seconds=5))
+
+    write = client.post("/write")
+    read = client.get("/success")
+
+    assert PRIMARY_UNTIL_COOKIE in write.cookies
+    assert float(write.cookies[PRIMARY_UNTIL_COOKIE]) > time.time()
+    assert "set-cookie" not in read.headers
+    assert provider.pinned == [False, True]
+
+
+def test_session_middleware_ignores_expired_pin_and_failed_writes() -> None:
+    provider = FakeContextProvider()
+    client = TestClient(build_app(provider, read_your_writes_seconds=5))
+
+    rejected = client.post("/rejected-write")
+    client.cookies.set(PRIMARY_UNTIL_COOKIE, str(time.time() - 1))
+    client.get("/success")
+    client.cookies.set(PRIMARY_UNTIL_COOKIE, "not-a-timestamp")
+    client.get("/success")
+
+    assert "set-cookie" not in rejected.headers
+    assert provider.pinned == [False, False, False]
+
+
+def test_session_middleware_without_window_never_pins() -> None:
+    provider = FakeContextProvider()
+    client = TestClient(build_app(provider))
+    client.cookies.set(PRIMARY_UNTIL_COOKIE, str(time.time() + 60))
+
+    write = client.post("/write")
+
+    assert "set-cookie" not in write.headers
+    assert provider.pinned == [False]
+
+
+class FakeAsyncSession:
+    def __init__(self) -> None:
+        self.rollback_called = False
+        self._in_transaction = False
+
+    def in_transaction(self) -> bool:
+        return self._in_transaction
+
+    async def rollback(self) -> None:
+        self.rollback_called = True
+        self._in_transaction = False
+
+
+class FakeAsyncContextProvider(AsyncContextProvider[AsyncSession]):
+    def __init__(self) -> None:
+        self.session = FakeAsyncSession()
+        self.enter_count = 0
+        self.exit_count = 0
+        self.pinned: list[bool] = []
+
+    def transaction(  # pragma: no cover
+        self, *, read_only: bool = False
+    ) -> AbstractAsyncContextManager[AsyncSession]:
+        raise AssertionError("unexpected call to transaction")
+
+    @asynccontextmanager
+    async def deferred_transaction(self, *, pin_primary: bool = False) -> AsyncIterator[None]:
+        self.pinned.append(pin_primary)
+        self.enter_count += 1
+        self.session._in_transaction = True
+        try:
+            yield
+        finally:
+            self.session._in_transaction = False
+            self.exit_count += 1
+
+    def current(self) -> AsyncSession:
+        return cast(AsyncSession, self.session)
+
+    async def rollback(self) -> None:
+        if self.session.in_transaction():
+            await self.session.rollback()
+
+    async def release(self) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to release")
+
+
+def build_async_app(
+    provider: FakeAsyncContextProvider, read_your_writes_seconds: float = 0.0
+) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        AsyncSessionMiddleware,
+        context_provider=provider,
+        read_your_writes_seconds=read_your_writes_seconds,
+    )
+
+    @app.get("/success")
+    async def success() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        provider.current()
+        return JSONResponse({"status": "ok"})
+
+    @app.get("/failure")
+    async def failure() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        return JSONResponse({"status": "fail"}, status_code=404)
+
+    @app.put("/write")
+    async def write() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        provider.current()
+        return JSONResponse({"status": "ok"})
+
+    return app
+
+
+def test_async_session_middleware_wraps_each_request_in_transaction() -> None:
+    provider = FakeAsyncContextProvider()
+    client = TestClient(build_async_app(provider))
+
+    response = client.get("/success")
+
+    assert response.status_code == 200
+    assert (provider.enter_count, provider.exit_count) == (1, 1)
+    assert provider.session.rollback_called is False
+
+
+def test_async_session_middleware_rolls_back_on_client_error() -> None:
+    provider = FakeAsyncContextProvider()
+    client = TestClient(build_async_app(provider))
+
+    response = client.get("/failure")
+
+    assert response.status_code == 404
+    assert provider.session.rollback_called is True
+    assert provider.exit_count == 1
+
+
+def test_session_middleware_ends_transaction_before_complete_response_is_sent() -> None:
+    provider = FakeContextProvider()
+    app = build_app(provider)
+    exits_at_send: list[tuple[str, int]] = []
+
+    def call(path: str) -> None:
+        received: list[Message] = []
+
+        async def receive() -> Message:
+            if received:
+                await anyio.sleep_forever()
+            received.append({"type": "http.request", "body": b"", "more_body": False})
+            return received[0]
+
+        async def send(message: Message) -> None:
+            exits_at_send.append((message["type"], provider.exit_count))
+
+        scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []}
+        anyio.run(app, scope, receive, send)
+
+    call("/success")
+    call("/stream")
+
+    # The complete body was committed before its headers went out; the stream was not.
+    assert exits_at_send[:2] == [("http.response.start", 1), ("http.response.body", 1)]
+    assert exits_at_send[2] == ("http.response.start", 1)
+    assert provider.exit_count == 2
+
+
+def test_async_session_middleware_pins_client_to_primary_after_write() -> None:
+    provider = FakeAsyncContextProvider()
+    client = TestClient(build_async_app(provider, read_your_writes_seconds=5))
+
+    write = client.put("/write")
+    client.get("/success")
+
+    assert PRIMARY_UNTIL_COOKIE in write.cookies
+    assert provider.pinned == [False, True]
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from todo_api.application_service.usecase.create_todo_usecase import (
+    AsyncCreateTodoUsecase,
+    CreateTodoUsecaseInput,
+    CreateTodoUsecaseOutput,
+)
+from todo_api.application_service.usecase.delete_todo_usecase import (
+    AsyncDeleteTodoUsecase,
+    DeleteTodoUsecaseInput,
+    DeleteTodoUsecaseOutput,
+)
+from todo_api.application_service.usecase.get_all_todos_usecase import (
+    AsyncGetAllTodosUsecase,
+    GetAllTodosUsecaseInput,
+    GetAllTodosUsecaseOutput,
+)
+from todo_api.application_service.usecase.get_todo_changes_usecase import (
+    AsyncGetTodoChangesUsecase,
+    GetTodoChangesUsecaseInput,
+    GetTodoChangesUsecaseOutput,
+)
+from todo_api.application_service.usecase.get_todo_stats_usecase import (
+    AsyncGetTodoStatsUsecase,
+    GetTodoStatsUsecaseInput,
+    GetTodoStatsUsecaseOutput,
+)
+from todo_api.application_service.usecase.get_todo_usecase import (
+    AsyncGetTodoUsecase,
+    GetTodoUsecaseInput,
+    GetTodoUsecaseOutput,
+)
+from todo_api.application_service.usecase.mark_as_completed_todo_usecase import (
+    AsyncMarkAsCompletedTodoUsecase,
+    MarkAsCompletedTodoUsecaseInput,
+    MarkAsCompletedTodoUsecaseOutput,
+)
+from todo_api.application_service.usecase.mark_as_uncompleted_todo_usecase import (
+    AsyncMarkAsUncompletedTodoUsecase,
+    MarkAsUncompletedTodoUsecaseInput,
+    MarkAsUncompletedTodoUsecaseOutput,
+)
+from todo_api.application_service.usecase.update_todo_usecase import (
+    AsyncUpdateTodoUsecase,
+    UpdateTodoUsecaseInput,
+    UpdateTodoUsecaseOutput,
+)
+from todo_api.domain.model.todo import Todo
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.domain.repository.errors import RepositoryNotFoundError
+from todo_api.presentation.handler.create_todo_handler import AsyncCreateTodoHandler
+from todo_api.presentation.handler.delete_todo_handler import AsyncDeleteTodoHandler
+from todo_api.presentation.handler.get_all_todos_handler import AsyncGetAllTodosHandler
+from todo_api.presentation.handler.get_todo_changes_handler import AsyncGetTodoChangesHandler
+from todo_api.presentation.handler.get_todo_handler import AsyncGetTodoHandler
+from todo_api.presentation.handler.get_todo_stats_handler import AsyncGetTodoStatsHandler
+from todo_api.presentation.handler.mark_as_completed_todo_handler import (
+    AsyncMarkAsCompletedTodoHandler,
+)
+from todo_api.presentation.handler.mark_as_uncompleted_todo_handler import (
+    AsyncMarkAsUnCompletedTodoHandler,
+)
+from todo_api.presentation.handler.update_todo_handler import AsyncUpdateTodoHandler
+from todo_api.presentation.middleware.error_handler import ErrorHandler
+from todo_api.presentation.router.async_todo_router import AsyncTodoRouterContainer, router
+from todo_api.utils.uuid import uuid7
+
+
+class RecordingCreateTodoUsecase(AsyncCreateTodoUsecase):
+    def __init__(self) -> None:
+        self.calls: list[CreateTodoUsecaseInput] = []
+
+    async def execute(self, input_dto: CreateTodoUsecaseInput) -> CreateTodoUsecaseOutput:
+        self.calls.append(input_dto)
+        return CreateTodoUsecaseOutput(
+            todo=Todo(title=input_dto.title, description=input_dto.description)
+        )
+
+
+class RecordingDeleteTodoUsecase(AsyncDeleteTodoUsecase):
+    def __init__(self) -> None:
+        self.calls: list[DeleteTodoUsecaseInput] = []
+
+    async def execute(self, input_dto: DeleteTodoUsecaseInput) -> DeleteTodoUsecaseOutput:
+        self.calls.append(input_dto)
+        if len(self.calls) > 1:
+            raise RepositoryNotFoundError(f"Todo with id {input_dto.id} not found")
+        return DeleteTodoUsecaseOutput()
+
+
+class RecordingGetAllTodosUsecase(AsyncGetAllTodosUsecase):
+    def __init__(self) -> None:
+        self.calls: list[GetAllTodosUsecaseInput] = []
+        self.todos: list[Todo] = []
+
+    async def execute(self, input_dto: GetAllTodosUsecaseInput) -> GetAllTodosUsecaseOutput:
+        self.calls.append(input_dto)
+        return GetAllTodosUsecaseOutput(todos=self.todos)
+
+
+class RecordingGetTodoUsecase(AsyncGetTodoUsecase):
+    def __init__(self, todo: Todo) -> None:
+        self.todo = todo
+
+    async def execute(self, input_dto: GetTodoUsecaseInput) -> GetTodoUsecaseOutput:
+        return GetTodoUsecaseOutput(todo=self.todo)
+
+
+class RecordingGetTodoChangesUsecase(AsyncGetTodoChangesUsecase):
+    def __init__(self) -> None:
+        self.calls: list[GetTodoChangesUsecaseInput] = []
+
+    async def execute(self, input_dto: GetTodoChangesUsecaseInput) -> GetTodoChangesUsecaseOutput:
+        self.calls.append(input_dto)
+        return GetTodoChangesUsecaseOutput(
+            todos=[], deleted_ids=[], watermark=datetime(2025, 1, 1, 12, 0, 0)
+        )
+
+
+class FixedGetTodoStatsUsecase(AsyncGetTodoStatsUsecase):
+    async def execute(self, input_dto: GetTodoStatsUsecaseInput) -> GetTodoStatsUsecaseOutput:
+        return GetTodoStatsUsecaseOutput(stats=TodoStats(total=3, completed=1))
+
+
+class RecordingMarkAsCompletedTodoUsecase(AsyncMarkAsCompletedTodoUsecase):
+    def __init__(self, todo: Todo) -> None:
+        self.todo = todo
+
+    async def execute(
+        self, input_dto: MarkAsCompletedTodoUsecaseInput
+    ) -> MarkAsCompletedTodoUsecaseOutput:
+        self.todo.mark_as_completed()
+        return MarkAsCompletedTodoUsecaseOutput(todo=self.todo)
+
+
+class RecordingMarkAsUncompletedTodoUsecase(AsyncMarkAsUncompletedTodoUsecase):
+    def __init__(self, todo: Todo) -> None:
+        self.todo = todo
+
+    async def execute(
+        self, input_dto: MarkAsUncompletedTodoUsecaseInput
+    ) -> MarkAsUncompletedTodoUsecaseOutput:
+        self.todo.mark_as_uncompleted()
+        return MarkAsUncompletedTodoUsecaseOutput(todo=self.todo)
+
+
+class RecordingUpdateTodoUsecase(AsyncUpdateTodoUsecase):
+    def __init__(self, todo: Todo) -> None:
+        self.todo = todo
+
+    async def execute(self, input_dto: UpdateTodoUsecaseInput) -> UpdateTodoUsecaseOutput:
+        self.todo.update(title=input_dto.title, description=input_dto.description)
+        return UpdateTodoUsecaseOutput(todo=self.todo)
+
+
+@dataclass
+class RouterSuite:
+    create: RecordingCreateTodoUsecase
+    delete: RecordingDeleteTodoUsecase
+    get_all: RecordingGetAllTodosUsecase
+    changes: RecordingGetTodoChangesUsecase
+    todo: Todo
+
+
+def build_client(suite: RouterSuite) -> TestClient:
+    app = FastAPI()
+    container = AsyncTodoRouterContainer(
+        create_todo=AsyncCreateTodoHandler(suite.create),
+        delete_todo=AsyncDeleteTodoHandler(suite.delete),
+        get_all_todos=AsyncGetAllTodosHandler(suite.get_all),
+        get_todo=AsyncGetTodoHandler(RecordingGetTodoUsecase(suite.todo)),
+        get_todo_changes=AsyncGetTodoChangesHandler(suite.changes),
+        get_todo_stats=AsyncGetTodoStatsHandler(FixedGetTodoStatsUsecase()),
+        mark_as_completed_todo=AsyncMarkAsCompletedTodoHandler(
+            RecordingMarkAsCompletedTodoUsecase(suite.todo)
+        ),
+        mark_as_uncompleted_todo=AsyncMarkAsUnCompletedTodoHandler(
+            RecordingMarkAsUncompletedTodoUsecase(suite.todo)
+        ),
+        update_todo=AsyncUpdateTodoHandler(RecordingUpdateTodoUsecase(suite.todo)),
+    )
+    app.include_router(router(container))
+    app.add_middleware(ErrorHandler)
+    return TestClient(app)
+
+
+def build_suite() -> RouterSuite:
+    return RouterSuite(
+        create=RecordingCreateTodoUsecase(),
+        delete=RecordingDeleteTodoUsecase(),
+        get_all=RecordingGetAllTodosUsecase(),
+        changes=RecordingGetTodoChangesUsecase(),
+        todo=Todo(title="detail", description="before"),
+    )
+
+
+def test_create_todo_route_awaits_usecase() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+
+    response = client.post("/todos", json={"title": "new", "description": "d"})
+
+    assert response.status_code == 201
+    assert suite.create.calls[0].title == "new"
+    assert response.json()["description"] == "d"
+
+
+def test_get_all_route_forwards_pagination_params() -> None:
+    suite = build_suite()
+    suite.get_all.todos = [Todo(title="first"), Todo(title="second")]
+    client = build_client(suite)
+
+    response = client.get("/todos", params={"limit": 5})
+    rejected = client.get("/todos", params={"limit": 0})
+
+    assert response.status_code == 200
+    assert [todo["title"] for todo in response.json()["todos"]] == ["first", "second"]
+    assert suite.get_all.calls[0].limit == 5
+    assert rejected.status_code == 422
+
+
+def test_single_todo_routes_round_trip() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+    path = f"/todos/{suite.todo.id}"
+
+    fetched = client.get(path)
+    updated = client.put(path, json={"title": "after", "description": None})
+    completed = client.put(f"{path}/complete")
+    uncompleted = client.put(f"{path}/uncomplete")
+
+    assert fetched.json()["title"] == "detail"
+    assert updated.json()["title"] == "after"
+    assert completed.json()["completed"] is True
+    assert uncompleted.json()["completed"] is False
+
+
+def test_delete_route_maps_missing_todo_to_404() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+    todo_id = str(uuid7())
+
+    deleted = client.delete(f"/todos/{todo_id}")
+    missing = client.delete(f"/todos/{todo_id}")
+
+    assert deleted.status_code == 204
+    assert missing.status_code == 404
+    assert [str(call.id) for call in suite.delete.calls] == [todo_id, todo_id]
+
+
+def test_changes_route_is_not_taken_for_a_todo_id() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+
+    response = client.get("/todos/changes", params={"since": "2025-01-01T11:00:00"})
+
+    assert response.status_code == 200
+    assert response.json()["next_since"] == "2025-01-01T12:00:00"
+    assert suite.changes.calls == [GetTodoChangesUsecaseInput(since=datetime(2025, 1, 1, 11))]
+
+
+def test_stats_route_is_not_taken_for_a_todo_id() -> None:
+    client = build_client(build_suite())
+
+    response = client.get("/todos/stats")
+
+    assert response.status_code == 200
+    assert response.json() == {"total": 3, "completed": 1, "open": 2}
@@ -0,0 +1,155 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Any
+
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, field_serializer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from todo_api.domain.repository.context_provider import AsyncContextProvider, ContextProvider
+from todo_api.presentation.middleware.error_handler import ErrorHandler, NotFoundError
+from todo_api.presentation.router.commit_early_route import (
+    async_commit_early_route,
+    commit_early_route,
+)
+
+
+class RecordingContextProvider(ContextProvider[Session]):
+    def __init__(self) -> None:
+        self.releases = 0
+
+    def transaction(  # pragma: no cover
+        self, *, read_only: bool = False
+    ) -> AbstractContextManager[Session]:
+        raise AssertionError("unexpected call to transaction")
+
+    def deferred_transaction(  # pragma: no cover
+        self, *, pin_primary: bool = False
+    ) -> AbstractContextManager[None]:
+        raise AssertionError("unexpected call to deferred_transaction")
+
+    def current(self) -> Session:  # pragma: no cover
+        raise AssertionError("unexpected call to current")
+
+    def rollback(self) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to rollback")
+
+    def release(self) -> None:
+        self.releases += 1
+
+    def on_commit(self, callback: Callable[[], None]) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to on_commit")
+
+
+class RecordingAsyncContextProvider(AsyncContextProvider[AsyncSession]):
+    def __init__(self) -> None:
+        self.releases = 0
+
+    def transaction(  # pragma: no cover
+        self, *, read_only: bool = False
+    ) -> AbstractAsyncContextManager[AsyncSession]:
+        raise AssertionError("unexpected call to transaction")
+
+    def deferred_transaction(  # pragma: no cover
+        self, *, pin_primary: bool = False
+    ) -> AbstractAsyncContextManager[None]:
+        raise AssertionError("unexpected call to deferred_transaction")
+
+    def current(self) -> AsyncSession:  # pragma: no cover
+        raise AssertionError("unexpected call to current")
+
+    async def rollback(self) -> None:  # pragma: no cover
+        raise AssertionError("unexpected call to rollback")
+
+    async def release(self) -> None:
+        self.releases += 1
+
+
+class Payload(BaseModel):
+    releases_at_serialization: int = -1
+
+
+def build_client(route_class: type[APIRoute], releases: Callable[[], int]) -> TestClient:
+    class ObservedPayload(Payload):
+        @field_serializer("releases_at_serialization")
+        def observe(self, _: int) -> int:
+            return releases()
+
+    api = APIRouter(route_class=route_class)
+
+    @api.get("/ok", response_model=ObservedPayload)
+    def ok() -> Any:  # pyright: ignore[reportUnusedFunction]
+        return ObservedPayload()
+
+    @api.get("/raises")
+    def raises() -> None:  # pyright: ignore[reportUnusedFunction]
+        raise NotFoundError("missing")
+
+    @api.get("/error-response")
+    def error_response() -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        return JSONResponse({"code": "409"}, status_code=409)
+
+    @api.get("/stream")
+    def stream() -> StreamingResponse:  # pyright: ignore[reportUnusedFunction]
+        return StreamingResponse(iter([b"chunk"]))
+
+    app = FastAPI()
+    app.include_router(api)
+    app.add_middleware(ErrorHandler)
+    return TestClient(app)
+
+
+def test_commit_early_route_releases_before_serialization() -> None:
+    provider = RecordingContextProvider()
+    client = build_client(commit_early_route(provider), lambda: provider.releases)
+
+    response = client.get("/ok")
+
+    assert response.json() == {"releases_at_serialization": 1}
+    assert provider.releases == 1
+
+
+def test_commit_early_route_leaves_errors_and_streams_to_the_middleware() -> None:
+    provider = RecordingContextProvider()
+    client = build_client(commit_early_route(provider), lambda: provider.releases)
+
+    assert client.get("/raises").status_code == 404
+    assert client.get("/error-response").status_code == 409
+    assert client.get("/stream").text == "chunk"
+    assert provider.releases == 0
+
+
+def test_async_commit_early_route_releases_before_serialization() -> None:
+    provider = RecordingAsyncContextProvider()
+    api = APIRouter(route_class=async_commit_early_route(provider))
+    seen: list[int] = []
+
+    class ObservedPayload(Payload):
+        @field_serializer("releases_at_serialization")
+        def observe(self, _: int) -> int:
+            seen.append(provider.releases)
+            return provider.releases
+
+    @api.get("/ok", response_model=ObservedPayload)
+    async def ok() -> Any:  # pyright: ignore[reportUnusedFunction]
+        return ObservedPayload()
+
+    @api.get("/stream")
+    async def stream() -> StreamingResponse:  # pyright: ignore[reportUnusedFunction]
+        async def body() -> AsyncIterator[bytes]:
+            yield b"chunk"
+
+        return StreamingResponse(body())
+
+    app = FastAPI()
+    app.include_router(api)
+    client = TestClient(app)
+
+    assert client.get("/ok").json() == {"releases_at_serialization": 1}
+    assert client.get("/stream").text == "chunk"
+    assert seen == [1]
+    assert provider.releases == 1
@@ -1,25 +1,51 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
+from datetime import datetime
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from todo_api.application_service.usecase.bulk_todo_result import (
+    BulkTodoOutcome,
+    BulkTodoResult,
+)
 from todo_api.application_service.usecase.create_todo_usecase import (
     CreateTodoUsecase,
     CreateTodoUsecaseInput,
     CreateTodoUsecaseOutput,
 )
+from todo_api.application_service.usecase.create_todos_usecase import (
+    CreateTodosUsecase,
+    CreateTodosUsecaseInput,
+    CreateTodosUsecaseOutput,
+)
 from todo_api.application_service.usecase.delete_todo_usecase import (
     DeleteTodoUsecase,
     DeleteTodoUsecaseInput,
     DeleteTodoUsecaseOutput,
 )
+from todo_api.application_service.usecase.delete_todos_usecase import (
+    DeleteTodosUsecase,
+    DeleteTodosUsecaseInput,
+    DeleteTodosUsecaseOutput,
+)
 from todo_api.application_service.usecase.get_all_todos_usecase import (
     GetAllTodosUsecase,
     GetAllTodosUsecaseInput,
     GetAllTodosUsecaseOutput,
 )
+from todo_api.application_service.usecase.get_todo_changes_usecase import (
+    GetTodoChangesUsecase,
+    GetTodoChangesUsecaseInput,
+    GetTodoChangesUsecaseOutput,
+)
+from todo_api.application_service.usecase.get_todo_stats_usecase import (
+    GetTodoStatsUsecase,
+    GetTodoStatsUsecaseInput,
+    GetTodoStatsUsecaseOutput,
+)
 from todo_api.application_service.usecase.get_todo_usecase import (
     GetTodoUsecase,
     GetTodoUsecaseInput,
@@ -30,28 +56,64 @@ from todo_api.application_service.usecase.mark_as_completed_todo_usecase import
     MarkAsCompletedTodoUsecaseInput,
     MarkAsCompletedTodoUsecaseOutput,
 )
+from todo_api.application_service.usecase.mark_as_completed_todos_usecase import (
+    MarkAsCompletedTodosUsecase,
+    MarkAsCompletedTodosUsecaseInput,
+    MarkAsCompletedTodosUsecaseOutput,
+)
 from todo_api.application_service.usecase.mark_as_uncompleted_todo_usecase import (
     MarkAsUncompletedTodoUsecase,
     MarkAsUncompletedTodoUsecaseInput,
     MarkAsUncompletedTodoUsecaseOutput,
 )
+from todo_api.application_service.usecase.mark_as_uncompleted_todos_usecase import (
+    MarkAsUncompletedTodosUsecase,
+    MarkAsUncompletedTodosUsecaseInput,
+    MarkAsUncompletedTodosUsecaseOutput,
+)
+from todo_api.application_service.usecase.search_todos_usecase import (
+    SearchTodosUsecase,
+    SearchTodosUsecaseInput,
+    SearchTodosUsecaseOutput,
+)
+from todo_api.application_service.usecase.stream_todos_usecase import (
+    StreamTodosUsecase,
+    StreamTodosUsecaseInput,
+    StreamTodosUsecaseOutput,
+)
 from todo_api.application_service.usecase.update_todo_usecase import (
     UpdateTodoUsecase,
     UpdateTodoUsecaseInput,
     UpdateTodoUsecaseOutput,
 )
 from todo_api.domain.model.todo import Todo, TodoDTO
+from todo_api.domain.model.todo_query import TodoQuery, TodoSort
+from todo_api.domain.model.todo_stats import TodoStats
+from todo_api.domain.repository.errors import RepositoryChangesExpiredError
 from todo_api.presentation.handler.create_todo_handler import CreateTodoHandler
+from todo_api.presentation.handler.create_todos_handler import CreateTodosHandler
 from todo_api.presentation.handler.delete_todo_handler import DeleteTodoHandler
-from todo_api.presentation.handler.get_all_todos_handler import GetAllTodosHandler
+from todo_api.presentation.handler.delete_todos_handler import DeleteTodosHandler
+from todo_api.presentation.handler.get_all_todos_handler import MAX_PAGE_SIZE, GetAllTodosHandler
+from todo_api.presentation.handler.get_todo_changes_handler import GetTodoChangesHandler
 from todo_api.presentation.handler.get_todo_handler import GetTodoHandler
+from todo_api.presentation.handler.get_todo_stats_handler import GetTodoStatsHandler
 from todo_api.presentation.handler.mark_as_completed_todo_handler import MarkAsCompletedTodoHandler
+from todo_api.presentation.handler.mark_as_completed_todos_handler import (
+    MarkAsCompletedTodosHandler,
+)
 from todo_api.presentation.handler.mark_as_uncompleted_todo_handler import (
     MarkAsUnCompletedTodoHandler,
 )
+from todo_api.presentation.handler.mark_as_uncompleted_todos_handler import (
+    MarkAsUnCompletedTodosHandler,
+)
+from todo_api.presentation.handler.search_todos_handler import SearchTodosHandler
+from todo_api.presentation.handler.stream_todos_handler import StreamTodosHandler
 from todo_api.presentation.handler.update_todo_handler import UpdateTodoHandler
+from todo_api.presentation.middleware.error_handler import ErrorHandler
 from todo_api.presentation.router.todo_router import TodoRouterContainer, router
-from todo_api.utils.uuid import uuid7
+from todo_api.utils.uuid import UUID7, uuid7
 
 
 class RecordingCreateTodoUsecase(CreateTodoUsecase):
@@ -64,6 +126,16 @@ class RecordingCreateTodoUsecase(CreateTodoUsecase):
         return CreateTodoUsecaseOutput(todo=self.todo)
 
 
+class RecordingCreateTodosUsecase(CreateTodosUsecase):
+    def __init__(self) -> None:
+        self.calls: list[CreateTodosUsecaseInput] = []
+
+    def execute(self, input_dto: CreateTodosUsecaseInput) -> CreateTodosUsecaseOutput:
+        self.calls.append(input_dto)
+        todos = [make_todo(item.title, description=item.description) for item in input_dto.items]
+        return CreateTodosUsecaseOutput(todos=todos)
+
+
 class RecordingGetAllTodosUsecase(GetAllTodosUsecase):
     def __init__(self, todos: list[Todo] | None = None) -> None:
         self.calls: list[GetAllTodosUsecaseInput] = []
@@ -84,6 +156,30 @@ class RecordingGetTodoUsecase(GetTodoUsecase):
         return GetTodoUsecaseOutput(todo=self.todo)
 
 
+class RecordingGetTodoChangesUsecase(GetTodoChangesUsecase):
+    def __init__(self) -> None:
+        self.calls: list[GetTodoChangesUsecaseInput] = []
+        self.todos: list[Todo] = []
+        self.deleted_ids: list[UUID7] = []
+        self.expired_before: datetime | None = None
+
+    def execute(self, input_dto: GetTodoChangesUsecaseInput) -> GetTodoChangesUsecaseOutput:
+        self.calls.append(input_dto)
+        since, expired_before = input_dto.since, self.expired_before
+        if since is not None and expired_before is not None and since < expired_before:
+            raise RepositoryChangesExpiredError("expired")
+        return GetTodoChangesUsecaseOutput(
+            todos=self.todos,
+            deleted_ids=self.deleted_ids,
+            watermark=datetime(2025, 1, 1, 12, 0, 0),
+        )
+
+
+class FixedGetTodoStatsUsecase(GetTodoStatsUsecase):
+    def execute(self, input_dto: GetTodoStatsUsecaseInput) -> GetTodoStatsUsecaseOutput:
+        return GetTodoStatsUsecaseOutput(stats=TodoStats(total=3, completed=1))
+
+
 class RecordingMarkAsCompletedTodoUsecase(MarkAsCompletedTodoUsecase):
     def __init__(self, todo: Todo) -> None:
         self.todo = todo
@@ -112,6 +208,28 @@ class RecordingMarkAsUncompletedTodoUsecase(MarkAsUncompletedTodoUsecase):
         return MarkAsUncompletedTodoUsecaseOutput(todo=self.todo)
 
 
+class RecordingSearchTodosUsecase(SearchTodosUsecase):
+    def __init__(self, todos: list[Todo] | None = None) -> None:
+        self.calls: list[SearchTodosUsecaseInput] = []
+        self.todos = todos or []
+
+    def execute(self, input_dto: SearchTodosUsecaseInput) -> SearchTodosUsecaseOutput:
+        self.calls.append(input_dto)
+        return SearchTodosUsecaseOutput(
+            todos=self.todos, next_offset=input_dto.offset + input_dto.limit
+        )
+
+
+class RecordingStreamTodosUsecase(StreamTodosUsecase):
+    def __init__(self, todos: list[Todo] | None = None) -> None:
+        self.calls: list[StreamTodosUsecaseInput] = []
+        self.todos = todos or []
+
+    def execute(self, input_dto: StreamTodosUsecaseInput) -> StreamTodosUsecaseOutput:
+        self.calls.append(input_dto)
+        return StreamTodosUsecaseOutput(todos=iter(self.todos))
+
+
 class RecordingUpdateTodoUsecase(UpdateTodoUsecase):
     def __init__(self, todo: Todo) -> None:
         self.todo = todo
@@ -132,14 +250,58 @@ class RecordingDeleteTodoUsecase(DeleteTodoUsecase):
         return DeleteTodoUsecaseOutput()
 
 
+class RecordingMarkAsCompletedTodosUsecase(MarkAsCompletedTodosUsecase):
+    def __init__(self) -> None:
+        self.calls: list[MarkAsCompletedTodosUsecaseInput] = []
+
+    def execute(
+        self, input_dto: MarkAsCompletedTodosUsecaseInput
+    ) -> MarkAsCompletedTodosUsecaseOutput:
+        self.calls.append(input_dto)
+        return MarkAsCompletedTodosUsecaseOutput(
+            results=[BulkTodoResult(id=i, outcome=BulkTodoOutcome.UPDATED) for i in input_dto.ids]
+        )
+
+
+class RecordingMarkAsUncompletedTodosUsecase(MarkAsUncompletedTodosUsecase):
+    def __init__(self) -> None:
+        self.calls: list[MarkAsUncompletedTodosUsecaseInput] = []
+
+    def execute(
+        self, input_dto: MarkAsUncompletedTodosUsecaseInput
+    ) -> MarkAsUncompletedTodosUsecaseOutput:
+        self.calls.append(input_dto)
+        return MarkAsUncompletedTodosUsecaseOutput(
+            results=[BulkTodoResult(id=i, outcome=BulkTodoOutcome.UNCHANGED) for i in input_dto.ids]
+        )
+
+
+class RecordingDeleteTodosUsecase(DeleteTodosUsecase):
+    def __init__(self) -> None:
+        self.calls: list[DeleteTodosUsecaseInput] = []
+
+    def execute(self, input_dto: DeleteTodosUsecaseInput) -> DeleteTodosUsecaseOutput:
+        self.calls.append(input_dto)
+        return DeleteTodosUsecaseOutput(
+            results=[BulkTodoResult(id=i, outcome=BulkTodoOutcome.NOT_FOUND) for i in input_dto.ids]
+        )
+
+
 @dataclass
 class RouterSuite:
     create: RecordingCreateTodoUsecase
+    create_many: RecordingCreateTodosUsecase
     delete: RecordingDeleteTodoUsecase
+    delete_many: RecordingDeleteTodosUsecase
     get_all: RecordingGetAllTodosUsecase
     get: RecordingGetTodoUsecase
+    changes: RecordingGetTodoChangesUsecase
     mark_completed: RecordingMarkAsCompletedTodoUsecase
+    mark_completed_many: RecordingMarkAsCompletedTodosUsecase
     mark_uncompleted: RecordingMarkAsUncompletedTodoUsecase
+    mark_uncompleted_many: RecordingMarkAsUncompletedTodosUsecase
+    search: RecordingSearchTodosUsecase
+    stream: RecordingStreamTodosUsecase
     update: RecordingUpdateTodoUsecase
 
 
@@ -162,29 +324,45 @@ def make_todo(
 def build_suite() -> RouterSuite:
     return RouterSuite(
         create=RecordingCreateTodoUsecase(),
+        create_many=RecordingCreateTodosUsecase(),
         delete=RecordingDeleteTodoUsecase(),
+        delete_many=RecordingDeleteTodosUsecase(),
         get_all=RecordingGetAllTodosUsecase(),
         get=RecordingGetTodoUsecase(make_todo("detail")),
+        changes=RecordingGetTodoChangesUsecase(),
         mark_completed=RecordingMarkAsCompletedTodoUsecase(make_todo("complete")),
+        mark_completed_many=RecordingMarkAsCompletedTodosUsecase(),
         mark_uncompleted=RecordingMarkAsUncompletedTodoUsecase(
             make_todo("uncomplete", completed=True)
         ),
+        mark_uncompleted_many=RecordingMarkAsUncompletedTodosUsecase(),
+        search=RecordingSearchTodosUsecase([make_todo("found")]),
+        stream=RecordingStreamTodosUsecase(),
         update=RecordingUpdateTodoUsecase(make_todo("update", description="before")),
     )
 
 
-def build_client(suite: RouterSuite) -> TestClient:
+def build_client(suite: RouterSuite, *, fast_json: bool = False) -> TestClient:
     app = FastAPI()
     container = TodoRouterContainer(
         create_todo=CreateTodoHandler(suite.create),
+        create_todos=CreateTodosHandler(suite.create_many),
         delete_todo=DeleteTodoHandler(suite.delete),
+        delete_todos=DeleteTodosHandler(suite.delete_many),
         get_all_todos=GetAllTodosHandler(suite.get_all),
         get_todo=GetTodoHandler(suite.get),
+        get_todo_changes=GetTodoChangesHandler(suite.changes),
+        get_todo_stats=GetTodoStatsHandler(FixedGetTodoStatsUsecase()),
         mark_as_completed_todo=MarkAsCompletedTodoHandler(suite.mark_completed),
+        mark_as_completed_todos=MarkAsCompletedTodosHandler(suite.mark_completed_many),
         mark_as_uncompleted_todo=MarkAsUnCompletedTodoHandler(suite.mark_uncompleted),
+        mark_as_uncompleted_todos=MarkAsUnCompletedTodosHandler(suite.mark_uncompleted_many),
+        search_todos=SearchTodosHandler(suite.search),
+        stream_todos=StreamTodosHandler(suite.stream),
         update_todo=UpdateTodoHandler(suite.update),
     )
-    app.include_router(router(container))
+    app.include_router(router(container, fast_json=fast_json))
+    app.add_middleware(ErrorHandler)
     return TestClient(app)
 
 
@@ -206,6 +384,48 @@ def test_create_todo_route_delegates_to_usecase() -> None:
     assert body["title"] == suite.create.todo.title
 
 
+def test_create_todos_route_delegates_to_usecase() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+
+    payload = {"todos": [{"title": "one"}, {"title": "two", "description": "d"}]}
+    response = client.post("/todos:batch", json=payload)
+
+    assert response.status_code == 201
+    assert len(suite.create_many.calls) == 1
+    assert [item.title for item in suite.create_many.calls[0].items] == ["one", "two"]
+    body = response.json()
+    assert [todo["title"] for todo in body["todos"]] == ["one", "two"]
+    assert body["todos"][1]["description"] == "d"
+
+
+def test_create_todos_route_rejects_empty_batch() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+
+    response = client.post("/todos:batch", json={"todos": []})
+
+    assert response.status_code == 422
+    assert suite.create_many.calls == []
+
+
+def test_bulk_routes_delegate_to_usecases() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+    ids = [str(uuid7()), str(uuid7())]
+
+    completed = client.put("/todos:complete", json={"ids": ids})
+    uncompleted = client.put("/todos:uncomplete", json={"ids": ids})
+    deleted = client.post("/todos:delete", json={"ids": ids})
+
+    assert [str(i) for i in suite.mark_completed_many.calls[0].ids] == ids
+    assert [str(i) for i in suite.mark_uncompleted_many.calls[0].ids] == ids
+    assert [str(i) for i in suite.delete_many.calls[0].ids] == ids
+    assert completed.json()["results"][0] == {"id": ids[0], "outcome": "updated"}
+    assert uncompleted.json()["results"][1] == {"id": ids[1], "outcome": "unchanged"}
+    assert deleted.json()["results"][0] == {"id": ids[0], "outcome": "not_found"}
+
+
 def test_get_all_route_returns_handler_response() -> None:
     suite = build_suite()
     suite.get_all.todos = [
@@ -220,9 +440,106 @@ def test_get_all_route_returns_handler_response() -> None:
     payload = response.json()
     assert len(payload["todos"]) == 2
     assert payload["todos"][1]["description"] == "more"
+    assert payload["todos"][0]["description"] is None
+    assert "next_cursor" not in payload
     assert len(suite.get_all.calls) == 1
 
 
+def test_get_all_route_forwards_pagination_params() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+
+    response = client.get("/todos", params={"limit": 5})
+    rejected = client.get("/todos", params={"limit": 0})
+
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] is None
+    assert len(suite.get_all.calls) == 1
+    assert suite.get_all.calls[0].limit == 5
+    assert suite.get_all.calls[0].after_id is None
+    assert rejected.status_code == 422
+
+
+def test_get_all_route_forwards_filters_as_a_query() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+
+    response = client.get(
+        "/todos",
+        params={"completed": "false", "title_prefix": "buy", "sort": "-title"},
+    )
+    rejected = client.get("/todos", params={"sort": "description"})
+
+    assert response.status_code == 200
+    assert len(suite.get_all.calls) == 1
+    assert suite.get_all.calls[0].query == TodoQuery(
+        completed=False, title_prefix="buy", sort=TodoSort.TITLE_DESC
+    )
+    assert suite.get_all.calls[0].limit == MAX_PAGE_SIZE
+    assert rejected.status_code == 422
+
+
+def test_search_route_passes_query_and_page_to_usecase() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+
+    response = client.get("/todos/search", params={"q": "buy milk", "offset": 20})
+    rejected = client.get("/todos/search", params={"q": ""})
+
+    assert response.status_code == 200
+    assert [todo["title"] for todo in response.json()["todos"]] == ["found"]
+    assert response.json()["next_offset"] == 40
+    assert suite.search.calls == [SearchTodosUsecaseInput(text="buy milk", offset=20, limit=20)]
+    assert rejected.status_code == 422
+
+
+def test_get_all_route_streams_ndjson_when_requested() -> None:
+    suite = build_suite()
+    suite.stream.todos = [make_todo("first"), make_todo("second")]
+    client = build_client(suite)
+
+    by_query = client.get("/todos", params={"stream": 1})
+    by_accept = client.get("/todos", headers={"Accept": "application/x-ndjson"})
+
+    for response in (by_query, by_accept):
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        titles = [json.loads(line)["title"] for line in response.text.splitlines()]
+        assert titles == ["first", "second"]
+    assert len(suite.stream.calls) == 2
+    assert suite.get_all.calls == []
+
+
+def test_get_all_route_negotiates_ndjson_by_media_type() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+
+    for accept in (
+        "application/x-ndjsonx",
+        "application/json, application/x-ndjson;q=0.5",
+        "application/x-ndjson;q=0, */*",
+    ):
+        response = client.get("/todos", headers={"Accept": accept})
+        assert response.headers["content-type"] == "application/json", accept
+    response = client.get("/todos", headers={"Accept": "Application/X-NDJSON; charset=utf-8, */*"})
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(suite.stream.calls) == 1
+
+
+def test_get_all_route_refuses_to_stream_a_paged_or_filtered_list() -> None:
+    suite = build_suite()
+    client = build_client(suite)
+
+    for params in ({"limit": 1}, {"cursor": "abc"}, {"completed": False}, {"sort": "title"}):
+        response = client.get("/todos", params={"stream": 1, **params})
+        assert response.status_code == 400, params
+    response = client.get(
+        "/todos", params={"title_prefix": "a"}, headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 400
+    assert suite.stream.calls == []
+
+
 def test_parameterized_routes_pass_id_and_body_to_usecases() -> None:
     suite = build_suite()
     todo_id = str(uuid7())
@@ -258,3 +575,83 @@ def test_parameterized_routes_pass_id_and_body_to_usecases() -> None:
 
     assert len(suite.delete.calls) == 1
     assert str(suite.delete.calls[0].id) == todo_id
+
+
+def test_fast_json_read_routes_render_the_same_bytes() -> None:
+    suite = build_suite()
+    todo_id = str(uuid7())
+    suite.get.todo = make_todo("détail", identifier=todo_id, description="line\nbreak")
+    suite.get_all.todos = [make_todo("first"), make_todo("second", completed=True)]
+    default, fast = build_client(suite), build_client(suite, fast_json=True)
+
+    for path in ("/todos", "/todos?limit=1", f"/todos/{todo_id}"):
+        expected, actual = default.get(path), fast.get(path)
+
+        assert actual.status_code == expected.status_code == 200
+        assert actual.headers["content-type"] == expected.headers["content-type"]
+        assert actual.content == expected.content
+
+
+def test_fast_json_keeps_the_openapi_schema() -> None:
+    suite = build_suite()
+
+    default, fast = build_client(suite), build_client(suite, fast_json=True)
+
+    assert fast.get("/openapi.json").json() == default.get("/openapi.json").json()
+
+
+def test_get_todo_route_answers_conditional_requests() -> None:
+    suite = build_suite()
+    todo_id = str(uuid7())
+    suite.get.todo = make_todo("detail", identifier=todo_id)
+
+    for client in (build_client(suite), build_client(suite, fast_json=True)):
+        etag = client.get(f"/todos/{todo_id}").headers["etag"]
+        cached = client.get(f"/todos/{todo_id}", headers={"If-None-Match": etag})
+        stale = client.get(f"/todos/{todo_id}", headers={"If-None-Match": '"other"'})
+
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+        assert stale.status_code == 200
+        assert stale.headers["etag"] == etag
+
+
+def test_changes_route_returns_changes_and_next_since() -> None:
+    suite = build_suite()
+    deleted_id = uuid7()
+    suite.changes.todos = [make_todo("changed")]
+    suite.changes.deleted_ids = [deleted_id]
+    client = build_client(suite)
+
+    initial = client.get("/todos/changes")
+    response = client.get("/todos/changes", params={"since": initial.json()["next_since"]})
+    rejected = client.get("/todos/changes", params={"since": "yesterday"})
+
+    assert [call.since for call in suite.changes.calls] == [None, datetime(2025, 1, 1, 12)]
+    assert response.json() == {
+        "todos": [initial.json()["todos"][0]],
+        "deleted_ids": [str(deleted_id)],
+        "next_since": "2025-01-01T12:00:00",
+    }
+    assert rejected.status_code == 400
+
+
+def test_changes_route_sends_clients_with_an_expired_since_back_to_a_full_list() -> None:
+    suite = build_suite()
+    suite.changes.expired_before = datetime(2025, 1, 1)
+    client = build_client(suite)
+
+    response = client.get("/todos/changes", params={"since": "2024-12-01T00:00:00"})
+
+    assert response.status_code == 410
+    assert response.json()["code"] == "410"
+
+
+def test_stats_route_returns_counts() -> None:
+    client = build_client(build_suite())
+
+    response = client.get("/todos/stats")
+
+    assert response.status_code == 200
+    assert response.json() == {"total": 3, "completed": 1, "open": 2}
@@ -0,0 +1,63 @@
+import pytest
+
+from todo_api.utils.lru_cache import CacheStats, LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_value_and_counts_hits_and_misses() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2, ttl_seconds=10)
+
+    assert cache.get("a") is None
+    cache.put("a", 1, cache.version())
+
+    assert cache.get("a") == 1
+    assert cache.stats() == CacheStats(hits=1, misses=1, evictions=0, size=1)
+
+
+def test_put_evicts_least_recently_used_entry() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2, ttl_seconds=10)
+    cache.put("a", 1, cache.version())
+    cache.put("b", 2, cache.version())
+    cache.get("a")
+
+    cache.put("c", 3, cache.version())
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_get_drops_expired_entry() -> None:
+    clock = FakeClock()
+    cache: LRUCache[str, int] = LRUCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.put("a", 1, cache.version())
+
+    clock.now = 10.0
+
+    assert cache.get("a") is None
+    assert cache.stats() == CacheStats(hits=0, misses=1, evictions=1, size=0)
+
+
+def test_put_is_dropped_when_invalidated_during_load() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2, ttl_seconds=10)
+    version = cache.version()
+
+    cache.invalidate("a")
+    cache.put("a", 1, version)
+
+    assert cache.get("a") is None
+
+
+def test_rejects_non_positive_bounds() -> None:
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0, ttl_seconds=10)
+    with pytest.raises(ValueError):
+        LRUCache(max_size=1, ttl_seconds=0)
@@ -0,0 +1,61 @@
+import copy
+import pickle
+import time
+
+import pytest
+from pydantic import BaseModel
+from uuid_utils import UUID as UUIDUtils
+from uuid_utils import uuid4
+
+from todo_api.utils.uuid import UUID7, parse_uuid7, uuid7
+
+
+class IdModel(BaseModel):
+    id: UUID7
+
+
+def test_uuid7_caches_string_and_bytes_forms():
+    todo_id = uuid7()
+    reference = UUIDUtils(str(todo_id))
+
+    assert str(todo_id) is str(todo_id)
+    assert todo_id.bytes == reference.bytes
+    assert todo_id == reference
+    assert hash(todo_id) == hash(reference)
+
+
+def test_uuid7_exposes_its_millisecond_timestamp():
+    before = int(time.time() * 1000)
+    todo_id = uuid7()
+    after = int(time.time() * 1000)
+
+    assert before <= todo_id.timestamp_ms <= after
+
+
+def test_uuid7_survives_copy_and_pickle():
+    todo_id = uuid7()
+
+    restored = pickle.loads(pickle.dumps(todo_id))
+
+    assert copy.deepcopy(todo_id) is todo_id
+    assert isinstance(restored, UUID7)
+    assert str(restored) == str(todo_id)
+
+
+def test_parse_uuid7_rejects_other_versions_and_garbage():
+    with pytest.raises(ValueError):
+        parse_uuid7(str(uuid4()))
+    with pytest.raises(ValueError):
+        parse_uuid7("not-a-uuid")
+    with pytest.raises(TypeError):
+        parse_uuid7(42)
+
+
+def test_pydantic_reuses_instances_and_parses_strings_once():
+    todo_id = uuid7()
+
+    assert IdModel(id=todo_id).id is todo_id
+    parsed = IdModel.model_validate_json(f'{{"id": "{todo_id}"}}').id
+    assert isinstance(parsed, UUID7)
+    assert parsed == todo_id
+    assert IdModel(id=todo_id).model_dump() == {"id": str(todo_id)}
@@ -4,9 +4,56 @@ CREATE TABLE IF NOT EXISTS todos (
     description TEXT,
     completed BOOLEAN NOT NULL DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP NOT NULL
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP NOT NULL,
+    INDEX ix_todos_updated_at (updated_at),
+    INDEX ix_todos_completed_id (completed, id),
+    INDEX ix_todos_completed_title (completed, title),
+    INDEX ix_todos_title (title),
+    FULLTEXT INDEX ft_todos_title_description (title, description)
 );
 
+-- One row per deleted todo for GET /todos/changes, written by the trigger below so that
+-- every delete is recorded, whoever makes it. The event drops rows after 30 days, the
+-- DELETIONS_RETENTION of the API; it needs the event scheduler, on by default.
+CREATE TABLE IF NOT EXISTS todo_tombstones (
+    id CHAR(36) PRIMARY KEY,
+    deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    INDEX ix_todo_tombstones_deleted_at (deleted_at)
+);
+
+CREATE TRIGGER todos_tombstone_delete AFTER DELETE ON todos FOR EACH ROW
+    INSERT INTO todo_tombstones (id) VALUES (OLD.id)
+    ON DUPLICATE KEY UPDATE deleted_at = CURRENT_TIMESTAMP;
+
+CREATE EVENT IF NOT EXISTS todo_tombstones_prune ON SCHEDULE EVERY 1 HOUR
+    DO DELETE FROM todo_tombstones
+    WHERE deleted_at < CURRENT_TIMESTAMP - INTERVAL 30 DAY;
+
+-- Todo counts for GET /todos/stats, kept by the triggers below in the transaction that
+-- writes the todo. Each connection adds to one of 16 slots, so concurrent writers do not
+-- wait on a single row; the counts are the sums over all slots.
+CREATE TABLE IF NOT EXISTS todo_stats (
+    slot SMALLINT PRIMARY KEY,
+    total BIGINT NOT NULL DEFAULT 0,
+    completed BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER todos_count_insert AFTER INSERT ON todos FOR EACH ROW
+    INSERT INTO todo_stats (slot, total, completed)
+    VALUES (MOD(CONNECTION_ID(), 16), 1, NEW.completed)
+    ON DUPLICATE KEY UPDATE total = total + 1, completed = completed + NEW.completed;
+
+CREATE TRIGGER todos_count_update AFTER UPDATE ON todos FOR EACH ROW
+    INSERT INTO todo_stats (slot, total, completed)
+    SELECT MOD(CONNECTION_ID(), 16), 0, NEW.completed - OLD.completed
+    FROM DUAL WHERE NEW.completed <> OLD.completed
+    ON DUPLICATE KEY UPDATE completed = completed + NEW.completed - OLD.completed;
+
+CREATE TRIGGER todos_count_delete AFTER DELETE ON todos FOR EACH ROW
+    INSERT INTO todo_stats (slot, total, completed)
+    VALUES (MOD(CONNECTION_ID(), 16), -1, -OLD.completed)
+    ON DUPLICATE KEY UPDATE total = total - 1, completed = completed - OLD.completed;
+
 INSERT INTO todos (id, title, description, completed) VALUES
 ('01994768-948a-759a-a485-3ccbb2f3a502', '1_Berkshire emulation deposit Sri Bacon', '1_I''ll index the redundant RSS firewall, that should microchip the PCI program!', false),
 ('02994768-948a-759a-a485-3ccbb2f3a502', '2_Berkshire emulation deposit Sri Bacon', '2_I''ll index the redundant RSS firewall, that should microchip the PCI program!', false),